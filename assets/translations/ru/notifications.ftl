@@ -71,6 +71,13 @@ ntf-event-bot-shutdown =
 
     <b>🔅 Событие: Бот остановлен!</b>
 
+ntf-event-digest =
+    #EventDigest
+
+    <b>🔅 Сводка событий { $type }: { $count }</b>
+
+    { $events }
+
 ntf-event-new-user =
     #EventNewUser
 
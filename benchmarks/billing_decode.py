@@ -0,0 +1,91 @@
+"""Decode + convert throughput of billing list responses: Pydantic vs msgspec Structs.
+
+Each list is built from the pinned contract fixtures in
+contracts/shop-billing/v1/http. Importing the converters loads AppConfig, so
+run from the repository root with the app environment available:
+
+    set -a; . ./.env; set +a
+    python -m benchmarks.billing_decode
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from src.infrastructure.billing import converters
+from src.infrastructure.billing.models import (
+    BillingPlan,
+    BillingPromocode,
+    BillingSubscription,
+    BillingTransaction,
+)
+from src.infrastructure.billing.structs import (
+    BillingPlanStruct,
+    BillingPromocodeStruct,
+    BillingSubscriptionStruct,
+    BillingTransactionStruct,
+    decode_struct_list,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "contracts" / "shop-billing" / "v1" / "http"
+ROWS = 5_000
+
+CASES: list[tuple[str, type[BaseModel], type[Any], Callable[[Any], Any]]] = [
+    ("plan.json", BillingPlan, BillingPlanStruct, converters.billing_plan_to_dto),
+    (
+        "subscription.json",
+        BillingSubscription,
+        BillingSubscriptionStruct,
+        converters.billing_subscription_to_dto,
+    ),
+    (
+        "transaction.json",
+        BillingTransaction,
+        BillingTransactionStruct,
+        converters.billing_transaction_to_dto,
+    ),
+    (
+        "promocode.json",
+        BillingPromocode,
+        BillingPromocodeStruct,
+        converters.billing_promocode_to_dto,
+    ),
+]
+
+
+def build_body(fixture_name: str) -> bytes:
+    fixture = json.loads((FIXTURES_DIR / fixture_name).read_text())
+    rows = [{**fixture, "ID": index} for index in range(1, ROWS + 1)]
+    return json.dumps(rows).encode()
+
+
+def main() -> None:
+    print(f"{ROWS} rows per response, best of 5")
+    print(f"{'endpoint':<18} {'path':<10} {'decode':>10} {'decode+convert':>16}")
+    for fixture_name, model, struct, convert in CASES:
+        body = build_body(fixture_name)
+
+        def pydantic_decode() -> list[Any]:
+            return [model.model_validate(row) for row in json.loads(body)]
+
+        def struct_decode() -> list[Any]:
+            return decode_struct_list(body, struct)
+
+        for path, decode in (("pydantic", pydantic_decode), ("msgspec", struct_decode)):
+            decode_only = min(timeit.repeat(decode, number=1, repeat=5))
+            full = min(
+                timeit.repeat(lambda: [convert(item) for item in decode()], number=1, repeat=5)
+            )
+            print(
+                f"{fixture_name:<18} {path:<10} "
+                f"{decode_only / ROWS * 1e6:7.2f} us {full / ROWS * 1e6:13.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
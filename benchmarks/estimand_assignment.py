@@ -0,0 +1,70 @@
+"""Per-unit cost of Estimand bucketing: original scalar hash vs fast scalar vs assign_many.
+
+Run from the repository root:
+
+    python -m benchmarks.estimand_assignment
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+
+from estimand_sdk.assignment import assign, assign_many, choose_variation, get_bucket_ranges
+
+SEED = "trial_offer_v1"
+UNITS = [
+    str(telegram_id) for telegram_id in random.Random(7).sample(range(10**8, 8 * 10**9), 100_000)
+]
+OPTIONS = {"num_variations": 2, "coverage": 1.0, "weights": [0.5, 0.5]}
+
+
+def _reference_fnv1a32(value: str) -> int:
+    hashed = 0x811C9DC5
+    encoded = value.encode("utf-16-le", "surrogatepass")
+    for index in range(0, len(encoded), 2):
+        code_unit = encoded[index] | (encoded[index + 1] << 8)
+        hashed ^= code_unit
+        hashed = (
+            hashed + (hashed << 1) + (hashed << 4) + (hashed << 7) + (hashed << 8) + (hashed << 24)
+        )
+        hashed &= 0xFFFFFFFF
+    return hashed
+
+
+def reference_assign_all() -> list[int]:
+    ranges = get_bucket_ranges(**OPTIONS)
+    return [
+        choose_variation(
+            (_reference_fnv1a32(str(_reference_fnv1a32(f"{SEED}{unit}"))) % 10000) / 10000,
+            ranges,
+        )
+        for unit in UNITS
+    ]
+
+
+def scalar_assign_all() -> list[int]:
+    return [assign(seed=SEED, unit=unit, **OPTIONS).variation_index for unit in UNITS]
+
+
+def bulk_assign_all() -> list[int]:
+    return assign_many(seed=SEED, unit_ids=UNITS, **OPTIONS).variation_indexes
+
+
+def main() -> None:
+    expected = reference_assign_all()
+    assert scalar_assign_all() == expected
+    assert bulk_assign_all() == expected
+
+    print(f"{len(UNITS)} telegram ids, hash version 2")
+    for name, func in (
+        ("original fnv1a32 + choose_variation", reference_assign_all),
+        ("assign (fast scalar path)", scalar_assign_all),
+        ("assign_many", bulk_assign_all),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:<48} {best / len(UNITS) * 1e6:8.3f} us/unit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Per-evaluation cost of the interpreted vs compiled Estimand evaluator.
+
+Run from the repository root:
+
+    python -m benchmarks.estimand_evaluator
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from estimand_sdk.assignment import hash_value
+from estimand_sdk.evaluator import (
+    CompiledConfig,
+    compile_config,
+    evaluate_feature,
+    evaluate_feature_from_payload,
+)
+from estimand_sdk.models import ConfigPayload, FeatureConfig, RuleConfig, VariationConfig
+
+UNITS = [str(telegram_id) for telegram_id in range(100_000, 101_000)]
+CONTEXT = {"language": "ru", "days_since_signup": 3, "platform": "android", "is_trial": False}
+
+
+def _feature(key: str, variations: list[tuple[str, object]], *, targeted: bool) -> FeatureConfig:
+    variation_keys = [variation_key for variation_key, _ in variations]
+    rules = [
+        RuleConfig(
+            id=f"{key}-default",
+            condition={},
+            variation_keys=variation_keys,
+            coverage=1.0,
+            priority=0,
+            is_default=True,
+            force=None,
+            seed="",
+            hash_version=2,
+            weights=None,
+            ranges=None,
+        )
+    ]
+    if targeted:
+        rules.insert(
+            0,
+            RuleConfig(
+                id=f"{key}-targeted",
+                condition={
+                    "language": {"in": ["ru", "uk", "be"]},
+                    "days_since_signup": {"lt": 7},
+                    "platform": {"ne": "web"},
+                },
+                variation_keys=variation_keys,
+                coverage=0.9,
+                priority=1,
+                is_default=False,
+                force=None,
+                seed=f"{key}-targeted",
+                hash_version=2,
+                weights=[0.5, 0.5] if len(variation_keys) == 2 else None,
+                ranges=None,
+            ),
+        )
+    return FeatureConfig(
+        type="experiment",
+        default_value=variations[0][1],
+        seed=f"{key}-v1",
+        unit_type="telegram_id",
+        enabled=True,
+        published=True,
+        variations=[
+            VariationConfig(
+                key=variation_key,
+                name=variation_key,
+                value=value,
+                weight=1,
+                is_control=index == 0,
+                description="",
+            )
+            for index, (variation_key, value) in enumerate(variations)
+        ],
+        rules=rules,
+        forced_variations={"100001": variation_keys[-1], "100002": variation_keys[0]},
+    )
+
+
+def build_config() -> ConfigPayload:
+    return ConfigPayload(
+        revision="bench-1",
+        features={
+            "trial_offer": _feature(
+                "trial_offer",
+                [("trial_on", {"enabled": True}), ("trial_off", {"enabled": False})],
+                targeted=True,
+            ),
+            "trial_length": _feature(
+                "trial_length",
+                [("trial_length_v1_off", {"days": 3}), ("trial_length_v1_on", {"days": 7})],
+                targeted=True,
+            ),
+            "start_tier_price": _feature(
+                "start_tier_price",
+                [
+                    ("start_tier_price_v1_off", {"amount": "149"}),
+                    ("start_tier_price_v1_on", {"amount": "129"}),
+                ],
+                targeted=False,
+            ),
+            "intro_price": _feature(
+                "intro_price",
+                [
+                    ("intro_99", {"final_amount": "99"}),
+                    ("intro_119", {"final_amount": "119"}),
+                    ("intro_129", {"final_amount": "129"}),
+                ],
+                targeted=True,
+            ),
+            "checkout_flow": _feature(
+                "checkout_flow",
+                [
+                    ("checkout_flow_v1_off", {"enabled": False}),
+                    ("checkout_flow_v1_on", {"enabled": True}),
+                ],
+                targeted=False,
+            ),
+            "payment_rescue": _feature(
+                "payment_rescue",
+                [
+                    ("payment_rescue_off", {"enabled": False}),
+                    ("payment_rescue_on", {"enabled": True}),
+                ],
+                targeted=True,
+            ),
+        },
+    )
+
+
+def main() -> None:
+    config = build_config()
+    evaluations = len(UNITS) * len(config.features)
+    compiled_config = compile_config(config)
+    seeds = [
+        rule.seed or feature.seed
+        for feature in config.features.values()
+        for rule in feature.rules[:1]
+    ]
+
+    def interpreted() -> None:
+        for unit_id in UNITS:
+            for feature_key, feature in config.features.items():
+                evaluate_feature(
+                    feature=feature,
+                    feature_key=feature_key,
+                    unit_id=unit_id,
+                    context=CONTEXT,
+                )
+
+    def via_payload() -> None:
+        for unit_id in UNITS:
+            for feature_key in config.features:
+                evaluate_feature_from_payload(
+                    config=config,
+                    feature_key=feature_key,
+                    unit_id=unit_id,
+                    context=CONTEXT,
+                )
+
+    def compiled() -> None:
+        for unit_id in UNITS:
+            for feature_key in config.features:
+                compiled_config.evaluate(feature_key, unit_id, CONTEXT)
+
+    def hashing_only() -> None:
+        for unit_id in UNITS:
+            for seed in seeds:
+                hash_value(seed=seed, unit=unit_id, version=2)
+
+    print(
+        f"{len(config.features)} features x {len(UNITS)} units = {evaluations} evaluations per run"
+    )
+    for name, func in (
+        ("interpreted evaluate_feature", interpreted),
+        ("evaluate_feature_from_payload (cached compile)", via_payload),
+        ("CompiledConfig.evaluate", compiled),
+        ("hash_value alone (floor for both)", hashing_only),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:<48} {best / evaluations * 1e6:8.2f} us/eval")
+
+    compile_seconds = min(timeit.repeat(lambda: CompiledConfig(config), number=100, repeat=5)) / 100
+    print(f"{'compile_config (once per revision)':<48} {compile_seconds * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Kafka consume throughput by batch size and handler concurrency.
+
+A stand-in AIOKafkaConsumer serves a backlog of notification events for a few
+hundred users from memory. Each handled event waits as long as a Telegram send
+and each commit as long as a broker round-trip, so the numbers show how much
+of the consume loop is spent waiting. ``batch 1, concurrency 1`` behaves like
+the previous one-message-one-commit loop. Run from the repository root:
+
+    python -m benchmarks.kafka_batch_consume
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiokafka import TopicPartition
+from loguru import logger
+
+from src.infrastructure.kafka.base_consumer import SupervisedKafkaConsumer
+
+MESSAGES = 1_000
+USERS = 300
+SEND_SECONDS = 0.02
+COMMIT_SECONDS = 0.003
+PARTITION = TopicPartition("bench.topic", 0)
+
+CASES: list[tuple[int, int]] = [(1, 1), (100, 1), (100, 16), (500, 64)]
+
+
+class BacklogConsumer:
+    def __init__(self, owner: SupervisedKafkaConsumer) -> None:
+        self.owner = owner
+        self.offset = 0
+        self.commits = 0
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def highwater(self, partition: TopicPartition) -> int:
+        return MESSAGES
+
+    async def commit(self, offsets: dict[TopicPartition, int]) -> None:
+        await asyncio.sleep(COMMIT_SECONDS)
+        self.offset = offsets[PARTITION]
+        self.commits += 1
+
+    async def getmany(self, timeout_ms: int, max_records: int) -> dict:
+        end = min(self.offset + max_records, MESSAGES)
+        if self.offset >= end:
+            self.owner._stopping = True
+            return {}
+        records = [
+            SimpleNamespace(
+                offset=offset, key=None, headers=(), value={"telegram_id": offset % USERS}
+            )
+            for offset in range(self.offset, end)
+        ]
+        return {PARTITION: records}
+
+
+class BenchConsumer(SupervisedKafkaConsumer):
+    consumer_name = "bench"
+
+    @property
+    def topic(self) -> str:
+        return PARTITION.topic
+
+    @property
+    def group_id(self) -> str:
+        return "bench"
+
+    async def _handle_message(self, payload: dict) -> None:
+        await asyncio.sleep(SEND_SECONDS)
+
+
+async def consume(batch_size: int, concurrency: int) -> tuple[float, int]:
+    config = MagicMock()
+    config.kafka_brokers = "bench:9092"
+    config.kafka_batch_size = batch_size
+    config.kafka_max_concurrency = concurrency
+    config.kafka_fetch_timeout_ms = 0
+    config.kafka_max_attempts = 3
+    config.kafka_retry_backoff = 0
+    consumer = BenchConsumer(config, MagicMock())
+    consumer._dead_letters = AsyncMock()
+    backlog = BacklogConsumer(consumer)
+
+    start = time.perf_counter()
+    with patch("src.infrastructure.kafka.base_consumer.AIOKafkaConsumer", return_value=backlog):
+        await consumer._run_once()
+    return time.perf_counter() - start, backlog.commits
+
+
+def main() -> None:
+    logger.remove()
+    print(
+        f"{MESSAGES} messages from {USERS} users, "
+        f"{SEND_SECONDS * 1e3:.0f} ms per send, {COMMIT_SECONDS * 1e3:.0f} ms per commit"
+    )
+    print(f"{'batch':>6} {'concurrency':>12} {'msg/s':>9} {'commits':>8}")
+    for batch_size, concurrency in CASES:
+        elapsed, commits = asyncio.run(consume(batch_size, concurrency))
+        print(f"{batch_size:>6} {concurrency:>12} {MESSAGES / elapsed:>9.0f} {commits:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Decode cost of a notify.user Kafka value, before and after typed decoding.
+
+``json.loads`` is the previous ``value_deserializer``; its dict was then
+walked with ``payload.get(...)`` and the notification type parsed in the
+handler. The typed path decodes the bytes straight into the contract structs
+with the consumer's own deserializer, validation included. Inputs are the
+contract fixtures. Run from the repository root:
+
+    python -m benchmarks.kafka_decode
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+from src.core.enums import SystemNotificationType
+from src.infrastructure.kafka.consumer import UserNotificationConsumer
+from src.infrastructure.kafka.events import build_value_deserializer
+
+FIXTURES_DIR = (
+    Path(__file__).resolve().parent.parent / "contracts" / "shop-billing" / "v1" / "kafka"
+)
+NUMBER = 50_000
+
+
+def dict_decode(raw: bytes) -> Any:
+    payload = json.loads(raw.decode("utf-8"))
+    if payload.get("telegram_id") and payload.get("type", "system") == "system":
+        SystemNotificationType(payload.get("ntf_type", ""))
+        payload.get("i18n_key", "")
+        payload.get("i18n_kwargs", {})
+    return payload
+
+
+def main() -> None:
+    typed_decode = build_value_deserializer(UserNotificationConsumer.payload_type, "benchmark")
+    cases: list[tuple[str, Callable[[bytes], Any]]] = [
+        ("json.loads + dict walk", dict_decode),
+        ("msgspec typed", typed_decode),
+    ]
+
+    print(f"best of 5 x {NUMBER} decodes")
+    for fixture in sorted(FIXTURES_DIR.glob("*.json")):
+        raw = fixture.read_bytes()
+        for name, decode in cases:
+            best = min(timeit.repeat(lambda: decode(raw), number=NUMBER, repeat=5))
+            print(f"{fixture.stem:<22} {name:<24} {best / NUMBER * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Event-loop time spent logging per update, by logger configuration.
+
+Each simulated update emits the lines a real one does on the hot path: cache
+hits, the user middleware, the notification service and a billing request at
+DEBUG, plus one INFO line. This module stands in for the hot modules, so the
+sampled configurations list it in ``hot_loggers``. Both sinks are installed
+as in production; stderr goes to /dev/null and the file sink to a temporary
+directory. Run from the repository root:
+
+    python -m benchmarks.logging_overhead
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from src.core.config.log import LogConfig
+from src.core.logger import setup_logger
+
+UPDATES = 5_000
+
+CASES: list[tuple[str, LogConfig]] = [
+    ("DEBUG (before)", LogConfig(level="DEBUG", hot_loggers="")),
+    ("DEBUG sampled", LogConfig(level="DEBUG", hot_loggers=__name__)),
+    ("DEBUG sampled json", LogConfig(level="DEBUG", hot_loggers=__name__, json_format=True)),
+    ("DEBUG sampled enqueue", LogConfig(level="DEBUG", hot_loggers=__name__, enqueue=True)),
+    ("INFO", LogConfig(level="INFO")),
+]
+
+
+def log_update(update_id: int) -> None:
+    user_id = 100_000 + update_id % 1_000
+    logger.debug(f"Cache hit: 'cache:get_user:{user_id}'")
+    logger.debug("Cache hit: 'cache:get_settings'")
+    logger.debug(f"Cache hit: 'cache:get_current_subscription:{user_id}'")
+    logger.debug(f"User '{user_id}' loaded from cache")
+    logger.debug(f"Billing GET /subscriptions/{user_id} -> 200 in 4.2ms")
+    logger.debug(f"Notification for user '{user_id}' rendered")
+    logger.info(f"Update '{update_id}' from user '{user_id}' handled")
+
+
+async def run_updates() -> float:
+    spent = 0.0
+    for update_id in range(UPDATES):
+        start = time.perf_counter()
+        log_update(update_id)
+        spent += time.perf_counter() - start
+        await asyncio.sleep(0)
+    return spent
+
+
+def main() -> None:
+    stderr = sys.stderr
+    print(f"{UPDATES} updates, 6 DEBUG + 1 INFO lines each")
+    print(f"{'config':<24} {'loop time/update':>17}")
+    with open(os.devnull, "w") as devnull, tempfile.TemporaryDirectory() as log_dir:
+        for name, config in CASES:
+            sys.stderr = devnull
+            try:
+                setup_logger(config, log_dir=Path(log_dir))
+                spent = asyncio.run(run_updates())
+                logger.remove()
+            finally:
+                sys.stderr = stderr
+            print(f"{name:<24} {spent / UPDATES * 1e6:14.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,14 @@
 
 from .assignment import (
     AssignmentResult,
+    BulkAssignmentResult,
     assign,
+    assign_many,
     choose_variation,
     fnv1a32,
     get_bucket_ranges,
     hash_value,
+    hash_values,
 )
 from .client import (
     ConfigCacheMissError,
@@ -17,6 +20,12 @@ from .client import (
     EstimandSDKHTTPError,
     EstimandSDKRequestError,
 )
+
+try:
+    from .async_client import AsyncEstimandClient
+except ImportError:  # httpx is only required for the asyncio client
+    AsyncEstimandClient = None  # type: ignore[assignment,misc]
+
 from .evaluator import (
     REASON_FEATURE_DISABLED,
     REASON_FEATURE_NOT_FOUND,
@@ -27,7 +36,10 @@ from .evaluator import (
     REASON_RULE_DEFAULT_MATCHED,
     REASON_RULE_MATCHED,
     REASON_VARIANT_FORCED,
+    CompiledConfig,
+    CompiledFeature,
     EvaluationResult,
+    compile_config,
     evaluate_feature,
     evaluate_feature_from_payload,
     evaluate_features,
@@ -46,6 +58,8 @@ from .models import (
 
 __all__ = [
     "AssignmentResult",
+    "AsyncEstimandClient",
+    "BulkAssignmentResult",
     "EstimandClient",
     "EstimandClientConfig",
     "EstimandSDKError",
@@ -53,6 +67,8 @@ __all__ = [
     "EstimandSDKHTTPError",
     "EstimandSDKRequestError",
     "ConfigCacheMissError",
+    "CompiledConfig",
+    "CompiledFeature",
     "EvaluationResult",
     "REASON_FEATURE_DISABLED",
     "REASON_FEATURE_NOT_FOUND",
@@ -67,15 +83,18 @@ __all__ = [
     "FeatureConfig",
     "RuleConfig",
     "VariationConfig",
+    "compile_config",
     "evaluate_feature",
     "evaluate_features",
     "evaluate_feature_from_payload",
     "evaluate_features_from_payload",
     "assign",
+    "assign_many",
     "choose_variation",
     "fnv1a32",
     "get_bucket_ranges",
     "hash_value",
+    "hash_values",
     "EventPayload",
     "EventBatchResponse",
     "EvaluationResult",
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import sys
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Sequence
 
 
@@ -19,24 +22,46 @@ class AssignmentResult:
     ranges: list[tuple[float, float]]
 
 
+FNV_OFFSET_BASIS = 0x811C9DC5
+FNV_PRIME = 0x01000193
+_UINT32_MASK = 0xFFFFFFFF
+
+
+@dataclass(frozen=True)
+class BulkAssignmentResult:
+    """Result of :func:`assign_many`; ``buckets[i]`` belongs to ``unit_ids[i]``."""
+
+    buckets: list[float]
+    variation_indexes: list[int]
+    ranges: list[tuple[float, float]]
+
+
 def fnv1a32(value: str) -> int:
     """Return the 32-bit FNV-1a hash for a UTF-16LE encoded string."""
 
-    hash_value = 0x811C9DC5
-    encoded = value.encode("utf-16-le", "surrogatepass")
-    for index in range(0, len(encoded), 2):
-        code_unit = encoded[index] | (encoded[index + 1] << 8)
-        hash_value ^= code_unit
-        hash_value = (
-            hash_value
-            + (hash_value << 1)
-            + (hash_value << 4)
-            + (hash_value << 7)
-            + (hash_value << 8)
-            + (hash_value << 24)
-        )
-        hash_value &= 0xFFFFFFFF
-    return hash_value
+    return _fnv1a32_update(FNV_OFFSET_BASIS, value)
+
+
+def _utf16_code_units(value: str) -> Sequence[int]:
+    if value.isascii():
+        return value.encode("ascii")
+    code_units = array("H", value.encode("utf-16-le", "surrogatepass"))
+    if sys.byteorder == "big":
+        code_units.byteswap()
+    return code_units
+
+
+def _fnv1a32_update(hash_state: int, value: str) -> int:
+    # FNV-1a is a streaming hash, so hashing "seed" + "unit" equals continuing
+    # from the state after "seed"; hash_value relies on that to cache seeds.
+    for code_unit in _utf16_code_units(value):
+        hash_state = ((hash_state ^ code_unit) * FNV_PRIME) & _UINT32_MASK
+    return hash_state
+
+
+@lru_cache(maxsize=1024)
+def _seed_hash_state(seed: str) -> int:
+    return fnv1a32(seed)
 
 
 def hash_value(seed: str, unit: str, *, version: int = 1) -> float:
@@ -48,7 +73,7 @@ def hash_value(seed: str, unit: str, *, version: int = 1) -> float:
     if version == 1:
         hashed = fnv1a32(f"{unit}{seed}")
     else:
-        hashed = fnv1a32(str(fnv1a32(f"{seed}{unit}")))
+        hashed = fnv1a32(str(_fnv1a32_update(_seed_hash_state(seed), unit)))
 
     return (hashed % GROWTHBOOK_BUCKET_SCALE[version]) / GROWTHBOOK_BUCKET_SCALE[version]
 
@@ -124,3 +149,41 @@ def assign(
         variation_index=variation_index,
         ranges=ranges,
     )
+
+
+def hash_values(seed: str, units: Sequence[str], *, version: int = 1) -> list[float]:
+    """Return ``hash_value(seed, unit, version=version)`` for every unit, in order."""
+
+    if version not in GROWTHBOOK_BUCKET_SCALE:
+        raise ValueError("hash version must be 1 or 2")
+    return [hash_value(seed, unit, version=version) for unit in units]
+
+
+def assign_many(
+    *,
+    seed: str,
+    unit_ids: Sequence[str],
+    num_variations: int,
+    coverage: float = 1,
+    weights: Sequence[float] | None = None,
+    hash_version: int = 2,
+) -> BulkAssignmentResult:
+    """Bulk version of :func:`assign`; the bucket ranges are built once.
+
+    Every bucket and variation index is identical to calling :func:`assign`
+    once per unit id.
+    """
+
+    ranges = get_bucket_ranges(
+        num_variations=num_variations,
+        coverage=coverage,
+        weights=weights,
+    )
+    buckets = hash_values(seed, unit_ids, version=hash_version)
+    variation_indexes = [choose_variation(bucket, ranges) for bucket in buckets]
+
+    return BulkAssignmentResult(
+        buckets=buckets,
+        variation_indexes=variation_indexes,
+        ranges=ranges,
+    )
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Callable, Mapping, Sequence
+
+import httpx
+
+from .client import (
+    EstimandClientConfig,
+    EstimandSDKHTTPError,
+    EstimandSDKRequestError,
+    _build_event,
+    _EstimandClientBase,
+    _normalize_headers,
+    _parse_event_response,
+    _parse_json,
+)
+from .models import ConfigPayload, EventBatchResponse, EventPayload
+
+DROP_REASON_BUFFER_FULL = "buffer_full"
+DROP_REASON_CLOSED = "closed"
+DROP_REASON_SEND_FAILED = "send_failed"
+
+EventsDroppedHook = Callable[[int, str], None]
+EventsFlushedHook = Callable[[int], None]
+
+
+class AsyncEstimandClient(_EstimandClientBase):
+    """Non-blocking Estimand client for asyncio applications.
+
+    Config fetches and event delivery go through ``httpx.AsyncClient``.
+    ``track_*`` never touch the network: events are put on a bounded in-memory
+    queue that a background task sends through ``send_events`` once
+    ``event_batch_size`` events are pending or ``event_flush_interval`` seconds
+    have passed. When the queue is full new events are dropped rather than
+    blocking the caller. Call :meth:`aclose` on shutdown to deliver whatever
+    is still buffered.
+    """
+
+    def __init__(
+        self,
+        config: EstimandClientConfig | str,
+        *,
+        api_key: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        on_events_dropped: EventsDroppedHook | None = None,
+        on_events_flushed: EventsFlushedHook | None = None,
+    ):
+        super().__init__(config, api_key=api_key)
+        self._http = http_client or httpx.AsyncClient(timeout=self._config.request_timeout)
+        self._owns_http = http_client is None
+        self._queue: asyncio.Queue[EventPayload] = asyncio.Queue(
+            maxsize=self._config.event_buffer_size
+        )
+        self._pending: list[EventPayload] = []
+        self._flusher: asyncio.Task[None] | None = None
+        self._closed = False
+        self._on_events_dropped = on_events_dropped
+        self._on_events_flushed = on_events_flushed
+
+    @property
+    def buffered(self) -> int:
+        """Events waiting to be sent, including a batch currently being collected."""
+        return self._queue.qsize() + len(self._pending)
+
+    async def fetch_config(
+        self,
+        *,
+        organization_id: str,
+        project_id: str,
+        environment_id: str,
+        force_refresh: bool = False,
+    ) -> ConfigPayload:
+        scope, headers, params = self._config_request(
+            organization_id, project_id, environment_id, force_refresh
+        )
+        response = await self._request("GET", "/api/v1/config", headers=headers, params=params)
+        return self._store_config(scope, response)
+
+    async def send_events(self, events: Sequence[EventPayload]) -> EventBatchResponse:
+        if not events:
+            raise ValueError("events payload cannot be empty")
+
+        response = await self._request(
+            "POST",
+            "/api/v1/events",
+            headers={"X-API-Key": self._config.api_key},
+            json_body={"events": [event.to_mapping() for event in events]},
+        )
+        return _parse_event_response(response["body"])
+
+    def track_exposure(
+        self,
+        *,
+        event_id: str | None = None,
+        project_id: str,
+        environment_id: str,
+        feature_id: str,
+        unit_id: str,
+        variant_key: str | None = None,
+        variation_id: str | None = None,
+        value: float = 1.0,
+        timestamp: datetime | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> None:
+        self.enqueue(
+            _build_event(
+                event_id=event_id,
+                project_id=project_id,
+                environment_id=environment_id,
+                feature_id=feature_id,
+                unit_id=unit_id,
+                event_type="exposure",
+                event_name="exposure",
+                variant_key=variant_key,
+                variation_id=variation_id,
+                value=value,
+                timestamp=timestamp,
+                properties=properties,
+            )
+        )
+
+    def track_conversion(
+        self,
+        *,
+        event_id: str | None = None,
+        project_id: str,
+        environment_id: str,
+        feature_id: str,
+        unit_id: str,
+        event_name: str,
+        variant_key: str | None = None,
+        variation_id: str | None = None,
+        value: float = 1.0,
+        timestamp: datetime | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> None:
+        if not event_name:
+            raise ValueError("event_name is required for conversion events")
+        self.enqueue(
+            _build_event(
+                event_id=event_id,
+                project_id=project_id,
+                environment_id=environment_id,
+                feature_id=feature_id,
+                unit_id=unit_id,
+                event_type="conversion",
+                event_name=event_name,
+                variant_key=variant_key,
+                variation_id=variation_id,
+                value=value,
+                timestamp=timestamp,
+                properties=properties,
+            )
+        )
+
+    def track_custom(
+        self,
+        *,
+        event_id: str | None = None,
+        project_id: str,
+        environment_id: str,
+        feature_id: str,
+        unit_id: str,
+        event_name: str,
+        variant_key: str | None = None,
+        variation_id: str | None = None,
+        value: float = 1.0,
+        timestamp: datetime | None = None,
+        properties: dict[str, Any] | None = None,
+    ) -> None:
+        if not event_name:
+            raise ValueError("event_name is required for custom events")
+        self.enqueue(
+            _build_event(
+                event_id=event_id,
+                project_id=project_id,
+                environment_id=environment_id,
+                feature_id=feature_id,
+                unit_id=unit_id,
+                event_type="custom",
+                event_name=event_name,
+                variant_key=variant_key,
+                variation_id=variation_id,
+                value=value,
+                timestamp=timestamp,
+                properties=properties,
+            )
+        )
+
+    def enqueue(self, event: EventPayload) -> bool:
+        """Buffer ``event`` for background delivery; returns False if it was dropped."""
+        if self._closed:
+            self._dropped(1, DROP_REASON_CLOSED)
+            return False
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._dropped(1, DROP_REASON_BUFFER_FULL)
+            return False
+        self._ensure_flusher()
+        return True
+
+    async def flush(self) -> None:
+        """Send every buffered event now, in ``event_batch_size`` chunks."""
+        batch = self._pending
+        self._pending = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+            if len(batch) >= self._config.event_batch_size:
+                await self._send_batch(batch)
+                batch = []
+        if batch:
+            await self._send_batch(batch)
+
+    async def aclose(self) -> None:
+        """Stop accepting events, deliver the buffer and release the HTTP client."""
+        self._closed = True
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+        if self._owns_http:
+            await self._http.aclose()
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch_size = self._config.event_batch_size
+        while True:
+            self._pending.append(await self._queue.get())
+            deadline = loop.time() + self._config.event_flush_interval
+            while len(self._pending) < batch_size:
+                try:
+                    self._pending.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    self._pending.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            # The batch stays in _pending until it is sent, so a shutdown that
+            # cancels this task mid-request re-sends it from aclose(); the
+            # ingestion API deduplicates on event_id.
+            if self._pending:
+                await self._send_batch(self._pending)
+                self._pending = []
+
+    async def _send_batch(self, batch: list[EventPayload]) -> None:
+        try:
+            await self.send_events(batch)
+        except Exception:
+            self._dropped(len(batch), DROP_REASON_SEND_FAILED)
+            return
+        if self._on_events_flushed is not None:
+            self._on_events_flushed(len(batch))
+
+    def _dropped(self, count: int, reason: str) -> None:
+        if self._on_events_dropped is not None:
+            self._on_events_dropped(count, reason)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+        json_body: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        full_headers = {
+            "Accept": "application/json",
+            "User-Agent": "estimand-python-sdk/0.1",
+        }
+        if headers:
+            full_headers.update(headers)
+        content: bytes | None = None
+        if json_body is not None:
+            content = json.dumps(json_body).encode("utf-8")
+            full_headers["Content-Type"] = "application/json"
+        query = {key: value for key, value in (params or {}).items() if value is not None}
+
+        attempts = self._config.retries + 1
+        last_error: Exception | None = None
+
+        for attempt in range(attempts):
+            try:
+                response = await self._http.request(
+                    method.upper(),
+                    self.base_url + path,
+                    headers=full_headers,
+                    params=query,
+                    content=content,
+                    timeout=self._config.request_timeout,
+                )
+            except httpx.HTTPError as exc:
+                if attempt < attempts - 1:
+                    last_error = exc
+                    await asyncio.sleep(self._config.retry_backoff_seconds * (2**attempt))
+                    continue
+                raise EstimandSDKRequestError("Request failed after retries") from exc
+
+            status = response.status_code
+            body = response.text
+            response_headers = _normalize_headers(response.headers)
+            if status < 400:
+                return {"status": status, "body": body, "headers": response_headers}
+
+            error = EstimandSDKHTTPError(
+                status=status, body=_parse_json(body), headers=response_headers
+            )
+            if status in self._config.retry_statuses and attempt < attempts - 1:
+                last_error = error
+                await asyncio.sleep(self._config.retry_backoff_seconds * (2**attempt))
+                continue
+            raise error from last_error
+
+        raise EstimandSDKRequestError("Request failed after retries") from last_error
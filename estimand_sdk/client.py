@@ -58,10 +58,13 @@ class EstimandClientConfig:
     retries: int = 2
     retry_backoff_seconds: float = 0.2
     retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+    event_buffer_size: int = 10_000
+    event_batch_size: int = 100
+    event_flush_interval: float = 1.0
 
 
-class EstimandClient:
-    """Typed client for Estimand config + event ingestion endpoints."""
+class _EstimandClientBase:
+    """Config caching, event building and local evaluation shared by the sync and async clients."""
 
     def __init__(self, config: EstimandClientConfig | str, *, api_key: str | None = None):
         if isinstance(config, str):
@@ -82,31 +85,81 @@ class EstimandClient:
         """Base URL without trailing slash."""
         return self._config.base_url.rstrip("/")
 
-    def fetch_config(
+    def evaluate_feature(
+        self,
+        *,
+        feature_key: str,
+        unit_id: str,
+        context: Mapping[str, Any] | None = None,
+        config: ConfigPayload | None = None,
+    ) -> EvaluationResult:
+        payload = config or self._latest_config()
+        return evaluate_feature_from_payload(
+            config=payload,
+            feature_key=feature_key,
+            unit_id=unit_id,
+            context=context,
+        )
+
+    def evaluate_all(
         self,
         *,
+        unit_id: str,
+        context: Mapping[str, Any] | None = None,
+        config: ConfigPayload | None = None,
+    ) -> dict[str, EvaluationResult]:
+        payload = config or self._latest_config()
+        return evaluate_features(config=payload, unit_id=unit_id, context=context)
+
+    def deterministic_assignment(
+        self,
+        *,
+        seed: str,
+        unit_id: str,
+        num_variations: int,
+        coverage: float = 1,
+        weights: Sequence[float] | None = None,
+        hash_version: int = 2,
+    ) -> tuple[float, int, list[tuple[float, float]]]:
+        result = assign(
+            seed=seed,
+            unit=unit_id,
+            num_variations=num_variations,
+            coverage=coverage,
+            weights=weights,
+            hash_version=hash_version,
+        )
+        return result.bucket, result.variation_index, result.ranges
+
+    def _latest_config(self) -> ConfigPayload:
+        if self._scope_cache_key is None:
+            raise ConfigCacheMissError("No config loaded yet")
+        cached = self._config_cache.get(self._scope_cache_key)
+        if cached is None:
+            raise ConfigCacheMissError("Cached config was removed")
+        return cached
+
+    def _config_request(
+        self,
         organization_id: str,
         project_id: str,
         environment_id: str,
-        force_refresh: bool = False,
-    ) -> ConfigPayload:
+        force_refresh: bool,
+    ) -> tuple[tuple[str, str, str], dict[str, str], dict[str, str]]:
         scope = self._scope_key(organization_id, project_id, environment_id)
         headers = {"X-API-Key": self._config.api_key}
         if not force_refresh and scope in self._etag_cache:
             headers["If-None-Match"] = self._etag_cache[scope]
+        params = {
+            "organization_id": organization_id,
+            "project_id": project_id,
+            "environment_id": environment_id,
+        }
+        return scope, headers, params
 
-        response = self._request(
-            "GET",
-            "/api/v1/config",
-            headers=headers,
-            params={
-                "organization_id": organization_id,
-                "project_id": project_id,
-                "environment_id": environment_id,
-            },
-            include_json=False,
-        )
-
+    def _store_config(
+        self, scope: tuple[str, str, str], response: Mapping[str, Any]
+    ) -> ConfigPayload:
         status = response["status"]
         body = response["body"]
         response_headers = response["headers"]
@@ -128,6 +181,35 @@ class EstimandClient:
         self._scope_cache_key = scope
         return config_payload
 
+    def _scope_key(
+        self, organization_id: str, project_id: str, environment_id: str
+    ) -> tuple[str, str, str]:
+        return (str(organization_id), str(project_id), str(environment_id))
+
+
+class EstimandClient(_EstimandClientBase):
+    """Typed client for Estimand config + event ingestion endpoints."""
+
+    def fetch_config(
+        self,
+        *,
+        organization_id: str,
+        project_id: str,
+        environment_id: str,
+        force_refresh: bool = False,
+    ) -> ConfigPayload:
+        scope, headers, params = self._config_request(
+            organization_id, project_id, environment_id, force_refresh
+        )
+        response = self._request(
+            "GET",
+            "/api/v1/config",
+            headers=headers,
+            params=params,
+            include_json=False,
+        )
+        return self._store_config(scope, response)
+
     def send_events(self, events: Sequence[EventPayload]) -> EventBatchResponse:
         if not events:
             raise ValueError("events payload cannot be empty")
@@ -140,10 +222,7 @@ class EstimandClient:
             json_body=payload,
         )
 
-        parsed = _parse_json(response["body"])
-        if not isinstance(parsed, Mapping):
-            raise EstimandSDKRequestError("Event API response must be JSON")
-        return EventBatchResponse.from_mapping(parsed)
+        return _parse_event_response(response["body"])
 
     def track_exposure(
         self,
@@ -161,8 +240,8 @@ class EstimandClient:
     ) -> EventBatchResponse:
         return self.send_events(
             [
-                EventPayload(
-                    event_id=event_id or str(uuid.uuid4()),
+                _build_event(
+                    event_id=event_id,
                     project_id=project_id,
                     environment_id=environment_id,
                     feature_id=feature_id,
@@ -172,7 +251,7 @@ class EstimandClient:
                     variant_key=variant_key,
                     variation_id=variation_id,
                     value=value,
-                    timestamp=(timestamp or datetime.now(timezone.utc)).isoformat(),
+                    timestamp=timestamp,
                     properties=properties,
                 )
             ]
@@ -197,8 +276,8 @@ class EstimandClient:
             raise ValueError("event_name is required for conversion events")
         return self.send_events(
             [
-                EventPayload(
-                    event_id=event_id or str(uuid.uuid4()),
+                _build_event(
+                    event_id=event_id,
                     project_id=project_id,
                     environment_id=environment_id,
                     feature_id=feature_id,
@@ -208,7 +287,7 @@ class EstimandClient:
                     variant_key=variant_key,
                     variation_id=variation_id,
                     value=value,
-                    timestamp=(timestamp or datetime.now(timezone.utc)).isoformat(),
+                    timestamp=timestamp,
                     properties=properties,
                 )
             ]
@@ -233,8 +312,8 @@ class EstimandClient:
             raise ValueError("event_name is required for custom events")
         return self.send_events(
             [
-                EventPayload(
-                    event_id=event_id or str(uuid.uuid4()),
+                _build_event(
+                    event_id=event_id,
                     project_id=project_id,
                     environment_id=environment_id,
                     feature_id=feature_id,
@@ -244,66 +323,12 @@ class EstimandClient:
                     variant_key=variant_key,
                     variation_id=variation_id,
                     value=value,
-                    timestamp=(timestamp or datetime.now(timezone.utc)).isoformat(),
+                    timestamp=timestamp,
                     properties=properties,
                 )
             ]
         )
 
-    def evaluate_feature(
-        self,
-        *,
-        feature_key: str,
-        unit_id: str,
-        context: Mapping[str, Any] | None = None,
-        config: ConfigPayload | None = None,
-    ) -> EvaluationResult:
-        payload = config or self._latest_config()
-        return evaluate_feature_from_payload(
-            config=payload,
-            feature_key=feature_key,
-            unit_id=unit_id,
-            context=context,
-        )
-
-    def evaluate_all(
-        self,
-        *,
-        unit_id: str,
-        context: Mapping[str, Any] | None = None,
-        config: ConfigPayload | None = None,
-    ) -> dict[str, EvaluationResult]:
-        payload = config or self._latest_config()
-        return evaluate_features(config=payload, unit_id=unit_id, context=context)
-
-    def deterministic_assignment(
-        self,
-        *,
-        seed: str,
-        unit_id: str,
-        num_variations: int,
-        coverage: float = 1,
-        weights: Sequence[float] | None = None,
-        hash_version: int = 2,
-    ) -> tuple[float, int, list[tuple[float, float]]]:
-        result = assign(
-            seed=seed,
-            unit=unit_id,
-            num_variations=num_variations,
-            coverage=coverage,
-            weights=weights,
-            hash_version=hash_version,
-        )
-        return result.bucket, result.variation_index, result.ranges
-
-    def _latest_config(self) -> ConfigPayload:
-        if self._scope_cache_key is None:
-            raise ConfigCacheMissError("No config loaded yet")
-        cached = self._config_cache.get(self._scope_cache_key)
-        if cached is None:
-            raise ConfigCacheMissError("Cached config was removed")
-        return cached
-
     def _request(
         self,
         method: str,
@@ -369,9 +394,6 @@ class EstimandClient:
 
         raise EstimandSDKRequestError("Request failed after retries") from last_error
 
-    def _scope_key(self, organization_id: str, project_id: str, environment_id: str) -> tuple[str, str, str]:
-        return (str(organization_id), str(project_id), str(environment_id))
-
 
 def _normalize_headers(headers: Mapping[str, str] | None) -> dict[str, str]:
     if headers is None:
@@ -384,6 +406,46 @@ def _extract_etag(headers: Mapping[str, str], revision: str) -> str:
     if etag:
         return etag
     return f'W/"{revision}"'
+
+
+def _build_event(
+    *,
+    event_id: str | None,
+    project_id: str,
+    environment_id: str,
+    feature_id: str,
+    unit_id: str,
+    event_type: str,
+    event_name: str,
+    variant_key: str | None,
+    variation_id: str | None,
+    value: float,
+    timestamp: datetime | None,
+    properties: dict[str, Any] | None,
+) -> EventPayload:
+    return EventPayload(
+        event_id=event_id or str(uuid.uuid4()),
+        project_id=project_id,
+        environment_id=environment_id,
+        feature_id=feature_id,
+        unit_id=unit_id,
+        event_type=event_type,
+        event_name=event_name,
+        variant_key=variant_key,
+        variation_id=variation_id,
+        value=value,
+        timestamp=(timestamp or datetime.now(timezone.utc)).isoformat(),
+        properties=properties,
+    )
+
+
+def _parse_event_response(payload: str) -> EventBatchResponse:
+    parsed = _parse_json(payload)
+    if not isinstance(parsed, Mapping):
+        raise EstimandSDKRequestError("Event API response must be JSON")
+    return EventBatchResponse.from_mapping(parsed)
+
+
 def _parse_json(payload: str) -> Any:
     if not payload:
         return None
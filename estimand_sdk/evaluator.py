@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Mapping, Sequence
+from operator import ge, gt, le, lt
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Sequence
 
 from .assignment import choose_variation, get_bucket_ranges, hash_value
 from .models import ConfigPayload, FeatureConfig, RuleConfig
@@ -16,6 +20,8 @@ REASON_VARIANT_FORCED = "forced_variation"
 REASON_RULE_MATCHED = "rule_matched"
 REASON_RULE_DEFAULT_MATCHED = "default_rule_matched"
 
+COMPILED_CONFIG_CACHE_SIZE = 8
+
 
 @dataclass(frozen=True)
 class EvaluationResult:
@@ -37,15 +43,7 @@ def evaluate_features(
 ) -> dict[str, EvaluationResult]:
     """Evaluate all feature keys in a config payload."""
 
-    return {
-        feature_key: evaluate_feature(
-            feature=feature,
-            feature_key=feature_key,
-            unit_id=unit_id,
-            context=context,
-        )
-        for feature_key, feature in config.features.items()
-    }
+    return compile_config(config).evaluate_all(unit_id, context)
 
 
 def evaluate_feature(
@@ -55,7 +53,11 @@ def evaluate_feature(
     unit_id: str,
     context: Mapping[str, Any] | None = None,
 ) -> EvaluationResult:
-    """Evaluate one feature against unit and context using local rule/assignment logic."""
+    """Evaluate one feature against unit and context using local rule/assignment logic.
+
+    This interprets ``feature`` from scratch on every call; the payload-level
+    helpers below go through :func:`compile_config` instead.
+    """
 
     if not feature.enabled:
         return EvaluationResult(
@@ -134,24 +136,7 @@ def evaluate_feature_from_payload(
 ) -> EvaluationResult:
     """Evaluate one feature by key from a parsed config payload."""
 
-    feature = config.features.get(feature_key)
-    if feature is None:
-        return EvaluationResult(
-            feature_key=feature_key,
-            variation_key=None,
-            value=None,
-            bucket=None,
-            variation_index=None,
-            reason=REASON_FEATURE_NOT_FOUND,
-            matched_rule_id=None,
-            is_default_rule=False,
-        )
-    return evaluate_feature(
-        feature=feature,
-        feature_key=feature_key,
-        unit_id=unit_id,
-        context=context,
-    )
+    return compile_config(config).evaluate(feature_key, unit_id, context)
 
 
 def _evaluate_rule(
@@ -330,3 +315,318 @@ def _as_float(value: Any) -> float | None:
 
 def config_default_value(variation_lookup: Mapping[str, Any]) -> Any:
     return variation_lookup.get("control")
+
+
+_Predicate = Callable[[Mapping[str, Any]], bool]
+_ValueCheck = Callable[[Any], bool]
+
+_NUMERIC_OPERATORS: dict[str, Callable[[float, float], bool]] = {
+    "gt": gt,
+    "gte": ge,
+    "lt": lt,
+    "lte": le,
+}
+
+
+class _CompiledRule:
+    """One targeting rule with its variations and bucket ranges resolved up front."""
+
+    __slots__ = (
+        "rule_id",
+        "is_default",
+        "_feature_key",
+        "_seed",
+        "_hash_version",
+        "_ranges",
+        "_variation_keys",
+        "_values",
+        "_reason",
+        "_static_result",
+    )
+
+    def __init__(
+        self,
+        *,
+        rule: RuleConfig,
+        feature_key: str,
+        feature_seed: str,
+        variation_lookup: Mapping[str, Any],
+        is_default: bool,
+    ) -> None:
+        self.rule_id = rule.id
+        self.is_default = is_default
+        self._feature_key = feature_key
+        self._seed = rule.seed or feature_seed
+        self._hash_version = rule.hash_version or 2
+        self._reason = REASON_RULE_DEFAULT_MATCHED if is_default else REASON_RULE_MATCHED
+        self._static_result: EvaluationResult | None = None
+
+        variation_keys = tuple(key for key in rule.variation_keys if key in variation_lookup)
+        default_value = config_default_value(variation_lookup)
+        self._variation_keys = variation_keys
+        self._values = tuple(variation_lookup.get(key, default_value) for key in variation_keys)
+        self._ranges: tuple[tuple[float, float], ...] = ()
+
+        if rule.force and rule.force in variation_lookup:
+            self._static_result = self._result(
+                rule.force,
+                variation_lookup.get(rule.force),
+                reason=REASON_VARIANT_FORCED,
+            )
+            return
+
+        if variation_keys:
+            self._ranges = tuple(
+                rule.ranges
+                or get_bucket_ranges(
+                    num_variations=len(variation_keys),
+                    coverage=rule.coverage,
+                    weights=rule.weights,
+                )
+            )
+        if not self._ranges:
+            self._static_result = self._result(None, None, reason=REASON_NO_VARIANTS)
+
+    def evaluate(self, unit_id: str) -> EvaluationResult:
+        if self._static_result is not None:
+            return self._static_result
+
+        bucket = hash_value(seed=self._seed, unit=unit_id, version=self._hash_version)
+        variation_index = choose_variation(bucket, self._ranges)
+        if variation_index < 0 or variation_index >= len(self._variation_keys):
+            return self._result(
+                None,
+                None,
+                reason=REASON_OUTSIDE_COVERAGE,
+                bucket=bucket,
+                variation_index=variation_index,
+            )
+        return self._result(
+            self._variation_keys[variation_index],
+            self._values[variation_index],
+            reason=self._reason,
+            bucket=bucket,
+            variation_index=variation_index,
+        )
+
+    def _result(
+        self,
+        variation_key: str | None,
+        value: Any | None,
+        *,
+        reason: str,
+        bucket: float | None = None,
+        variation_index: int | None = None,
+    ) -> EvaluationResult:
+        return EvaluationResult(
+            feature_key=self._feature_key,
+            variation_key=variation_key,
+            value=value,
+            bucket=bucket,
+            variation_index=variation_index,
+            reason=reason,
+            matched_rule_id=self.rule_id,
+            is_default_rule=self.is_default,
+        )
+
+
+class CompiledFeature:
+    """Precomputed evaluator for one feature; results match :func:`evaluate_feature`."""
+
+    __slots__ = ("feature_key", "_static_result", "_forced", "_rules", "_no_match")
+
+    def __init__(self, feature_key: str, feature: FeatureConfig) -> None:
+        self.feature_key = feature_key
+        self._static_result: EvaluationResult | None = None
+        self._forced: Mapping[str, EvaluationResult] = MappingProxyType({})
+        self._rules: tuple[tuple[_Predicate | None, _CompiledRule], ...] = ()
+        self._no_match = _empty_result(feature_key, REASON_NO_MATCHING_RULE)
+
+        if not feature.enabled:
+            self._static_result = _empty_result(feature_key, REASON_FEATURE_DISABLED)
+            return
+        if not feature.published:
+            self._static_result = _empty_result(feature_key, REASON_FEATURE_UNPUBLISHED)
+            return
+
+        variation_lookup = {variation.key: variation.value for variation in feature.variations}
+        self._forced = MappingProxyType(
+            {
+                unit_id: EvaluationResult(
+                    feature_key=feature_key,
+                    variation_key=variation_key,
+                    value=variation_lookup.get(variation_key),
+                    bucket=None,
+                    variation_index=None,
+                    reason=REASON_VARIANT_FORCED,
+                    matched_rule_id=None,
+                    is_default_rule=False,
+                )
+                for unit_id, variation_key in feature.forced_variations.items()
+                if variation_key in variation_lookup
+            }
+        )
+
+        ordered_rules = [(rule, False) for rule in feature.rules if not rule.is_default]
+        ordered_rules += [(rule, True) for rule in feature.rules if rule.is_default]
+        self._rules = tuple(
+            (
+                _compile_condition(rule.condition),
+                _CompiledRule(
+                    rule=rule,
+                    feature_key=feature_key,
+                    feature_seed=feature.seed,
+                    variation_lookup=variation_lookup,
+                    is_default=is_default,
+                ),
+            )
+            for rule, is_default in ordered_rules
+        )
+
+    def evaluate(self, unit_id: str, context: Mapping[str, Any] | None = None) -> EvaluationResult:
+        if self._static_result is not None:
+            return self._static_result
+
+        forced = self._forced.get(str(unit_id))
+        if forced is not None:
+            return forced
+
+        context = context or {}
+        for predicate, rule in self._rules:
+            if predicate is None or predicate(context):
+                return rule.evaluate(unit_id)
+        return self._no_match
+
+
+class CompiledConfig:
+    """All features of one config revision, ready for repeated evaluation."""
+
+    __slots__ = ("revision", "features")
+
+    def __init__(self, config: ConfigPayload) -> None:
+        self.revision = config.revision
+        self.features: Mapping[str, CompiledFeature] = MappingProxyType(
+            {
+                feature_key: CompiledFeature(feature_key, feature)
+                for feature_key, feature in config.features.items()
+            }
+        )
+
+    def evaluate(
+        self,
+        feature_key: str,
+        unit_id: str,
+        context: Mapping[str, Any] | None = None,
+    ) -> EvaluationResult:
+        feature = self.features.get(feature_key)
+        if feature is None:
+            return _empty_result(feature_key, REASON_FEATURE_NOT_FOUND)
+        return feature.evaluate(unit_id, context)
+
+    def evaluate_all(
+        self,
+        unit_id: str,
+        context: Mapping[str, Any] | None = None,
+    ) -> dict[str, EvaluationResult]:
+        return {
+            feature_key: feature.evaluate(unit_id, context)
+            for feature_key, feature in self.features.items()
+        }
+
+
+_compiled_configs: OrderedDict[str, tuple[ConfigPayload, CompiledConfig]] = OrderedDict()
+_compiled_configs_lock = threading.Lock()
+
+
+def compile_config(config: ConfigPayload) -> CompiledConfig:
+    """Return the compiled evaluator for ``config``, reused while its revision is unchanged.
+
+    A payload that carries a cached revision but different content (a server
+    that does not bump revisions, hand-built test payloads) is recompiled.
+    """
+
+    with _compiled_configs_lock:
+        cached = _compiled_configs.get(config.revision)
+        if cached is not None:
+            cached_payload, compiled = cached
+            if cached_payload is config or cached_payload == config:
+                # Keep the newest equal payload so later lookups hit the identity check.
+                _compiled_configs[config.revision] = (config, compiled)
+                _compiled_configs.move_to_end(config.revision)
+                return compiled
+
+    compiled = CompiledConfig(config)
+    with _compiled_configs_lock:
+        _compiled_configs[config.revision] = (config, compiled)
+        _compiled_configs.move_to_end(config.revision)
+        while len(_compiled_configs) > COMPILED_CONFIG_CACHE_SIZE:
+            _compiled_configs.popitem(last=False)
+    return compiled
+
+
+def _empty_result(feature_key: str, reason: str) -> EvaluationResult:
+    return EvaluationResult(
+        feature_key=feature_key,
+        variation_key=None,
+        value=None,
+        bucket=None,
+        variation_index=None,
+        reason=reason,
+        matched_rule_id=None,
+        is_default_rule=False,
+    )
+
+
+def _compile_condition(condition: Mapping[str, Any]) -> _Predicate | None:
+    """Compile a rule condition; ``None`` means the rule matches every context."""
+
+    if not condition:
+        return None
+    # Operator dicts are flattened into one check per operator, so a context
+    # value is tested with a flat loop instead of nested all() calls.
+    checks: list[tuple[str, _ValueCheck]] = []
+    for key, expected in condition.items():
+        if isinstance(expected, dict):
+            checks.extend((key, _compile_operator(name, value)) for name, value in expected.items())
+        else:
+            checks.append((key, _compile_expected(expected)))
+
+    def matches(context: Mapping[str, Any]) -> bool:
+        for key, check in checks:
+            if not check(context.get(key)):
+                return False
+        return True
+
+    return matches
+
+
+def _compile_expected(expected: Any) -> _ValueCheck:
+    if isinstance(expected, list):
+        members = tuple(expected)
+        return lambda actual: actual in members
+    return lambda actual: actual == expected
+
+
+def _compile_operator(name: str, expected: Any) -> _ValueCheck:
+    if name in {"in", "nin"}:
+        if not isinstance(expected, list):
+            return lambda _actual: False
+        members = tuple(expected)
+        if name == "in":
+            return lambda actual: actual in members
+        return lambda actual: actual not in members
+    if name == "ne":
+        return lambda actual: not actual == expected
+    if name == "eq":
+        return lambda actual: actual == expected
+
+    compare = _NUMERIC_OPERATORS.get(name)
+    expected_as_float = _as_float(expected)
+    if compare is None or expected_as_float is None:
+        return lambda _actual: False
+
+    def check(actual: Any) -> bool:
+        actual_as_float = _as_float(actual)
+        return actual_as_float is not None and compare(actual_as_float, expected_as_float)
+
+    return check
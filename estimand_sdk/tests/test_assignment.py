@@ -1,17 +1,61 @@
 from __future__ import annotations
 
+import random
+import string
 from unittest import TestCase
 
 from estimand_sdk.assignment import (
     AssignmentResult,
     assign,
+    assign_many,
     choose_variation,
     fnv1a32,
     get_bucket_ranges,
     hash_value,
+    hash_values,
 )
 
 
+def _reference_fnv1a32(value: str) -> int:
+    """The original shift-and-add implementation, kept as the parity oracle."""
+
+    hashed = 0x811C9DC5
+    encoded = value.encode("utf-16-le", "surrogatepass")
+    for index in range(0, len(encoded), 2):
+        code_unit = encoded[index] | (encoded[index + 1] << 8)
+        hashed ^= code_unit
+        hashed = (
+            hashed
+            + (hashed << 1)
+            + (hashed << 4)
+            + (hashed << 7)
+            + (hashed << 8)
+            + (hashed << 24)
+        )
+        hashed &= 0xFFFFFFFF
+    return hashed
+
+
+def _reference_hash_value(seed: str, unit: str, version: int) -> float:
+    if version == 1:
+        hashed = _reference_fnv1a32(f"{unit}{seed}")
+        return (hashed % 1000) / 1000
+    hashed = _reference_fnv1a32(str(_reference_fnv1a32(f"{seed}{unit}")))
+    return (hashed % 10000) / 10000
+
+
+def _sample_units(count: int) -> list[str]:
+    rng = random.Random(20240601)
+    alphabet = string.ascii_letters + string.digits + "-_:. \x00éßжあ\U0001f600\U0001f680"
+    units = ["", "0", "user_123", "\U0001f600", "a\x00"]
+    units += [str(telegram_id) for telegram_id in rng.sample(range(1, 8_000_000_000), count // 2)]
+    units += [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 24)))
+        for _ in range(count - len(units))
+    ]
+    return units
+
+
 class AssignmentAlgorithmTestCase(TestCase):
     def test_fnv1a32_matches_reference_vectors(self) -> None:
         self.assertEqual(fnv1a32("checkout-redesignuser_123"), 3369010751)
@@ -61,3 +105,49 @@ class AssignmentAlgorithmTestCase(TestCase):
         self.assertEqual(choose_variation(0.25, ranges), 1)
         self.assertEqual(choose_variation(0.0, ranges), 0)
         self.assertEqual(choose_variation(0.5, ranges), -1)
+
+
+class AssignmentParityTestCase(TestCase):
+    seeds = ("", "checkout-redesign", "trial_offer_v1", "сид-\U0001f600")
+    units = _sample_units(2000)
+
+    def test_fnv1a32_matches_reference_implementation(self) -> None:
+        for value in self.units:
+            self.assertEqual(fnv1a32(value), _reference_fnv1a32(value), value)
+
+    def test_hash_value_matches_reference_implementation(self) -> None:
+        for version in (1, 2):
+            for seed in self.seeds:
+                for unit in self.units[:500]:
+                    self.assertEqual(
+                        hash_value(seed, unit, version=version),
+                        _reference_hash_value(seed, unit, version),
+                    )
+
+    def test_hash_values_match_hash_value(self) -> None:
+        for version in (1, 2):
+            for seed in self.seeds:
+                self.assertEqual(
+                    hash_values(seed, self.units, version=version),
+                    [_reference_hash_value(seed, unit, version) for unit in self.units],
+                )
+
+    def test_assign_many_matches_assign(self) -> None:
+        options = {"num_variations": 3, "coverage": 0.8, "weights": [0.2, 0.3, 0.5]}
+        result = assign_many(seed="intro-price", unit_ids=self.units, **options)
+
+        expected = [assign(seed="intro-price", unit=unit, **options) for unit in self.units]
+        self.assertEqual(result.buckets, [item.bucket for item in expected])
+        self.assertEqual(result.variation_indexes, [item.variation_index for item in expected])
+        self.assertEqual(result.ranges, expected[0].ranges)
+        self.assertIn(-1, result.variation_indexes)
+
+    def test_assign_many_single_unit(self) -> None:
+        result = assign_many(seed="checkout-redesign", unit_ids=["user_42"], num_variations=2, weights=[0.25, 0.75])
+
+        self.assertEqual(result.buckets, [0.9493])
+        self.assertEqual(result.variation_indexes, [1])
+
+    def test_hash_values_rejects_unknown_version(self) -> None:
+        with self.assertRaises(ValueError):
+            hash_values("seed", ["unit"], version=3)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable
+from unittest import IsolatedAsyncioTestCase
+
+import httpx
+
+from estimand_sdk import AsyncEstimandClient, ConfigCacheMissError, EstimandClientConfig, EstimandSDKHTTPError
+
+_ACCEPTED = {"status": "accepted", "code": "events_accepted", "ingested": 1, "deduplicated": 0}
+
+
+def _make_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    *,
+    buffer_size: int = 100,
+    batch_size: int = 10,
+    flush_interval: float = 60.0,
+    dropped: list[tuple[int, str]] | None = None,
+    flushed: list[int] | None = None,
+) -> AsyncEstimandClient:
+    return AsyncEstimandClient(
+        EstimandClientConfig(
+            base_url="https://estimand.app",
+            api_key="esk_test",
+            request_timeout=1.0,
+            retries=1,
+            retry_backoff_seconds=0,
+            event_buffer_size=buffer_size,
+            event_batch_size=batch_size,
+            event_flush_interval=flush_interval,
+        ),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        on_events_dropped=(lambda count, reason: dropped.append((count, reason))) if dropped is not None else None,
+        on_events_flushed=flushed.append if flushed is not None else None,
+    )
+
+
+def _event_recorder(batches: list[list[dict[str, Any]]]) -> Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        batches.append(json.loads(request.content)["events"])
+        return httpx.Response(202, json=_ACCEPTED)
+
+    return handler
+
+
+def _track(client: AsyncEstimandClient, unit_id: str) -> None:
+    client.track_exposure(
+        project_id="p",
+        environment_id="e",
+        feature_id="f",
+        unit_id=unit_id,
+        variant_key="on",
+    )
+
+
+class AsyncClientConfigTestCase(IsolatedAsyncioTestCase):
+    scope = {"organization_id": "org-1", "project_id": "proj-1", "environment_id": "env-1"}
+
+    async def test_fetch_config_uses_etag_cache(self) -> None:
+        seen_etags: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match"):
+                return httpx.Response(304, headers={"ETag": 'W/"rev-1"'})
+            return httpx.Response(200, json={"revision": "rev-1", "features": {}}, headers={"ETag": 'W/"rev-1"'})
+
+        client = _make_client(handler)
+        first = await client.fetch_config(**self.scope)
+        second = await client.fetch_config(**self.scope)
+        await client.aclose()
+
+        self.assertEqual(first.revision, "rev-1")
+        self.assertIs(second, first)
+        self.assertEqual(seen_etags, [None, 'W/"rev-1"'])
+
+    async def test_304_without_cache_fails_fast(self) -> None:
+        client = _make_client(lambda _request: httpx.Response(304))
+
+        with self.assertRaises(ConfigCacheMissError):
+            await client.fetch_config(**self.scope)
+        await client.aclose()
+
+    async def test_retries_then_raises_http_error(self) -> None:
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503, json={"status": "error"})
+
+        client = _make_client(handler)
+        with self.assertRaises(EstimandSDKHTTPError):
+            await client.fetch_config(**self.scope)
+        await client.aclose()
+
+        self.assertEqual(calls, 2)
+
+
+class AsyncClientBufferTestCase(IsolatedAsyncioTestCase):
+    async def test_track_does_not_send_until_batch_is_full(self) -> None:
+        batches: list[list[dict[str, Any]]] = []
+        flushed: list[int] = []
+        client = _make_client(_event_recorder(batches), batch_size=3, flushed=flushed)
+
+        _track(client, "u1")
+        _track(client, "u2")
+        await asyncio.sleep(0.01)
+        self.assertEqual(batches, [])
+
+        _track(client, "u3")
+        await asyncio.sleep(0.01)
+        await client.aclose()
+
+        self.assertEqual([[event["unit_id"] for event in batch] for batch in batches], [["u1", "u2", "u3"]])
+        self.assertEqual(flushed, [3])
+
+    async def test_partial_batch_is_sent_after_flush_interval(self) -> None:
+        batches: list[list[dict[str, Any]]] = []
+        client = _make_client(_event_recorder(batches), batch_size=100, flush_interval=0.02)
+
+        _track(client, "u1")
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(len(batches), 1)
+        await client.aclose()
+
+    async def test_full_buffer_drops_new_events(self) -> None:
+        dropped: list[tuple[int, str]] = []
+        client = _make_client(_event_recorder([]), buffer_size=2, dropped=dropped)
+
+        _track(client, "u1")
+        _track(client, "u2")
+        _track(client, "u3")
+
+        self.assertEqual(dropped, [(1, "buffer_full")])
+        await client.aclose()
+
+    async def test_aclose_flushes_buffer_and_rejects_new_events(self) -> None:
+        batches: list[list[dict[str, Any]]] = []
+        dropped: list[tuple[int, str]] = []
+        client = _make_client(_event_recorder(batches), batch_size=2, dropped=dropped)
+
+        for unit_id in ("u1", "u2", "u3", "u4", "u5"):
+            _track(client, unit_id)
+        await client.aclose()
+        _track(client, "late")
+
+        sent = [event["unit_id"] for batch in batches for event in batch]
+        self.assertEqual(sent, ["u1", "u2", "u3", "u4", "u5"])
+        self.assertTrue(all(len(batch) <= 2 for batch in batches))
+        self.assertEqual(dropped, [(1, "closed")])
+        self.assertEqual(client.buffered, 0)
+
+    async def test_failed_delivery_is_reported_as_dropped(self) -> None:
+        dropped: list[tuple[int, str]] = []
+        client = _make_client(lambda _request: httpx.Response(500), batch_size=2, dropped=dropped)
+
+        _track(client, "u1")
+        _track(client, "u2")
+        await asyncio.sleep(0.01)
+        await client.aclose()
+
+        self.assertEqual(dropped, [(2, "send_failed")])
@@ -8,7 +8,10 @@ from estimand_sdk import (
     REASON_NO_MATCHING_RULE,
     REASON_RULE_MATCHED,
     REASON_VARIANT_FORCED,
+    CompiledConfig,
     ConfigPayload,
+    compile_config,
+    evaluate_feature,
     evaluate_feature_from_payload,
     evaluate_features,
 )
@@ -229,3 +232,118 @@ class EvaluatorTestCase(TestCase):
         )
         self.assertEqual(result.feature_key, "missing")
         self.assertEqual(result.reason, "feature_not_found")
+
+
+class CompiledEvaluatorTestCase(TestCase):
+    def _rule(self, rule_id: str, **overrides: object) -> RuleConfig:
+        fields: dict = {
+            "id": rule_id,
+            "condition": {},
+            "variation_keys": ["control", "treatment", "holdout"],
+            "coverage": 1.0,
+            "priority": 1,
+            "is_default": False,
+            "force": None,
+            "seed": "",
+            "hash_version": 2,
+            "weights": None,
+            "ranges": None,
+        }
+        fields.update(overrides)
+        return RuleConfig(**fields)
+
+    def _feature(self, rules: list[RuleConfig], **overrides: object) -> FeatureConfig:
+        fields: dict = {
+            "type": "experiment",
+            "default_value": None,
+            "seed": "pricing-v1",
+            "unit_type": "telegram_id",
+            "enabled": True,
+            "published": True,
+            "variations": [
+                VariationConfig(key=key, name=key, value={"key": key}, weight=1, is_control=False, description="")
+                for key in ("control", "treatment")
+            ],
+            "rules": rules,
+            "forced_variations": {"unit-7": "treatment", "unit-8": "missing"},
+        }
+        fields.update(overrides)
+        return FeatureConfig(**fields)
+
+    def _config(self, revision: str = "rev-compiled") -> ConfigPayload:
+        return ConfigPayload(
+            revision=revision,
+            features={
+                "targeted": self._feature(
+                    [
+                        self._rule("default", is_default=True, coverage=0.5, weights=[70, 30, 0]),
+                        self._rule(
+                            "ru-new",
+                            condition={
+                                "language": {"in": ["ru", "uk"]},
+                                "days": {"lt": 7, "gte": "1"},
+                                "platform": {"ne": "web"},
+                                "tier": ["start", "pro"],
+                            },
+                            seed="ru-new",
+                            hash_version=1,
+                        ),
+                        self._rule("excluded", condition={"country": {"nin": ["RU"], "bogus": 1}}),
+                    ]
+                ),
+                "forced_rule": self._feature([self._rule("force", force="control")]),
+                "explicit_ranges": self._feature(
+                    [self._rule("ranges", ranges=[(0.0, 0.2), (0.2, 0.4)], variation_keys=["control", "treatment"])]
+                ),
+                "no_variants": self._feature([self._rule("empty", variation_keys=["unknown"])]),
+                "disabled": self._feature([self._rule("r")], enabled=False),
+                "unpublished": self._feature([self._rule("r")], published=False),
+            },
+        )
+
+    def test_compiled_results_match_interpreted_evaluator(self) -> None:
+        payload = self._config()
+        compiled = compile_config(payload)
+        contexts = [
+            {},
+            {"language": "ru", "days": 3, "platform": "ios", "tier": "pro"},
+            {"language": "ru", "days": "0", "platform": "ios", "tier": "pro"},
+            {"language": "uk", "days": 6.5, "platform": "web", "tier": "start"},
+            {"language": "en", "days": None, "country": "DE"},
+            {"country": "US"},
+        ]
+        for unit_id in [f"unit-{index}" for index in range(200)]:
+            for context in contexts:
+                for feature_key, feature in payload.features.items():
+                    expected = evaluate_feature(
+                        feature=feature,
+                        feature_key=feature_key,
+                        unit_id=unit_id,
+                        context=context,
+                    )
+                    self.assertEqual(compiled.evaluate(feature_key, unit_id, context), expected)
+
+    def test_compiled_config_is_cached_by_revision(self) -> None:
+        payload = self._config(revision="rev-cache")
+
+        first = compile_config(payload)
+
+        self.assertIsInstance(first, CompiledConfig)
+        self.assertIs(compile_config(payload), first)
+        self.assertIs(compile_config(self._config(revision="rev-cache")), first)
+
+    def test_changed_payload_with_same_revision_is_recompiled(self) -> None:
+        payload = self._config(revision="rev-reused")
+        first = compile_config(payload)
+        changed = ConfigPayload(
+            revision="rev-reused",
+            features={"targeted": self._feature([self._rule("only", force="treatment")])},
+        )
+
+        second = compile_config(changed)
+
+        self.assertIsNot(second, first)
+        self.assertEqual(
+            evaluate_feature_from_payload(config=changed, feature_key="targeted", unit_id="u1").variation_key,
+            "treatment",
+        )
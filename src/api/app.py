@@ -7,6 +7,7 @@ from src.api.endpoints import (
     TelegramWebhookEndpoint,
     health_router,
 )
+from src.api.update_executor import UpdateExecutor
 from src.core.config import AppConfig
 from src.lifespan import lifespan
 
@@ -34,6 +35,12 @@ def create_app(config: AppConfig, dispatcher: Dispatcher) -> FastAPI:
     telegram_webhook_endpoint = TelegramWebhookEndpoint(
         dispatcher=dispatcher,
         secret_token=config.bot.secret_token.get_secret_value(),
+        executor=UpdateExecutor(
+            concurrency=config.bot.update_concurrency,
+            user_queue_size=config.bot.update_user_queue_size,
+            max_queued=config.bot.update_max_queued,
+            shed_policy=config.bot.update_shed_policy,
+        ),
     )
     telegram_webhook_endpoint.register(app=app, path=config.bot.webhook_path)
     app.state.telegram_webhook_endpoint = telegram_webhook_endpoint
@@ -1,39 +1,41 @@
-import asyncio
 import secrets
 import time
-from typing import Annotated, Any
+from typing import Annotated, Optional
 
 from aiogram import Bot, Dispatcher
 from aiogram.methods import TelegramMethod
 from aiogram.types import Update
+from aiogram.types.update import UpdateTypeLookupError
 from dishka.integrations.fastapi import FromDishka, inject
 from fastapi import Body, FastAPI, Header, HTTPException, Response, status
 from loguru import logger
 
+from src.api.update_executor import UpdateExecutor, update_sender_id
+from src.core.enums import UpdateShedPolicy
 from src.core.metrics import UPDATE_PROCESSING_TIME, UPDATES_TOTAL
 
 
 class TelegramWebhookEndpoint:
     dispatcher: Dispatcher
     secret_token: str
-    _feed_update_tasks: set[asyncio.Task[Any]]
+    executor: UpdateExecutor
 
-    def __init__(self, dispatcher: Dispatcher, secret_token: str) -> None:
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        secret_token: str,
+        executor: Optional[UpdateExecutor] = None,
+    ) -> None:
         self.dispatcher = dispatcher
         self.secret_token = secret_token
-        self._feed_update_tasks = set()
+        self.executor = executor or UpdateExecutor()
 
     async def startup(self) -> None:
         await self.dispatcher.emit_startup(**self.dispatcher.workflow_data)
 
     async def shutdown(self) -> None:
         await self.dispatcher.emit_shutdown(**self.dispatcher.workflow_data)
-
-        for task in list(self._feed_update_tasks):
-            if not task.done():
-                task.cancel()
-
-        await asyncio.gather(*self._feed_update_tasks, return_exceptions=True)
+        await self.executor.shutdown()
 
     def register(self, app: FastAPI, path: str) -> None:
         app.add_api_route(path=path, endpoint=self._handle_request, methods=["POST"])
@@ -42,7 +44,10 @@ class TelegramWebhookEndpoint:
         return secrets.compare_digest(telegram_secret_token, self.secret_token)
 
     async def _feed_update(self, bot: Bot, update: Update) -> None:
-        update_type = update.event_type
+        try:
+            update_type = update.event_type
+        except UpdateTypeLookupError:
+            update_type = "unknown"
         UPDATES_TOTAL.labels(update_type=update_type).inc()
         start = time.monotonic()
         result = await self.dispatcher.feed_update(bot=bot, update=update)
@@ -62,9 +67,13 @@ class TelegramWebhookEndpoint:
             logger.warning(f"Invalid secret token for update '{update.update_id}'")
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
 
-        task = asyncio.create_task(self._feed_update(bot=bot, update=update))
-        self._feed_update_tasks.add(task)
-        task.add_done_callback(self._feed_update_tasks.discard)
+        accepted = self.executor.submit(
+            update_sender_id(update),
+            lambda: self._feed_update(bot=bot, update=update),
+        )
+        if not accepted and self.executor.shed_policy is UpdateShedPolicy.REJECT:
+            # Telegram redelivers updates that were not answered with 2xx
+            return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
         logger.debug(f"Update '{update.update_id}' scheduled for processing")
         return Response(status_code=status.HTTP_200_OK)
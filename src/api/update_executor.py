@@ -0,0 +1,146 @@
+"""Bounded executor for webhook updates.
+
+Each update is queued under its sender's ``telegram_id`` and the per-user
+queues are drained one update at a time, so two quick clicks from the same
+user are handled in the order Telegram delivered them. Different users run
+in parallel, capped by a global concurrency limit. Updates without a sender
+(e.g. channel posts) bypass the per-user queues but still count against the
+limits.
+
+When a user's queue or the global backlog is full the update is shed
+according to ``UpdateShedPolicy``.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Coroutine, Optional
+
+from aiogram.types import Update
+from aiogram.types.update import UpdateTypeLookupError
+from loguru import logger
+
+from src.core.enums import UpdateShedPolicy
+from src.core.metrics import (
+    UPDATE_QUEUE_DEPTH,
+    UPDATE_QUEUE_WAIT_TIME,
+    UPDATES_IN_FLIGHT,
+    UPDATES_SHED_TOTAL,
+)
+
+UpdateJob = Callable[[], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class _QueuedUpdate:
+    run: UpdateJob
+    enqueued_at: float
+
+
+def update_sender_id(update: Update) -> Optional[int]:
+    try:
+        event = update.event
+    except UpdateTypeLookupError:
+        # An update type this aiogram version does not know; run it unordered
+        return None
+    user = getattr(event, "from_user", None)
+    return user.id if user else None
+
+
+class UpdateExecutor:
+    def __init__(
+        self,
+        *,
+        concurrency: int = 100,
+        user_queue_size: int = 10,
+        max_queued: int = 5_000,
+        shed_policy: UpdateShedPolicy = UpdateShedPolicy.REJECT,
+    ) -> None:
+        self.shed_policy = shed_policy
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._user_queue_size = user_queue_size
+        self._max_queued = max_queued
+        self._queues: dict[int, deque[_QueuedUpdate]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._queued = 0
+        self._closed = False
+
+    @property
+    def queued(self) -> int:
+        """Accepted updates that have not started running yet."""
+        return self._queued
+
+    def submit(self, sender_id: Optional[int], run: UpdateJob) -> bool:
+        """Queue ``run`` behind the sender's earlier updates; False if it was shed."""
+        if self._closed:
+            return False
+
+        queue = self._queues.get(sender_id) if sender_id is not None else None
+        if queue is not None and len(queue) >= self._user_queue_size:
+            if self.shed_policy is not UpdateShedPolicy.DROP_OLDEST:
+                return self._shed("user_queue_full")
+            queue.popleft()
+            self._set_queued(self._queued - 1)
+            self._shed("user_queue_full")
+        elif self._queued >= self._max_queued:
+            return self._shed("backlog_full")
+
+        item = _QueuedUpdate(run=run, enqueued_at=time.monotonic())
+        self._set_queued(self._queued + 1)
+
+        if sender_id is None:
+            self._spawn(self._run(item))
+        elif queue is None:
+            self._queues[sender_id] = deque([item])
+            self._spawn(self._drain(sender_id))
+        else:
+            queue.append(item)
+        return True
+
+    async def shutdown(self) -> None:
+        """Stop accepting updates and cancel everything queued or running."""
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self, sender_id: int) -> None:
+        queue = self._queues[sender_id]
+        try:
+            while queue:
+                await self._run(queue.popleft())
+        finally:
+            # Only reached with updates left when cancelled on shutdown
+            self._set_queued(self._queued - len(queue))
+            del self._queues[sender_id]
+
+    async def _run(self, item: _QueuedUpdate) -> None:
+        started = False
+        try:
+            async with self._semaphore:
+                started = True
+                self._set_queued(self._queued - 1)
+                UPDATE_QUEUE_WAIT_TIME.observe(time.monotonic() - item.enqueued_at)
+                with UPDATES_IN_FLIGHT.track_inprogress():
+                    await item.run()
+        except asyncio.CancelledError:
+            if not started:
+                self._set_queued(self._queued - 1)
+            raise
+        except Exception as exception:
+            logger.exception(f"Unhandled error while processing update: {exception}")
+
+    def _shed(self, reason: str) -> bool:
+        UPDATES_SHED_TOTAL.labels(reason=reason, policy=self.shed_policy.value).inc()
+        logger.debug(f"Update shed ({reason}, policy '{self.shed_policy}')")
+        return False
+
+    def _set_queued(self, value: int) -> None:
+        self._queued = value
+        UPDATE_QUEUE_DEPTH.set(value)
@@ -1,25 +1,103 @@
-from typing import Any, Awaitable, Callable
+"""Per-user flood protection for incoming messages and button presses.
 
-from aiogram.types import TelegramObject
-from cachetools import TTLCache
+Each user gets a budget per event type, enforced with GCRA: an event is let
+through while the user's theoretical arrival time (TAT) is no more than one
+period ahead of now. With the REDIS backend the TAT lives in Redis and is
+checked and advanced by one Lua call, so every process and replica shares the
+budget. The MEMORY backend keeps the same state in the process instead.
+
+A throttled event is dropped. The user is told to slow down at most once per
+``warning_interval``, so a flood does not turn into a flood of replies.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from aiogram.types import CallbackQuery, TelegramObject
 from dishka import AsyncContainer
 from loguru import logger
+from redis.exceptions import RedisError
 
+from src.core.config import AppConfig
 from src.core.constants import CONTAINER_KEY, USER_KEY
-from src.core.enums import MiddlewareEventType
+from src.core.enums import MiddlewareEventType, ThrottlingBackend
 from src.core.metrics import THROTTLED_REQUESTS_TOTAL
+from src.core.storage.keys import ThrottlingKey, ThrottlingWarningKey
 from src.core.utils.message_payload import MessagePayload
+from src.infrastructure.redis.repository import RedisRepository
 from src.models.dto import UserDto
 from src.services.notification import NotificationService
 
 from .base import EventTypedMiddleware
 
+# KEYS: TAT key, warning key. ARGV: emission interval, burst tolerance and
+# warning interval, all in milliseconds. Returns {allowed, warn}.
+_GCRA_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = math.max(tonumber(redis.call('GET', KEYS[1])) or now, now)
+local retry_after = tat - tolerance - now
+if retry_after > 0 then
+    local warning_ttl = math.max(retry_after, tonumber(ARGV[3]))
+    if redis.call('SET', KEYS[2], 1, 'NX', 'PX', warning_ttl) then
+        return {0, 1}
+    end
+    return {0, 0}
+end
+redis.call('SET', KEYS[1], tat + interval, 'PX', tat + interval - now)
+return {1, 0}
+"""
+
+# How often the memory backend drops state that has run out
+_PRUNE_INTERVAL = 1.0
+
+
+class MemoryThrottle:
+    """Process-local GCRA state; expired entries are pruned, never evicted early."""
+
+    def __init__(self) -> None:
+        self.tats: dict[tuple[int, str], float] = {}
+        self.warnings: dict[int, float] = {}
+        self._next_prune = 0.0
+
+    def hit(
+        self,
+        telegram_id: int,
+        event_type: str,
+        interval: float,
+        tolerance: float,
+        warning_interval: float,
+    ) -> tuple[bool, bool]:
+        now = time.monotonic()
+        self._prune(now)
+
+        key = (telegram_id, event_type)
+        tat = max(self.tats.get(key, now), now)
+        retry_after = tat - tolerance - now
+        if retry_after > 0:
+            if self.warnings.get(telegram_id, 0.0) > now:
+                return False, False
+            self.warnings[telegram_id] = now + max(retry_after, warning_interval)
+            return False, True
+
+        self.tats[key] = tat + interval
+        return True, False
+
+    def _prune(self, now: float) -> None:
+        if now < self._next_prune:
+            return
+        self._next_prune = now + _PRUNE_INTERVAL
+        self.tats = {key: tat for key, tat in self.tats.items() if tat > now}
+        self.warnings = {key: until for key, until in self.warnings.items() if until > now}
+
 
 class ThrottlingMiddleware(EventTypedMiddleware):
     __event_types__ = [MiddlewareEventType.MESSAGE, MiddlewareEventType.CALLBACK_QUERY]
 
-    def __init__(self, ttl: float = 0.5) -> None:
-        self.cache: TTLCache[int, Any] = TTLCache(maxsize=10_000, ttl=ttl)
+    def __init__(self) -> None:
+        self.memory = MemoryThrottle()
 
     async def middleware_logic(
         self,
@@ -29,17 +107,73 @@ class ThrottlingMiddleware(EventTypedMiddleware):
     ) -> Any:
         container: AsyncContainer = data[CONTAINER_KEY]
         user: UserDto = data[USER_KEY]
+        config: AppConfig = await container.get(AppConfig)
+
+        if isinstance(event, CallbackQuery):
+            event_type = MiddlewareEventType.CALLBACK_QUERY
+            limit = config.bot.throttling_callback_limit
+        else:
+            event_type = MiddlewareEventType.MESSAGE
+            limit = config.bot.throttling_message_limit
+
+        interval = config.bot.throttling_period / max(limit, 1)
+        tolerance = config.bot.throttling_period - interval
+        warning_interval = config.bot.throttling_warning_interval
 
-        notification_service: NotificationService = await container.get(NotificationService)
+        if config.bot.throttling_backend == ThrottlingBackend.MEMORY:
+            allowed, warn = self.memory.hit(
+                user.telegram_id, event_type, interval, tolerance, warning_interval
+            )
+        else:
+            redis_repository: RedisRepository = await container.get(RedisRepository)
+            result = await self._hit_redis(
+                redis_repository,
+                user.telegram_id,
+                event_type,
+                interval,
+                tolerance,
+                warning_interval,
+            )
+            if result is None:
+                return await handler(event, data)
+            allowed, warn = result
+
+        if allowed:
+            return await handler(event, data)
 
-        if user.telegram_id in self.cache:
-            THROTTLED_REQUESTS_TOTAL.inc()
+        THROTTLED_REQUESTS_TOTAL.inc()
+        if warn:
+            notification_service: NotificationService = await container.get(NotificationService)
             await notification_service.notify_user(
                 user=user,
                 payload=MessagePayload(i18n_key="ntf-throttling-many-requests"),
             )
-            logger.warning(f"User '{user.telegram_id}' throttled")
-            return
+            logger.warning(f"User '{user.telegram_id}' throttled on {event_type}")
 
-        self.cache[user.telegram_id] = None
-        return await handler(event, data)
+    @staticmethod
+    async def _hit_redis(
+        redis_repository: RedisRepository,
+        telegram_id: int,
+        event_type: str,
+        interval: float,
+        tolerance: float,
+        warning_interval: float,
+    ) -> Optional[tuple[bool, bool]]:
+        """Run one GCRA step in Redis; ``None`` when Redis is unavailable (fail open)."""
+        keys = [
+            ThrottlingKey(telegram_id=telegram_id, event_type=event_type).pack(),
+            ThrottlingWarningKey(telegram_id=telegram_id).pack(),
+        ]
+        args = [
+            round(interval * 1000),
+            round(tolerance * 1000),
+            round(warning_interval * 1000),
+        ]
+        try:
+            allowed, warn = await redis_repository.run_script(_GCRA_SCRIPT, keys, args)
+        except RedisError as exception:
+            logger.warning(
+                f"Throttling unavailable, letting user '{telegram_id}' through: {exception}"
+            )
+            return None
+        return bool(allowed), bool(warn)
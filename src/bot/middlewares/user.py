@@ -18,10 +18,10 @@ from src.core.enums import MiddlewareEventType, SystemNotificationType
 from src.core.metrics import NEW_USERS_TOTAL
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.billing import BillingClient
-from src.infrastructure.billing.converters import billing_subscription_to_dto
 from src.models.dto import UserDto
 from src.services.notification import NotificationService
 from src.services.referral import ReferralService
+from src.services.subscription import SubscriptionService
 from src.services.user import UserService
 
 from .base import EventTypedMiddleware
@@ -54,6 +54,7 @@ class UserMiddleware(EventTypedMiddleware):
         config: AppConfig = await container.get(AppConfig)
         user_service: UserService = await container.get(UserService)
         referral_service: ReferralService = await container.get(ReferralService)
+        subscription_service: SubscriptionService = await container.get(SubscriptionService)
         user: Optional[UserDto] = await user_service.get(telegram_id=aiogram_user.id)
 
         billing: BillingClient = await container.get(BillingClient)
@@ -113,13 +114,10 @@ class UserMiddleware(EventTypedMiddleware):
 
         await user_service.update_recent_activity(telegram_id=user.telegram_id)
 
-        # Replace ORM-loaded subscription with billing API version (has derived expiry)
+        # Served from the subscription cache; invalidated by the shop's own writes
+        # and by billing's subscription/payment events (SubscriptionCacheConsumer).
         try:
-            billing_sub = await billing.get_current_subscription(user.telegram_id)
-            if billing_sub:
-                user.current_subscription = billing_subscription_to_dto(billing_sub)
-            else:
-                user.current_subscription = None
+            user.current_subscription = await subscription_service.get_current(user.telegram_id)
         except Exception:
             logger.opt(exception=True).warning(
                 "Failed to fetch subscription from billing API, using ORM value"
@@ -2,7 +2,7 @@
 
 Used by the emergency user-management dialog for on_content_input / on_preview
 (DashboardUser.MESSAGE window), allowing admins to send a message to a
-specific user.
+specific user, and by the /broadcast command to read its content.
 """
 
 from __future__ import annotations
@@ -26,6 +26,34 @@ from src.models.dto import UserDto
 from src.services.notification import NotificationService
 
 
+def extract_message_content(message: Message) -> Optional[dict[str, Any]]:
+    """MessagePayload fields carrying the text and media of ``message``; None if empty."""
+    media_type: Optional[MediaType] = None
+    file_id: Optional[str] = None
+
+    if message.photo:
+        media_type = MediaType.PHOTO
+        file_id = message.photo[-1].file_id
+    elif message.video:
+        media_type = MediaType.VIDEO
+        file_id = message.video.file_id
+    elif message.document:
+        media_type = MediaType.DOCUMENT
+        file_id = message.document.file_id
+    elif message.sticker:
+        media_type = MediaType.DOCUMENT
+        file_id = message.sticker.file_id
+
+    if not (message.html_text or file_id):
+        return None
+
+    return {
+        "i18n_kwargs": {"content": html.unescape(message.html_text)},
+        "media_type": media_type,
+        "media_id": file_id,
+    }
+
+
 def _update_payload(dialog_manager: DialogManager, **updates: Any) -> MessagePayload:
     raw_payload = dialog_manager.dialog_data.get("payload")
 
@@ -59,23 +87,8 @@ async def on_content_input(
     user: UserDto = dialog_manager.middleware_data[USER_KEY]
     logger.debug(f"{log(user)} Attempted to set content")
 
-    media_type: Optional[MediaType] = None
-    file_id: Optional[str] = None
-
-    if message.photo:
-        media_type = MediaType.PHOTO
-        file_id = message.photo[-1].file_id
-    elif message.video:
-        media_type = MediaType.VIDEO
-        file_id = message.video.file_id
-    elif message.document:
-        media_type = MediaType.DOCUMENT
-        file_id = message.document.file_id
-    elif message.sticker:
-        media_type = MediaType.DOCUMENT
-        file_id = message.sticker.file_id
-
-    if not (message.html_text or file_id):
+    content = extract_message_content(message)
+    if content is None:
         logger.warning(f"{log(user)} Provided invalid or empty content")
         await notification_service.notify_user(
             user=user,
@@ -83,12 +96,7 @@ async def on_content_input(
         )
         return
 
-    _update_payload(
-        dialog_manager,
-        i18n_kwargs={"content": html.unescape(message.html_text)},
-        media_type=media_type,
-        media_id=file_id,
-    )
+    _update_payload(dialog_manager, **content)
 
     logger.info(f"{log(user)} Updated message payload (content only)")
     await notification_service.notify_user(
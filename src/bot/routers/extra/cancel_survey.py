@@ -69,29 +69,29 @@ async def _resolve_gateway(billing: BillingClient, payment_id: str) -> str:
     return transaction.GatewayType if transaction else "UNKNOWN"
 
 
-def _track_survey_event(
+async def _track_survey_event(
     *,
     experiment_service: ExperimentService,
     user: UserDto,
     event: str,
 ) -> None:
     try:
-        experiment_service.record_conversion(
+        await experiment_service.record_conversion(
             _SURVEY_EXPERIMENT_KEY,
             user.telegram_id,
             event,
             created_at=user.created_at,
         )
     except TypeError:
-        experiment_service.record_conversion(_SURVEY_EXPERIMENT_KEY, user.telegram_id, event)
+        await experiment_service.record_conversion(_SURVEY_EXPERIMENT_KEY, user.telegram_id, event)
 
 
-def _track_rescue_clicked(
+async def _track_rescue_clicked(
     *,
     experiment_service: ExperimentService,
     user: UserDto,
 ) -> None:
-    _track_survey_event(
+    await _track_survey_event(
         experiment_service=experiment_service,
         user=user,
         event="rescue_clicked",
@@ -124,7 +124,7 @@ async def on_cancel_survey_answer(
         reason = CancelSurveyReason(reason_value)
     except ValueError:
         logger.warning(f"{log(user)} Unknown cancel-survey reason '{reason_value}'")
-        _track_rescue_clicked(experiment_service=experiment_service, user=user)
+        await _track_rescue_clicked(experiment_service=experiment_service, user=user)
         await callback.answer()
         return
 
@@ -132,18 +132,18 @@ async def on_cancel_survey_answer(
         payment_uuid = UUID(payment_id)
     except ValueError:
         logger.warning(f"{log(user)} Invalid cancel-survey payment id '{payment_id}'")
-        _track_rescue_clicked(experiment_service=experiment_service, user=user)
+        await _track_rescue_clicked(experiment_service=experiment_service, user=user)
         await callback.answer()
         return
 
     answer_key = CancelSurveyAnswerKey(payment_id=payment_uuid)
 
     if await redis_client.exists(answer_key.pack()):
-        _track_rescue_clicked(experiment_service=experiment_service, user=user)
+        await _track_rescue_clicked(experiment_service=experiment_service, user=user)
         await callback.answer(text=i18n.get("msg-cancel-survey-already-answered"))
         return
 
-    _track_rescue_clicked(experiment_service=experiment_service, user=user)
+    await _track_rescue_clicked(experiment_service=experiment_service, user=user)
 
     if reason == CancelSurveyReason.OTHER:
         awaiting_key = CancelSurveyAwaitingTextKey(telegram_id=user.telegram_id)
@@ -171,7 +171,7 @@ async def on_cancel_survey_answer(
     )
     await redis_client.expire(answer_key.pack(), _ANSWER_TTL)
     CANCEL_SURVEY_ANSWERS_TOTAL.labels(reason=reason.value, gateway=gateway).inc()
-    _track_survey_event(
+    await _track_survey_event(
         experiment_service=experiment_service,
         user=user,
         event="cancel_reason_selected",
@@ -234,7 +234,7 @@ async def on_cancel_survey_other_text(
     await redis_client.delete(awaiting_key.pack())
     CANCEL_SURVEY_ANSWERS_TOTAL.labels(reason=CancelSurveyReason.OTHER.value, gateway=gateway).inc()
 
-    _track_survey_event(
+    await _track_survey_event(
         experiment_service=experiment_service,
         user=user,
         event="cancel_reason_selected",
@@ -9,12 +9,15 @@ from fluentogram import TranslatorRunner
 from loguru import logger
 
 from src.bot.keyboards import get_contact_support_keyboard
+from src.bot.routers.dashboard._shared import extract_message_content
 from src.core.config.app import AppConfig
 from src.core.enums import Command
 from src.core.utils.formatters import affiliate_link
 from src.core.utils.formatters import format_user_log as log
 from src.core.utils.message_payload import MessagePayload
+from src.infrastructure.taskiq.tasks.broadcast import launch_broadcast_workers
 from src.models.dto import UserDto
+from src.services.broadcast import BroadcastService
 from src.services.loyalty_reward import LoyaltyRewardService
 from src.services.notification import NotificationService
 from src.services.remnawave import RemnawaveService
@@ -238,3 +241,73 @@ async def on_announce_loyalty_command(
     )
     await message.answer(f"Loyalty announcement sent to {channel}")
     logger.info(f"{log(user)} Sent loyalty announcement to '{channel}'")
+
+
+@inject
+@router.message(FilterCommand("broadcast"))
+async def on_broadcast_command(
+    message: Message,
+    user: UserDto,
+    config: FromDishka[AppConfig],
+    broadcast_service: FromDishka[BroadcastService],
+    notification_service: FromDishka[NotificationService],
+) -> None:
+    if not user.is_privileged:
+        return
+
+    args = (message.text or "").split()[1:]
+    action = args[0] if args else ""
+
+    if action in ("status", "cancel") and len(args) > 1:
+        broadcast_id = args[1]
+        if action == "cancel" and not await broadcast_service.cancel(broadcast_id):
+            await message.answer(f"Broadcast {broadcast_id} is not running")
+            return
+        progress = await broadcast_service.get_progress(broadcast_id)
+        await message.answer(
+            progress.to_admin_message() if progress else f"Broadcast {broadcast_id} not found"
+        )
+        return
+
+    source = message.reply_to_message
+    content = extract_message_content(source) if source else None
+    if source is None or content is None:
+        await message.answer(
+            "Reply to the message to broadcast with /broadcast to preview it, "
+            "then with /broadcast confirm to send it.\n"
+            "/broadcast status <id> and /broadcast cancel <id> manage a running one."
+        )
+        return
+
+    payload = MessagePayload(
+        i18n_key="ntf-broadcast-preview",
+        auto_delete_after=None,
+        add_close_button=True,
+        **content,
+    )
+
+    if action != "confirm":
+        await notification_service.notify_user(user=user, payload=payload)
+        recipients = await broadcast_service.count_recipients()
+        await message.answer(
+            f"Broadcast preview above, {recipients} recipients.\n"
+            "Reply to the same message with /broadcast confirm to send it."
+        )
+        return
+
+    progress, existing_id = await broadcast_service.create_once(
+        user,
+        payload,
+        chat_id=message.chat.id,
+        message_id=source.message_id,
+    )
+    if progress is None:
+        await message.answer(
+            f"Broadcast {existing_id} was already started from this message"
+            if existing_id
+            else "A broadcast from this message is already being started"
+        )
+        return
+
+    await launch_broadcast_workers(progress.broadcast_id, config.bot.broadcast_workers)
+    logger.info(f"{log(user)} Started broadcast '{progress.broadcast_id}'")
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from aiogram_dialog import DialogManager
@@ -19,6 +20,7 @@ from src.infrastructure.billing import BillingClient
 from src.infrastructure.billing.converters import billing_settings_to_dto
 from src.models.dto import UserDto
 from src.services.experiment import ExperimentService
+from src.services.menu import MenuService
 from src.services.referral import ReferralService
 from src.services.remnawave import RemnawaveService
 from src.services.subscription import SubscriptionService
@@ -30,40 +32,35 @@ async def menu_getter(
     config: AppConfig,
     user: UserDto,
     i18n: FromDishka[TranslatorRunner],
-    billing: FromDishka[BillingClient],
-    referral_service: FromDishka[ReferralService],
+    menu_service: FromDishka[MenuService],
     experiment_service: FromDishka[ExperimentService],
-    remnawave_service: FromDishka[RemnawaveService],
     **kwargs: Any,
 ) -> dict[str, Any]:
     try:
-        trial_plan = await billing.get_trial_plan()
-        has_used_trial = await billing.has_used_trial(user.telegram_id)
-        trial_offer_enabled = await experiment_service.is_trial_offer_enabled(user)
-        settings = billing_settings_to_dto(await billing.get_settings())
+        snapshot, trial_offer_enabled = await asyncio.gather(
+            menu_service.get_snapshot(user),
+            experiment_service.is_trial_offer_enabled(user),
+        )
         support_username = config.bot.support_username.get_secret_value()
-        ref_link = await referral_service.get_ref_link(user.referral_code)
         support_link = format_username_to_url(support_username, i18n.get("contact-support-help"))
 
-        is_referral_enable = settings.referral.enable
-
         base_data = {
             "user_id": str(user.telegram_id),
             "user_name": user.name,
             "personal_discount": user.personal_discount,
             "loyalty_discount": user.loyalty_discount,
-            "is_beta_tester": 0,
+            "is_beta_tester": int(snapshot.is_beta_tester),
             "support": support_link,
             "invite": i18n.get(
                 "referral-invite-message",
-                url=ref_link,
-                invitee_discount=settings.referral.invitee_reward.amount,
-                referrer_days=settings.referral.reward.config.get(ReferralLevel.FIRST, 14),
-                long_referrer_days=settings.referral.reward.long_purchase_amount or 30,
+                url=snapshot.ref_link,
+                invitee_discount=snapshot.invitee_discount,
+                referrer_days=snapshot.referrer_days,
+                long_referrer_days=snapshot.long_referrer_days,
             ),
             "has_subscription": user.has_subscription,
             "is_app": config.bot.is_mini_app,
-            "is_referral_enable": is_referral_enable,
+            "is_referral_enable": snapshot.is_referral_enable,
         }
 
         subscription = user.current_subscription
@@ -73,9 +70,7 @@ async def menu_getter(
                 {
                     "status": None,
                     "is_trial": False,
-                    "trial_available": bool(
-                        not has_used_trial and trial_plan and trial_offer_enabled
-                    ),
+                    "trial_available": bool(snapshot.trial_available and trial_offer_enabled),
                     "has_device_limit": False,
                     "connectable": False,
                     "tg_proxy_available": False,
@@ -83,21 +78,6 @@ async def menu_getter(
             )
             return base_data
 
-        plan_id = subscription.plan.id if subscription.plan else 0
-        try:
-            base_data["is_beta_tester"] = int(await remnawave_service.is_beta_tester(subscription))
-        except Exception:
-            logger.opt(exception=True).warning(
-                f"Failed to resolve beta tester status for user '{user.telegram_id}'"
-            )
-        try:
-            tg_proxies = (
-                await billing.get_tg_proxies(plan_id) if subscription.is_active and plan_id else []
-            )
-        except Exception:
-            logger.opt(exception=True).warning("Failed to fetch TG proxies, hiding button")
-            tg_proxies = []
-
         base_data.update(
             {
                 "status": subscription.get_status,
@@ -116,7 +96,7 @@ async def menu_getter(
                 "url": SubscriptionService.build_connect_url(
                     subscription.url, config.remnawave.sub_public_domain
                 ),
-                "tg_proxy_available": len(tg_proxies) > 0,
+                "tg_proxy_available": snapshot.tg_proxy_available,
             }
         )
 
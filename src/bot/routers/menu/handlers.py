@@ -29,9 +29,9 @@ router = Router(name=__name__)
 BETA_TESTERS_DEEP_LINK = "beta_testers"
 
 
-def _record_trial_activation(experiment_service: ExperimentService, user: UserDto) -> None:
+async def _record_trial_activation(experiment_service: ExperimentService, user: UserDto) -> None:
     try:
-        experiment_service.record_conversion(
+        await experiment_service.record_conversion(
             TRIAL_EXPERIMENT_KEY,
             user.telegram_id,
             "trial_activated",
@@ -39,7 +39,7 @@ def _record_trial_activation(experiment_service: ExperimentService, user: UserDt
         )
         return
     except TypeError:
-        experiment_service.record_conversion(
+        await experiment_service.record_conversion(
             TRIAL_EXPERIMENT_KEY,
             user.telegram_id,
             "trial_activated",
@@ -180,7 +180,7 @@ async def on_get_trial(
 
     try:
         await billing.create_trial_subscription(user.telegram_id, billing_plan.ID)
-        _record_trial_activation(experiment_service, user)
+        await _record_trial_activation(experiment_service, user)
         await callback.answer("Пробный период активирован")
         await dialog_manager.start(
             state=Subscription.TRIAL,
@@ -79,7 +79,7 @@ def _extract_price_override(payload: Any) -> dict[str, Any] | None:
     return None
 
 
-def build_checkout_context(
+async def build_checkout_context(
     experiment_service: ExperimentService | None,
     user: UserDto,
     *,
@@ -90,13 +90,13 @@ def build_checkout_context(
     if experiment_service is None:
         return None
 
-    checkout_flow = experiment_service.evaluate_feature_for_user(
+    checkout_flow = await experiment_service.evaluate_feature_for_user(
         user,
         ExperimentFeature.CHECKOUT_FLOW,
     )
     pricing_experiment = None
     for feature in PRICING_EXPERIMENTS:
-        evaluation = experiment_service.evaluate_feature_for_user(user, feature)
+        evaluation = await experiment_service.evaluate_feature_for_user(user, feature)
         if evaluation.payload is not None and _is_pricing_experiment_eligible(
             evaluation.feature_key,
             plan=plan,
@@ -177,7 +177,7 @@ async def track_checkout_event(
         return
 
     cache[cache_key] = True
-    context = context or build_checkout_context(
+    context = context or await build_checkout_context(
         experiment_service,
         user,
         plan=plan,
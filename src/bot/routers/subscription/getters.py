@@ -23,6 +23,7 @@ from src.infrastructure.billing import (
     billing_plan_to_dto,
     billing_price_details_to_dto,
 )
+from src.infrastructure.billing.client import BillingPriceQuery
 from src.infrastructure.billing.converters import billing_subscription_to_dto
 from src.infrastructure.billing.models import BillingSubscription
 from src.models.dto import PlanDto, PriceDetailsDto, UserDto
@@ -118,34 +119,46 @@ async def duration_getter(
     if not plan:
         raise ValueError("PlanDto not found in dialog data")
 
-    default_currency = await billing.get_default_currency()
+    default_currency, channel_discount = await asyncio.gather(
+        billing.get_default_currency(),
+        channel_incentive_service.discount_context(user),
+    )
     only_single_plan = dialog_manager.dialog_data.get("only_single_plan", False)
     dialog_manager.dialog_data["is_free"] = False
     durations = []
     purchase_type = dialog_manager.dialog_data.get("purchase_type")
 
+    queries = []
     for duration in plan.durations:
-        key, kw = i18n_format_days(duration.days)
-        experiment_context = build_checkout_context(
+        experiment_context = await build_checkout_context(
             experiment_service,
             user,
             plan=plan,
             duration_days=duration.days,
             purchase_type=purchase_type,
         )
-        channel_discount = await channel_incentive_service.discount_context(user)
-        price_details = await billing.calculate_price(
-            telegram_id=user.telegram_id,
-            plan_id=plan.id,
-            duration_days=duration.days,
-            currency=default_currency,
-            experiment=experiment_context.billing_experiment if experiment_context else None,
-            channel_discount=channel_discount,
+        queries.append(
+            BillingPriceQuery(
+                plan_id=plan.id,
+                duration_days=duration.days,
+                currency=default_currency,
+                experiment=experiment_context.billing_experiment if experiment_context else None,
+            )
         )
-        pricing = billing_price_details_to_dto(price_details)
-        from src.core.enums import Currency  # noqa: PLC0415
 
-        currency_enum = Currency(default_currency)
+    prices = await billing.calculate_prices(
+        telegram_id=user.telegram_id,
+        queries=queries,
+        channel_discount=channel_discount,
+    )
+
+    from src.core.enums import Currency  # noqa: PLC0415
+
+    currency_enum = Currency(default_currency)
+
+    for duration, price_details in zip(plan.durations, prices):
+        key, kw = i18n_format_days(duration.days)
+        pricing = billing_price_details_to_dto(price_details)
         durations.append(
             {
                 "days": duration.days,
@@ -199,7 +212,7 @@ async def payment_method_getter(
 
     payment_methods = []
     purchase_type = dialog_manager.dialog_data.get("purchase_type")
-    experiment_context = build_checkout_context(
+    experiment_context = await build_checkout_context(
         experiment_service,
         user,
         plan=plan,
@@ -207,16 +220,21 @@ async def payment_method_getter(
         purchase_type=purchase_type,
     )
     channel_discount = await channel_incentive_service.discount_context(user)
+    prices = await billing.calculate_prices(
+        telegram_id=user.telegram_id,
+        queries=[
+            BillingPriceQuery(
+                plan_id=plan.id,
+                duration_days=duration.days,
+                currency=gateway.currency.value,
+                experiment=experiment_context.billing_experiment if experiment_context else None,
+            )
+            for gateway in gateways
+        ],
+        channel_discount=channel_discount,
+    )
 
-    for gateway in gateways:
-        price_details = await billing.calculate_price(
-            telegram_id=user.telegram_id,
-            plan_id=plan.id,
-            duration_days=duration.days,
-            currency=gateway.currency.value,
-            experiment=experiment_context.billing_experiment if experiment_context else None,
-            channel_discount=channel_discount,
-        )
+    for gateway, price_details in zip(gateways, prices):
         pricing = billing_price_details_to_dto(price_details)
         payment_methods.append(
             {
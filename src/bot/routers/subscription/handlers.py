@@ -87,7 +87,7 @@ async def _create_payment_and_get_data(
 
     gt_str = gateway_type.value if hasattr(gateway_type, "value") else str(gateway_type)
     pt_str = purchase_type.value if hasattr(purchase_type, "value") else str(purchase_type)
-    experiment_context = build_checkout_context(
+    experiment_context = await build_checkout_context(
         experiment_service,
         user,
         plan=plan,
@@ -470,7 +470,7 @@ async def on_duration_select(
     gateways = [billing_gateway_to_dto(g) for g in billing_gateways if g.Channel in ("BOT", "ALL")]
     default_currency = await billing.get_default_currency()
     purchase_type: PurchaseType | None = dialog_manager.dialog_data.get("purchase_type")
-    experiment_context = build_checkout_context(
+    experiment_context = await build_checkout_context(
         experiment_service,
         user,
         plan=plan,
@@ -6,13 +6,14 @@ from pydantic import Field, SecretStr, field_validator
 from pydantic_core.core_schema import FieldValidationInfo
 
 from src.core.constants import API_V1, ASSETS_DIR, DOMAIN_REGEX, PAYMENTS_WEBHOOK_PATH
-from src.core.enums import Locale, PaymentGatewayType
+from src.core.enums import KafkaDeadLetterBackend, Locale, PaymentGatewayType
 from src.core.utils.types import LocaleList, StringList
 
 from .base import BaseConfig
 from .bot import BotConfig
 from .build import BuildConfig
 from .experiments import ExperimentsConfig
+from .log import LogConfig
 from .redis import RedisConfig
 from .remnawave import RemnawaveConfig
 from .validators import validate_not_change_me
@@ -37,13 +38,28 @@ class AppConfig(BaseConfig, env_prefix="APP_"):
     redis: RedisConfig = Field(default_factory=RedisConfig)
     build: BuildConfig = Field(default_factory=BuildConfig)
     experiments: ExperimentsConfig = Field(default_factory=ExperimentsConfig)
+    log: LogConfig = Field(default_factory=LogConfig)
 
     api_url: str = ""
     api_internal_secret: SecretStr = SecretStr("")
+    billing_single_flight: bool = True
+    billing_struct_decoding: StringList = StringList(
+        "list_plans,get_available_plans,get_allowed_plans,"
+        "list_subscriptions_by_user,list_all_subscriptions,"
+        "list_transactions,list_all_transactions,list_transactions_by_status,"
+        "list_promocodes"
+    )
 
     kafka_brokers: str = "kafka-kafka-bootstrap.kafka.svc.cluster.local:9092"
     kafka_topic_env: str = "stage"
     kafka_group_id: str = "compono-shop"
+    kafka_batch_size: int = 100
+    kafka_max_concurrency: int = 16
+    kafka_fetch_timeout_ms: int = 1000
+    kafka_max_attempts: int = 3
+    kafka_retry_backoff: float = 0.5
+    kafka_dlq_backend: KafkaDeadLetterBackend = KafkaDeadLetterBackend.REDIS
+    kafka_dlq_max_length: int = 100_000
 
     @property
     def kafka_notify_topic(self) -> str:
@@ -61,6 +77,10 @@ class AppConfig(BaseConfig, env_prefix="APP_"):
     def kafka_payment_canceled_topic(self) -> str:
         return f"{self.kafka_topic_env}.compono-billing.payment.canceled.v1"
 
+    @property
+    def kafka_dlq_topic(self) -> str:
+        return f"{self.kafka_topic_env}.compono-shop.dlq.v1"
+
     # External service base URLs (overridable, non-secret)
     yookassa_api_base: str = "https://api.yookassa.ru"
     yoomoney_api_base: str = "https://yoomoney.ru"
@@ -4,6 +4,8 @@ from pydantic import SecretStr, field_validator
 from pydantic_core.core_schema import FieldValidationInfo
 
 from src.core.constants import API_V1, BOT_WEBHOOK_PATH, T_ME, URL_PATTERN
+from src.core.enums import SystemNotificationType, ThrottlingBackend, UpdateShedPolicy
+from src.core.utils.types import SystemNotificationTypeList
 
 from .base import BaseConfig
 from .validators import validate_not_change_me, validate_username
@@ -23,6 +25,32 @@ class BotConfig(BaseConfig, env_prefix="BOT_"):
     setup_commands: bool = True
     use_banners: bool = True
 
+    update_concurrency: int = 100
+    update_user_queue_size: int = 10
+    update_max_queued: int = 5_000
+    update_shed_policy: UpdateShedPolicy = UpdateShedPolicy.REJECT
+
+    send_rate_limit_enabled: bool = True
+    send_global_rate: float = 28.0
+    send_chat_rate: float = 1.0
+    send_chat_burst: int = 3
+    send_group_rate: float = 0.33
+    send_bulk_reserve: float = 0.2
+    send_max_wait: float = 30.0
+    send_max_retries: int = 3
+
+    broadcast_workers: int = 8
+
+    throttling_backend: ThrottlingBackend = ThrottlingBackend.REDIS
+    throttling_period: float = 1.0
+    throttling_message_limit: int = 2
+    throttling_callback_limit: int = 4
+    throttling_warning_interval: float = 10.0
+
+    system_digest_types: SystemNotificationTypeList = SystemNotificationTypeList([])
+    system_digest_interval: int = 300
+    system_digest_max_events: int = 50
+
     @property
     def channel_chat_id(self) -> Optional[str]:
         if self.channel_address and self.channel_address.startswith("@"):
@@ -72,6 +100,15 @@ class BotConfig(BaseConfig, env_prefix="BOT_"):
         validate_username(field, info)
         return field
 
+    @field_validator("system_digest_types")
+    @classmethod
+    def validate_system_digest_types(
+        cls, field: list[SystemNotificationType]
+    ) -> list[SystemNotificationType]:
+        if SystemNotificationType.BOT_LIFETIME in field:
+            raise ValueError("BOT_LIFETIME notifications are always sent immediately")
+        return field
+
     @field_validator("mini_app")
     @classmethod
     def validate_mini_app(
@@ -0,0 +1,17 @@
+from src.core.utils.types import StringList
+
+from .base import BaseConfig
+
+
+class LogConfig(BaseConfig, env_prefix="LOG_"):
+    level: str = "DEBUG"
+    enqueue: bool = False
+    json_format: bool = False
+
+    hot_loggers: StringList = StringList(
+        "src.infrastructure.redis.cache,"
+        "src.bot.middlewares.user,"
+        "src.services.notification,"
+        "src.infrastructure.billing.client"
+    )
+    hot_debug_rate: int = 20
@@ -10,6 +10,7 @@ class RedisConfig(BaseConfig, env_prefix="REDIS_"):
     port: int = 6379
     name: str = "0"
     password: SecretStr | None = None
+    local_cache_enabled: bool = False
 
     @property
     def dsn(self) -> str:
@@ -51,3 +51,4 @@ BATCH_SIZE: Final[int] = 20
 BATCH_DELAY: Final[int] = 1
 
 TASKIQ_WORKER_METRICS_PORT: Final[int] = 9090
+KAFKA_CONSUMERS_METRICS_PORT: Final[int] = 9091
@@ -271,6 +271,33 @@ class AccessMode(UpperStrEnum):
     RESTRICTED = auto()  # All actions are completely forbidden
 
 
+class UpdateShedPolicy(UpperStrEnum):
+    REJECT = auto()  # Answer 503 so Telegram redelivers the update later
+    DROP_NEWEST = auto()  # Acknowledge and discard the incoming update
+    DROP_OLDEST = auto()  # Discard the user's oldest queued update instead (else the incoming)
+
+
+class ThrottlingBackend(UpperStrEnum):
+    REDIS = auto()  # Budgets shared by every process through Redis
+    MEMORY = auto()  # Per-process budgets; only for single-process deployments
+
+
+class KafkaDeadLetterBackend(UpperStrEnum):
+    REDIS = auto()  # Redis stream; a local stand-in for a dead-letter topic
+    KAFKA = auto()  # Dead-letter topic on the same brokers
+
+
+class BroadcastStatus(UpperStrEnum):
+    PROCESSING = auto()
+    COMPLETED = auto()
+    CANCELED = auto()
+
+
+class SendPriority(UpperStrEnum):
+    INTERACTIVE = auto()  # Replies to a user action; may drain the send buckets
+    BULK = auto()  # Notifications and mailings; leave a reserve for interactive sends
+
+
 class Command(Enum):
     START = BotCommand(command="start", description="cmd-start")
     PAYSUPPORT = BotCommand(command="paysupport", description="cmd-paysupport")
@@ -1,16 +1,21 @@
 import inspect
 import logging
 import sys
+import time
 from pathlib import Path
-from typing import Final
+from typing import TYPE_CHECKING, Final, Iterable, Optional
 from zipfile import ZipFile
 
 from loguru import logger
 
+from src.core.config.log import LogConfig
 from src.core.constants import LOG_DIR
+from src.core.metrics import LOG_RECORDS_DROPPED_TOTAL
+
+if TYPE_CHECKING:
+    from loguru import Record
 
 LOG_FILENAME: Final[str] = "bot.log"
-LOG_LEVEL: Final[str] = "DEBUG"
 LOG_ROTATION: Final[str] = "00:00"
 LOG_COMPRESSION: Final[str] = "zip"
 LOG_RETENTION: Final[str] = "7 days"
@@ -52,6 +57,62 @@ class InterceptHandler(logging.Handler):
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
 
+class HotLogSampler:
+    """Sink filter that caps DEBUG records from hot modules at ``rate`` per second each.
+
+    Loguru runs a handler's filter once per sink, so the verdict for the last
+    record is reused and every sink keeps or drops the same records.
+    """
+
+    def __init__(self, hot_loggers: Iterable[str], rate: int) -> None:
+        self.hot_loggers = tuple(name for name in hot_loggers if name)
+        self.rate = rate
+        self._debug_no = logger.level("DEBUG").no
+        self._prefixes: dict[str, Optional[str]] = {}
+        self._windows: dict[str, tuple[int, int]] = {}
+        self._last_record: Optional["Record"] = None
+        self._last_verdict = True
+
+    def __call__(self, record: "Record") -> bool:
+        if record is self._last_record:
+            return self._last_verdict
+
+        self._last_record = record
+        self._last_verdict = self._keep(record)
+        return self._last_verdict
+
+    def _keep(self, record: "Record") -> bool:
+        if record["level"].no > self._debug_no:
+            return True
+
+        prefix = self._hot_prefix(record["name"] or "")
+        if prefix is None:
+            return True
+
+        second = int(time.monotonic())
+        window, count = self._windows.get(prefix, (second, 0))
+        if window != second:
+            count = 0
+        if count >= self.rate:
+            LOG_RECORDS_DROPPED_TOTAL.labels(logger=prefix).inc()
+            return False
+
+        self._windows[prefix] = (second, count + 1)
+        return True
+
+    def _hot_prefix(self, name: str) -> Optional[str]:
+        if name not in self._prefixes:
+            self._prefixes[name] = next(
+                (
+                    prefix
+                    for prefix in self.hot_loggers
+                    if name == prefix or name.startswith(f"{prefix}.")
+                ),
+                None,
+            )
+        return self._prefixes[name]
+
+
 def compress_log_file(filepath: str) -> None:
     log_file = Path(filepath)
     filename_stem = log_file.stem
@@ -71,21 +132,30 @@ def compress_log_file(filepath: str) -> None:
     log_file.unlink()
 
 
-def setup_logger() -> None:
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
+def setup_logger(config: Optional[LogConfig] = None, log_dir: Path = LOG_DIR) -> None:
+    config = config or LogConfig()
+    log_dir.mkdir(parents=True, exist_ok=True)
     logger.remove()
 
+    sampler = HotLogSampler(config.hot_loggers, config.hot_debug_rate)
+
     logger.add(
         sink=sys.stderr,
-        level=LOG_LEVEL,
+        level=config.level,
         format=LOG_FORMAT,
-        colorize=True,
+        filter=sampler,
+        colorize=not config.json_format,
+        serialize=config.json_format,
+        enqueue=config.enqueue,
     )
 
     logger.add(
-        sink=LOG_DIR / LOG_FILENAME,
-        level=LOG_LEVEL,
+        sink=log_dir / LOG_FILENAME,
+        level=config.level,
         format=LOG_FORMAT,
+        filter=sampler,
+        serialize=config.json_format,
+        enqueue=config.enqueue,
         rotation="1GB",
         retention="3 days",
         compression="zip",
@@ -21,6 +21,40 @@ UPDATES_TOTAL = Counter(
     ["update_type"],
 )
 
+UPDATE_QUEUE_DEPTH = Gauge(
+    "bot_update_queue_depth",
+    "Webhook updates accepted but not yet started by the update executor",
+)
+
+UPDATES_IN_FLIGHT = Gauge(
+    "bot_updates_in_flight",
+    "Webhook updates currently being processed",
+)
+
+UPDATE_QUEUE_WAIT_TIME = Histogram(
+    "bot_update_queue_wait_seconds",
+    "Time a webhook update waited in the update executor before processing started",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+UPDATES_SHED_TOTAL = Counter(
+    "bot_updates_shed_total",
+    "Webhook updates shed by the update executor, by reason and shedding policy",
+    ["reason", "policy"],
+)
+
+TELEGRAM_SEND_WAIT_TIME = Histogram(
+    "bot_telegram_send_wait_seconds",
+    "Time an outbound Telegram request waited for the shared rate limiter",
+    ["priority"],
+)
+
+TELEGRAM_RETRY_AFTER_TOTAL = Counter(
+    "bot_telegram_retry_after_total",
+    "Outbound Telegram requests answered with 429 retry_after",
+    ["method"],
+)
+
 ERRORS_TOTAL = Counter(
     "bot_errors_total",
     "Total number of unexpected errors",
@@ -99,6 +133,17 @@ ESTIMAND_CIRCUIT_OPENS_TOTAL = Counter(
     ["operation"],
 )
 
+ESTIMAND_EVENTS_FLUSHED_TOTAL = Counter(
+    "bot_estimand_events_flushed_total",
+    "Total Estimand events delivered by the buffered event flusher",
+)
+
+ESTIMAND_EVENTS_DROPPED_TOTAL = Counter(
+    "bot_estimand_events_dropped_total",
+    "Total Estimand events dropped before delivery, by reason",
+    ["reason"],
+)
+
 KAFKA_CONSUMER_UP = Gauge(
     "kafka_consumer_up",
     "Whether a Kafka consumer's consume loop is currently running (1) or down/restarting (0)",
@@ -117,6 +162,62 @@ KAFKA_CONSUMER_DISCARDED_MESSAGES_TOTAL = Counter(
     ["consumer", "reason"],
 )
 
+KAFKA_CONSUMER_MESSAGES_TOTAL = Counter(
+    "kafka_consumer_messages_total",
+    "Kafka messages handled by a consumer, by result (processed/dead_lettered/failed)",
+    ["consumer", "result"],
+)
+
+KAFKA_CONSUMER_RETRIES_TOTAL = Counter(
+    "kafka_consumer_retries_total",
+    "Kafka message handling attempts retried after a failure",
+    ["consumer"],
+)
+
+KAFKA_CONSUMER_DEAD_LETTERS_TOTAL = Counter(
+    "kafka_consumer_dead_letters_total",
+    "Kafka messages published to the dead-letter sink, by reason",
+    ["consumer", "reason"],
+)
+
+KAFKA_CONSUMER_BATCH_DURATION = Histogram(
+    "kafka_consumer_batch_duration_seconds",
+    "Time spent handling and committing one fetched Kafka batch",
+    ["consumer"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+KAFKA_CONSUMER_LAG = Gauge(
+    "kafka_consumer_lag",
+    "Messages between a partition's high watermark and the consumer's committed offset",
+    ["consumer", "partition"],
+)
+
+BILLING_SINGLE_FLIGHT_REQUESTS_TOTAL = Counter(
+    "billing_single_flight_requests_total",
+    "Billing GETs on single-flight endpoints, by whether they issued or joined a request",
+    ["endpoint", "outcome"],
+)
+
+CACHE_RECOMPUTES_TOTAL = Counter(
+    "cache_recomputes_total",
+    "redis_cache recomputes on stampede-protected prefixes, by reason",
+    ["prefix", "reason"],
+)
+
+CACHE_RECOMPUTES_AVOIDED_TOTAL = Counter(
+    "cache_recomputes_avoided_total",
+    "redis_cache callers that skipped a recompute by serving stale or waiting on the lock",
+    ["prefix", "outcome"],
+)
+
+MENU_SNAPSHOT_INPUT_TIME = Histogram(
+    "bot_menu_snapshot_input_seconds",
+    "Time spent fetching each main menu input when building a menu snapshot",
+    ["input"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
 
 CANCEL_SURVEY_SENT_TOTAL = Counter(
     "bot_cancel_survey_sent_total",
@@ -130,6 +231,18 @@ CANCEL_SURVEY_ANSWERS_TOTAL = Counter(
     ["reason", "gateway"],
 )
 
+MESSAGE_DELETIONS_TOTAL = Counter(
+    "bot_message_deletions_total",
+    "Auto-deleted messages, by result (deleted, skipped, retried)",
+    ["result"],
+)
+
+LOG_RECORDS_DROPPED_TOTAL = Counter(
+    "bot_log_records_dropped_total",
+    "DEBUG records dropped by the hot-logger rate limit, by module",
+    ["logger"],
+)
+
 
 def start_metrics_server(port: int) -> None:
     """Expose the process-local Prometheus registry over HTTP.
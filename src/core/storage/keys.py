@@ -31,14 +31,103 @@ class AccessWaitListKey(StorageKey, prefix="access_wait_list"): ...
 class RecentActivityUsersKey(StorageKey, prefix="recent_activity_users"): ...
 
 
+class MenuSnapshotKey(StorageKey, prefix="menu_snapshot"):
+    """Short-lived per-user snapshot of the main menu inputs, dropped on
+    user and subscription changes."""
+
+    telegram_id: int
+
+
+class BroadcastKey(StorageKey, prefix="broadcast"):
+    """Redis hash with a broadcast's status, payload, cursor and counters."""
+
+    broadcast_id: str
+
+
+class BroadcastRecipientsKey(StorageKey, prefix="broadcast_recipients"):
+    """Redis list of ``telegram_id:locale`` recipients, claimed in chunks by offset."""
+
+    broadcast_id: str
+
+
+class BroadcastLeasesKey(StorageKey, prefix="broadcast_leases"):
+    """Sorted set of claimed chunk offsets scored by lease deadline; an
+    expired lease means its worker died and the chunk is up for grabs."""
+
+    broadcast_id: str
+
+
+class BroadcastCheckpointsKey(StorageKey, prefix="broadcast_checkpoints"):
+    """Redis hash of chunk offset -> index of the next recipient to send to."""
+
+    broadcast_id: str
+
+
+class BroadcastProgressLockKey(StorageKey, prefix="broadcast_progress_lock"):
+    """Throttles edits of the admin's progress message (SETNX, short TTL)."""
+
+    broadcast_id: str
+
+
+class BroadcastSourceKey(StorageKey, prefix="broadcast_source"):
+    """Claim on the admin message a broadcast is sent from, holding the
+    broadcast id once created, so a repeated confirm does not send it twice."""
+
+    chat_id: int
+    message_id: int
+
+
+class ActiveBroadcastsKey(StorageKey, prefix="active_broadcasts"): ...
+
+
+class ThrottlingKey(StorageKey, prefix="throttling"):
+    """Theoretical arrival time of a user's next event of one type (GCRA)."""
+
+    telegram_id: int
+    event_type: str
+
+
+class ThrottlingWarningKey(StorageKey, prefix="throttling_warning"):
+    """Set while a user has already been told to slow down."""
+
+    telegram_id: int
+
+
+class TelegramSendBucketKey(StorageKey, prefix="tg_send_bucket"):
+    """Redis hash holding one outbound token bucket (``global`` or a chat id)."""
+
+    scope: str
+
+
 class NotificationDedupKey(StorageKey, prefix="ntf_dedup"):
     telegram_id: int
     ntf_type: str
 
 
+class SentNotificationKey(StorageKey, prefix="sent_ntf"):
+    """Long-lived claim on a one-off notification (``sent_ntf:<telegram_id>:<type>``)."""
+
+    telegram_id: int
+    type: str
+
+
 class PendingNotConnectedRemindersKey(StorageKey, prefix="pending_not_connected"): ...
 
 
+class SystemDigestKey(StorageKey, prefix="system_digest"):
+    """Redis list of queued system notification events of one type."""
+
+    ntf_type: str
+
+
+class PendingSystemDigestsKey(StorageKey, prefix="pending_system_digests"):
+    """Sorted set of system notification types with queued events, scored by the first one."""
+
+
+class MessageDeletionsKey(StorageKey, prefix="message_deletions"):
+    """Sorted set of ``chat_id:message_id`` scored by when the message is due for deletion."""
+
+
 class PendingCancelSurveyChecksKey(StorageKey, prefix="pending_cancel_survey"): ...
 
 
@@ -65,3 +154,14 @@ class CancelSurveyPendingPingKey(StorageKey, prefix="cancel_survey_pending_ping"
     """Guards the pending checkout reminder so it is sent only once."""
 
     payment_id: UUID
+
+
+class KafkaHandlerProgressKey(StorageKey, prefix="kafka_progress"):
+    """Redis hash of ``handler:partition`` -> next offset for handlers of a
+    topic hub that got ahead of the group's committed offset."""
+
+    group_id: str
+
+
+class KafkaDeadLettersKey(StorageKey, prefix="kafka_dlq"):
+    """Redis stream of Kafka messages dead-lettered by the consumers, see ``kafka/dlq.py``."""
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Annotated, NewType, TypeAlias, Union
+from typing import TYPE_CHECKING, Annotated, Any, NewType, TypeAlias, Union
 
 from aiogram.types import (
     BufferedInputFile,
@@ -17,9 +17,11 @@ from src.core.enums import Locale, SystemNotificationType, UserNotificationType
 if TYPE_CHECKING:
     ListStr: TypeAlias = list[str]
     ListLocale: TypeAlias = list[Locale]
+    ListSystemNotificationType: TypeAlias = list[SystemNotificationType]
 else:
     ListStr = NewType("ListStr", list[str])
     ListLocale = NewType("ListLocale", list[Locale])
+    ListSystemNotificationType = NewType("ListSystemNotificationType", list[SystemNotificationType])
 
 AnyInputFile: TypeAlias = Union[BufferedInputFile, FSInputFile]
 
@@ -40,3 +42,13 @@ StringList: TypeAlias = Annotated[
 LocaleList: TypeAlias = Annotated[
     ListLocale, PlainValidator(func=lambda x: [Locale(loc.strip()) for loc in x.split(",")])
 ]
+
+
+def _parse_system_notification_types(value: Any) -> list[SystemNotificationType]:
+    items = value.split(",") if isinstance(value, str) else value
+    return [SystemNotificationType(item.strip()) for item in items if item.strip()]
+
+
+SystemNotificationTypeList: TypeAlias = Annotated[
+    ListSystemNotificationType, PlainValidator(func=_parse_system_notification_types)
+]
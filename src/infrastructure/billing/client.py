@@ -2,15 +2,27 @@
 
 Calls the internal API endpoints that are protected by X-Internal-Secret
 header authentication. All methods are async and use httpx.AsyncClient.
+
+Hot read endpoints opt into single-flight coalescing: concurrent callers
+issuing the same GET (method + path + params) share one in-flight HTTP
+request instead of each sending their own.
+
+List endpoints named in ``struct_endpoints`` decode the raw response body
+into msgspec Structs (see `structs.py`) instead of Pydantic models.
 """
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Collection, Final, Optional, Sequence
 from uuid import UUID
 
 import httpx
+from cachetools import TTLCache
 from loguru import logger
 
+from src.core.metrics import BILLING_SINGLE_FLIGHT_REQUESTS_TOTAL
+from src.core.utils import json_utils
 from src.core.utils.time import to_rfc3339_utc
 
 from .models import (
@@ -30,6 +42,33 @@ from .models import (
     BillingTransaction,
     BillingUser,
 )
+from .structs import (
+    AnyBillingPlan,
+    AnyBillingPromocode,
+    AnyBillingSubscription,
+    AnyBillingTransaction,
+    BillingPlanStruct,
+    BillingPromocodeStruct,
+    BillingSubscriptionStruct,
+    BillingTransactionStruct,
+    decode_struct_list,
+)
+
+_FlightKey = tuple[str, str, tuple[tuple[str, str], ...]]
+_QuoteKey = tuple[int, int, int, str, str, str]
+
+PRICE_QUOTE_CONCURRENCY: Final[int] = 4
+PRICE_QUOTE_CACHE_SIZE: Final[int] = 10_000
+
+
+@dataclass(frozen=True)
+class BillingPriceQuery:
+    """One (plan, duration, currency) tuple to quote via ``calculate_prices``."""
+
+    plan_id: int
+    duration_days: int
+    currency: str
+    experiment: Optional[dict[str, Any]] = None
 
 
 class BillingClientError(Exception):
@@ -44,11 +83,26 @@ class BillingClientError(Exception):
 class BillingClient:
     """Async HTTP client for the compono-billing internal API."""
 
-    def __init__(self, base_url: str, internal_secret: str, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        internal_secret: str,
+        timeout: float = 10.0,
+        single_flight: bool = True,
+        quote_ttl: float = 30.0,
+        struct_endpoints: Collection[str] = (),
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self._internal_secret = internal_secret
         self._timeout = timeout
         self._client: Optional[httpx.AsyncClient] = None
+        self._single_flight = single_flight
+        self._in_flight: dict[_FlightKey, asyncio.Task[Any]] = {}
+        self._quotes: TTLCache[_QuoteKey, BillingPriceDetails] = TTLCache(
+            maxsize=PRICE_QUOTE_CACHE_SIZE,
+            ttl=quote_ttl,
+        )
+        self._struct_endpoints = frozenset(struct_endpoints)
 
     @property
     def _base_path(self) -> str:
@@ -79,6 +133,62 @@ class BillingClient:
         *,
         json: Any = None,
         params: Optional[dict[str, Any]] = None,
+        coalesce: Optional[str] = None,
+        raw: bool = False,
+    ) -> Any:
+        """Send a request to the billing API and return the decoded JSON body.
+
+        ``coalesce`` opts an idempotent GET into single-flight mode; its value
+        is the endpoint label used in metrics. While a request with the same
+        method, path and params is in flight, later callers await it instead
+        of issuing their own, and receive the same result or exception. The
+        decoded body is shared between those callers and must not be mutated.
+
+        ``raw`` returns the undecoded response bytes (``None`` for 204).
+        """
+        if coalesce is None or method != "GET" or not self._single_flight:
+            return await self._send(method, path, json=json, params=params, raw=raw)
+
+        key: _FlightKey = (
+            method if not raw else f"{method}:raw",
+            path,
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+        )
+        task = self._in_flight.get(key)
+
+        if task is None:
+            BILLING_SINGLE_FLIGHT_REQUESTS_TOTAL.labels(endpoint=coalesce, outcome="issued").inc()
+            task = asyncio.create_task(self._send(method, path, json=json, params=params, raw=raw))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._on_flight_done(key, t))
+        else:
+            BILLING_SINGLE_FLIGHT_REQUESTS_TOTAL.labels(
+                endpoint=coalesce, outcome="coalesced"
+            ).inc()
+            logger.debug(f"Billing API request coalesced: {method} {path}")
+
+        # Shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    def _on_flight_done(
+        self,
+        key: _FlightKey,
+        task: asyncio.Task[Any],
+    ) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled
+            task.exception()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: Optional[dict[str, Any]] = None,
+        raw: bool = False,
     ) -> Any:
         client = await self._get_client()
         url = f"{self._base_path}{path}"
@@ -104,11 +214,17 @@ class BillingClient:
         if response.status_code == 204:
             return None
 
+        if raw:
+            return response.content
+
         return response.json()
 
     async def _get(self, path: str, **kwargs: Any) -> Any:
         return await self._request("GET", path, **kwargs)
 
+    def _decodes_structs(self, endpoint: str) -> bool:
+        return endpoint in self._struct_endpoints
+
     async def _post(self, path: str, **kwargs: Any) -> Any:
         return await self._request("POST", path, **kwargs)
 
@@ -122,7 +238,10 @@ class BillingClient:
     # Plans
     # ------------------------------------------------------------------ #
 
-    async def list_plans(self) -> list[BillingPlan]:
+    async def list_plans(self) -> Sequence[AnyBillingPlan]:
+        if self._decodes_structs("list_plans"):
+            body = await self._get("/plans", raw=True)
+            return decode_struct_list(body, BillingPlanStruct)
         data = await self._get("/plans")
         return [BillingPlan.model_validate(p) for p in (data or [])]
 
@@ -140,14 +259,21 @@ class BillingClient:
             raise
 
     async def get_trial_plan(self) -> Optional[BillingPlan]:
-        data = await self._get("/plans/trial")
+        data = await self._get("/plans/trial", coalesce="trial_plan")
         return BillingPlan.model_validate(data) if data else None
 
-    async def get_available_plans(self, telegram_id: int) -> list[BillingPlan]:
-        data = await self._get("/plans/available", params={"telegram_id": str(telegram_id)})
+    async def get_available_plans(self, telegram_id: int) -> Sequence[AnyBillingPlan]:
+        params = {"telegram_id": str(telegram_id)}
+        if self._decodes_structs("get_available_plans"):
+            body = await self._get("/plans/available", params=params, raw=True)
+            return decode_struct_list(body, BillingPlanStruct)
+        data = await self._get("/plans/available", params=params)
         return [BillingPlan.model_validate(p) for p in (data or [])]
 
-    async def get_allowed_plans(self) -> list[BillingPlan]:
+    async def get_allowed_plans(self) -> Sequence[AnyBillingPlan]:
+        if self._decodes_structs("get_allowed_plans"):
+            body = await self._get("/plans/allowed", raw=True)
+            return decode_struct_list(body, BillingPlanStruct)
         data = await self._get("/plans/allowed")
         return [BillingPlan.model_validate(p) for p in (data or [])]
 
@@ -172,7 +298,9 @@ class BillingClient:
     # ------------------------------------------------------------------ #
 
     async def get_current_subscription(self, telegram_id: int) -> Optional[BillingSubscription]:
-        data = await self._get(f"/subscription/{telegram_id}/current")
+        data = await self._get(
+            f"/subscription/{telegram_id}/current", coalesce="current_subscription"
+        )
         return BillingSubscription.model_validate(data) if data else None
 
     async def has_used_trial(self, telegram_id: int) -> bool:
@@ -222,7 +350,10 @@ class BillingClient:
         )
         return BillingTransaction.model_validate(data)
 
-    async def list_transactions(self, telegram_id: int) -> list[BillingTransaction]:
+    async def list_transactions(self, telegram_id: int) -> Sequence[AnyBillingTransaction]:
+        if self._decodes_structs("list_transactions"):
+            body = await self._get(f"/transactions/{telegram_id}", raw=True)
+            return decode_struct_list(body, BillingTransactionStruct)
         data = await self._get(f"/transactions/{telegram_id}")
         return [BillingTransaction.model_validate(t) for t in (data or [])]
 
@@ -235,13 +366,19 @@ class BillingClient:
                 return None
             raise
 
-    async def list_all_transactions(self) -> list[BillingTransaction]:
+    async def list_all_transactions(self) -> Sequence[AnyBillingTransaction]:
+        if self._decodes_structs("list_all_transactions"):
+            body = await self._get("/transactions/stats", raw=True)
+            return decode_struct_list(body, BillingTransactionStruct)
         data = await self._get("/transactions/stats")
         if isinstance(data, list):
             return [BillingTransaction.model_validate(t) for t in data]
         return []
 
-    async def list_transactions_by_status(self, status: str) -> list[BillingTransaction]:
+    async def list_transactions_by_status(self, status: str) -> Sequence[AnyBillingTransaction]:
+        if self._decodes_structs("list_transactions_by_status"):
+            body = await self._get("/transactions/by-status", params={"status": status}, raw=True)
+            return decode_struct_list(body, BillingTransactionStruct)
         data = await self._get("/transactions/by-status", params={"status": status})
         return [BillingTransaction.model_validate(t) for t in (data or [])]
 
@@ -312,7 +449,10 @@ class BillingClient:
     # Promocodes
     # ------------------------------------------------------------------ #
 
-    async def list_promocodes(self) -> list[BillingPromocode]:
+    async def list_promocodes(self) -> Sequence[AnyBillingPromocode]:
+        if self._decodes_structs("list_promocodes"):
+            body = await self._get("/promocodes", raw=True)
+            return decode_struct_list(body, BillingPromocodeStruct)
         data = await self._get("/promocodes")
         return [BillingPromocode.model_validate(p) for p in (data or [])]
 
@@ -354,6 +494,7 @@ class BillingClient:
                 "telegram_id": telegram_id,
             },
         )
+        self.invalidate_price_quotes(telegram_id)
 
     async def validate_promocode(self, code: str) -> Optional[dict[str, Any]]:
         """Validate a promocode via the public endpoint."""
@@ -378,6 +519,8 @@ class BillingClient:
 
     async def update_user(self, telegram_id: int, user_data: dict[str, Any]) -> BillingUser:
         data = await self._put(f"/users/{telegram_id}", json=user_data)
+        # User discounts feed into pricing
+        self.invalidate_price_quotes(telegram_id)
         return BillingUser.model_validate(data)
 
     async def delete_user(self, telegram_id: int) -> None:
@@ -411,7 +554,12 @@ class BillingClient:
     # Subscriptions (extended)
     # ------------------------------------------------------------------ #
 
-    async def list_subscriptions_by_user(self, telegram_id: int) -> list[BillingSubscription]:
+    async def list_subscriptions_by_user(
+        self, telegram_id: int
+    ) -> Sequence[AnyBillingSubscription]:
+        if self._decodes_structs("list_subscriptions_by_user"):
+            body = await self._get(f"/subscriptions?telegram_id={telegram_id}", raw=True)
+            return decode_struct_list(body, BillingSubscriptionStruct)
         data = await self._get(f"/subscriptions?telegram_id={telegram_id}")
         if isinstance(data, list):
             return [BillingSubscription.model_validate(s) for s in data]
@@ -438,7 +586,10 @@ class BillingClient:
                 return None
             raise
 
-    async def list_all_subscriptions(self) -> list[BillingSubscription]:
+    async def list_all_subscriptions(self) -> Sequence[AnyBillingSubscription]:
+        if self._decodes_structs("list_all_subscriptions"):
+            body = await self._get("/subscriptions", raw=True)
+            return decode_struct_list(body, BillingSubscriptionStruct)
         data = await self._get("/subscriptions")
         if isinstance(data, list):
             return [BillingSubscription.model_validate(s) for s in data]
@@ -496,7 +647,7 @@ class BillingClient:
     # ------------------------------------------------------------------ #
 
     async def get_settings(self) -> BillingSettings:
-        data = await self._get("/settings")
+        data = await self._get("/settings", coalesce="settings")
         return BillingSettings.model_validate(data)
 
     async def update_settings(self, settings_data: dict[str, Any]) -> BillingSettings:
@@ -504,7 +655,7 @@ class BillingClient:
         return BillingSettings.model_validate(data)
 
     async def get_default_currency(self) -> str:
-        data = await self._get("/settings/default-currency")
+        data = await self._get("/settings/default-currency", coalesce="default_currency")
         return data.get("currency", "") if data else ""
 
     async def set_default_currency(self, currency: str) -> None:
@@ -541,7 +692,7 @@ class BillingClient:
         return [BillingPaymentGateway.model_validate(g) for g in (data or [])]
 
     async def list_active_gateways(self) -> list[BillingPaymentGateway]:
-        data = await self._get("/gateways/active")
+        data = await self._get("/gateways/active", coalesce="active_gateways")
         return [BillingPaymentGateway.model_validate(g) for g in (data or [])]
 
     async def get_gateway(self, gateway_id: int) -> Optional[BillingPaymentGateway]:
@@ -617,6 +768,72 @@ class BillingClient:
         data = await self._post("/pricing/calculate", json=payload)
         return BillingPriceDetails.model_validate(data)
 
+    async def calculate_prices(
+        self,
+        telegram_id: int,
+        queries: Sequence[BillingPriceQuery],
+        channel_discount: Optional[dict[str, Any]] = None,
+    ) -> list[BillingPriceDetails]:
+        """Quote several plan/duration/currency tuples for one user.
+
+        The billing API has no batch pricing endpoint, so uncached quotes are
+        requested concurrently (at most ``PRICE_QUOTE_CONCURRENCY`` at a time).
+        Results are kept for ``quote_ttl`` seconds, keyed by user, query,
+        experiment attribution and channel discount, so re-rendering the
+        duration and payment method screens does not re-quote. Results are
+        returned in the order of ``queries``.
+        """
+        discount_key = json_utils.encode(channel_discount)
+        keys: list[_QuoteKey] = [
+            (
+                telegram_id,
+                query.plan_id,
+                query.duration_days,
+                query.currency,
+                json_utils.encode(query.experiment),
+                discount_key,
+            )
+            for query in queries
+        ]
+        results: dict[_QuoteKey, BillingPriceDetails] = {}
+        missing: dict[_QuoteKey, BillingPriceQuery] = {}
+
+        for key, query in zip(keys, queries):
+            cached = self._quotes.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                missing[key] = query
+
+        if missing:
+            semaphore = asyncio.Semaphore(PRICE_QUOTE_CONCURRENCY)
+
+            async def _quote(query: BillingPriceQuery) -> BillingPriceDetails:
+                async with semaphore:
+                    return await self.calculate_price(
+                        telegram_id=telegram_id,
+                        plan_id=query.plan_id,
+                        duration_days=query.duration_days,
+                        currency=query.currency,
+                        experiment=query.experiment,
+                        channel_discount=channel_discount,
+                    )
+
+            quoted = await asyncio.gather(*(_quote(query) for query in missing.values()))
+            for key, details in zip(missing, quoted):
+                self._quotes[key] = details
+                results[key] = details
+
+        logger.debug(
+            f"Quoted '{len(queries)}' prices for user '{telegram_id}' "
+            f"('{len(queries) - len(missing)}' from cache)"
+        )
+        return [results[key] for key in keys]
+
+    def invalidate_price_quotes(self, telegram_id: int) -> None:
+        for key in [key for key in self._quotes if key[0] == telegram_id]:
+            self._quotes.pop(key, None)
+
     # ------------------------------------------------------------------ #
     # Referrals
     # ------------------------------------------------------------------ #
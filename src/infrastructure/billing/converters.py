@@ -52,20 +52,22 @@ from src.models.dto.user import BaseUserDto, UserDto
 
 from .models import (
     BillingPaymentGateway,
-    BillingPlan,
-    BillingPlanDuration,
-    BillingPlanPrice,
-    BillingPlanSnapshot,
-    BillingPriceDetails,
-    BillingPromocode,
-    BillingPromocodeActivation,
     BillingReferral,
     BillingReferralReward,
     BillingSettings,
-    BillingSubscription,
-    BillingTransaction,
     BillingUser,
 )
+from .structs import (
+    AnyBillingPlan,
+    AnyBillingPlanDuration,
+    AnyBillingPlanPrice,
+    AnyBillingPlanSnapshot,
+    AnyBillingPriceDetails,
+    AnyBillingPromocode,
+    AnyBillingPromocodeActivation,
+    AnyBillingSubscription,
+    AnyBillingTransaction,
+)
 
 # ------------------------------------------------------------------ #
 # Plans
@@ -94,7 +96,7 @@ def _parse_uuid(raw: Optional[str]) -> Optional[UUID]:
         return None
 
 
-def billing_plan_price_to_dto(bp: BillingPlanPrice) -> PlanPriceDto:
+def billing_plan_price_to_dto(bp: AnyBillingPlanPrice) -> PlanPriceDto:
     return PlanPriceDto(
         id=bp.ID if bp.ID else None,
         currency=Currency(bp.Currency),
@@ -102,7 +104,7 @@ def billing_plan_price_to_dto(bp: BillingPlanPrice) -> PlanPriceDto:
     )
 
 
-def billing_plan_duration_to_dto(bd: BillingPlanDuration) -> PlanDurationDto:
+def billing_plan_duration_to_dto(bd: AnyBillingPlanDuration) -> PlanDurationDto:
     return PlanDurationDto(
         id=bd.ID if bd.ID else None,
         days=bd.Days,
@@ -110,7 +112,7 @@ def billing_plan_duration_to_dto(bd: BillingPlanDuration) -> PlanDurationDto:
     )
 
 
-def billing_plan_to_dto(bp: BillingPlan) -> PlanDto:
+def billing_plan_to_dto(bp: AnyBillingPlan) -> PlanDto:
     return PlanDto(
         id=bp.ID if bp.ID else None,
         order_index=bp.OrderIndex,
@@ -132,7 +134,7 @@ def billing_plan_to_dto(bp: BillingPlan) -> PlanDto:
     )
 
 
-def billing_plan_snapshot_to_dto(bs: BillingPlanSnapshot) -> PlanSnapshotDto:
+def billing_plan_snapshot_to_dto(bs: AnyBillingPlanSnapshot) -> PlanSnapshotDto:
     return PlanSnapshotDto(
         id=bs.id,
         name=bs.name,
@@ -154,7 +156,7 @@ def billing_plan_snapshot_to_dto(bs: BillingPlanSnapshot) -> PlanSnapshotDto:
 # ------------------------------------------------------------------ #
 
 
-def billing_subscription_to_dto(bs: BillingSubscription) -> SubscriptionDto:
+def billing_subscription_to_dto(bs: AnyBillingSubscription) -> SubscriptionDto:
     plan_snapshot = billing_plan_snapshot_to_dto(bs.Plan) if bs.Plan else PlanSnapshotDto.test()
     return SubscriptionDto(
         id=bs.ID if bs.ID else None,
@@ -182,7 +184,7 @@ def billing_subscription_to_dto(bs: BillingSubscription) -> SubscriptionDto:
 # ------------------------------------------------------------------ #
 
 
-def billing_price_details_to_dto(bp: BillingPriceDetails) -> PriceDetailsDto:
+def billing_price_details_to_dto(bp: AnyBillingPriceDetails) -> PriceDetailsDto:
     base_discount_percent = getattr(bp, "base_discount_percent", 0)
     channel_discount_percent = getattr(bp, "channel_discount_percent", 0)
     channel_discount_source = getattr(bp, "channel_discount_source", "")
@@ -203,7 +205,7 @@ def billing_price_details_to_dto(bp: BillingPriceDetails) -> PriceDetailsDto:
     )
 
 
-def billing_transaction_to_dto(bt: BillingTransaction) -> TransactionDto:
+def billing_transaction_to_dto(bt: AnyBillingTransaction) -> TransactionDto:
     plan_snapshot = billing_plan_snapshot_to_dto(bt.Plan) if bt.Plan else PlanSnapshotDto.test()
     pricing = billing_price_details_to_dto(bt.Pricing) if bt.Pricing else PriceDetailsDto()
     return TransactionDto(
@@ -228,7 +230,9 @@ def billing_transaction_to_dto(bt: BillingTransaction) -> TransactionDto:
 # ------------------------------------------------------------------ #
 
 
-def billing_promocode_activation_to_dto(ba: BillingPromocodeActivation) -> PromocodeActivationDto:
+def billing_promocode_activation_to_dto(
+    ba: AnyBillingPromocodeActivation,
+) -> PromocodeActivationDto:
     return PromocodeActivationDto(
         id=ba.ID if ba.ID else None,
         promocode_id=ba.PromocodeID,
@@ -237,7 +241,7 @@ def billing_promocode_activation_to_dto(ba: BillingPromocodeActivation) -> Promo
     )
 
 
-def billing_promocode_to_dto(bp: BillingPromocode) -> PromocodeDto:
+def billing_promocode_to_dto(bp: AnyBillingPromocode) -> PromocodeDto:
     plan_snapshot = billing_plan_snapshot_to_dto(bp.Plan) if bp.Plan else None
     return PromocodeDto(
         id=bp.ID if bp.ID else None,
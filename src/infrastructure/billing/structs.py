@@ -0,0 +1,208 @@
+"""msgspec mirrors of the billing response models for large list endpoints.
+
+Each Struct declares the same PascalCase (or json-tagged snake_case) fields
+and defaults as its Pydantic counterpart in `models.py`, so the converters
+accept either. Lists decode straight from the response bytes in one pass
+instead of `response.json()` followed by one `model_validate` per row.
+`BillingClient` only takes this path for the endpoints listed in its
+`struct_endpoints` (``APP_BILLING_STRUCT_DECODING``).
+"""
+
+from datetime import datetime
+from typing import Any, Final, Optional, TypeAlias, TypeVar, Union
+
+import msgspec
+
+from .models import (
+    BillingPlan,
+    BillingPlanDuration,
+    BillingPlanPrice,
+    BillingPlanSnapshot,
+    BillingPriceDetails,
+    BillingPromocode,
+    BillingPromocodeActivation,
+    BillingSubscription,
+    BillingTransaction,
+)
+
+_StructT = TypeVar("_StructT", bound=msgspec.Struct)
+
+# --- Plans ---
+
+
+class BillingPlanPriceStruct(msgspec.Struct, kw_only=True, gc=False):
+    ID: int = 0
+    DurationID: int = 0
+    Currency: str = ""
+    Price: str = "0"
+
+
+class BillingPlanDurationStruct(msgspec.Struct, kw_only=True, gc=False):
+    ID: int = 0
+    PlanID: int = 0
+    Days: int = 0
+    Prices: list[BillingPlanPriceStruct] = msgspec.field(default_factory=list)
+
+
+class BillingPlanStruct(msgspec.Struct, kw_only=True, gc=False):
+    ID: int = 0
+    OrderIndex: int = 0
+    IsActive: bool = True
+    Type: str = ""
+    Availability: str = ""
+    Name: str = ""
+    Description: Optional[str] = None
+    Tag: Optional[str] = None
+    TrafficLimit: int = 0
+    DeviceLimit: int = 0
+    TrafficLimitStrategy: str = ""
+    AllowedUserIDs: Optional[list[int]] = None
+    InternalSquads: Optional[list[str]] = None
+    ExternalSquad: Optional[str] = None
+    Durations: list[BillingPlanDurationStruct] = msgspec.field(default_factory=list)
+    CreatedAt: Optional[datetime] = None
+    UpdatedAt: Optional[datetime] = None
+
+
+class BillingPlanSnapshotStruct(msgspec.Struct, kw_only=True, gc=False):
+    id: int = 0
+    name: str = ""
+    tag: Optional[str] = None
+    type: str = ""
+    traffic_limit: int = 0
+    device_limit: int = 0
+    duration: int = 0
+    traffic_limit_strategy: str = ""
+    internal_squads: Optional[list[str]] = None
+    external_squad: Optional[str] = None
+
+
+# --- Subscriptions ---
+
+
+class BillingSubscriptionStruct(msgspec.Struct, kw_only=True, gc=False):
+    ID: int = 0
+    UserRemnaID: str = ""
+    UserTelegramID: int = 0
+    Status: str = ""
+    IsTrial: bool = False
+    TrafficLimit: int = 0
+    DeviceLimit: int = 0
+    TrafficLimitStrategy: str = ""
+    Tag: Optional[str] = None
+    InternalSquads: Optional[list[str]] = None
+    ExternalSquad: Optional[str] = None
+    ExpireAt: Optional[datetime] = None
+    URL: str = ""
+    Plan: Optional[BillingPlanSnapshotStruct] = None
+    CreatedAt: Optional[datetime] = None
+    UpdatedAt: Optional[datetime] = None
+
+
+# --- Transactions ---
+
+
+class BillingPriceDetailsStruct(msgspec.Struct, kw_only=True, gc=False):
+    original_amount: str = "0"
+    discount_percent: int = 0
+    final_amount: str = "0"
+    base_discount_percent: int = 0
+    channel_discount_percent: int = 0
+    channel_discount_source: str = ""
+
+
+class BillingTransactionStruct(msgspec.Struct, kw_only=True, gc=False):
+    ID: int = 0
+    PaymentID: str = ""
+    UserTelegramID: int = 0
+    Status: str = ""
+    IsTest: bool = False
+    PurchaseType: str = ""
+    GatewayType: str = ""
+    Pricing: Optional[BillingPriceDetailsStruct] = None
+    Currency: str = ""
+    Plan: Optional[BillingPlanSnapshotStruct] = None
+    CreatedAt: Optional[datetime] = None
+    UpdatedAt: Optional[datetime] = None
+
+
+# --- Promocodes ---
+
+
+class BillingPromocodeActivationStruct(msgspec.Struct, kw_only=True, gc=False):
+    ID: int = 0
+    PromocodeID: int = 0
+    UserTelegramID: int = 0
+    ActivatedAt: Optional[datetime] = None
+
+
+class BillingPromocodeStruct(msgspec.Struct, kw_only=True, gc=False):
+    ID: int = 0
+    Code: str = ""
+    IsActive: bool = True
+    Availability: str = ""
+    RewardType: str = ""
+    Reward: Optional[int] = None
+    Plan: Optional[BillingPlanSnapshotStruct] = None
+    PurchaseDiscountMaxDays: Optional[int] = None
+    Lifetime: int = -1
+    MaxActivations: int = -1
+    AllowedTelegramIDs: Optional[list[int]] = None
+    Activations: Optional[list[BillingPromocodeActivationStruct]] = msgspec.field(
+        default_factory=list
+    )
+    CreatedAt: Optional[datetime] = None
+    UpdatedAt: Optional[datetime] = None
+
+
+# Either decoding path may feed a converter.
+AnyBillingPlanPrice: TypeAlias = Union[BillingPlanPrice, BillingPlanPriceStruct]
+AnyBillingPlanDuration: TypeAlias = Union[BillingPlanDuration, BillingPlanDurationStruct]
+AnyBillingPlan: TypeAlias = Union[BillingPlan, BillingPlanStruct]
+AnyBillingPlanSnapshot: TypeAlias = Union[BillingPlanSnapshot, BillingPlanSnapshotStruct]
+AnyBillingSubscription: TypeAlias = Union[BillingSubscription, BillingSubscriptionStruct]
+AnyBillingPriceDetails: TypeAlias = Union[BillingPriceDetails, BillingPriceDetailsStruct]
+AnyBillingTransaction: TypeAlias = Union[BillingTransaction, BillingTransactionStruct]
+AnyBillingPromocodeActivation: TypeAlias = Union[
+    BillingPromocodeActivation, BillingPromocodeActivationStruct
+]
+AnyBillingPromocode: TypeAlias = Union[BillingPromocode, BillingPromocodeStruct]
+
+# BillingClient list endpoints that can decode into the Structs above.
+STRUCT_DECODING_ENDPOINTS: Final[frozenset[str]] = frozenset(
+    {
+        "list_plans",
+        "get_available_plans",
+        "get_allowed_plans",
+        "list_subscriptions_by_user",
+        "list_all_subscriptions",
+        "list_transactions",
+        "list_all_transactions",
+        "list_transactions_by_status",
+        "list_promocodes",
+    }
+)
+
+_list_decoders: dict[type[Any], msgspec.json.Decoder[Any]] = {}
+
+
+def decode_struct_list(body: Optional[bytes], struct: type[_StructT]) -> list[_StructT]:
+    """Decode a JSON array of ``struct`` items from raw response bytes.
+
+    An empty body, ``null`` or a non-array document yields an empty list; a
+    malformed item raises ``msgspec.ValidationError``.
+    """
+    if not body:
+        return []
+
+    decoder = _list_decoders.get(struct)
+    if decoder is None:
+        # strict=False keeps Pydantic's lax coercions ("42" -> 42, 1.0 -> 1).
+        decoder = msgspec.json.Decoder(
+            Union[list[struct], dict[str, Any], None],  # type: ignore[valid-type]
+            strict=False,
+        )
+        _list_decoders[struct] = decoder
+
+    result = decoder.decode(body)
+    return result if isinstance(result, list) else []
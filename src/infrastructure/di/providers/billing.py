@@ -12,4 +12,6 @@ class BillingProvider(Provider):
         return BillingClient(
             base_url=config.api_url,
             internal_secret=config.api_internal_secret.get_secret_value(),
+            single_flight=config.billing_single_flight,
+            struct_endpoints=config.billing_struct_decoding,
         )
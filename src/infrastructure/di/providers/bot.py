@@ -10,6 +10,12 @@ from dishka import Provider, Scope, from_context, provide
 from loguru import logger
 
 from src.core.config import AppConfig
+from src.infrastructure.redis import RedisRepository
+from src.infrastructure.telegram import (
+    MessageDeletionScheduler,
+    RateLimitedRequestMiddleware,
+    TelegramRateLimiter,
+)
 
 
 class BotProvider(Provider):
@@ -18,7 +24,11 @@ class BotProvider(Provider):
     bg_manager_factory = from_context(provides=BgManagerFactory)
 
     @provide
-    async def get_bot(self, config: AppConfig) -> AsyncIterable[Bot]:
+    async def get_bot(
+        self,
+        config: AppConfig,
+        redis_repository: RedisRepository,
+    ) -> AsyncIterable[Bot]:
         logger.debug("Initializing Bot instance")
 
         session = None
@@ -33,7 +43,30 @@ class BotProvider(Provider):
             default=DefaultBotProperties(parse_mode=ParseMode.HTML),
             session=session,
         ) as bot:
+            if config.bot.send_rate_limit_enabled:
+                limiter = TelegramRateLimiter(
+                    redis_repository,
+                    global_rate=config.bot.send_global_rate,
+                    chat_rate=config.bot.send_chat_rate,
+                    chat_burst=config.bot.send_chat_burst,
+                    group_rate=config.bot.send_group_rate,
+                    bulk_reserve=config.bot.send_bulk_reserve,
+                    max_wait=config.bot.send_max_wait,
+                )
+                bot.session.middleware(
+                    RateLimitedRequestMiddleware(limiter, max_retries=config.bot.send_max_retries)
+                )
             yield bot
 
         logger.debug("Closing Bot session")
         await bot.session.close()
+
+    @provide
+    async def get_message_deletion_scheduler(
+        self,
+        bot: Bot,
+        redis_repository: RedisRepository,
+    ) -> AsyncIterable[MessageDeletionScheduler]:
+        scheduler = MessageDeletionScheduler(bot, redis_repository)
+        yield scheduler
+        await scheduler.stop()
@@ -5,7 +5,7 @@ from loguru import logger
 from redis.asyncio import ConnectionPool, Redis
 
 from src.core.config import AppConfig
-from src.infrastructure.redis import RedisRepository
+from src.infrastructure.redis import CacheInvalidationListener, RedisRepository
 
 
 class RedisProvider(Provider):
@@ -31,3 +31,17 @@ class RedisProvider(Provider):
         await connection_pool.disconnect()
 
     redis_repository = provide(source=RedisRepository)
+
+    @provide
+    async def get_cache_invalidation_listener(
+        self,
+        config: AppConfig,
+        client: Redis,
+    ) -> AsyncGenerator[CacheInvalidationListener, None]:
+        listener = CacheInvalidationListener(client)
+        if config.redis.local_cache_enabled:
+            await listener.start()
+
+        yield listener
+
+        await listener.stop()
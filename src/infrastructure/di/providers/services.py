@@ -1,12 +1,16 @@
+from typing import AsyncIterable
+
 from dishka import Provider, Scope, provide
 from redis.asyncio import Redis
 
 from src.core.config import AppConfig
 from src.services.access import AccessService
+from src.services.broadcast import BroadcastService
 from src.services.channel_incentive import ChannelIncentiveService
 from src.services.command import CommandService
-from src.services.experiment import ExperimentService
+from src.services.experiment import EstimandRuntime, ExperimentService
 from src.services.loyalty_reward import LoyaltyRewardService
+from src.services.menu import MenuService
 from src.services.notification import NotificationService
 from src.services.payment_gateway import PaymentGatewayService
 from src.services.plan import PlanService
@@ -24,9 +28,25 @@ class ServicesProvider(Provider):
 
     command_service = provide(source=CommandService)
 
+    @provide
+    async def get_estimand_runtime(self, config: AppConfig) -> AsyncIterable[EstimandRuntime]:
+        runtime = EstimandRuntime.create(config)
+        runtime.start()
+        yield runtime
+        await runtime.aclose()
+
     @provide(scope=Scope.REQUEST)
-    def get_experiment_service(self, config: AppConfig, redis_client: Redis) -> ExperimentService:
-        return ExperimentService(config=config, redis_client=redis_client)
+    def get_experiment_service(
+        self,
+        config: AppConfig,
+        redis_client: Redis,
+        estimand_runtime: EstimandRuntime,
+    ) -> ExperimentService:
+        return ExperimentService(
+            config=config,
+            redis_client=redis_client,
+            estimand_runtime=estimand_runtime,
+        )
 
     access_service = provide(source=AccessService, scope=Scope.REQUEST)
     notification_service = provide(source=NotificationService, scope=Scope.REQUEST)
@@ -43,3 +63,5 @@ class ServicesProvider(Provider):
     referral_service = provide(source=ReferralService, scope=Scope.REQUEST)
     channel_incentive_service = provide(source=ChannelIncentiveService, scope=Scope.REQUEST)
     loyalty_reward_service = provide(source=LoyaltyRewardService, scope=Scope.REQUEST)
+    menu_service = provide(source=MenuService, scope=Scope.REQUEST)
+    broadcast_service = provide(source=BroadcastService, scope=Scope.REQUEST)
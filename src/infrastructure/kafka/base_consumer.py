@@ -1,25 +1,65 @@
 import asyncio
-import json
+import time
+from collections import defaultdict
+from typing import Any, Optional
 
-from aiokafka import AIOKafkaConsumer
+import msgspec
+from aiokafka import AIOKafkaConsumer, ConsumerRecord, TopicPartition
 from dishka import AsyncContainer
 from loguru import logger
+from redis.asyncio import Redis
 
 from src.core.config import AppConfig
-from src.core.metrics import KAFKA_CONSUMER_RESTARTS_TOTAL, KAFKA_CONSUMER_UP
+from src.core.metrics import (
+    KAFKA_CONSUMER_BATCH_DURATION,
+    KAFKA_CONSUMER_DEAD_LETTERS_TOTAL,
+    KAFKA_CONSUMER_LAG,
+    KAFKA_CONSUMER_MESSAGES_TOTAL,
+    KAFKA_CONSUMER_RESTARTS_TOTAL,
+    KAFKA_CONSUMER_RETRIES_TOTAL,
+    KAFKA_CONSUMER_UP,
+)
+from src.infrastructure.kafka.dlq import (
+    ERROR_LIMIT,
+    REPLAY_HANDLER_HEADER,
+    DeadLetter,
+    DeadLetterSink,
+    create_dead_letter_sink,
+)
+from src.infrastructure.kafka.events import RejectedEvent, build_value_deserializer
 
 INITIAL_BACKOFF_SECONDS = 1.0
 MAX_BACKOFF_SECONDS = 60.0
 BACKOFF_MULTIPLIER = 2.0
 
+Batches = dict[TopicPartition, list[ConsumerRecord]]
+
 
 class SupervisedKafkaConsumer:
     """Base class for Kafka consumers with at-least-once delivery and crash
     supervision.
 
-    Offsets are committed manually, only after `_handle_message` returns
-    successfully, so a crash mid-processing redelivers the message instead of
-    silently dropping it. If the consume loop crashes, the supervisor logs it,
+    Messages are fetched in batches with `getmany` and handled concurrently,
+    at most `kafka_max_concurrency` at a time. Messages with the same ordering
+    key (the payload's `telegram_id`) are handled one after another in offset
+    order, so a user never sees their events reordered, while one slow send
+    no longer holds up everyone else on the partition.
+
+    Values are decoded into `payload_type` as they are fetched. A value that
+    does not decode is counted and committed without reaching
+    `_handle_message`, so a poison message cannot crash the consume loop.
+
+    A failing message is retried in place up to `kafka_max_attempts` times
+    with exponential backoff; only its own key's lane waits. Errors listed in
+    `non_retryable` skip the retries. A message that still fails is published
+    to the dead-letter sink (see `dlq.py`) with its error and counts as done,
+    so one bad event no longer stalls the partition.
+
+    Offsets are committed manually, once per batch, and only up to the highest
+    offset below which every message was handled or dead-lettered. If the
+    dead-letter sink is unavailable the failure propagates: the message and
+    anything after it is redelivered instead of silently dropped. If the
+    consume loop crashes, the supervisor logs it,
     flips the `kafka_consumer_up` gauge to 0, increments
     `kafka_consumer_restarts_total`, and restarts the loop (recreating the
     underlying AIOKafkaConsumer) with exponential backoff instead of leaving
@@ -27,8 +67,13 @@ class SupervisedKafkaConsumer:
     """
 
     consumer_name: str = "unnamed"
+    # msgspec type message values decode into; values that don't match are rejected
+    payload_type: Any = dict[str, Any]
+    # Errors retrying can never fix; such messages are dead-lettered on the first failure
+    non_retryable: tuple[type[Exception], ...] = ()
 
     def __init__(self, config: AppConfig, container: AsyncContainer) -> None:
+        self._config = config
         self._brokers = config.kafka_brokers
         self._container = container
         self._consumer: AIOKafkaConsumer | None = None
@@ -39,6 +84,13 @@ class SupervisedKafkaConsumer:
         self._max_backoff = MAX_BACKOFF_SECONDS
         self._backoff_multiplier = BACKOFF_MULTIPLIER
 
+        self._batch_size = config.kafka_batch_size
+        self._max_concurrency = config.kafka_max_concurrency
+        self._fetch_timeout_ms = config.kafka_fetch_timeout_ms
+        self._max_attempts = config.kafka_max_attempts
+        self._retry_backoff = config.kafka_retry_backoff
+        self._dead_letters: Optional[DeadLetterSink] = None
+
     @property
     def topic(self) -> str:
         raise NotImplementedError
@@ -47,9 +99,15 @@ class SupervisedKafkaConsumer:
     def group_id(self) -> str:
         raise NotImplementedError
 
-    async def _handle_message(self, payload: dict) -> None:
+    async def _handle_message(self, payload: Any) -> None:
         raise NotImplementedError
 
+    def _ordering_key(self, payload: Any) -> Any:
+        """Messages sharing a key are handled sequentially; ``None`` means unordered."""
+        if isinstance(payload, dict):
+            return payload.get("telegram_id") or None
+        return getattr(payload, "telegram_id", None)
+
     async def start(self) -> None:
         if not self._brokers:
             logger.warning(f"Kafka brokers not configured, skipping {self.consumer_name} consumer")
@@ -68,6 +126,9 @@ class SupervisedKafkaConsumer:
                 pass
             self._supervisor_task = None
         await self._stop_consumer()
+        if self._dead_letters is not None:
+            await self._dead_letters.close()
+            self._dead_letters = None
         KAFKA_CONSUMER_UP.labels(consumer=self.consumer_name).set(0)
         logger.info(f"{self.consumer_name} consumer stopped")
 
@@ -98,20 +159,248 @@ class SupervisedKafkaConsumer:
                     break
 
     async def _run_once(self) -> None:
+        if self._dead_letters is None:
+            redis_client = await self._container.get(Redis)
+            self._dead_letters = create_dead_letter_sink(self._config, redis_client)
+
         self._consumer = AIOKafkaConsumer(
             self.topic,
             bootstrap_servers=self._brokers,
             group_id=self.group_id,
             auto_offset_reset="latest",
             enable_auto_commit=False,
-            value_deserializer=lambda v: json.loads(v.decode("utf-8")),
+            value_deserializer=build_value_deserializer(self.payload_type, self.consumer_name),
         )
         await self._consumer.start()
         logger.info(f"{self.consumer_name} consumer started, topic={self.topic}")
         KAFKA_CONSUMER_UP.labels(consumer=self.consumer_name).set(1)
         try:
-            async for msg in self._consumer:
-                await self._handle_message(msg.value)
-                await self._consumer.commit()
+            while not self._stopping:
+                batches = await self._consumer.getmany(
+                    timeout_ms=self._fetch_timeout_ms,
+                    max_records=self._batch_size,
+                )
+                if batches:
+                    await self._process_batch(batches)
         finally:
             await self._stop_consumer()
+
+    async def _process_batch(self, batches: Batches) -> None:
+        """Handle one fetched batch, commit its completed prefix, then re-raise any failure."""
+        started = time.perf_counter()
+        await self._dead_letter_rejected(batches)
+        semaphore = asyncio.Semaphore(max(self._max_concurrency, 1))
+        done, error = await self._dispatch(self, batches, semaphore)
+        await self._commit(batches, self._completed_offsets(batches, done))
+        KAFKA_CONSUMER_BATCH_DURATION.labels(consumer=self.consumer_name).observe(
+            time.perf_counter() - started
+        )
+        if error is not None:
+            raise error
+
+    async def _dispatch(
+        self,
+        handler: "SupervisedKafkaConsumer",
+        batches: Batches,
+        semaphore: asyncio.Semaphore,
+        handled_below: Optional[dict[TopicPartition, int]] = None,
+    ) -> tuple[dict[TopicPartition, set[int]], Optional[BaseException]]:
+        """Run ``handler`` over a batch, one sequential lane per ordering key.
+
+        Offsets below ``handled_below`` count as done without being handled,
+        as do rejected values and replays meant for another handler. Returns
+        the done offsets per partition and the first unrecoverable failure.
+        """
+        handled_below = handled_below or {}
+        done: dict[TopicPartition, set[int]] = {partition: set() for partition in batches}
+        lanes: defaultdict[Any, list[tuple[TopicPartition, ConsumerRecord]]] = defaultdict(list)
+        for partition, records in batches.items():
+            for record in records:
+                replay_target = _replay_target(record)
+                if (
+                    # Rejected values were dead-lettered when the batch arrived
+                    isinstance(record.value, RejectedEvent)
+                    or record.offset < handled_below.get(partition, 0)
+                    or replay_target not in (None, handler.consumer_name)
+                ):
+                    done[partition].add(record.offset)
+                    continue
+                key = handler._ordering_key(record.value)
+                if key is None:
+                    key = (partition, record.offset)
+                lanes[key].append((partition, record))
+
+        async def run_lane(lane: list[tuple[TopicPartition, ConsumerRecord]]) -> None:
+            async with semaphore:
+                for partition, record in lane:
+                    error, attempts = await self._attempt(handler, record.value)
+                    if error is None:
+                        result = "processed"
+                    else:
+                        reason = (
+                            "non_retryable"
+                            if isinstance(error, handler.non_retryable)
+                            else "exhausted"
+                        )
+                        try:
+                            await self._dead_letter(
+                                handler.consumer_name,
+                                partition,
+                                record,
+                                reason=reason,
+                                error_type=type(error).__name__,
+                                error=str(error),
+                                attempts=attempts,
+                            )
+                        except Exception as exception:
+                            KAFKA_CONSUMER_MESSAGES_TOTAL.labels(
+                                consumer=handler.consumer_name, result="failed"
+                            ).inc()
+                            logger.error(
+                                f"{handler.consumer_name} could not dead-letter offset "
+                                f"{record.offset}: {exception!r}"
+                            )
+                            # Later messages of this key stay unhandled to keep their order
+                            raise error
+                        result = "dead_lettered"
+                    done[partition].add(record.offset)
+                    KAFKA_CONSUMER_MESSAGES_TOTAL.labels(
+                        consumer=handler.consumer_name, result=result
+                    ).inc()
+
+        results = await asyncio.gather(
+            *(run_lane(lane) for lane in lanes.values()),
+            return_exceptions=True,
+        )
+        error = next((result for result in results if isinstance(result, BaseException)), None)
+        return done, error
+
+    async def _attempt(
+        self,
+        handler: "SupervisedKafkaConsumer",
+        payload: Any,
+    ) -> tuple[Optional[Exception], int]:
+        """Handle ``payload`` within the retry budget; returns the last error and attempts made."""
+        max_attempts = max(self._max_attempts, 1)
+        attempt = 1
+        while True:
+            try:
+                await handler._handle_message(payload)
+            except handler.non_retryable as exception:
+                return exception, attempt
+            except Exception as exception:
+                if attempt >= max_attempts:
+                    return exception, attempt
+                KAFKA_CONSUMER_RETRIES_TOTAL.labels(consumer=handler.consumer_name).inc()
+                logger.warning(
+                    f"{handler.consumer_name} failed attempt {attempt}/{max_attempts}, "
+                    f"retrying: {exception!r}"
+                )
+                await asyncio.sleep(self._retry_backoff * 2 ** (attempt - 1))
+                attempt += 1
+            else:
+                return None, attempt
+
+    async def _dead_letter(
+        self,
+        handler_name: str,
+        partition: TopicPartition,
+        record: ConsumerRecord,
+        *,
+        reason: str,
+        error_type: str,
+        error: str,
+        attempts: int,
+    ) -> None:
+        if self._dead_letters is None:
+            raise RuntimeError("Dead-letter sink is not open")
+
+        value = record.value
+        raw = value.raw if isinstance(value, RejectedEvent) else msgspec.json.encode(value)
+        key = record.key.decode(errors="replace") if isinstance(record.key, bytes) else None
+        await self._dead_letters.publish(
+            DeadLetter(
+                consumer=self.consumer_name,
+                handler=handler_name,
+                topic=partition.topic,
+                partition=partition.partition,
+                offset=record.offset,
+                key=key,
+                value=raw.decode(errors="replace"),
+                reason=reason,
+                error_type=error_type,
+                error=error[:ERROR_LIMIT],
+                attempts=attempts,
+            )
+        )
+        KAFKA_CONSUMER_DEAD_LETTERS_TOTAL.labels(consumer=handler_name, reason=reason).inc()
+        logger.error(
+            f"{handler_name} dead-lettered {partition.topic}[{partition.partition}] "
+            f"offset {record.offset} after {attempts} attempt(s) ({reason}): {error}"
+        )
+
+    async def _dead_letter_rejected(self, batches: Batches) -> None:
+        """Keep values that failed to decode for inspection; they are committed either way."""
+        for partition, records in batches.items():
+            for record in records:
+                if not isinstance(record.value, RejectedEvent):
+                    continue
+                try:
+                    await self._dead_letter(
+                        self.consumer_name,
+                        partition,
+                        record,
+                        reason=record.value.reason,
+                        error_type=record.value.reason,
+                        error=record.value.error,
+                        attempts=0,
+                    )
+                except Exception as exception:
+                    logger.warning(
+                        f"{self.consumer_name} could not dead-letter rejected offset "
+                        f"{record.offset}: {exception!r}"
+                    )
+
+    @staticmethod
+    def _completed_offsets(
+        batches: Batches,
+        done: dict[TopicPartition, set[int]],
+    ) -> dict[TopicPartition, int]:
+        """Per partition, the offset just past the longest fully handled run from the start."""
+        offsets: dict[TopicPartition, int] = {}
+        for partition, records in batches.items():
+            next_offset = records[0].offset
+            for record in records:
+                if record.offset not in done[partition]:
+                    break
+                next_offset = record.offset + 1
+            offsets[partition] = next_offset
+        return offsets
+
+    async def _commit(self, batches: Batches, offsets: dict[TopicPartition, int]) -> None:
+        if self._consumer is None:
+            return
+
+        for partition, next_offset in offsets.items():
+            highwater = self._consumer.highwater(partition)
+            if highwater is not None:
+                KAFKA_CONSUMER_LAG.labels(
+                    consumer=self.consumer_name,
+                    partition=str(partition.partition),
+                ).set(max(highwater - next_offset, 0))
+
+        committable = {
+            partition: next_offset
+            for partition, next_offset in offsets.items()
+            if next_offset > batches[partition][0].offset
+        }
+        if committable:
+            await self._consumer.commit(committable)
+
+
+def _replay_target(record: ConsumerRecord) -> Optional[str]:
+    """Handler a message re-injected from the dead-letter sink is meant for, if any."""
+    for name, value in record.headers or ():
+        if name == REPLAY_HANDLER_HEADER:
+            return bytes(value).decode()
+    return None
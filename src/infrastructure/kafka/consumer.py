@@ -7,8 +7,7 @@ from loguru import logger
 from src.bot.keyboards import get_user_keyboard
 from src.bot.states import Subscription
 from src.core.config import AppConfig
-from src.core.enums import PurchaseType, SystemNotificationType
-from src.core.metrics import KAFKA_CONSUMER_DISCARDED_MESSAGES_TOTAL
+from src.core.enums import PurchaseType
 from src.core.utils.formatters import (
     i18n_format_days,
     i18n_format_device_limit,
@@ -16,6 +15,11 @@ from src.core.utils.formatters import (
 )
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.kafka.base_consumer import SupervisedKafkaConsumer
+from src.infrastructure.kafka.events import (
+    NotifyUserEvent,
+    NotifyUserRedirectEvent,
+    NotifyUserSystemEvent,
+)
 from src.services.notification import NotificationService
 
 
@@ -45,9 +49,13 @@ class UserNotificationConsumer(SupervisedKafkaConsumer):
         "i18n_kwargs": { ... },
         "reply_markup_user_id": int | null
     }
+    or a "redirect" event; see `events.py` for both variants.
     """
 
     consumer_name = "notification"
+    payload_type = NotifyUserEvent
+    # A malformed Fluent payload never renders; dead-letter it without retrying
+    non_retryable = (FormatError,)
 
     def __init__(self, config: AppConfig, container: AsyncContainer) -> None:
         super().__init__(config, container)
@@ -62,78 +70,38 @@ class UserNotificationConsumer(SupervisedKafkaConsumer):
     def group_id(self) -> str:
         return self._group_id
 
-    async def _handle_message(self, payload: dict) -> None:
-        telegram_id = payload.get("telegram_id")
-        if not telegram_id:
-            logger.warning("Notification event missing telegram_id, skipping")
-            return
-
-        msg_type = payload.get("type", "system")
-
-        try:
-            if msg_type == "system":
-                await self._handle_system_notify(telegram_id, payload)
-            elif msg_type == "redirect":
-                await self._handle_redirect(telegram_id, payload)
-            else:
-                logger.warning(f"Unknown notification type '{msg_type}', skipping")
-        except FormatError as exc:
-            # Retrying a malformed Fluent payload can never succeed. Let the
-            # base consumer commit this one poison message so later customer
-            # redirects are not held behind an exponential restart loop.
-            KAFKA_CONSUMER_DISCARDED_MESSAGES_TOTAL.labels(
-                consumer=self.consumer_name,
-                reason="format_error",
-            ).inc()
-            logger.error(
-                "Discarding malformed notification after translation failure: "
-                f"i18n_key={payload.get('i18n_key', '')!r}, error={exc}"
-            )
-
-    async def _handle_system_notify(self, telegram_id: int, payload: dict) -> None:
-        ntf_type_str = payload.get("ntf_type", "")
-        i18n_key = payload.get("i18n_key", "")
-        if not i18n_key:
-            logger.warning("System notification missing i18n_key, skipping")
-            return
-
-        try:
-            ntf_type = SystemNotificationType(ntf_type_str)
-        except ValueError:
-            logger.warning(f"Unknown ntf_type '{ntf_type_str}', skipping")
-            return
-
-        i18n_kwargs = payload.get("i18n_kwargs", {})
+    async def _handle_message(self, payload: NotifyUserEvent) -> None:
+        if isinstance(payload, NotifyUserSystemEvent):
+            await self._handle_system_notify(payload)
+        else:
+            await self._handle_redirect(payload)
 
+    async def _handle_system_notify(self, event: NotifyUserSystemEvent) -> None:
+        i18n_kwargs = dict(event.i18n_kwargs)
         _format_plan_i18n_kwargs(i18n_kwargs)
 
         reply_markup = None
-        reply_markup_user_id = payload.get("reply_markup_user_id")
-        if reply_markup_user_id:
-            reply_markup = get_user_keyboard(int(reply_markup_user_id))
+        if event.reply_markup_user_id:
+            reply_markup = get_user_keyboard(event.reply_markup_user_id)
 
         async with self._container() as request_container:
             notification_service = await request_container.get(NotificationService)
             await notification_service.system_notify(
-                ntf_type=ntf_type,
+                ntf_type=event.ntf_type,
                 payload=MessagePayload.not_deleted(
-                    i18n_key=i18n_key,
+                    i18n_key=event.i18n_key,
                     i18n_kwargs=i18n_kwargs,
                     reply_markup=reply_markup,
                 ),
             )
 
-        logger.info(f"Delivered system notification '{i18n_key}' for user {telegram_id}")
-
-    async def _handle_redirect(self, telegram_id: int, payload: dict) -> None:
-        redirect_to = payload.get("redirect_to", "")
-        if redirect_to != "subscription_success":
-            logger.warning(f"Unknown redirect_to '{redirect_to}', skipping")
-            return
+        logger.info(
+            f"Delivered system notification '{event.i18n_key}' for user {event.telegram_id}"
+        )
 
-        purchase_type_str = payload.get("purchase_type", "NEW")
+    async def _handle_redirect(self, event: NotifyUserRedirectEvent) -> None:
         try:
-            purchase_type = PurchaseType(purchase_type_str)
+            purchase_type = PurchaseType(event.purchase_type)
         except ValueError:
             purchase_type = PurchaseType.NEW
 
@@ -142,8 +110,8 @@ class UserNotificationConsumer(SupervisedKafkaConsumer):
             bg_factory = await request_container.get(BgManagerFactory)
             bg_manager = bg_factory.bg(
                 bot=bot,
-                user_id=telegram_id,
-                chat_id=telegram_id,
+                user_id=event.telegram_id,
+                chat_id=event.telegram_id,
             )
             await bg_manager.start(
                 state=Subscription.SUCCESS,
@@ -152,4 +120,4 @@ class UserNotificationConsumer(SupervisedKafkaConsumer):
                 show_mode=ShowMode.DELETE_AND_SEND,
             )
 
-        logger.info(f"Redirected user {telegram_id} to subscription success")
+        logger.info(f"Redirected user {event.telegram_id} to subscription success")
@@ -0,0 +1,166 @@
+"""Dead-letter sinks for Kafka messages no handler could process.
+
+A consumer that exhausts a message's retry budget (or hits an error that can
+never succeed, or a value that does not decode) publishes a ``DeadLetter``
+with the original value and the error, then commits past the message so the
+partition moves on. ``APP_KAFKA_DLQ_BACKEND`` picks the sink: a Redis stream
+(the default, and a local stand-in) or a Kafka topic.
+
+Entries are inspected and re-injected with ``dlq_cli``. A re-injected message
+carries the ``REPLAY_HANDLER_HEADER`` header, so in a topic hub only the
+handler that gave up on it runs again.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Final, Optional, Sequence
+
+import msgspec
+from aiokafka import AIOKafkaConsumer, AIOKafkaProducer, TopicPartition
+from redis.asyncio import Redis
+
+from src.core.config import AppConfig
+from src.core.enums import KafkaDeadLetterBackend
+from src.core.storage.keys import KafkaDeadLettersKey
+
+REPLAY_HANDLER_HEADER: Final[str] = "dlq_handler"
+# Longest error message kept with an entry
+ERROR_LIMIT: Final[int] = 2000
+
+_STREAM_PAGE: Final[int] = 500
+_ENTRY_FIELD: Final[str] = "entry"
+
+
+class DeadLetter(msgspec.Struct, kw_only=True, gc=False):
+    consumer: str
+    handler: str
+    topic: str
+    partition: int
+    offset: int
+    key: Optional[str] = None
+    value: str
+    # exhausted, non_retryable, malformed_json or invalid_schema
+    reason: str
+    error_type: str
+    error: str
+    attempts: int
+    failed_at: float = msgspec.field(default_factory=time.time)
+
+
+class DeadLetterSink(ABC):
+    # Whether entries can be removed once handled; check before calling delete
+    supports_delete: bool = True
+
+    @abstractmethod
+    async def publish(self, entry: DeadLetter) -> None: ...
+
+    @abstractmethod
+    def entries(self) -> AsyncIterator[tuple[str, DeadLetter]]:
+        """Every stored entry with its id, oldest first."""
+
+    @abstractmethod
+    async def delete(self, entry_ids: Sequence[str]) -> int: ...
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisDeadLetterSink(DeadLetterSink):
+    """Redis stream of JSON entries, trimmed to roughly ``max_length``."""
+
+    def __init__(self, redis_client: Redis, max_length: int) -> None:
+        self.redis_client = redis_client
+        self.max_length = max_length
+        self._key = KafkaDeadLettersKey().pack()
+
+    async def publish(self, entry: DeadLetter) -> None:
+        await self.redis_client.xadd(
+            self._key,
+            {_ENTRY_FIELD: msgspec.json.encode(entry)},
+            maxlen=self.max_length,
+            approximate=True,
+        )
+
+    async def entries(self) -> AsyncIterator[tuple[str, DeadLetter]]:
+        start = "-"
+        while True:
+            page = await self.redis_client.xrange(self._key, min=start, count=_STREAM_PAGE)
+            for entry_id, fields in page:
+                yield (
+                    entry_id.decode(),
+                    msgspec.json.decode(fields[_ENTRY_FIELD.encode()], type=DeadLetter),
+                )
+            if len(page) < _STREAM_PAGE:
+                return
+            start = f"({page[-1][0].decode()}"
+
+    async def delete(self, entry_ids: Sequence[str]) -> int:
+        if not entry_ids:
+            return 0
+        deleted: int = await self.redis_client.xdel(self._key, *entry_ids)
+        return deleted
+
+
+class KafkaDeadLetterSink(DeadLetterSink):
+    """Dead-letter topic; entries are ``partition:offset`` and expire with its retention."""
+
+    supports_delete = False
+
+    def __init__(self, brokers: str, topic: str) -> None:
+        self.brokers = brokers
+        self.topic = topic
+        self._producer: Optional[AIOKafkaProducer] = None
+
+    async def publish(self, entry: DeadLetter) -> None:
+        if self._producer is None:
+            producer = AIOKafkaProducer(bootstrap_servers=self.brokers, acks="all")
+            await producer.start()
+            self._producer = producer
+        await self._producer.send_and_wait(
+            self.topic,
+            value=msgspec.json.encode(entry),
+            key=entry.key.encode() if entry.key else None,
+        )
+
+    async def entries(self) -> AsyncIterator[tuple[str, DeadLetter]]:
+        consumer = AIOKafkaConsumer(
+            bootstrap_servers=self.brokers,
+            group_id=None,
+            enable_auto_commit=False,
+        )
+        await consumer.start()
+        try:
+            await consumer.topics()  # loads the metadata partitions_for_topic reads
+            partitions = [
+                TopicPartition(self.topic, partition)
+                for partition in consumer.partitions_for_topic(self.topic) or ()
+            ]
+            consumer.assign(partitions)
+            await consumer.seek_to_beginning(*partitions)
+            end_offsets = await consumer.end_offsets(partitions)
+            pending = {p for p in partitions if await consumer.position(p) < end_offsets[p]}
+            while pending:
+                batches = await consumer.getmany(*pending, timeout_ms=1000)
+                for partition, records in batches.items():
+                    for record in records:
+                        entry = msgspec.json.decode(record.value, type=DeadLetter)
+                        yield f"{partition.partition}:{record.offset}", entry
+                for partition in list(pending):
+                    if await consumer.position(partition) >= end_offsets[partition]:
+                        pending.discard(partition)
+        finally:
+            await consumer.stop()
+
+    async def delete(self, entry_ids: Sequence[str]) -> int:
+        raise RuntimeError("Kafka dead letters cannot be deleted, see supports_delete")
+
+    async def close(self) -> None:
+        if self._producer is not None:
+            await self._producer.stop()
+            self._producer = None
+
+
+def create_dead_letter_sink(config: AppConfig, redis_client: Redis) -> DeadLetterSink:
+    if config.kafka_dlq_backend == KafkaDeadLetterBackend.KAFKA:
+        return KafkaDeadLetterSink(config.kafka_brokers, config.kafka_dlq_topic)
+    return RedisDeadLetterSink(redis_client, config.kafka_dlq_max_length)
@@ -0,0 +1,187 @@
+"""Inspect, replay and purge Kafka dead letters.
+
+    python -m src.infrastructure.kafka.dlq_cli summary
+    python -m src.infrastructure.kafka.dlq_cli list --handler trial_reminder --since 2026-10-01
+    python -m src.infrastructure.kafka.dlq_cli replay --reason exhausted --delete
+    python -m src.infrastructure.kafka.dlq_cli purge --reason malformed_json
+
+Filters combine with AND. ``replay`` publishes each matching value back to
+its original topic with its original key. When a handler gave up on a message,
+the ``dlq_handler`` header makes only that handler run again; entries
+rejected before reaching any handler replay to the whole consumer.
+``--delete`` and ``purge`` need the Redis backend, since Kafka dead letters
+only expire with the topic retention.
+"""
+
+import argparse
+import asyncio
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+import msgspec
+from aiokafka import AIOKafkaProducer
+from redis.asyncio import Redis
+
+from src.core.config import AppConfig
+from src.infrastructure.kafka.dlq import (
+    REPLAY_HANDLER_HEADER,
+    DeadLetter,
+    DeadLetterSink,
+    create_dead_letter_sink,
+)
+
+
+@dataclass(frozen=True)
+class DeadLetterFilter:
+    consumer: Optional[str] = None
+    handler: Optional[str] = None
+    topic: Optional[str] = None
+    reason: Optional[str] = None
+    error_type: Optional[str] = None
+    since: Optional[float] = None
+    limit: Optional[int] = None
+
+    def matches(self, entry: DeadLetter) -> bool:
+        return (
+            self.consumer in (None, entry.consumer)
+            and self.handler in (None, entry.handler)
+            and self.topic in (None, entry.topic)
+            and self.reason in (None, entry.reason)
+            and self.error_type in (None, entry.error_type)
+            and (self.since is None or entry.failed_at >= self.since)
+        )
+
+
+async def select_entries(
+    sink: DeadLetterSink,
+    entry_filter: DeadLetterFilter,
+) -> list[tuple[str, DeadLetter]]:
+    selected: list[tuple[str, DeadLetter]] = []
+    async for entry_id, entry in sink.entries():
+        if entry_filter.limit is not None and len(selected) >= entry_filter.limit:
+            break
+        if entry_filter.matches(entry):
+            selected.append((entry_id, entry))
+    return selected
+
+
+async def replay_entries(
+    producer: AIOKafkaProducer,
+    entries: Sequence[tuple[str, DeadLetter]],
+) -> None:
+    for _, entry in entries:
+        headers = []
+        if entry.handler != entry.consumer:
+            headers.append((REPLAY_HANDLER_HEADER, entry.handler.encode()))
+        await producer.send_and_wait(
+            entry.topic,
+            value=entry.value.encode(),
+            key=entry.key.encode() if entry.key else None,
+            headers=headers,
+        )
+
+
+def summarize(entries: Sequence[tuple[str, DeadLetter]]) -> list[str]:
+    counts = Counter((entry.consumer, entry.handler, entry.reason) for _, entry in entries)
+    return [
+        f"{count:>8}  {consumer}/{handler}  {reason}"
+        for (consumer, handler, reason), count in counts.most_common()
+    ]
+
+
+def _parse_since(value: str) -> float:
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _write(line: str) -> None:
+    sys.stdout.write(line + "\n")
+
+
+async def run(args: argparse.Namespace) -> int:
+    config = AppConfig.get()
+    redis_client = Redis.from_url(config.redis.dsn)
+    sink = create_dead_letter_sink(config, redis_client)
+    entry_filter = DeadLetterFilter(
+        consumer=args.consumer,
+        handler=args.handler,
+        topic=args.topic,
+        reason=args.reason,
+        error_type=args.error_type,
+        since=args.since,
+        limit=args.limit,
+    )
+
+    delete = args.command == "purge" or (args.command == "replay" and args.delete)
+    try:
+        if delete and not sink.supports_delete:
+            _write(
+                f"The {config.kafka_dlq_backend} dead-letter backend cannot delete entries; "
+                "they expire with the topic retention"
+            )
+            return 1
+
+        entries = await select_entries(sink, entry_filter)
+        if args.command == "list":
+            for entry_id, entry in entries:
+                _write(msgspec.json.encode({"id": entry_id, **msgspec.to_builtins(entry)}).decode())
+            return 0
+        if args.command == "summary":
+            for line in summarize(entries):
+                _write(line)
+            _write(f"{len(entries):>8}  total")
+            return 0
+
+        if args.command == "replay":
+            if args.dry_run:
+                _write(f"Would replay {len(entries)} dead letter(s)")
+                return 0
+            producer = AIOKafkaProducer(bootstrap_servers=config.kafka_brokers, acks="all")
+            await producer.start()
+            try:
+                await replay_entries(producer, entries)
+            finally:
+                await producer.stop()
+            _write(f"Replayed {len(entries)} dead letter(s)")
+        if delete:
+            deleted = await sink.delete([entry_id for entry_id, _ in entries])
+            _write(f"Deleted {deleted} dead letter(s)")
+        return 0
+    finally:
+        await sink.close()
+        await redis_client.aclose()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument("--consumer", help="consumer that dead-lettered the message")
+    filters.add_argument("--handler", help="handler that gave up on the message")
+    filters.add_argument("--topic")
+    filters.add_argument(
+        "--reason",
+        help="exhausted, non_retryable, malformed_json or invalid_schema",
+    )
+    filters.add_argument("--error-type", help="exception class name, e.g. TelegramBadRequest")
+    filters.add_argument("--since", type=_parse_since, help="ISO date or time, UTC if naive")
+    filters.add_argument("--limit", type=int, help="stop after this many matching entries")
+
+    parser = argparse.ArgumentParser(description="Inspect and replay Kafka dead letters")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", parents=[filters], help="print matching entries as JSON lines")
+    commands.add_parser("summary", parents=[filters], help="count entries by handler and reason")
+    replay = commands.add_parser("replay", parents=[filters], help="re-publish matching entries")
+    replay.add_argument("--dry-run", action="store_true")
+    replay.add_argument("--delete", action="store_true", help="delete entries once replayed")
+    commands.add_parser("purge", parents=[filters], help="delete matching entries")
+
+    args = parser.parse_args(argv)
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
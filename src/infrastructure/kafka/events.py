@@ -0,0 +1,71 @@
+"""Typed Kafka event payloads, decoded straight from the message bytes.
+
+The notify.user variants mirror the fixtures in
+``contracts/shop-billing/v1/kafka``; ``tests/test_contract.py`` decodes those
+fixtures with them. Every consumer decodes through
+``build_value_deserializer``. A value that is not JSON or does not match its
+type becomes a ``RejectedEvent``, counted, dead-lettered with its raw bytes
+and committed without ever reaching a handler, instead of raising inside the
+fetcher and restarting the consumer.
+"""
+
+from typing import Annotated, Any, Callable, Literal, Optional, Union
+
+import msgspec
+from loguru import logger
+
+from src.core.enums import PurchaseType, SystemNotificationType
+from src.core.metrics import KAFKA_CONSUMER_DISCARDED_MESSAGES_TOTAL
+
+TelegramId = Annotated[int, msgspec.Meta(gt=0)]
+
+
+class RejectedEvent(msgspec.Struct, frozen=True, gc=False):
+    reason: str
+    error: str
+    raw: bytes = b""
+
+
+class NotifyUserSystemEvent(msgspec.Struct, tag_field="type", tag="system", kw_only=True):
+    telegram_id: TelegramId
+    ntf_type: SystemNotificationType
+    i18n_key: Annotated[str, msgspec.Meta(min_length=1)]
+    i18n_kwargs: dict[str, Any] = msgspec.field(default_factory=dict)
+    reply_markup_user_id: Optional[int] = None
+
+
+class NotifyUserRedirectEvent(
+    msgspec.Struct, tag_field="type", tag="redirect", kw_only=True, gc=False
+):
+    telegram_id: TelegramId
+    redirect_to: Literal["subscription_success"]
+    # Unknown purchase types fall back to NEW rather than dropping the redirect
+    purchase_type: str = PurchaseType.NEW.value
+
+
+NotifyUserEvent = Union[NotifyUserSystemEvent, NotifyUserRedirectEvent]
+
+
+def build_value_deserializer(payload_type: Any, consumer_name: str) -> Callable[[bytes], Any]:
+    decoder = msgspec.json.Decoder(payload_type)
+
+    def deserialize(raw: Optional[bytes]) -> Any:
+        try:
+            if raw is None:
+                raise msgspec.DecodeError("empty message value")
+            return decoder.decode(raw)
+        except msgspec.ValidationError as exception:
+            rejected = RejectedEvent(reason="invalid_schema", error=str(exception), raw=raw or b"")
+        except msgspec.DecodeError as exception:
+            rejected = RejectedEvent(reason="malformed_json", error=str(exception), raw=raw or b"")
+
+        KAFKA_CONSUMER_DISCARDED_MESSAGES_TOTAL.labels(
+            consumer=consumer_name,
+            reason=rejected.reason,
+        ).inc()
+        logger.warning(
+            f"{consumer_name} rejected Kafka message ({rejected.reason}): {rejected.error}"
+        )
+        return rejected
+
+    return deserialize
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from typing import Awaitable, Final, Sequence, cast
+
+from aiokafka import TopicPartition
+from dishka import AsyncContainer
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import AppConfig
+from src.core.metrics import KAFKA_CONSUMER_BATCH_DURATION
+from src.core.storage.keys import KafkaHandlerProgressKey
+from src.infrastructure.kafka.base_consumer import Batches, SupervisedKafkaConsumer
+
+# Progress only matters until the group's committed offset catches up with it
+PROGRESS_TTL: Final[int] = 60 * 60 * 24 * 7
+
+
+class KafkaTopicHub(SupervisedKafkaConsumer):
+    """One consumer group per topic that fans every message out to several handlers.
+
+    Each message is fetched and decoded once and handed to every registered
+    handler. Handlers are consumers that would otherwise each join their own
+    group on the same topic; here only their `_handle_message` and
+    `_ordering_key` run, and `consumer_name` labels their metrics.
+
+    Handlers fail independently. The group commits, per partition, the lowest
+    offset every handler has reached. A handler that got further than that
+    records its own next offset in Redis, so when the batch is redelivered
+    after a failure it skips the messages it already handled and only the
+    failing handler sees them again.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        container: AsyncContainer,
+        *,
+        topic: str,
+        group_suffix: str,
+        event: str,
+        handlers: Sequence[SupervisedKafkaConsumer],
+    ) -> None:
+        super().__init__(config, container)
+        self._topic = topic
+        self._group_id = f"{config.kafka_group_id}-{group_suffix}"
+        self.consumer_name = f"hub_{event}"
+        self.handlers = list(handlers)
+        self._progress_key = KafkaHandlerProgressKey(group_id=self._group_id).pack()
+
+    @property
+    def topic(self) -> str:
+        return self._topic
+
+    @property
+    def group_id(self) -> str:
+        return self._group_id
+
+    async def _process_batch(self, batches: Batches) -> None:
+        started = time.perf_counter()
+        redis_client: Redis = await self._container.get(Redis)
+        progress = await self._load_progress(redis_client)
+        await self._dead_letter_rejected(batches)
+        semaphore = asyncio.Semaphore(max(self._max_concurrency, 1))
+
+        outcomes = await asyncio.gather(
+            *(
+                self._dispatch(
+                    handler,
+                    batches,
+                    semaphore,
+                    handled_below={
+                        partition: progress.get(
+                            _progress_field(handler.consumer_name, partition), 0
+                        )
+                        for partition in batches
+                    },
+                )
+                for handler in self.handlers
+            )
+        )
+        handler_offsets = {
+            handler.consumer_name: self._completed_offsets(batches, done)
+            for handler, (done, _) in zip(self.handlers, outcomes)
+        }
+        offsets = {
+            partition: min(handled[partition] for handled in handler_offsets.values())
+            for partition in batches
+        }
+
+        await self._save_progress(redis_client, progress, handler_offsets, offsets)
+        await self._commit(batches, offsets)
+        KAFKA_CONSUMER_BATCH_DURATION.labels(consumer=self.consumer_name).observe(
+            time.perf_counter() - started
+        )
+
+        errors = [(handler, error) for handler, (_, error) in zip(self.handlers, outcomes) if error]
+        for handler, error in errors[1:]:
+            logger.error(f"{handler.consumer_name} handler failed on {self._topic}: {error!r}")
+        if errors:
+            raise errors[0][1]
+
+    async def _load_progress(self, redis_client: Redis) -> dict[str, int]:
+        try:
+            stored = await cast(
+                Awaitable[dict[bytes, bytes]], redis_client.hgetall(self._progress_key)
+            )
+        except RedisError as exception:
+            # Without it every handler sees redelivered messages again, which
+            # at-least-once delivery already allows for
+            logger.warning(f"{self.consumer_name} handler progress unavailable: {exception}")
+            return {}
+        return {field.decode(): int(offset) for field, offset in stored.items()}
+
+    async def _save_progress(
+        self,
+        redis_client: Redis,
+        progress: dict[str, int],
+        handler_offsets: dict[str, dict[TopicPartition, int]],
+        offsets: dict[TopicPartition, int],
+    ) -> None:
+        ahead: dict[str, int] = {}
+        caught_up: list[str] = []
+        for name, handled in handler_offsets.items():
+            for partition, next_offset in handled.items():
+                field = _progress_field(name, partition)
+                # Stored progress can run past the end of a redelivered batch
+                next_offset = max(next_offset, progress.get(field, 0))
+                if next_offset > offsets[partition]:
+                    if next_offset != progress.get(field):
+                        ahead[field] = next_offset
+                elif field in progress:
+                    caught_up.append(field)
+
+        if not ahead and not caught_up:
+            return
+
+        try:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                if ahead:
+                    pipe.hset(self._progress_key, mapping=ahead)
+                if caught_up:
+                    pipe.hdel(self._progress_key, *caught_up)
+                pipe.expire(self._progress_key, PROGRESS_TTL)
+                await pipe.execute()
+        except RedisError as exception:
+            logger.warning(f"{self.consumer_name} failed to save handler progress: {exception}")
+
+
+def _progress_field(handler_name: str, partition: TopicPartition) -> str:
+    return f"{handler_name}:{partition.partition}"
@@ -0,0 +1,79 @@
+from dishka import AsyncContainer
+
+from src.core.config import AppConfig
+from src.infrastructure.kafka.base_consumer import SupervisedKafkaConsumer
+from src.infrastructure.kafka.consumer import UserNotificationConsumer
+from src.infrastructure.kafka.hub import KafkaTopicHub
+from src.infrastructure.kafka.pricing_outcome_consumer import PricingOutcomeConsumer
+from src.infrastructure.kafka.subscription_cache_consumer import SubscriptionCacheConsumer
+from src.infrastructure.kafka.trial_reminder_consumer import TrialReminderConsumer
+
+
+def create_kafka_consumers(
+    config: AppConfig,
+    container: AsyncContainer,
+) -> list[SupervisedKafkaConsumer]:
+    """One consumer per topic; topics with several handlers share a `KafkaTopicHub`.
+
+    Each hub reuses the group of a consumer that used to read its topic on its
+    own, so the hub resumes from that group's committed offsets. A new group
+    would start at the latest offset and skip whatever was published during
+    the rollout.
+    """
+    return [
+        UserNotificationConsumer(config, container),
+        KafkaTopicHub(
+            config,
+            container,
+            topic=config.kafka_subscription_created_topic,
+            group_suffix="trial-reminder",
+            event="subscription_created",
+            handlers=[
+                TrialReminderConsumer(config, container),
+                PricingOutcomeConsumer(
+                    config,
+                    container,
+                    topic=config.kafka_subscription_created_topic,
+                    group_suffix="pricing-outcome-subscription-created",
+                    event="subscription_created",
+                ),
+                SubscriptionCacheConsumer(
+                    config,
+                    container,
+                    topic=config.kafka_subscription_created_topic,
+                    group_suffix="subscription-cache-subscription-created",
+                    event="subscription_created",
+                ),
+            ],
+        ),
+        KafkaTopicHub(
+            config,
+            container,
+            topic=config.kafka_payment_completed_topic,
+            group_suffix="pricing-outcome-payment-completed",
+            event="payment_completed",
+            handlers=[
+                PricingOutcomeConsumer(
+                    config,
+                    container,
+                    topic=config.kafka_payment_completed_topic,
+                    group_suffix="pricing-outcome-payment-completed",
+                    event="payment_completed",
+                ),
+                SubscriptionCacheConsumer(
+                    config,
+                    container,
+                    topic=config.kafka_payment_completed_topic,
+                    group_suffix="subscription-cache-payment-completed",
+                    event="payment_completed",
+                ),
+            ],
+        ),
+        PricingOutcomeConsumer(
+            config,
+            container,
+            topic=config.kafka_payment_canceled_topic,
+            group_suffix="pricing-outcome-payment-canceled",
+            event="payment_canceled",
+        ),
+    ]
@@ -0,0 +1,106 @@
+"""Standalone process for the Kafka consumers.
+
+Runs the consumers from ``create_kafka_consumers`` outside the taskiq
+workers, with its own DI container and metrics port, so event consumption
+and task execution scale independently:
+
+    python -m src.infrastructure.kafka.runner
+    python -m src.infrastructure.kafka.runner --consumer notification --metrics-port 9092
+
+``--consumer`` restricts the process to the named consumers, so one
+consumer set can run per process. Each consumer is supervised on its own and
+restarts with backoff; SIGTERM and SIGINT stop them all and close the
+container.
+"""
+
+import argparse
+import asyncio
+import signal
+from typing import Optional, Sequence
+
+from dishka.integrations.aiogram import setup_dishka as setup_aiogram_dishka
+from loguru import logger
+
+from src.bot.dispatcher import create_bg_manager_factory, create_dispatcher, setup_dispatcher
+from src.core.config import AppConfig
+from src.core.constants import KAFKA_CONSUMERS_METRICS_PORT
+from src.core.enums import SendPriority
+from src.core.logger import setup_logger
+from src.core.metrics import start_metrics_server
+from src.infrastructure.di import create_container
+from src.infrastructure.kafka.base_consumer import SupervisedKafkaConsumer
+from src.infrastructure.kafka.registry import create_kafka_consumers
+from src.infrastructure.redis import CacheInvalidationListener
+from src.infrastructure.telegram import set_default_send_priority
+
+
+def select_consumers(
+    consumers: Sequence[SupervisedKafkaConsumer],
+    names: Optional[Sequence[str]],
+) -> list[SupervisedKafkaConsumer]:
+    if not names:
+        return list(consumers)
+
+    known = {consumer.consumer_name for consumer in consumers}
+    unknown = sorted(set(names) - known)
+    if unknown:
+        raise ValueError(f"Unknown Kafka consumers {unknown}, expected some of {sorted(known)}")
+    return [consumer for consumer in consumers if consumer.consumer_name in names]
+
+
+async def run_consumers(
+    consumers: Sequence[SupervisedKafkaConsumer],
+    stop_event: asyncio.Event,
+) -> None:
+    """Start ``consumers``, wait for ``stop_event``, then stop them in reverse order."""
+    try:
+        for consumer in consumers:
+            await consumer.start()
+        logger.info(f"Running Kafka consumers: {[c.consumer_name for c in consumers]}")
+        await stop_event.wait()
+    finally:
+        for consumer in reversed(consumers):
+            await consumer.stop()
+
+
+async def serve(consumer_names: Optional[Sequence[str]], metrics_port: int) -> None:
+    setup_logger()
+    # Consumers send notifications, never replies to a user action
+    set_default_send_priority(SendPriority.BULK)
+
+    config = AppConfig.get()
+    dispatcher = create_dispatcher(config=config)
+    bg_manager_factory = create_bg_manager_factory(dispatcher=dispatcher)
+    setup_dispatcher(dispatcher)
+    container = create_container(config=config, bg_manager_factory=bg_manager_factory)
+    setup_aiogram_dishka(container=container, router=dispatcher, auto_inject=True)
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop_event.set)
+
+    try:
+        consumers = select_consumers(create_kafka_consumers(config, container), consumer_names)
+        start_metrics_server(metrics_port)
+        await container.get(CacheInvalidationListener)
+        await run_consumers(consumers, stop_event)
+    finally:
+        await container.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the Kafka consumers")
+    parser.add_argument(
+        "--consumer",
+        action="append",
+        dest="consumers",
+        help="run only this consumer (repeatable); all of them by default",
+    )
+    parser.add_argument("--metrics-port", type=int, default=KAFKA_CONSUMERS_METRICS_PORT)
+    args = parser.parse_args(argv)
+    asyncio.run(serve(args.consumers, args.metrics_port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from dishka import AsyncContainer
+from loguru import logger
+
+from src.core.config import AppConfig
+from src.infrastructure.kafka.base_consumer import SupervisedKafkaConsumer
+from src.services.subscription import SubscriptionService
+
+
+class SubscriptionCacheConsumer(SupervisedKafkaConsumer):
+    """Drops a user's cached subscription state when billing reports a change.
+
+    Subscriptions created or extended by billing (purchases, renewals, trials
+    activated outside the bot) never pass through `SubscriptionService`, so
+    without this the middleware would serve the previous subscription until
+    the cache entry expires.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        container: AsyncContainer,
+        *,
+        topic: str,
+        group_suffix: str,
+        event: str,
+    ) -> None:
+        super().__init__(config, container)
+        self._topic = topic
+        self._group_id = f"{config.kafka_group_id}-{group_suffix}"
+        self.consumer_name = f"subscription_cache_{event}"
+
+    @property
+    def topic(self) -> str:
+        return self._topic
+
+    @property
+    def group_id(self) -> str:
+        return self._group_id
+
+    async def _handle_message(self, payload: dict) -> None:
+        telegram_id = payload.get("telegram_id")
+        if not telegram_id:
+            logger.warning(f"{self.consumer_name} event missing telegram_id, skipping")
+            return
+
+        subscription_id = payload.get("subscription_id")
+
+        async with self._container() as request_container:
+            subscription_service = await request_container.get(SubscriptionService)
+            await subscription_service.clear_subscription_cache(
+                int(subscription_id) if subscription_id else None,
+                int(telegram_id),
+            )
+
+        logger.debug(f"Invalidated subscription cache for telegram_id={telegram_id}")
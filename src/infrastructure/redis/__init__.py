@@ -1,7 +1,12 @@
-from .cache import redis_cache
+from .cache import CacheStampede, redis_cache
+from .local_cache import CacheInvalidationListener, invalidate_cache, publish_invalidation
 from .repository import RedisRepository
 
 __all__ = [
+    "CacheStampede",
     "redis_cache",
+    "CacheInvalidationListener",
+    "invalidate_cache",
+    "publish_invalidation",
     "RedisRepository",
 ]
@@ -1,5 +1,22 @@
+import asyncio
+import math
+import random
+import time
+import uuid
+from datetime import timedelta
+from enum import StrEnum
 from functools import wraps
-from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar, get_type_hints
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Final,
+    Optional,
+    ParamSpec,
+    TypeVar,
+    cast,
+    get_type_hints,
+)
 
 from loguru import logger
 from pydantic import SecretStr, TypeAdapter
@@ -7,11 +24,40 @@ from redis.asyncio import Redis
 from redis.typing import ExpiryT
 
 from src.core.constants import TIME_1M
+from src.core.metrics import CACHE_RECOMPUTES_AVOIDED_TOTAL, CACHE_RECOMPUTES_TOTAL
 from src.core.utils import json_utils
 
+from .local_cache import MISSING, local_cache
+
 T = TypeVar("T", bound=Any)
 P = ParamSpec("P")
 
+STAMPEDE_LOCK_TTL: Final[float] = 5.0
+STAMPEDE_WAIT_TIMEOUT: Final[float] = 2.0
+STAMPEDE_POLL_INTERVAL: Final[float] = 0.05
+XFETCH_BETA: Final[float] = 1.0
+
+_RELEASE_LOCK_SCRIPT: Final[str] = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class CacheStampede(StrEnum):
+    """How ``redis_cache`` stops concurrent callers recomputing an expired key together.
+
+    LOCK: one caller takes a short Redis lock and recomputes; the rest serve
+    the stale value (kept ``stale_ttl`` past expiry) or, on a cold miss, wait
+    for the lock holder's result.
+    XFETCH: callers refresh early with a probability that grows as expiry
+    approaches, scaled by how long the last recompute took.
+    """
+
+    LOCK = "lock"
+    XFETCH = "xfetch"
+
 
 def prepare_for_cache(obj: Any) -> Any:
     if isinstance(obj, SecretStr):
@@ -23,13 +69,190 @@ def prepare_for_cache(obj: Any) -> Any:
     return obj
 
 
+def _seconds(ttl: ExpiryT) -> float:
+    return ttl.total_seconds() if isinstance(ttl, timedelta) else float(ttl)
+
+
+async def _read_entry(redis: Redis, key: str) -> Optional[dict[str, Any]]:
+    """Read a stampede-protected entry: ``{"value", "expires_at", "delta"}``."""
+    try:
+        cached_value: Optional[bytes] = await redis.get(key)
+        if cached_value is None:
+            return None
+        entry = json_utils.decode(cached_value)
+    except Exception as exception:
+        logger.warning(f"Cache read failed for key '{key}': {exception}")
+        return None
+    # Anything else (e.g. a plain value written before protection was enabled) is a miss
+    if isinstance(entry, dict) and "expires_at" in entry and "value" in entry:
+        return entry
+    return None
+
+
+async def _acquire_lock(redis: Redis, key: str) -> Optional[str]:
+    token = uuid.uuid4().hex
+    try:
+        acquired = await redis.set(f"lock:{key}", token, nx=True, px=int(STAMPEDE_LOCK_TTL * 1000))
+    except Exception as exception:
+        # Without Redis there is nothing to coordinate on; recompute as usual
+        logger.warning(f"Cache lock failed for key '{key}': {exception}")
+        return token
+    return token if acquired else None
+
+
+async def _release_lock(redis: Redis, key: str, token: str) -> None:
+    try:
+        await cast(Awaitable[int], redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token))
+    except Exception as exception:
+        logger.warning(f"Cache unlock failed for key '{key}': {exception}")
+
+
+async def _wait_for_entry(redis: Redis, key: str) -> Optional[dict[str, Any]]:
+    deadline = time.monotonic() + STAMPEDE_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(STAMPEDE_POLL_INTERVAL)
+        entry = await _read_entry(redis, key)
+        if entry is not None:
+            return entry
+    return None
+
+
+def _xfetch_due(entry: dict[str, Any], now: float, beta: float) -> bool:
+    # XFetch (Vattani et al.): -log(U) is Exp(1), so the refresh point is
+    # drawn earlier for slow recomputes and becomes certain at expiry.
+    delta: float = entry["delta"]
+    expires_at: float = entry["expires_at"]
+    return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+class _StampedeGuard:
+    """The read/recompute path of one ``redis_cache`` prefix with stampede protection."""
+
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        type_adapter: TypeAdapter[Any],
+        prefix: str,
+        mode: CacheStampede,
+        ttl: ExpiryT,
+        stale_ttl: ExpiryT,
+        beta: float,
+    ) -> None:
+        self.func = func
+        self.type_adapter = type_adapter
+        self.prefix = prefix
+        self.mode = mode
+        self.ttl = _seconds(ttl)
+        self.beta = beta
+        # Only LOCK serves past the logical expiry, so only it keeps the key longer
+        self.redis_ttl = (
+            math.ceil(self.ttl + _seconds(stale_ttl)) if mode is CacheStampede.LOCK else ttl
+        )
+
+    async def get(self, redis: Redis, key: str, generation: int, args: Any, kwargs: Any) -> Any:
+        entry = await _read_entry(redis, key)
+        now = time.time()
+
+        if self.mode is CacheStampede.XFETCH:
+            if entry is None:
+                return await self._recompute(redis, key, generation, "miss", args, kwargs)
+            if _xfetch_due(entry, now, self.beta):
+                return await self._recompute(redis, key, generation, "early_refresh", args, kwargs)
+            return self._serve(key, entry, generation)
+
+        if entry is not None and entry["expires_at"] > now:
+            return self._serve(key, entry, generation)
+
+        token = await _acquire_lock(redis, key)
+        if token is None:
+            return await self._serve_without_lock(redis, key, entry, generation, args, kwargs)
+
+        try:
+            reason = "miss" if entry is None else "expired"
+            return await self._recompute(redis, key, generation, reason, args, kwargs)
+        finally:
+            await _release_lock(redis, key, token)
+
+    async def _serve_without_lock(
+        self,
+        redis: Redis,
+        key: str,
+        entry: Optional[dict[str, Any]],
+        generation: int,
+        args: Any,
+        kwargs: Any,
+    ) -> Any:
+        if entry is not None:
+            CACHE_RECOMPUTES_AVOIDED_TOTAL.labels(prefix=self.prefix, outcome="stale").inc()
+            logger.debug(f"Cache stale: '{key}'. Serving while another caller recomputes")
+            return self._serve(key, entry, generation)
+
+        entry = await _wait_for_entry(redis, key)
+        if entry is not None:
+            CACHE_RECOMPUTES_AVOIDED_TOTAL.labels(prefix=self.prefix, outcome="waited").inc()
+            return self._serve(key, entry, generation)
+        return await self._recompute(redis, key, generation, "lock_timeout", args, kwargs)
+
+    def _serve(self, key: str, entry: dict[str, Any], generation: int) -> Any:
+        validated = self.type_adapter.validate_python(entry["value"])
+        local_cache.put(self.prefix, key, entry["value"], generation)
+        return validated
+
+    async def _recompute(
+        self, redis: Redis, key: str, generation: int, reason: str, args: Any, kwargs: Any
+    ) -> Any:
+        logger.debug(f"Cache {reason}: '{key}'. Executing function")
+        CACHE_RECOMPUTES_TOTAL.labels(prefix=self.prefix, reason=reason).inc()
+        started = time.perf_counter()
+        result = await self.func(*args, **kwargs)
+        delta = time.perf_counter() - started
+
+        try:
+            safe_result = prepare_for_cache(self.type_adapter.dump_python(result))
+            local_cache.put(self.prefix, key, safe_result, generation)
+            entry = {"value": safe_result, "expires_at": time.time() + self.ttl, "delta": delta}
+            await redis.setex(key, self.redis_ttl, json_utils.encode(entry))
+            logger.debug(f"Result cached: '{key}' (ttl={self.ttl}, stampede={self.mode})")
+        except Exception as exception:
+            logger.warning(f"Cache write failed for key '{key}': {exception}")
+
+        return result
+
+
 def redis_cache(
     prefix: Optional[str] = None,
     ttl: ExpiryT = TIME_1M,
+    local_ttl: Optional[float] = None,
+    local_maxsize: int = 1024,
+    stampede: Optional[CacheStampede] = None,
+    stale_ttl: ExpiryT = TIME_1M,
+    xfetch_beta: float = XFETCH_BETA,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Cache the coroutine result in Redis under ``cache:<prefix>:<args>``.
+
+    ``local_ttl`` additionally keeps up to ``local_maxsize`` entries of this
+    prefix in the in-process L1 tier, invalidated via ``invalidate_cache``.
+
+    ``stampede`` enables protection against concurrent recomputes of an
+    expired key (see ``CacheStampede``). Protected prefixes store the value
+    with its logical expiry and last recompute time; with LOCK the Redis key
+    outlives ``ttl`` by ``stale_ttl`` so the previous value can be served
+    while one caller recomputes. ``invalidate_cache`` still deletes the key,
+    so an explicit invalidation is never answered with stale data.
+    """
+
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         return_type: Any = get_type_hints(func)["return"]
         type_adapter: TypeAdapter[T] = TypeAdapter(return_type)
+        cache_prefix = prefix or func.__name__
+        guard: Optional[_StampedeGuard] = None
+        if stampede is not None:
+            guard = _StampedeGuard(
+                func, type_adapter, cache_prefix, stampede, ttl, stale_ttl, xfetch_beta
+            )
+
+        if local_ttl is not None:
+            local_cache.register(cache_prefix, maxsize=local_maxsize, ttl=local_ttl)
 
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
@@ -39,18 +262,29 @@ def redis_cache(
             # Build cache key
             key_parts = [
                 "cache",
-                prefix or func.__name__,
+                cache_prefix,
                 *map(str, args[1:]),
                 *map(str, kwargs.values()),
             ]
             key: str = ":".join(key_parts)
 
+            # Unregistered prefixes always miss the local tier and never populate it
+            local_value = local_cache.get(cache_prefix, key)
+            if local_value is not MISSING:
+                return type_adapter.validate_python(local_value)
+            generation = local_cache.generation(cache_prefix)
+
+            if guard is not None:
+                return cast(T, await guard.get(redis, key, generation, args, kwargs))
+
             try:
                 cached_value: Optional[bytes] = await redis.get(key)
                 if cached_value is not None:
                     logger.debug(f"Cache hit: '{key}'")
                     parsed = json_utils.decode(cached_value.decode())
-                    return type_adapter.validate_python(parsed)
+                    validated = type_adapter.validate_python(parsed)
+                    local_cache.put(cache_prefix, key, parsed, generation)
+                    return validated
             except Exception as exception:
                 logger.warning(f"Cache read failed for key '{key}': {exception}")
 
@@ -59,6 +293,7 @@ def redis_cache(
 
             try:
                 safe_result = prepare_for_cache(type_adapter.dump_python(result))
+                local_cache.put(cache_prefix, key, safe_result, generation)
                 await redis.setex(key, ttl, json_utils.encode(safe_result))
                 logger.debug(f"Result cached: '{key}' (ttl={ttl})")
             except Exception as exception:
@@ -0,0 +1,136 @@
+"""In-process L1 tier in front of the Redis-backed ``redis_cache``.
+
+Entries live in bounded per-prefix LRU+TTL caches. Invalidations are
+broadcast over Redis pub/sub so every uvicorn and taskiq process drops the
+same keys. The tier only serves entries while this process is subscribed to
+the invalidation channel: on disconnect it is cleared and bypassed, so a
+replica that may have missed an invalidation never answers from memory.
+"""
+
+import asyncio
+from typing import Any, Final, Optional
+
+from cachetools import TTLCache
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.utils import json_utils
+
+CACHE_INVALIDATION_CHANNEL: Final[str] = "cache:invalidate"
+LISTENER_RETRY_DELAY: Final[float] = 1.0
+
+MISSING: Final[Any] = object()
+
+
+class _Tier:
+    __slots__ = ("entries", "generation")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.entries: TTLCache[str, Any] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.generation = 0
+
+
+class LocalCache:
+    def __init__(self) -> None:
+        self._tiers: dict[str, _Tier] = {}
+        self.active = False
+
+    def register(self, prefix: str, maxsize: int, ttl: float) -> None:
+        self._tiers[prefix] = _Tier(maxsize=maxsize, ttl=ttl)
+
+    def get(self, prefix: str, key: str) -> Any:
+        tier = self._tiers.get(prefix)
+        if not self.active or tier is None:
+            return MISSING
+        return tier.entries.get(key, MISSING)
+
+    def generation(self, prefix: str) -> int:
+        tier = self._tiers.get(prefix)
+        return tier.generation if tier else 0
+
+    def put(self, prefix: str, key: str, value: Any, generation: int) -> None:
+        # An invalidation that arrived while the value was being loaded bumps
+        # the generation; storing the (possibly stale) value then is skipped.
+        tier = self._tiers.get(prefix)
+        if self.active and tier is not None and tier.generation == generation:
+            tier.entries[key] = value
+
+    def invalidate(self, key: str) -> None:
+        parts = key.split(":", 2)
+        tier = self._tiers.get(parts[1]) if len(parts) > 1 else None
+        if tier is None:
+            return
+        tier.entries.pop(key, None)
+        tier.generation += 1
+
+    def clear(self) -> None:
+        for tier in self._tiers.values():
+            tier.entries.clear()
+            tier.generation += 1
+
+
+local_cache = LocalCache()
+
+
+async def publish_invalidation(redis: Redis, *keys: str) -> None:
+    if not keys:
+        return
+    for key in keys:
+        local_cache.invalidate(key)
+    await redis.publish(CACHE_INVALIDATION_CHANNEL, json_utils.encode({"keys": list(keys)}))
+
+
+async def invalidate_cache(redis: Redis, *keys: str) -> None:
+    if not keys:
+        return
+    await redis.delete(*keys)
+    await publish_invalidation(redis, *keys)
+
+
+class CacheInvalidationListener:
+    redis: Redis
+    cache: LocalCache
+
+    def __init__(self, redis: Redis, cache: Optional[LocalCache] = None) -> None:
+        self.redis = redis
+        self.cache = cache or local_cache
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Local cache listening on '{CACHE_INVALIDATION_CHANNEL}'")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                logger.warning(f"Cache invalidation listener failed: {exception}")
+            finally:
+                self.cache.active = False
+                self.cache.clear()
+            await asyncio.sleep(LISTENER_RETRY_DELAY)
+
+    async def _listen(self) -> None:
+        async with self.redis.pubsub() as pubsub:
+            await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "subscribe":
+                    self.cache.clear()
+                    self.cache.active = True
+                elif message["type"] == "message":
+                    for key in json_utils.decode(message["data"]).get("keys", []):
+                        self.cache.invalidate(key)
@@ -2,6 +2,8 @@ from typing import Any, Awaitable, Final, Optional, Set, TypeVar, cast
 
 from pydantic import BaseModel, TypeAdapter
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.commands.core import AsyncScript
 from redis.typing import ExpiryT
 
 from src.core.config import AppConfig
@@ -12,6 +14,26 @@ T = TypeVar("T", bound=Any)
 
 TX_QUEUE_KEY: Final[str] = "tx_queue"
 
+# KEYS[1] list, KEYS[2] optional guard; ARGV value, max length, guard ttl
+_LIST_PUSH_UNIQUE_SCRIPT: Final[str] = """
+if KEYS[2] and not redis.call('set', KEYS[2], 1, 'NX', 'EX', ARGV[3]) then
+    return 0
+end
+redis.call('lrem', KEYS[1], 0, ARGV[1])
+redis.call('lpush', KEYS[1], ARGV[1])
+redis.call('ltrim', KEYS[1], 0, tonumber(ARGV[2]) - 1)
+return 1
+"""
+
+# KEYS[1] sorted set; ARGV max score. ZREM in chunks to stay under Lua's unpack limit.
+_SORTED_POP_BY_SCORE_SCRIPT: Final[str] = """
+local items = redis.call('zrangebyscore', KEYS[1], '-inf', ARGV[1])
+for i = 1, #items, 1000 do
+    redis.call('zrem', KEYS[1], unpack(items, i, math.min(i + 999, #items)))
+end
+return items
+"""
+
 
 class RedisRepository:
     config: AppConfig
@@ -20,6 +42,23 @@ class RedisRepository:
     def __init__(self, config: AppConfig, client: Redis) -> None:
         self.config = config
         self.client = client
+        self._scripts: dict[str, AsyncScript] = {}
+
+    def pipeline(self, transaction: bool = True) -> Pipeline:
+        """Queue commands to send in one round trip.
+
+        Use as ``async with repository.pipeline() as pipe:``; queued commands
+        run on ``await pipe.execute()``, which returns their results in order.
+        ``transaction`` wraps them in MULTI/EXEC.
+        """
+        return self.client.pipeline(transaction=transaction)
+
+    async def run_script(self, source: str, keys: list[str], args: list[Any]) -> Any:
+        """Run a Lua script atomically via EVALSHA, loading it on first use."""
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts[source] = self.client.register_script(source)
+        return await script(keys=keys, args=args)
 
     async def get(
         self,
@@ -44,6 +83,13 @@ class RedisRepository:
     async def delete(self, key: StorageKey) -> None:
         await self.client.delete(key.pack())
 
+    async def claim(self, key: StorageKey, ex: ExpiryT) -> bool:
+        """Atomically take ``key`` for ``ex`` (SET NX); ``False`` if it is already taken.
+
+        Release a claim whose work failed with ``delete`` so it can be retried.
+        """
+        return bool(await self.client.set(name=key.pack(), value=1, nx=True, ex=ex))
+
     async def close(self) -> None:
         await self.client.aclose(close_connection_pool=True)
 
@@ -80,6 +126,25 @@ class RedisRepository:
     async def list_trim(self, key: StorageKey, start: int, end: int) -> None:
         await cast(Awaitable[str], self.client.ltrim(key.pack(), start, end))
 
+    async def list_push_unique(
+        self,
+        key: StorageKey,
+        value: Any,
+        max_length: int,
+        guard_key: Optional[str] = None,
+        guard_ttl: int = 0,
+    ) -> bool:
+        """Move ``value`` to the head of the list and cap it at ``max_length``, atomically.
+
+        With ``guard_key`` the push only happens if that key did not exist;
+        it is then set for ``guard_ttl`` seconds. Returns whether the list changed.
+        """
+        keys = [key.pack()] if guard_key is None else [key.pack(), guard_key]
+        pushed = await self.run_script(
+            _LIST_PUSH_UNIQUE_SCRIPT, keys, [str(value), max_length, guard_ttl]
+        )
+        return bool(pushed)
+
     #
 
     async def sorted_collection_add(self, key: StorageKey, mapping: dict[Any, float]) -> int:
@@ -95,3 +160,11 @@ class RedisRepository:
     async def sorted_collection_remove(self, key: StorageKey, *values: Any) -> int:
         str_values = [str(v) for v in values]
         return await cast(Awaitable[int], self.client.zrem(key.pack(), *str_values))
+
+    async def sorted_collection_pop_by_score(self, key: StorageKey, max_score: float) -> list[str]:
+        """Atomically remove and return every member scored at or below ``max_score``.
+
+        Concurrent callers never receive the same member.
+        """
+        items_bytes = await self.run_script(_SORTED_POP_BY_SCORE_SCRIPT, [key.pack()], [max_score])
+        return [item.decode() for item in items_bytes]
@@ -1,6 +1,15 @@
-from . import cancel_survey, funnel_report, notifications, redirects, referrals, subscriptions
+from . import (
+    broadcast,
+    cancel_survey,
+    funnel_report,
+    notifications,
+    redirects,
+    referrals,
+    subscriptions,
+)
 
 __all__ = [
+    "broadcast",
     "cancel_survey",
     "funnel_report",
     "notifications",
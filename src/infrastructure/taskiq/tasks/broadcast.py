@@ -0,0 +1,32 @@
+from dishka.integrations.taskiq import FromDishka, inject
+from loguru import logger
+
+from src.core.config import AppConfig
+from src.infrastructure.taskiq.broker import broker
+from src.services.broadcast import BroadcastService
+
+
+@broker.task(retry_on_error=False)
+@inject
+async def broadcast_worker_task(
+    broadcast_id: str,
+    broadcast_service: FromDishka[BroadcastService],
+) -> None:
+    await broadcast_service.run_worker(broadcast_id)
+
+
+async def launch_broadcast_workers(broadcast_id: str, workers: int) -> None:
+    for _ in range(workers):
+        await broadcast_worker_task.kiq(broadcast_id)
+
+
+@broker.task(schedule=[{"cron": "* * * * *"}], retry_on_error=False)
+@inject
+async def resume_broadcasts_task(
+    config: FromDishka[AppConfig],
+    broadcast_service: FromDishka[BroadcastService],
+) -> None:
+    # Workers that died (deploy, OOM) leave their leases to expire; restart delivery
+    for broadcast_id in await broadcast_service.list_stalled():
+        logger.warning(f"Broadcast '{broadcast_id}' has no live workers, resuming")
+        await launch_broadcast_workers(broadcast_id, config.bot.broadcast_workers)
@@ -1,4 +1,5 @@
 import time
+from typing import Optional
 from uuid import UUID
 
 from dishka.integrations.taskiq import FromDishka, inject
@@ -15,6 +16,7 @@ from src.core.storage.keys import (
 )
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.billing import BillingClient
+from src.infrastructure.redis import RedisRepository
 from src.infrastructure.taskiq.broker import broker
 from src.services.notification import NotificationService
 from src.services.user import UserService
@@ -46,7 +48,6 @@ async def _has_paid_since(billing: BillingClient, telegram_id: int) -> bool:
 
 async def _handle_pending_cancel_survey_check(
     *,
-    member: str,
     payment_id: str,
     now: float,
     created_at: float,
@@ -54,14 +55,13 @@ async def _handle_pending_cancel_survey_check(
     redis_client: Redis,
     user_service: UserService,
     notification_service: NotificationService,
-    due_key: str,
-) -> None:
+) -> bool:
     if now - created_at >= _MAX_PENDING_AGE:
         logger.debug(
             f"Giving up on cancel-survey check for '{payment_id}': "
             f"still pending after '{_MAX_PENDING_AGE}' seconds"
         )
-        return
+        return False
 
     ping_key = CancelSurveyPendingPingKey(payment_id=payment_id)
     was_pinged = await redis_client.set(
@@ -79,7 +79,7 @@ async def _handle_pending_cancel_survey_check(
                 payload=MessagePayload(i18n_key="ntf-event-cancel-survey-pending"),
             )
 
-    await redis_client.zadd(due_key, {member: created_at}, nx=True)
+    return True
 
 
 async def _process_due_member(  # noqa: C901
@@ -89,33 +89,36 @@ async def _process_due_member(  # noqa: C901
     user_service: UserService,
     notification_service: NotificationService,
     redis_client: Redis,
-) -> None:
-    key = _PENDING_KEY.pack()
+) -> Optional[float]:
+    """Settle one claimed queue member.
+
+    Returns the score to re-queue it with while the payment is still
+    pending, or None once it needs no further checks.
+    """
     try:
         payment_id, telegram_id_str, gateway_type, created_at_str = member.split(":", 3)
     except ValueError:
         logger.warning(f"Skipping cancel-survey check: malformed queue member '{member}'")
-        return
+        return None
     try:
         telegram_id = int(telegram_id_str)
         created_at = float(created_at_str)
     except ValueError:
         logger.warning(f"Skipping cancel-survey check: malformed queue payload '{member}'")
-        return
+        return None
 
     try:
         transaction = await billing.get_transaction(UUID(payment_id))
     except ValueError:
         logger.warning(f"Skipping cancel-survey check: invalid payment id '{payment_id}'")
-        return
+        return None
 
     if not transaction:
         logger.debug(f"Skipping cancel-survey check for '{payment_id}': transaction not found")
-        return
+        return None
 
     if transaction.Status == TransactionStatus.PENDING.value:
-        await _handle_pending_cancel_survey_check(
-            member=member,
+        still_pending = await _handle_pending_cancel_survey_check(
             payment_id=payment_id,
             now=now,
             created_at=created_at,
@@ -123,29 +126,28 @@ async def _process_due_member(  # noqa: C901
             redis_client=redis_client,
             user_service=user_service,
             notification_service=notification_service,
-            due_key=key,
         )
-        return
+        return created_at if still_pending else None
 
     if transaction.Status != TransactionStatus.CANCELED.value:
-        return
+        return None
 
     if await _has_paid_since(billing, telegram_id):
         logger.debug(
             f"Skipping cancel-survey for '{payment_id}': "
             f"user '{telegram_id}' already has a paid subscription"
         )
-        return
+        return None
 
     sent_key = CancelSurveySentKey(payment_id=UUID(payment_id))
     was_scheduled = await redis_client.set(sent_key.pack(), "1", nx=True, ex=_SENT_TTL)
     if not was_scheduled:
-        return
+        return None
 
     user = await user_service.get(telegram_id)
     if not user:
         logger.debug(f"Skipping cancel-survey for '{payment_id}': user '{telegram_id}' not found")
-        return
+        return None
 
     logger.info(f"Sending cancel-reason survey to '{telegram_id}' for payment '{payment_id}'")
 
@@ -159,6 +161,7 @@ async def _process_due_member(  # noqa: C901
         ),
     )
     CANCEL_SURVEY_SENT_TOTAL.labels(gateway=gateway_type).inc()
+    return None
 
 
 @broker.task(schedule=[{"cron": "*/5 * * * *"}], retry_on_error=False)
@@ -168,19 +171,30 @@ async def process_pending_cancel_survey_checks_task(
     user_service: FromDishka[UserService],
     notification_service: FromDishka[NotificationService],
     redis_client: FromDishka[Redis],
+    redis_repository: FromDishka[RedisRepository],
 ) -> None:
     now = time.time()
-    key = _PENDING_KEY.pack()
 
-    due_items: list[bytes] = await redis_client.zrangebyscore(key, "-inf", now)
-    if not due_items:
+    # One atomic pop instead of ZRANGEBYSCORE + a ZREM per member; overlapping
+    # sweeps can no longer pick up the same member.
+    members = await redis_repository.sorted_collection_pop_by_score(_PENDING_KEY, now)
+    if not members:
         return
 
-    logger.info(f"Processing {len(due_items)} pending cancel-survey checks")
+    logger.info(f"Processing {len(members)} pending cancel-survey checks")
 
-    for raw_member in due_items:
-        member = raw_member.decode() if isinstance(raw_member, bytes) else raw_member
-        await redis_client.zrem(key, member)
-        await _process_due_member(
-            member, now, billing, user_service, notification_service, redis_client
-        )
+    requeue: dict[str, float] = {}
+    processed = 0
+    try:
+        for member in members:
+            processed += 1
+            score = await _process_due_member(
+                member, now, billing, user_service, notification_service, redis_client
+            )
+            if score is not None:
+                requeue[member] = score
+    finally:
+        # Members a failed sweep never reached go back for the next run
+        requeue.update(dict.fromkeys(members[processed:], now))
+        if requeue:
+            await redis_client.zadd(_PENDING_KEY.pack(), requeue, nx=True)
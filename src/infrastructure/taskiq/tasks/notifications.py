@@ -9,7 +9,7 @@ from redis.asyncio import Redis
 from src.bot.keyboards import get_buy_keyboard, get_connect_keyboard, get_renew_keyboard
 from src.core.constants import BATCH_DELAY, BATCH_SIZE
 from src.core.enums import UserNotificationType
-from src.core.storage.keys import PendingNotConnectedRemindersKey
+from src.core.storage.keys import PendingNotConnectedRemindersKey, SentNotificationKey
 from src.core.utils.iterables import chunked
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.types import RemnaUserDto
@@ -22,8 +22,7 @@ from src.services.user import UserService
 NOT_CONNECTED_REMINDER_DELAY = 2 * 60 * 60  # 2 hours
 NOT_CONNECTED_NOTIFICATION_KEY = "not_connected_reminder"
 _PENDING_KEY = PendingNotConnectedRemindersKey()
-# Redis dedup: track sent notifications for 90 days
-_SENT_NTF_KEY_PREFIX = "sent_ntf:"
+# Redis dedup: a reminder is claimed for 90 days
 _SENT_NTF_TTL = 90 * 24 * 60 * 60  # 90 days
 
 
@@ -165,6 +164,14 @@ async def schedule_not_connected_reminder(
     logger.debug(f"Scheduled not-connected reminder for '{user_telegram_id}' at {send_at}")
 
 
+@broker.task(schedule=[{"cron": "* * * * *"}], retry_on_error=False)
+@inject
+async def flush_system_digests_task(
+    notification_service: FromDishka[NotificationService],
+) -> None:
+    await notification_service.flush_due_system_digests()
+
+
 @broker.task(schedule=[{"cron": "*/5 * * * *"}], retry_on_error=False)
 @inject
 async def process_pending_not_connected_reminders_task(
@@ -192,9 +199,12 @@ async def process_pending_not_connected_reminders_task(
         user_telegram_id = int(member[:sep])
         connect_url = member[sep + 1 :]
 
-        # Redis-based dedup (replaces DB sent_notifications table)
-        dedup_key = f"{_SENT_NTF_KEY_PREFIX}{user_telegram_id}:{NOT_CONNECTED_NOTIFICATION_KEY}"
-        already_sent = await redis_client.exists(dedup_key)
+        # Cheap early skip before the lookups below; notify_user's claim on the
+        # same key is what actually prevents a second reminder
+        dedup_key = SentNotificationKey(
+            telegram_id=user_telegram_id, type=NOT_CONNECTED_NOTIFICATION_KEY
+        )
+        already_sent = await redis_client.exists(dedup_key.pack())
         if already_sent:
             logger.debug(
                 f"Skipping not-connected reminder for '{user_telegram_id}': already sent (Redis)"
@@ -236,7 +246,6 @@ async def process_pending_not_connected_reminders_task(
                 add_close_button=True,
             ),
             ntf_type=UserNotificationType.NOT_CONNECTED,
+            dedup_key=dedup_key,
+            dedup_ttl=_SENT_NTF_TTL,
         )
-
-        # Mark as sent in Redis with TTL
-        await redis_client.setex(dedup_key, _SENT_NTF_TTL, "1")
@@ -6,20 +6,20 @@ from taskiq_redis import RedisStreamBroker
 from src.bot.dispatcher import create_bg_manager_factory, create_dispatcher, setup_dispatcher
 from src.core.config import AppConfig
 from src.core.constants import TASKIQ_WORKER_METRICS_PORT
+from src.core.enums import SendPriority
 from src.core.logger import setup_logger
 from src.core.metrics import start_metrics_server
 from src.infrastructure.di import create_container
-from src.infrastructure.kafka.consumer import UserNotificationConsumer
-from src.infrastructure.kafka.pricing_outcome_consumer import PricingOutcomeConsumer
-from src.infrastructure.kafka.trial_reminder_consumer import TrialReminderConsumer
+from src.infrastructure.redis import CacheInvalidationListener
+from src.infrastructure.telegram import set_default_send_priority
 
 from .broker import broker
 
-_kafka_consumers: list[object] = []
-
 
 def worker() -> RedisStreamBroker:
     setup_logger()
+    # Worker sends are notifications and mailings, never replies to a user action
+    set_default_send_priority(SendPriority.BULK)
 
     config = AppConfig.get()
     dispatcher = create_dispatcher(config=config)
@@ -32,39 +32,11 @@ def worker() -> RedisStreamBroker:
 
     @broker.on_event(TaskiqEvents.WORKER_STARTUP)
     async def on_startup(state: TaskiqState) -> None:
-        global _kafka_consumers  # noqa: PLW0603
         start_metrics_server(TASKIQ_WORKER_METRICS_PORT)
-        _kafka_consumers = [
-            UserNotificationConsumer(config, container),
-            TrialReminderConsumer(config, container),
-            PricingOutcomeConsumer(
-                config,
-                container,
-                topic=config.kafka_payment_completed_topic,
-                group_suffix="pricing-outcome-payment-completed",
-                event="payment_completed",
-            ),
-            PricingOutcomeConsumer(
-                config,
-                container,
-                topic=config.kafka_payment_canceled_topic,
-                group_suffix="pricing-outcome-payment-canceled",
-                event="payment_canceled",
-            ),
-            PricingOutcomeConsumer(
-                config,
-                container,
-                topic=config.kafka_subscription_created_topic,
-                group_suffix="pricing-outcome-subscription-created",
-                event="subscription_created",
-            ),
-        ]
-        for consumer in _kafka_consumers:
-            await consumer.start()
+        await container.get(CacheInvalidationListener)
 
     @broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
     async def on_shutdown(state: TaskiqState) -> None:
-        for consumer in reversed(_kafka_consumers):
-            await consumer.stop()
+        await container.close()
 
     return broker
@@ -0,0 +1,18 @@
+from .deletion import MessageDeletionScheduler, schedule_message_deletion
+from .rate_limiter import (
+    RateLimitedRequestMiddleware,
+    TelegramRateLimiter,
+    current_send_priority,
+    send_priority,
+    set_default_send_priority,
+)
+
+__all__ = [
+    "MessageDeletionScheduler",
+    "RateLimitedRequestMiddleware",
+    "TelegramRateLimiter",
+    "current_send_priority",
+    "schedule_message_deletion",
+    "send_priority",
+    "set_default_send_priority",
+]
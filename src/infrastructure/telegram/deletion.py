@@ -0,0 +1,142 @@
+"""Durable auto-deletion of sent messages.
+
+``schedule_message_deletion`` records ``chat_id:message_id`` in a Redis sorted
+set scored by the time the message is due, so any process can schedule a
+deletion and pending deletions survive restarts. One
+``MessageDeletionScheduler`` loop per app process claims due entries in
+batches and removes them with ``deleteMessages``, one call per chat, as bulk
+traffic through the send rate limiter.
+
+A claim moves the entries ``LEASE_SECONDS`` into the future instead of
+removing them. They are removed once Telegram answered, so a process that
+dies mid-batch leaves them to be claimed again.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import Final, Optional
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from loguru import logger
+
+from src.core.enums import SendPriority
+from src.core.metrics import MESSAGE_DELETIONS_TOTAL
+from src.core.storage.keys import MessageDeletionsKey
+from src.infrastructure.redis.repository import RedisRepository
+
+from .rate_limiter import send_priority
+
+BATCH_SIZE: Final[int] = 500
+POLL_INTERVAL: Final[float] = 1.0
+LEASE_SECONDS: Final[int] = 60
+# Telegram accepts at most this many message ids per deleteMessages call
+DELETE_MESSAGES_LIMIT: Final[int] = 100
+
+_KEY = MessageDeletionsKey()
+
+# Returns up to ARGV[2] members due at ARGV[1] and pushes them ARGV[3] seconds ahead.
+_CLAIM_SCRIPT: Final[str] = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local lease_until = tonumber(ARGV[1]) + tonumber(ARGV[3])
+for _, member in ipairs(due) do
+    redis.call('ZADD', KEYS[1], lease_until, member)
+end
+return due
+"""
+
+
+async def schedule_message_deletion(
+    redis_repository: RedisRepository,
+    chat_id: int,
+    message_id: int,
+    delay: float,
+) -> None:
+    await redis_repository.sorted_collection_add(
+        _KEY, {f"{chat_id}:{message_id}": time.time() + delay}
+    )
+
+
+class MessageDeletionScheduler:
+    bot: Bot
+    redis_repository: RedisRepository
+
+    def __init__(self, bot: Bot, redis_repository: RedisRepository) -> None:
+        self.bot = bot
+        self.redis_repository = redis_repository
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Message deletion scheduler started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def drain(self) -> int:
+        """Delete one batch of due messages; returns how many entries were claimed."""
+        members = await self.redis_repository.run_script(
+            _CLAIM_SCRIPT, [_KEY.pack()], [time.time(), BATCH_SIZE, LEASE_SECONDS]
+        )
+        if not members:
+            return 0
+
+        by_chat: defaultdict[int, list[int]] = defaultdict(list)
+        for member in members:
+            chat_id, _, message_id = member.decode().rpartition(":")
+            by_chat[int(chat_id)].append(int(message_id))
+
+        done: list[str] = []
+        for chat_id, message_ids in by_chat.items():
+            for start in range(0, len(message_ids), DELETE_MESSAGES_LIMIT):
+                chunk = message_ids[start : start + DELETE_MESSAGES_LIMIT]
+                if await self._delete(chat_id, chunk):
+                    done.extend(f"{chat_id}:{message_id}" for message_id in chunk)
+
+        if done:
+            await self.redis_repository.sorted_collection_remove(_KEY, *done)
+        return len(members)
+
+    async def _delete(self, chat_id: int, message_ids: list[int]) -> bool:
+        """Delete ``message_ids``; ``False`` leaves them to be retried after the lease."""
+        try:
+            await self.bot.delete_messages(chat_id=chat_id, message_ids=message_ids)
+        except (TelegramBadRequest, TelegramForbiddenError) as exception:
+            # Already deleted, too old to delete or the chat is gone: nothing left to retry
+            MESSAGE_DELETIONS_TOTAL.labels(result="skipped").inc(len(message_ids))
+            logger.debug(
+                f"Skipped deleting {len(message_ids)} messages in chat '{chat_id}': {exception}"
+            )
+            return True
+        except Exception as exception:
+            MESSAGE_DELETIONS_TOTAL.labels(result="retried").inc(len(message_ids))
+            logger.warning(
+                f"Failed to delete {len(message_ids)} messages in chat '{chat_id}': {exception}"
+            )
+            return False
+
+        MESSAGE_DELETIONS_TOTAL.labels(result="deleted").inc(len(message_ids))
+        return True
+
+    async def _run(self) -> None:
+        with send_priority(SendPriority.BULK):
+            while True:
+                try:
+                    claimed = await self.drain()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exception:
+                    logger.warning(f"Message deletion sweep failed: {exception}")
+                    claimed = 0
+
+                if claimed < BATCH_SIZE:
+                    await asyncio.sleep(POLL_INTERVAL)
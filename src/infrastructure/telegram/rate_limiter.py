@@ -0,0 +1,238 @@
+"""Outbound Telegram rate limiting shared by every process that uses the bot.
+
+The token buckets live in Redis, so the API app and all taskiq workers draw
+from one budget. Each request needs a token from the global bucket and, when
+it targets a chat, from that chat's bucket. Private chats and groups use
+separate rates. A request waits until every bucket it needs holds a token.
+Bulk sends must leave ``bulk_reserve`` of each bucket untouched, so replies
+to user actions still go out promptly during a mailing.
+
+``TelegramRetryAfter`` drains the chat's bucket for the requested time, so
+every process backs off, and the request is retried.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional, Union
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import TelegramType
+from loguru import logger
+from redis.exceptions import RedisError
+
+from src.core.enums import SendPriority
+from src.core.metrics import TELEGRAM_RETRY_AFTER_TOTAL, TELEGRAM_SEND_WAIT_TIME
+from src.core.storage.keys import TelegramSendBucketKey
+from src.infrastructure.redis.repository import RedisRepository
+
+ChatId = Union[int, str]
+
+# Refills every bucket in KEYS, then takes one token from each if all of them
+# hold at least 1 + reserve. ARGV holds (rate, capacity, reserve) per key.
+# Returns "0" once taken, otherwise the seconds until that becomes possible.
+_TAKE_TOKEN_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local levels = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 3 - 2])
+    local capacity = tonumber(ARGV[i * 3 - 1])
+    local reserve = tonumber(ARGV[i * 3])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local elapsed = math.max(0, now - (tonumber(state[2]) or now))
+    tokens = math.min(capacity, tokens + elapsed * rate)
+    levels[i] = tokens
+    local missing = 1 + reserve - tokens
+    if missing > 0 then
+        wait = math.max(wait, missing / rate)
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 3 - 2])
+    local capacity = tonumber(ARGV[i * 3 - 1])
+    redis.call('HSET', key, 'tokens', levels[i] - 1, 'ts', now)
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000) + 1000)
+end
+return '0'
+"""
+
+# Empties the bucket in KEYS[1] so it refills only after ARGV[3] seconds.
+_DRAIN_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local seconds = tonumber(ARGV[3])
+redis.call('HSET', KEYS[1], 'tokens', -seconds * rate, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity / rate + seconds) * 1000) + 1000)
+return 1
+"""
+
+# Methods that post or change messages, plus bulk deletes; reads, single deletes and chat
+# actions are not limited.
+_LIMITED_METHOD_PREFIXES = (
+    "send",
+    "copyMessage",
+    "forwardMessage",
+    "editMessage",
+    "deleteMessages",
+)
+_UNLIMITED_METHODS = frozenset({"sendChatAction"})
+
+_send_priority: ContextVar[Optional[SendPriority]] = ContextVar("send_priority", default=None)
+_default_send_priority = SendPriority.INTERACTIVE
+
+
+def set_default_send_priority(priority: SendPriority) -> None:
+    """Set the priority of sends made outside any ``send_priority`` block in this process."""
+    global _default_send_priority  # noqa: PLW0603
+    _default_send_priority = priority
+
+
+def current_send_priority() -> SendPriority:
+    return _send_priority.get() or _default_send_priority
+
+
+@contextmanager
+def send_priority(priority: SendPriority) -> Iterator[None]:
+    """Send every Telegram request made inside the block with ``priority``."""
+    token = _send_priority.set(priority)
+    try:
+        yield
+    finally:
+        _send_priority.reset(token)
+
+
+class TelegramRateLimiter:
+    def __init__(
+        self,
+        redis_repository: RedisRepository,
+        *,
+        global_rate: float = 28.0,
+        chat_rate: float = 1.0,
+        chat_burst: int = 3,
+        group_rate: float = 0.33,
+        bulk_reserve: float = 0.2,
+        max_wait: float = 30.0,
+    ) -> None:
+        self.redis_repository = redis_repository
+        self.global_rate = global_rate
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.group_rate = group_rate
+        self.bulk_reserve = bulk_reserve
+        self.max_wait = max_wait
+
+    async def acquire(self, chat_id: Optional[ChatId], priority: SendPriority) -> float:
+        """Wait for a send token; returns the seconds spent waiting.
+
+        Gives up after ``max_wait`` and lets the request through, leaving
+        Telegram's retry_after as the last line of defence. Redis errors
+        fail open as well.
+        """
+        buckets = self._buckets(chat_id)
+        keys = [key for key, _, _ in buckets]
+        args: list[Any] = []
+        for _, rate, capacity in buckets:
+            reserve = 0.0
+            if priority is SendPriority.BULK:
+                # A bucket holding a single token has nothing to spare; a reserve
+                # it can never cover would stall every bulk send until max_wait
+                reserve = min(capacity * self.bulk_reserve, max(capacity - 1, 0.0))
+            args.extend((rate, capacity, reserve))
+
+        start = time.monotonic()
+        deadline = start + self.max_wait
+        while True:
+            try:
+                wait = float(await self.redis_repository.run_script(_TAKE_TOKEN_SCRIPT, keys, args))
+            except RedisError as exception:
+                logger.warning(
+                    f"Telegram rate limiter unavailable, sending unthrottled: {exception}"
+                )
+                break
+
+            remaining = deadline - time.monotonic()
+            if wait <= 0:
+                break
+            if remaining <= 0:
+                logger.warning(f"Gave up waiting for a send token for chat '{chat_id}'")
+                break
+            await asyncio.sleep(min(wait, remaining))
+
+        waited = time.monotonic() - start
+        TELEGRAM_SEND_WAIT_TIME.labels(priority=priority.value).observe(waited)
+        return waited
+
+    async def drain(self, chat_id: Optional[ChatId], seconds: float) -> None:
+        """Block the chat's bucket (the global one without a chat) for ``seconds``."""
+        key, rate, capacity = self._buckets(chat_id)[-1]
+        try:
+            await self.redis_repository.run_script(_DRAIN_SCRIPT, [key], [rate, capacity, seconds])
+        except RedisError as exception:
+            logger.warning(f"Failed to record retry_after for chat '{chat_id}': {exception}")
+
+    def _buckets(self, chat_id: Optional[ChatId]) -> list[tuple[str, float, float]]:
+        buckets = [
+            (
+                TelegramSendBucketKey(scope="global").pack(),
+                self.global_rate,
+                max(self.global_rate, 1.0),
+            )
+        ]
+        if chat_id is None:
+            return buckets
+
+        scope = TelegramSendBucketKey(scope=str(chat_id)).pack()
+        if isinstance(chat_id, int) and chat_id > 0:
+            buckets.append((scope, self.chat_rate, float(self.chat_burst)))
+        else:
+            buckets.append((scope, self.group_rate, 1.0))
+        return buckets
+
+
+class RateLimitedRequestMiddleware(BaseRequestMiddleware):
+    """Session middleware that paces message-sending Bot API calls through the limiter."""
+
+    def __init__(self, limiter: TelegramRateLimiter, max_retries: int = 3) -> None:
+        self.limiter = limiter
+        self.max_retries = max_retries
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Any:
+        api_method = method.__api_method__
+        if api_method in _UNLIMITED_METHODS or not api_method.startswith(_LIMITED_METHOD_PREFIXES):
+            return await make_request(bot, method)
+
+        chat_id: Optional[ChatId] = getattr(method, "chat_id", None)
+        priority = current_send_priority()
+        attempt = 0
+        while True:
+            await self.limiter.acquire(chat_id, priority)
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as exception:
+                TELEGRAM_RETRY_AFTER_TOTAL.labels(method=api_method).inc()
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"Telegram asked to retry '{api_method}' for chat '{chat_id}' "
+                    f"after {exception.retry_after}s (attempt {attempt}/{self.max_retries})"
+                )
+                await self.limiter.drain(chat_id, exception.retry_after)
+                await asyncio.sleep(exception.retry_after)
@@ -15,6 +15,8 @@ from src.core.config.app import AppConfig
 from src.core.enums import SystemNotificationType
 from src.core.metrics import BOT_INFO
 from src.core.utils.message_payload import MessagePayload
+from src.infrastructure.redis import CacheInvalidationListener
+from src.infrastructure.telegram import MessageDeletionScheduler
 from src.services.command import CommandService
 from src.services.notification import NotificationService
 from src.services.remnawave import RemnawaveService
@@ -29,6 +31,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     telegram_webhook_endpoint: TelegramWebhookEndpoint = app.state.telegram_webhook_endpoint
     container: AsyncContainer = app.state.dishka_container
 
+    await container.get(CacheInvalidationListener)
+
     async with container(scope=Scope.REQUEST) as startup_container:
         config: AppConfig = await startup_container.get(AppConfig)
         webhook_service: WebhookService = await startup_container.get(WebhookService)
@@ -57,6 +61,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await command_service.setup()
     await telegram_webhook_endpoint.startup()
 
+    message_deletion_scheduler: MessageDeletionScheduler = await container.get(
+        MessageDeletionScheduler
+    )
+    await message_deletion_scheduler.start()
+
     bot: Bot = await container.get(Bot)
     bot_info = await bot.get_me()
     states: dict[Optional[bool], str] = {True: "Enabled", False: "Disabled", None: "Unknown"}
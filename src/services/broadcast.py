@@ -0,0 +1,428 @@
+import time
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Optional, Self, cast
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest, TelegramForbiddenError
+from fluentogram import TranslatorHub
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.config import AppConfig
+from src.core.constants import TIME_24H
+from src.core.enums import BroadcastStatus, Locale, UserRole
+from src.core.storage.keys import (
+    ActiveBroadcastsKey,
+    BroadcastCheckpointsKey,
+    BroadcastKey,
+    BroadcastLeasesKey,
+    BroadcastProgressLockKey,
+    BroadcastRecipientsKey,
+    BroadcastSourceKey,
+)
+from src.core.utils.iterables import chunked
+from src.core.utils.message_payload import MessagePayload
+from src.infrastructure.redis import RedisRepository
+from src.models.dto import UserDto
+from src.services.notification import NotificationService
+from src.services.user import UserService
+
+from .base import BaseService
+
+BROADCAST_CHUNK_SIZE = 200
+BROADCAST_LEASE_SECONDS = 120
+BROADCAST_PROGRESS_INTERVAL = 10
+BROADCAST_PUSH_BATCH = 1_000
+BROADCAST_TTL = 7 * TIME_24H
+
+# Hands out the next chunk offset: first a chunk whose lease expired (its
+# worker died; it resumes from the checkpoint), else a fresh one from the
+# cursor. KEYS: meta, leases. ARGV: now, lease seconds, chunk size.
+# Returns -1 when nothing is left or the broadcast is no longer running.
+_CLAIM_CHUNK_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'status') ~= 'PROCESSING' then
+    return -1
+end
+local now = tonumber(ARGV[1])
+local start
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now, 'LIMIT', 0, 1)
+if #expired > 0 then
+    start = tonumber(expired[1])
+else
+    local total = tonumber(redis.call('HGET', KEYS[1], 'total'))
+    start = tonumber(redis.call('HGET', KEYS[1], 'cursor'))
+    if start >= total then
+        return -1
+    end
+    redis.call('HSET', KEYS[1], 'cursor', math.min(start + tonumber(ARGV[3]), total))
+end
+redis.call('ZADD', KEYS[2], now + tonumber(ARGV[2]), start)
+return start
+"""
+
+# Moves a running broadcast to ARGV[3]. With ARGV[4] == '1' only once every
+# chunk was handed out and finished. Returns 1 to the single caller that did it.
+# KEYS: meta, leases, active set, then keys to expire. ARGV: now, ttl, status,
+# drained, broadcast id.
+_FINISH_SCRIPT = """
+if redis.call('HGET', KEYS[1], 'status') ~= 'PROCESSING' then
+    return 0
+end
+if ARGV[4] == '1' then
+    if redis.call('ZCARD', KEYS[2]) > 0 then
+        return 0
+    end
+    local cursor = tonumber(redis.call('HGET', KEYS[1], 'cursor'))
+    if cursor < tonumber(redis.call('HGET', KEYS[1], 'total')) then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[3], 'finished_at', ARGV[1])
+redis.call('SREM', KEYS[3], ARGV[5])
+for i = 1, #KEYS do
+    if i ~= 3 then
+        redis.call('EXPIRE', KEYS[i], ARGV[2])
+    end
+end
+return 1
+"""
+
+
+@dataclass
+class BroadcastProgress:
+    broadcast_id: str
+    status: BroadcastStatus
+    total: int
+    sent: int = 0
+    blocked: int = 0
+    failed: int = 0
+    started_at: float = 0.0
+    finished_at: Optional[float] = None
+
+    @classmethod
+    def from_meta(cls, broadcast_id: str, meta: dict[str, str]) -> Self:
+        finished_at = meta.get("finished_at")
+        return cls(
+            broadcast_id=broadcast_id,
+            status=BroadcastStatus(meta["status"]),
+            total=int(meta["total"]),
+            sent=int(meta.get("sent", 0)),
+            blocked=int(meta.get("blocked", 0)),
+            failed=int(meta.get("failed", 0)),
+            started_at=float(meta["started_at"]),
+            finished_at=float(finished_at) if finished_at else None,
+        )
+
+    @property
+    def processed(self) -> int:
+        return self.sent + self.blocked + self.failed
+
+    @property
+    def rate(self) -> float:
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def to_admin_message(self) -> str:
+        percent = self.processed / self.total * 100 if self.total else 100.0
+        lines = [
+            f"Broadcast {self.broadcast_id}: {self.status.value}",
+            f"progress: {self.processed}/{self.total} ({percent:.1f}%)",
+            f"sent: {self.sent}",
+            f"blocked: {self.blocked}",
+            f"failed: {self.failed}",
+            f"rate: {self.rate:.1f} msg/s",
+        ]
+        if self.status == BroadcastStatus.PROCESSING and self.rate > 0:
+            eta = (self.total - self.processed) / self.rate
+            lines.append(f"eta: {int(eta // 60)}m {int(eta % 60)}s")
+        return "\n".join(lines)
+
+
+class BroadcastService(BaseService):
+    """Delivers one payload to every reachable user from taskiq workers.
+
+    Recipients are stored in Redis once and handed out to any number of
+    workers in chunks. Each send is checkpointed together with a lease
+    renewal, so a crashed worker's chunk is picked up where it stopped;
+    at most the message in flight at the crash is sent twice.
+    """
+
+    user_service: UserService
+    notification_service: NotificationService
+
+    def __init__(
+        self,
+        config: AppConfig,
+        bot: Bot,
+        redis_client: Redis,
+        redis_repository: RedisRepository,
+        translator_hub: TranslatorHub,
+        #
+        user_service: UserService,
+        notification_service: NotificationService,
+    ) -> None:
+        super().__init__(config, bot, redis_client, redis_repository, translator_hub)
+        self.user_service = user_service
+        self.notification_service = notification_service
+
+    async def count_recipients(self) -> int:
+        return sum([len(page) async for page in self._recipient_pages()])
+
+    async def create(self, admin: UserDto, payload: MessagePayload) -> BroadcastProgress:
+        broadcast_id = uuid.uuid4().hex[:12]
+        recipients_key = BroadcastRecipientsKey(broadcast_id=broadcast_id).pack()
+        total = 0
+        async for page in self._recipient_pages():
+            async with self.redis_repository.pipeline() as pipe:
+                for batch in chunked(page, BROADCAST_PUSH_BATCH):
+                    pipe.rpush(recipients_key, *batch)
+                pipe.expire(recipients_key, BROADCAST_TTL)
+                await pipe.execute()
+            total += len(page)
+
+        progress = BroadcastProgress(
+            broadcast_id=broadcast_id,
+            status=BroadcastStatus.PROCESSING,
+            total=total,
+            started_at=time.time(),
+        )
+        message = await self.bot.send_message(
+            chat_id=admin.telegram_id,
+            text=progress.to_admin_message(),
+        )
+
+        meta_key = BroadcastKey(broadcast_id=broadcast_id).pack()
+        async with self.redis_repository.pipeline() as pipe:
+            pipe.hset(
+                meta_key,
+                mapping={
+                    "status": progress.status.value,
+                    "total": progress.total,
+                    "cursor": 0,
+                    "started_at": progress.started_at,
+                    "admin_id": admin.telegram_id,
+                    "progress_message_id": message.message_id,
+                    "payload": payload.model_dump_json(exclude={"media"}),
+                },
+            )
+            pipe.expire(meta_key, BROADCAST_TTL)
+            pipe.sadd(ActiveBroadcastsKey().pack(), broadcast_id)
+            await pipe.execute()
+
+        logger.info(f"Created broadcast '{broadcast_id}' for '{progress.total}' recipients")
+        return progress
+
+    async def create_once(
+        self,
+        admin: UserDto,
+        payload: MessagePayload,
+        *,
+        chat_id: int,
+        message_id: int,
+    ) -> tuple[Optional[BroadcastProgress], Optional[str]]:
+        """`create`, at most once per source message.
+
+        Returns the new broadcast, or ``None`` and the id of the broadcast
+        already started from that message (``None`` while it is still being
+        created).
+        """
+        source_key = BroadcastSourceKey(chat_id=chat_id, message_id=message_id)
+        if not await self.redis_repository.claim(source_key, ex=BROADCAST_TTL):
+            # The claim holds a placeholder until the broadcast id replaces it
+            existing = await cast(
+                Awaitable[Optional[bytes]], self.redis_client.get(source_key.pack())
+            )
+            return None, existing.decode() if existing and existing != b"1" else None
+
+        try:
+            progress = await self.create(admin, payload)
+        except Exception:
+            await self.redis_repository.delete(source_key)
+            raise
+        await self.redis_client.set(source_key.pack(), progress.broadcast_id, ex=BROADCAST_TTL)
+        return progress, None
+
+    async def get_progress(self, broadcast_id: str) -> Optional[BroadcastProgress]:
+        meta = await self._get_meta(broadcast_id)
+        return BroadcastProgress.from_meta(broadcast_id, meta) if meta else None
+
+    async def cancel(self, broadcast_id: str) -> bool:
+        canceled = await self._finish(broadcast_id, BroadcastStatus.CANCELED, drained=False)
+        if canceled:
+            logger.info(f"Broadcast '{broadcast_id}' canceled")
+            await self._report_progress(broadcast_id, force=True)
+        return canceled
+
+    async def list_stalled(self) -> list[str]:
+        """Running broadcasts with work left but no live worker lease."""
+        now = time.time()
+        stalled = []
+        for broadcast_id in await self.redis_repository.collection_members(ActiveBroadcastsKey()):
+            meta = await self._get_meta(broadcast_id)
+            if not meta or meta["status"] != BroadcastStatus.PROCESSING:
+                await self.redis_repository.collection_remove(ActiveBroadcastsKey(), broadcast_id)
+                continue
+
+            leases_key = BroadcastLeasesKey(broadcast_id=broadcast_id).pack()
+            async with self.redis_repository.pipeline(transaction=False) as pipe:
+                pipe.zcount(leases_key, f"({now}", "+inf")
+                pipe.zcard(leases_key)
+                live, leased = await pipe.execute()
+
+            if not live and (leased or int(meta["cursor"]) < int(meta["total"])):
+                stalled.append(broadcast_id)
+        return stalled
+
+    async def run_worker(self, broadcast_id: str) -> None:
+        meta = await self._get_meta(broadcast_id)
+        if not meta:
+            logger.warning(f"Broadcast '{broadcast_id}' not found")
+            return
+
+        payload = MessagePayload.model_validate_json(meta["payload"])
+        total = int(meta["total"])
+
+        while (start := await self._claim_chunk(broadcast_id)) is not None:
+            if not await self._process_chunk(broadcast_id, start, total, payload):
+                return
+            await self._report_progress(broadcast_id)
+
+        if await self._finish(broadcast_id, BroadcastStatus.COMPLETED, drained=True):
+            logger.info(f"Broadcast '{broadcast_id}' completed")
+            await self._report_progress(broadcast_id, force=True)
+
+    #
+
+    async def _recipient_pages(self) -> AsyncIterator[list[str]]:
+        """Recipients as ``telegram_id:locale``, one role per page, read fresh from billing.
+
+        The cached role lists can be ten minutes old and still include users
+        who blocked the bot since. Billing has no paged user listing, so a
+        role is the smallest page available; only ids are kept across pages.
+        """
+        seen: set[int] = set()
+        for role in (UserRole.USER, UserRole.ADMIN, UserRole.DEV):
+            page: list[str] = []
+            for user in await self.user_service.fetch_by_role(role):
+                if user.telegram_id in seen or user.is_blocked or user.is_bot_blocked:
+                    continue
+                seen.add(user.telegram_id)
+                page.append(f"{user.telegram_id}:{user.language.value}")
+            yield page
+
+    async def _get_meta(self, broadcast_id: str) -> dict[str, str]:
+        raw = await cast(
+            Awaitable[dict[bytes, bytes]],
+            self.redis_client.hgetall(BroadcastKey(broadcast_id=broadcast_id).pack()),
+        )
+        return {key.decode(): value.decode() for key, value in raw.items()}
+
+    async def _claim_chunk(self, broadcast_id: str) -> Optional[int]:
+        start = await self.redis_repository.run_script(
+            _CLAIM_CHUNK_SCRIPT,
+            [
+                BroadcastKey(broadcast_id=broadcast_id).pack(),
+                BroadcastLeasesKey(broadcast_id=broadcast_id).pack(),
+            ],
+            [time.time(), BROADCAST_LEASE_SECONDS, BROADCAST_CHUNK_SIZE],
+        )
+        return int(start) if int(start) >= 0 else None
+
+    async def _process_chunk(
+        self,
+        broadcast_id: str,
+        start: int,
+        total: int,
+        payload: MessagePayload,
+    ) -> bool:
+        """Send to the chunk at ``start``; False if the broadcast stopped meanwhile."""
+        meta_key = BroadcastKey(broadcast_id=broadcast_id).pack()
+        leases_key = BroadcastLeasesKey(broadcast_id=broadcast_id).pack()
+        checkpoints_key = BroadcastCheckpointsKey(broadcast_id=broadcast_id).pack()
+
+        checkpoint = await cast(
+            Awaitable[Optional[bytes]], self.redis_client.hget(checkpoints_key, str(start))
+        )
+        offset = int(checkpoint) if checkpoint else start
+        end = min(start + BROADCAST_CHUNK_SIZE, total)
+        recipients = await cast(
+            Awaitable[list[bytes]],
+            self.redis_client.lrange(
+                BroadcastRecipientsKey(broadcast_id=broadcast_id).pack(), offset, end - 1
+            ),
+        )
+
+        for index, recipient in enumerate(recipients, start=offset):
+            outcome = await self._send(recipient.decode(), payload)
+            async with self.redis_repository.pipeline() as pipe:
+                pipe.hset(checkpoints_key, str(start), str(index + 1))
+                pipe.hincrby(meta_key, outcome, 1)
+                pipe.zadd(leases_key, {str(start): time.time() + BROADCAST_LEASE_SECONDS}, xx=True)
+                pipe.hget(meta_key, "status")
+                *_, status = await pipe.execute()
+            if status is None or status.decode() != BroadcastStatus.PROCESSING:
+                return False
+
+        async with self.redis_repository.pipeline() as pipe:
+            pipe.zrem(leases_key, str(start))
+            pipe.hdel(checkpoints_key, str(start))
+            await pipe.execute()
+        return True
+
+    async def _send(self, recipient: str, payload: MessagePayload) -> str:
+        """Deliver to ``telegram_id:locale``; returns the counter to bump."""
+        telegram_id, _, locale = recipient.partition(":")
+        user = UserDto(telegram_id=int(telegram_id), name=telegram_id, language=Locale(locale))
+        try:
+            await self.notification_service.deliver(user, payload)
+            return "sent"
+        except TelegramForbiddenError:
+            await self._mark_bot_blocked(user.telegram_id)
+            return "blocked"
+        except TelegramAPIError as exception:
+            logger.warning(f"Broadcast message to '{telegram_id}' failed: {exception}")
+            return "failed"
+
+    async def _mark_bot_blocked(self, telegram_id: int) -> None:
+        try:
+            user = await self.user_service.get(telegram_id)
+            if user and not user.is_bot_blocked:
+                await self.user_service.set_bot_blocked(user, blocked=True)
+        except Exception as exception:
+            logger.warning(f"Failed to mark '{telegram_id}' as bot_blocked: {exception}")
+
+    async def _finish(self, broadcast_id: str, status: BroadcastStatus, drained: bool) -> bool:
+        finished = await self.redis_repository.run_script(
+            _FINISH_SCRIPT,
+            [
+                BroadcastKey(broadcast_id=broadcast_id).pack(),
+                BroadcastLeasesKey(broadcast_id=broadcast_id).pack(),
+                ActiveBroadcastsKey().pack(),
+                BroadcastRecipientsKey(broadcast_id=broadcast_id).pack(),
+                BroadcastCheckpointsKey(broadcast_id=broadcast_id).pack(),
+            ],
+            [time.time(), BROADCAST_TTL, status.value, int(drained), broadcast_id],
+        )
+        return bool(finished)
+
+    async def _report_progress(self, broadcast_id: str, force: bool = False) -> None:
+        if not force:
+            lock_key = BroadcastProgressLockKey(broadcast_id=broadcast_id).pack()
+            if not await self.redis_client.set(
+                lock_key, 1, nx=True, ex=BROADCAST_PROGRESS_INTERVAL
+            ):
+                return
+
+        meta = await self._get_meta(broadcast_id)
+        if not meta:
+            return
+        try:
+            await self.bot.edit_message_text(
+                text=BroadcastProgress.from_meta(broadcast_id, meta).to_admin_message(),
+                chat_id=int(meta["admin_id"]),
+                message_id=int(meta["progress_message_id"]),
+            )
+        except TelegramBadRequest as exception:
+            # "message is not modified" when nothing moved since the last edit
+            logger.debug(f"Broadcast '{broadcast_id}' progress not updated: {exception}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -14,6 +15,8 @@ from src.core.experiments import Experiment, assign_variant
 from src.core.metrics import (
     ESTIMAND_CIRCUIT_OPENS_TOTAL,
     ESTIMAND_CLIENT_FAILURES_TOTAL,
+    ESTIMAND_EVENTS_DROPPED_TOTAL,
+    ESTIMAND_EVENTS_FLUSHED_TOTAL,
     ESTIMAND_RUNTIME_STATE,
     EXPERIMENT_CONVERSIONS_TOTAL,
     EXPERIMENT_EXPOSURES_TOTAL,
@@ -22,12 +25,12 @@ from src.models.dto.user import UserDto
 
 try:
     from estimand_sdk import (
+        AsyncEstimandClient,
         ConfigCacheMissError,
-        EstimandClient,
         EstimandClientConfig,
     )
 except Exception:
-    EstimandClient = None
+    AsyncEstimandClient = None
     EstimandClientConfig = None
 
     class ConfigCacheMissError(Exception):
@@ -125,24 +128,210 @@ class FeatureEvaluation:
     track_events: bool
 
 
+class EstimandRuntime:
+    """App-scoped Estimand state shared by every request-scoped ExperimentService.
+
+    Owns the client (buffered event flusher and ETag cache), the feature specs,
+    the last fetched ConfigPayload and the circuit breaker. ``start`` launches a
+    background task that re-fetches the config every
+    ``_ESTIMAND_CONFIG_CACHE_TTL_SECONDS`` (a 304 keeps the current payload), so
+    request handlers evaluate against whatever revision is already in memory.
+    Without the refresher the config is fetched on demand once it goes stale.
+    ``aclose`` stops the refresher and delivers buffered events on shutdown.
+    """
+
+    def __init__(self, config: AppConfig, client: Any | None) -> None:
+        self.client = client
+        self.estimand_config = ExperimentService._resolve_estimand_config(config)
+        self.features = ExperimentService._build_features(config, self.estimand_config)
+        self._config: Any | None = None
+        self._config_at = 0.0
+        self._cached_config_safe = False
+        self._retry_at = 0.0
+        self._state: _EstimandRuntimeState | None = None
+        self._fetch_lock = asyncio.Lock()
+        self._refresher: asyncio.Task[None] | None = None
+        self._set_state(self._resolve_initial_state())
+
+    @classmethod
+    def create(cls, config: AppConfig) -> EstimandRuntime:
+        return cls(config, ExperimentService.create_estimand_client(config))
+
+    @property
+    def is_configured(self) -> bool:
+        return bool(
+            self.estimand_config.enabled
+            and self.estimand_config.is_fully_configured()
+            and self.client is not None
+        )
+
+    @property
+    def revision(self) -> str | None:
+        return ExperimentService._extract_config_revision(self._config)
+
+    def start(self) -> None:
+        if self.client is None or self._refresher is not None:
+            return
+        self._refresher = asyncio.get_running_loop().create_task(self._refresh_loop())
+
+    async def aclose(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+
+        if self.client is None:
+            return
+        try:
+            await self.client.aclose()
+        except Exception:
+            logger.opt(exception=True).warning("Failed to flush Estimand events on shutdown")
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            now = monotonic()
+            if not self.is_circuit_open(now):
+                await self._fetch(now)
+            await asyncio.sleep(_ESTIMAND_CONFIG_CACHE_TTL_SECONDS)
+
+    async def get_config(self) -> Any | None:
+        now = monotonic()
+        if self._config is not None:
+            if now - self._config_at < _ESTIMAND_CONFIG_CACHE_TTL_SECONDS:
+                return self._config
+            # A stale payload is still served while the refresher is catching up.
+            if (
+                self._refresher is not None
+                and not self._refresher.done()
+                and self._cached_config_safe
+            ):
+                return self._config
+        if self.client is None:
+            return None
+        if self.is_circuit_open(now):
+            if self._cached_config_safe and self._config is not None:
+                return self._config
+            return None
+
+        return await self._fetch(now)
+
+    async def _fetch(self, now: float) -> Any | None:
+        if self.client is None:
+            return None
+
+        async with self._fetch_lock:
+            # Another request may have refreshed the config while we waited.
+            if self._config is not None and self._config_at >= now:
+                return self._config
+
+            try:
+                payload = await self.client.fetch_config(
+                    organization_id=self.estimand_config.organization_id,
+                    project_id=self.estimand_config.project_id,
+                    environment_id=self.estimand_config.environment_id,
+                )
+            except (Exception, ConfigCacheMissError):
+                fallback = (
+                    "cached_config"
+                    if self._cached_config_safe and self._config is not None
+                    else "local_fallback"
+                )
+                self.record_failure("fetch_config", fallback)
+                using = (
+                    "cached config" if fallback == "cached_config" else "local experiment fallback"
+                )
+                logger.opt(exception=True).warning(
+                    "Failed to fetch Estimand config; opening circuit for "
+                    f"{_ESTIMAND_CIRCUIT_OPEN_SECONDS:.0f}s and using {using}"
+                )
+                self.open_circuit("fetch_config")
+                if fallback == "cached_config":
+                    return self._config
+                return None
+
+            if payload is not self._config:
+                previous = self.revision
+                self._config = payload
+                if self.revision != previous:
+                    logger.info(f"Estimand config revision changed: {previous} -> {self.revision}")
+            self._config_at = now
+            self._cached_config_safe = True
+            self.reset_circuit()
+            return self._config
+
+    def record_evaluation_failure(self) -> None:
+        self._cached_config_safe = False
+        self.record_failure("evaluate_feature", "local_fallback")
+        logger.opt(exception=True).warning(
+            "Failed to evaluate Estimand feature; opening circuit for "
+            f"{_ESTIMAND_CIRCUIT_OPEN_SECONDS:.0f}s and using local fallback without analytics"
+        )
+        self.open_circuit("evaluate_feature")
+
+    def _resolve_initial_state(self) -> _EstimandRuntimeState:
+        if not self.estimand_config.enabled:
+            return _EstimandRuntimeState.CONFIGURED_DISABLED
+        if not self.estimand_config.is_fully_configured() or self.client is None:
+            return _EstimandRuntimeState.NOT_CONFIGURED
+        return _EstimandRuntimeState.AVAILABLE
+
+    def _set_state(self, state: _EstimandRuntimeState) -> None:
+        if self._state == state:
+            return
+
+        previous = self._state
+        for candidate in _EstimandRuntimeState:
+            ESTIMAND_RUNTIME_STATE.labels(state=candidate.value).set(1 if candidate == state else 0)
+
+        if state == _EstimandRuntimeState.CONFIGURED_DISABLED:
+            logger.info("Estimand disabled by configuration; using local experiment assignments")
+        elif state == _EstimandRuntimeState.NOT_CONFIGURED:
+            logger.warning(
+                "Estimand enabled but not fully configured or client unavailable; "
+                "using local experiment fallback"
+            )
+        elif (
+            state == _EstimandRuntimeState.AVAILABLE
+            and previous == _EstimandRuntimeState.TEMPORARILY_UNAVAILABLE
+        ):
+            logger.info("Estimand recovered; resuming remote experiment evaluation")
+
+        self._state = state
+
+    def is_circuit_open(self, now: float | None = None) -> bool:
+        current = monotonic() if now is None else now
+        return current < self._retry_at
+
+    def open_circuit(self, operation: str) -> None:
+        self._retry_at = monotonic() + _ESTIMAND_CIRCUIT_OPEN_SECONDS
+        ESTIMAND_CIRCUIT_OPENS_TOTAL.labels(operation=operation).inc()
+        self._set_state(_EstimandRuntimeState.TEMPORARILY_UNAVAILABLE)
+
+    def reset_circuit(self) -> None:
+        self._retry_at = 0.0
+        self._set_state(_EstimandRuntimeState.AVAILABLE)
+
+    def record_failure(self, operation: str, fallback: str) -> None:
+        ESTIMAND_CLIENT_FAILURES_TOTAL.labels(operation=operation, fallback=fallback).inc()
+
+
 class ExperimentService:
     def __init__(
         self,
         config: AppConfig,
         redis_client: Redis,
         estimand_client: Any | None = None,
+        estimand_runtime: EstimandRuntime | None = None,
     ) -> None:
         self.config = config
         self.redis_client = redis_client
-        self.estimand_config = self._resolve_estimand_config()
-        self.estimand_client = estimand_client or self._build_estimand_client()
-        self._features = self._build_features(config, self.estimand_config)
-        self._fetched_config = None
-        self._fetched_config_at = 0.0
-        self._cached_config_safe = False
-        self._estimand_retry_at = 0.0
-        self._estimand_state: _EstimandRuntimeState | None = None
-        self._set_estimand_runtime_state(self._resolve_initial_estimand_state())
+        self.estimand_runtime = estimand_runtime or EstimandRuntime(config, estimand_client)
+        self.estimand_config = self.estimand_runtime.estimand_config
+        self.estimand_client = self.estimand_runtime.client
+        self._features = self.estimand_runtime.features
 
     @staticmethod
     def _as_str(value: Any, default: str) -> str:
@@ -170,69 +359,70 @@ class ExperimentService:
             cls._as_str(getattr(estimand_cfg, "off_variant", None), TRIAL_VARIANT_OFF),
         )
 
-    def _resolve_estimand_config(self) -> _ResolvedEstimandConfig:
-        experiment_cfg = getattr(self.config, "experiments", None)
+    @classmethod
+    def _resolve_estimand_config(cls, config: AppConfig) -> _ResolvedEstimandConfig:
+        experiment_cfg = getattr(config, "experiments", None)
         estimand_cfg = getattr(experiment_cfg, "estimand", None) if experiment_cfg else None
         raw_api_key = getattr(estimand_cfg, "api_key", "")
 
         return _ResolvedEstimandConfig(
             enabled=bool(getattr(estimand_cfg, "enabled", False)),
-            base_url=self._as_str(
+            base_url=cls._as_str(
                 getattr(estimand_cfg, "base_url", None),
                 "https://estimand.app",
             ),
-            api_key=self._resolve_secret(raw_api_key),
-            organization_id=self._as_str(getattr(estimand_cfg, "organization_id", None), ""),
-            project_id=self._as_str(getattr(estimand_cfg, "project_id", None), ""),
-            environment_id=self._as_str(getattr(estimand_cfg, "environment_id", None), ""),
-            feature_key=self._as_str(
+            api_key=cls._resolve_secret(raw_api_key),
+            organization_id=cls._as_str(getattr(estimand_cfg, "organization_id", None), ""),
+            project_id=cls._as_str(getattr(estimand_cfg, "project_id", None), ""),
+            environment_id=cls._as_str(getattr(estimand_cfg, "environment_id", None), ""),
+            feature_key=cls._as_str(
                 getattr(estimand_cfg, "feature_key", None),
                 TRIAL_EXPERIMENT_KEY,
             ),
-            feature_id=self._as_str(getattr(estimand_cfg, "feature_id", None), ""),
-            trial_length_feature_key=self._as_str(
+            feature_id=cls._as_str(getattr(estimand_cfg, "feature_id", None), ""),
+            trial_length_feature_key=cls._as_str(
                 getattr(estimand_cfg, "trial_length_feature_key", None),
                 ExperimentFeature.TRIAL_LENGTH.value,
             ),
-            trial_length_feature_id=self._as_str(
+            trial_length_feature_id=cls._as_str(
                 getattr(estimand_cfg, "trial_length_feature_id", None),
                 "",
             ),
-            start_tier_price_feature_key=self._as_str(
+            start_tier_price_feature_key=cls._as_str(
                 getattr(estimand_cfg, "start_tier_price_feature_key", None),
                 ExperimentFeature.START_TIER_PRICE.value,
             ),
-            start_tier_price_feature_id=self._as_str(
+            start_tier_price_feature_id=cls._as_str(
                 getattr(estimand_cfg, "start_tier_price_feature_id", None),
                 "",
             ),
-            intro_price_feature_key=self._as_str(
+            intro_price_feature_key=cls._as_str(
                 getattr(estimand_cfg, "intro_price_feature_key", None),
                 ExperimentFeature.INTRO_PRICE.value,
             ),
-            intro_price_feature_id=self._as_str(
+            intro_price_feature_id=cls._as_str(
                 getattr(estimand_cfg, "intro_price_feature_id", None),
                 "",
             ),
-            checkout_flow_feature_key=self._as_str(
+            checkout_flow_feature_key=cls._as_str(
                 getattr(estimand_cfg, "checkout_flow_feature_key", None),
                 ExperimentFeature.CHECKOUT_FLOW.value,
             ),
-            checkout_flow_feature_id=self._as_str(
+            checkout_flow_feature_id=cls._as_str(
                 getattr(estimand_cfg, "checkout_flow_feature_id", None),
                 "",
             ),
-            payment_rescue_feature_key=self._as_str(
+            payment_rescue_feature_key=cls._as_str(
                 getattr(estimand_cfg, "payment_rescue_feature_key", None),
                 ExperimentFeature.PAYMENT_RESCUE.value,
             ),
-            payment_rescue_feature_id=self._as_str(
+            payment_rescue_feature_id=cls._as_str(
                 getattr(estimand_cfg, "payment_rescue_feature_id", None),
                 "",
             ),
-            on_variant=self._as_str(getattr(estimand_cfg, "on_variant", None), TRIAL_VARIANT_ON),
-            off_variant=self._as_str(getattr(estimand_cfg, "off_variant", None), TRIAL_VARIANT_OFF),
-            conversion_event=self._as_str(
+            on_variant=cls._as_str(getattr(estimand_cfg, "on_variant", None), TRIAL_VARIANT_ON),
+            off_variant=cls._as_str(getattr(estimand_cfg, "off_variant", None), TRIAL_VARIANT_OFF),
+            conversion_event=cls._as_str(
                 getattr(estimand_cfg, "conversion_event", None),
                 "trial_activated",
             ),
@@ -243,22 +433,23 @@ class ExperimentService:
     def _binary_variant_set(feature_key: str, suffix: str) -> tuple[str, str]:
         return (f"{feature_key}_{suffix}_off", f"{feature_key}_{suffix}_on")
 
+    @classmethod
     def _build_features(
-        self,
+        cls,
         config: AppConfig,
         estimand_config: _ResolvedEstimandConfig,
     ) -> dict[str, _FeatureSpec]:
         cfg = config.experiments
-        trial_on, trial_off = self._resolve_trial_variants(cfg)
+        trial_on, trial_off = cls._resolve_trial_variants(cfg)
 
-        trial_length_off, trial_length_on = self._binary_variant_set("trial_length", "v1")
+        trial_length_off, trial_length_on = cls._binary_variant_set("trial_length", "v1")
         (
             start_tier_price_off,
             start_tier_price_on,
-        ) = self._binary_variant_set("start_tier_price", "v1")
-        intro_price_off, intro_price_on = self._binary_variant_set("intro_price", "v1")
-        checkout_flow_off, checkout_flow_on = self._binary_variant_set("checkout_flow", "v1")
-        payment_rescue_off, payment_rescue_on = self._binary_variant_set("payment_rescue", "v1")
+        ) = cls._binary_variant_set("start_tier_price", "v1")
+        intro_price_off, intro_price_on = cls._binary_variant_set("intro_price", "v1")
+        checkout_flow_off, checkout_flow_on = cls._binary_variant_set("checkout_flow", "v1")
+        payment_rescue_off, payment_rescue_on = cls._binary_variant_set("payment_rescue", "v1")
 
         return {
             TRIAL_EXPERIMENT_KEY: _FeatureSpec(
@@ -270,7 +461,7 @@ class ExperimentService:
                     salt="trial_offer_v1",
                     enabled=bool(getattr(cfg, "trial_enabled", False)),
                 ),
-                start_date=self._coerce_start_date(getattr(cfg, "trial_offer_start_date", None)),
+                start_date=cls._coerce_start_date(getattr(cfg, "trial_offer_start_date", None)),
                 use_estimand=True,
                 estimand_feature_key=estimand_config.feature_key,
                 estimand_feature_id=estimand_config.feature_id,
@@ -287,7 +478,7 @@ class ExperimentService:
                     salt="trial_length_v1",
                     enabled=False,
                 ),
-                start_date=self._coerce_start_date(getattr(cfg, "trial_length_start_date", None)),
+                start_date=cls._coerce_start_date(getattr(cfg, "trial_length_start_date", None)),
                 use_estimand=True,
                 estimand_feature_key=estimand_config.trial_length_feature_key,
                 estimand_feature_id=estimand_config.trial_length_feature_id,
@@ -304,7 +495,7 @@ class ExperimentService:
                     salt="start_tier_price_v1",
                     enabled=False,
                 ),
-                start_date=self._coerce_start_date(
+                start_date=cls._coerce_start_date(
                     getattr(cfg, "start_tier_price_start_date", None)
                 ),
                 use_estimand=True,
@@ -323,7 +514,7 @@ class ExperimentService:
                     salt="intro_price_v1",
                     enabled=False,
                 ),
-                start_date=self._coerce_start_date(getattr(cfg, "intro_price_start_date", None)),
+                start_date=cls._coerce_start_date(getattr(cfg, "intro_price_start_date", None)),
                 use_estimand=True,
                 estimand_feature_key=estimand_config.intro_price_feature_key,
                 estimand_feature_id=estimand_config.intro_price_feature_id,
@@ -340,7 +531,7 @@ class ExperimentService:
                     salt="checkout_flow_v1",
                     enabled=False,
                 ),
-                start_date=self._coerce_start_date(getattr(cfg, "checkout_flow_start_date", None)),
+                start_date=cls._coerce_start_date(getattr(cfg, "checkout_flow_start_date", None)),
                 use_estimand=True,
                 estimand_feature_key=estimand_config.checkout_flow_feature_key,
                 estimand_feature_id=estimand_config.checkout_flow_feature_id,
@@ -357,7 +548,7 @@ class ExperimentService:
                     salt="payment_rescue_v1",
                     enabled=False,
                 ),
-                start_date=self._coerce_start_date(getattr(cfg, "payment_rescue_start_date", None)),
+                start_date=cls._coerce_start_date(getattr(cfg, "payment_rescue_start_date", None)),
                 use_estimand=True,
                 estimand_feature_key=estimand_config.payment_rescue_feature_key,
                 estimand_feature_id=estimand_config.payment_rescue_feature_id,
@@ -367,22 +558,26 @@ class ExperimentService:
             ),
         }
 
-    def _build_estimand_client(self) -> Any | None:
+    @classmethod
+    def create_estimand_client(cls, config: AppConfig) -> Any | None:
+        estimand_config = cls._resolve_estimand_config(config)
         if (
-            not self.estimand_config.enabled
-            or not self.estimand_config.is_fully_configured()
-            or EstimandClient is None
+            not estimand_config.enabled
+            or not estimand_config.is_fully_configured()
+            or AsyncEstimandClient is None
             or EstimandClientConfig is None
         ):
             return None
 
         try:
-            return EstimandClient(
+            return AsyncEstimandClient(
                 config=EstimandClientConfig(
-                    base_url=self.estimand_config.base_url,
-                    api_key=self.estimand_config.api_key,
-                    request_timeout=self.estimand_config.request_timeout,
-                )
+                    base_url=estimand_config.base_url,
+                    api_key=estimand_config.api_key,
+                    request_timeout=estimand_config.request_timeout,
+                ),
+                on_events_dropped=_on_estimand_events_dropped,
+                on_events_flushed=_on_estimand_events_flushed,
             )
         except Exception:
             logger.opt(exception=True).warning(
@@ -390,52 +585,6 @@ class ExperimentService:
             )
             return None
 
-    def _resolve_initial_estimand_state(self) -> _EstimandRuntimeState:
-        if not self.estimand_config.enabled:
-            return _EstimandRuntimeState.CONFIGURED_DISABLED
-        if not self.estimand_config.is_fully_configured() or self.estimand_client is None:
-            return _EstimandRuntimeState.NOT_CONFIGURED
-        return _EstimandRuntimeState.AVAILABLE
-
-    def _set_estimand_runtime_state(self, state: _EstimandRuntimeState) -> None:
-        if self._estimand_state == state:
-            return
-
-        previous = self._estimand_state
-        for candidate in _EstimandRuntimeState:
-            ESTIMAND_RUNTIME_STATE.labels(state=candidate.value).set(1 if candidate == state else 0)
-
-        if state == _EstimandRuntimeState.CONFIGURED_DISABLED:
-            logger.info("Estimand disabled by configuration; using local experiment assignments")
-        elif state == _EstimandRuntimeState.NOT_CONFIGURED:
-            logger.warning(
-                "Estimand enabled but not fully configured or client unavailable; "
-                "using local experiment fallback"
-            )
-        elif (
-            state == _EstimandRuntimeState.AVAILABLE
-            and previous == _EstimandRuntimeState.TEMPORARILY_UNAVAILABLE
-        ):
-            logger.info("Estimand recovered; resuming remote experiment evaluation")
-
-        self._estimand_state = state
-
-    def _is_estimand_circuit_open(self, now: float | None = None) -> bool:
-        current = monotonic() if now is None else now
-        return current < self._estimand_retry_at
-
-    def _open_estimand_circuit(self, operation: str) -> None:
-        self._estimand_retry_at = monotonic() + _ESTIMAND_CIRCUIT_OPEN_SECONDS
-        ESTIMAND_CIRCUIT_OPENS_TOTAL.labels(operation=operation).inc()
-        self._set_estimand_runtime_state(_EstimandRuntimeState.TEMPORARILY_UNAVAILABLE)
-
-    def _reset_estimand_circuit(self) -> None:
-        self._estimand_retry_at = 0.0
-        self._set_estimand_runtime_state(_EstimandRuntimeState.AVAILABLE)
-
-    def _record_estimand_failure(self, operation: str, fallback: str) -> None:
-        ESTIMAND_CLIENT_FAILURES_TOTAL.labels(operation=operation, fallback=fallback).inc()
-
     def _should_use_estimand(self, feature: _FeatureSpec) -> bool:
         if feature.key == TRIAL_EXPERIMENT_KEY and not bool(
             getattr(self.config.experiments, "trial_enabled", False)
@@ -444,11 +593,7 @@ class ExperimentService:
 
         return (
             feature.use_estimand
-            and bool(
-                self.estimand_config.enabled
-                and self.estimand_config.is_fully_configured()
-                and self.estimand_client is not None
-            )
+            and self.estimand_runtime.is_configured
             and bool(feature.estimand_feature_key)
         )
 
@@ -456,50 +601,9 @@ class ExperimentService:
         return (
             self._should_use_estimand(feature)
             and bool(feature.estimand_feature_id)
-            and not self._is_estimand_circuit_open()
+            and not self.estimand_runtime.is_circuit_open()
         )
 
-    def _fetch_estimand_config(self) -> Any | None:
-        now = monotonic()
-        if (
-            self._fetched_config is not None
-            and now - self._fetched_config_at < _ESTIMAND_CONFIG_CACHE_TTL_SECONDS
-        ):
-            return self._fetched_config
-        if self.estimand_client is None:
-            return None
-        if self._is_estimand_circuit_open(now):
-            if self._cached_config_safe and self._fetched_config is not None:
-                return self._fetched_config
-            return None
-
-        try:
-            self._fetched_config = self.estimand_client.fetch_config(
-                organization_id=self.estimand_config.organization_id,
-                project_id=self.estimand_config.project_id,
-                environment_id=self.estimand_config.environment_id,
-            )
-            self._fetched_config_at = now
-            self._cached_config_safe = True
-            self._reset_estimand_circuit()
-            return self._fetched_config
-        except (Exception, ConfigCacheMissError):
-            fallback = (
-                "cached_config"
-                if self._cached_config_safe and self._fetched_config is not None
-                else "local_fallback"
-            )
-            self._record_estimand_failure("fetch_config", fallback)
-            logger.opt(exception=True).warning(
-                "Failed to fetch Estimand config; opening circuit for "
-                f"{_ESTIMAND_CIRCUIT_OPEN_SECONDS:.0f}s and using "
-                f"{'cached config' if fallback == 'cached_config' else 'local experiment fallback'}"
-            )
-            self._open_estimand_circuit("fetch_config")
-            if fallback == "cached_config":
-                return self._fetched_config
-            return None
-
     def _is_feature_enabled_for_user(
         self,
         feature: _FeatureSpec,
@@ -546,7 +650,7 @@ class ExperimentService:
             track_events=track_events,
         )
 
-    def _evaluate(
+    async def _evaluate(
         self,
         experiment_key: str,
         telegram_id: int,
@@ -571,7 +675,7 @@ class ExperimentService:
             )
 
         try:
-            payload = self._fetch_estimand_config()
+            payload = await self.estimand_runtime.get_config()
             if payload is None:
                 return self._local_fallback_evaluation(
                     feature,
@@ -606,13 +710,7 @@ class ExperimentService:
                     f"'{variation}' (reason='{reason}'); using local fallback without analytics"
                 )
         except Exception:
-            self._cached_config_safe = False
-            self._record_estimand_failure("evaluate_feature", "local_fallback")
-            logger.opt(exception=True).warning(
-                "Failed to evaluate Estimand feature; opening circuit for "
-                f"{_ESTIMAND_CIRCUIT_OPEN_SECONDS:.0f}s and using local fallback without analytics"
-            )
-            self._open_estimand_circuit("evaluate_feature")
+            self.estimand_runtime.record_evaluation_failure()
 
         return self._local_fallback_evaluation(
             feature,
@@ -694,15 +792,15 @@ class ExperimentService:
                 "Failed to send Estimand conversion event; keeping local metrics path"
             )
 
-    def variant(
+    async def variant(
         self,
         experiment_key: str,
         telegram_id: int,
         created_at: datetime | None = None,
     ) -> str:
-        return self._evaluate(experiment_key, telegram_id, created_at).variant
+        return (await self._evaluate(experiment_key, telegram_id, created_at)).variant
 
-    def evaluate_feature_for_user(
+    async def evaluate_feature_for_user(
         self,
         user: UserDto,
         experiment_key: str | ExperimentFeature,
@@ -711,7 +809,7 @@ class ExperimentService:
             experiment_key if isinstance(experiment_key, str) else experiment_key.value,
             "",
         )
-        evaluation = self._evaluate(feature_key, user.telegram_id, user.created_at)
+        evaluation = await self._evaluate(feature_key, user.telegram_id, user.created_at)
         return FeatureEvaluation(
             feature_key=evaluation.feature_key,
             variant=evaluation.variant,
@@ -808,7 +906,7 @@ class ExperimentService:
         telegram_id: int,
         created_at: datetime | None = None,
     ) -> str:
-        evaluation = self._evaluate(experiment_key, telegram_id, created_at)
+        evaluation = await self._evaluate(experiment_key, telegram_id, created_at)
         return await self.expose_evaluation(
             FeatureEvaluation(
                 feature_key=evaluation.feature_key,
@@ -820,14 +918,14 @@ class ExperimentService:
             telegram_id,
         )
 
-    def record_conversion(
+    async def record_conversion(
         self,
         experiment_key: str,
         telegram_id: int,
         event: str,
         created_at: datetime | None = None,
     ) -> None:
-        evaluation = self._evaluate(experiment_key, telegram_id, created_at)
+        evaluation = await self._evaluate(experiment_key, telegram_id, created_at)
         self.record_evaluated_conversion(
             FeatureEvaluation(
                 feature_key=evaluation.feature_key,
@@ -851,3 +949,11 @@ class ExperimentService:
         variant = await self.expose(TRIAL_EXPERIMENT_KEY, telegram_id, created_at)
         on_variant, _ = self._get_feature_variants(TRIAL_EXPERIMENT_KEY)
         return variant == on_variant
+
+
+def _on_estimand_events_dropped(count: int, reason: str) -> None:
+    ESTIMAND_EVENTS_DROPPED_TOTAL.labels(reason=reason).inc(count)
+
+
+def _on_estimand_events_flushed(count: int) -> None:
+    ESTIMAND_EVENTS_FLUSHED_TOTAL.inc(count)
@@ -0,0 +1,158 @@
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Final, Optional, TypeVar
+
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.config import AppConfig
+from src.core.enums import ReferralLevel
+from src.core.metrics import MENU_SNAPSHOT_INPUT_TIME
+from src.core.storage.keys import MenuSnapshotKey
+from src.infrastructure.billing import BillingClient
+from src.infrastructure.redis import RedisRepository
+from src.models.dto import UserDto
+from src.models.dto.subscription import BaseSubscriptionDto
+
+from .plan import PlanService
+from .referral import ReferralService
+from .remnawave import RemnawaveService
+from .settings import SettingsService
+from .subscription import SubscriptionService
+
+T = TypeVar("T")
+
+MENU_SNAPSHOT_TTL: Final[int] = 30
+
+
+class MenuSnapshot(BaseModel):
+    """Per-user inputs of the main menu that don't change between renders.
+
+    ``fingerprint`` ties the snapshot to the subscription state it was built
+    for, so a subscription that expired or changed plan since is never served
+    a stale proxy or beta-tester flag even before the key is invalidated.
+    """
+
+    fingerprint: str
+    ref_link: str
+    is_referral_enable: bool
+    invitee_discount: int
+    referrer_days: int
+    long_referrer_days: int
+    trial_available: bool = False
+    is_beta_tester: bool = False
+    tg_proxy_available: bool = False
+
+
+class MenuService:
+    def __init__(
+        self,
+        config: AppConfig,
+        redis_repository: RedisRepository,
+        billing: BillingClient,
+        plan_service: PlanService,
+        settings_service: SettingsService,
+        subscription_service: SubscriptionService,
+        referral_service: ReferralService,
+        remnawave_service: RemnawaveService,
+    ) -> None:
+        self.config = config
+        self.redis_repository = redis_repository
+        self.billing = billing
+        self.plan_service = plan_service
+        self.settings_service = settings_service
+        self.subscription_service = subscription_service
+        self.referral_service = referral_service
+        self.remnawave_service = remnawave_service
+
+    async def get_snapshot(self, user: UserDto) -> MenuSnapshot:
+        key = MenuSnapshotKey(telegram_id=user.telegram_id)
+        fingerprint = self._fingerprint(user.current_subscription)
+
+        try:
+            cached = await self.redis_repository.get(key, MenuSnapshot)
+            if cached is not None and cached.fingerprint == fingerprint:
+                logger.debug(f"Menu snapshot hit for user '{user.telegram_id}'")
+                return cached
+        except Exception as exception:
+            logger.warning(f"Menu snapshot read failed for user '{user.telegram_id}': {exception}")
+
+        snapshot = await self._build_snapshot(user, fingerprint)
+
+        try:
+            await self.redis_repository.set(key, snapshot, ex=MENU_SNAPSHOT_TTL)
+        except Exception as exception:
+            logger.warning(f"Menu snapshot write failed for user '{user.telegram_id}': {exception}")
+
+        return snapshot
+
+    async def _build_snapshot(self, user: UserDto, fingerprint: str) -> MenuSnapshot:
+        subscription = user.current_subscription
+
+        settings, ref_link = await asyncio.gather(
+            _timed("settings", self.settings_service.get()),
+            _timed("ref_link", self.referral_service.get_ref_link(user.referral_code)),
+        )
+        referral = settings.referral
+        snapshot = MenuSnapshot(
+            fingerprint=fingerprint,
+            ref_link=ref_link,
+            is_referral_enable=referral.enable,
+            invitee_discount=referral.invitee_reward.amount,
+            referrer_days=referral.reward.config.get(ReferralLevel.FIRST, 14),
+            long_referrer_days=referral.reward.long_purchase_amount or 30,
+        )
+
+        if not subscription:
+            trial_plan, has_used_trial = await asyncio.gather(
+                _timed("trial_plan", self.plan_service.get_trial_plan()),
+                _timed(
+                    "has_used_trial", self.subscription_service.has_used_trial(user.telegram_id)
+                ),
+            )
+            snapshot.trial_available = bool(trial_plan and not has_used_trial)
+            return snapshot
+
+        snapshot.is_beta_tester, snapshot.tg_proxy_available = await asyncio.gather(
+            self._is_beta_tester(user, subscription),
+            self._has_tg_proxies(subscription),
+        )
+        return snapshot
+
+    async def _is_beta_tester(self, user: UserDto, subscription: BaseSubscriptionDto) -> bool:
+        try:
+            return await _timed(
+                "beta_tester",
+                self.remnawave_service.is_beta_tester(subscription),
+            )
+        except Exception:
+            logger.opt(exception=True).warning(
+                f"Failed to resolve beta tester status for user '{user.telegram_id}'"
+            )
+            return False
+
+    async def _has_tg_proxies(self, subscription: BaseSubscriptionDto) -> bool:
+        plan_id = subscription.plan.id if subscription.plan else 0
+        if not subscription.is_active or not plan_id:
+            return False
+        try:
+            return len(await _timed("tg_proxies", self.billing.get_tg_proxies(plan_id))) > 0
+        except Exception:
+            logger.opt(exception=True).warning("Failed to fetch TG proxies, hiding button")
+            return False
+
+    @staticmethod
+    def _fingerprint(subscription: Optional[BaseSubscriptionDto]) -> str:
+        if not subscription:
+            return "none"
+        plan_id = subscription.plan.id if subscription.plan else 0
+        squads = ",".join(sorted(str(squad) for squad in subscription.internal_squads))
+        return f"{plan_id}:{int(subscription.is_active)}:{squads}"
+
+
+async def _timed(name: str, awaitable: Awaitable[T]) -> T:
+    start = perf_counter()
+    try:
+        return await awaitable
+    finally:
+        MENU_SNAPSHOT_INPUT_TIME.labels(input=name).observe(perf_counter() - start)
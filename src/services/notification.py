@@ -1,4 +1,5 @@
 import asyncio
+import time
 import uuid
 from typing import Any, Optional, Union, cast
 
@@ -15,6 +16,7 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from fluentogram import TranslatorHub
 from loguru import logger
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from src.__version__ import __version__
 from src.bot.keyboards import get_remnashop_keyboard
@@ -25,16 +27,20 @@ from src.core.enums import (
     Locale,
     MediaType,
     MessageEffect,
+    SendPriority,
     SystemNotificationType,
     UserNotificationType,
     UserRole,
 )
 from src.core.i18n.translator import get_translated_kwargs
-from src.core.storage.keys import NotificationDedupKey
+from src.core.storage.key_builder import StorageKey
+from src.core.storage.keys import NotificationDedupKey, PendingSystemDigestsKey, SystemDigestKey
+from src.core.utils import json_utils
 from src.core.utils.formatters import i18n_postprocess_text
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.types import AnyKeyboard
 from src.infrastructure.redis.repository import RedisRepository
+from src.infrastructure.telegram import schedule_message_deletion, send_priority
 from src.models.dto import UserDto
 from src.models.dto.user import BaseUserDto
 from src.services.settings import SettingsService
@@ -42,6 +48,26 @@ from src.services.settings import SettingsService
 from .base import BaseService
 from .user import UserService
 
+# Queues one event; KEYS: digest list, pending set. ARGV: event, type, now. Returns the list size.
+_PUSH_DIGEST_EVENT_SCRIPT = """
+local size = redis.call('RPUSH', KEYS[1], ARGV[1])
+redis.call('ZADD', KEYS[2], 'NX', ARGV[3], ARGV[2])
+return size
+"""
+
+# Takes every queued event of one type; KEYS: digest list, pending set. ARGV: type.
+_CLAIM_DIGEST_SCRIPT = """
+local events = redis.call('LRANGE', KEYS[1], 0, -1)
+redis.call('DEL', KEYS[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+return events
+"""
+
+# Room left for the digest header within Telegram's 4096 character message limit
+_DIGEST_TEXT_LIMIT = 3_500
+_DIGEST_SEPARATOR = "\n\n➖➖➖➖➖\n\n"
+_PENDING_DIGESTS_KEY = PendingSystemDigestsKey()
+
 
 class NotificationService(BaseService):
     user_service: UserService
@@ -67,7 +93,15 @@ class NotificationService(BaseService):
         user: Optional[BaseUserDto],
         payload: MessagePayload,
         ntf_type: Optional[UserNotificationType] = None,
+        dedup_key: Optional[StorageKey] = None,
+        dedup_ttl: int = TIME_24H,
     ) -> Optional[Message]:
+        """Send ``payload`` to ``user``; typed notifications go out at most once per ``dedup_ttl``.
+
+        A typed notification first claims ``dedup_key`` (by default one per user and
+        type) with a single SET NX, so concurrent workers cannot both send it. The
+        claim is released when the send fails, leaving the notification to a retry.
+        """
         if not user:
             logger.warning("Skipping user notification: user object is empty")
             return None
@@ -79,20 +113,32 @@ class NotificationService(BaseService):
             )
             return None
 
-        if ntf_type and await self._is_duplicate(user.telegram_id, ntf_type):
-            logger.debug(
-                f"Skipping duplicate notification '{ntf_type.value}' for '{user.telegram_id}'"
+        claim_key: Optional[StorageKey] = None
+        if ntf_type:
+            claim_key = dedup_key or NotificationDedupKey(
+                telegram_id=user.telegram_id, ntf_type=ntf_type.value
             )
-            return None
+            if not await self.redis_repository.claim(claim_key, ex=dedup_ttl):
+                logger.debug(
+                    f"Skipping duplicate notification '{ntf_type.value}' for '{user.telegram_id}'"
+                )
+                return None
 
         logger.debug(
             f"Attempting to send user notification '{payload.i18n_key}' to '{user.telegram_id}'"
         )
 
-        result = await self._send_message(user, payload)
+        try:
+            # Typed notifications are pushed by the bot, not answers to a user action
+            with send_priority(SendPriority.BULK if ntf_type else SendPriority.INTERACTIVE):
+                result = await self._send_message(user, payload)
+        except Exception:
+            if claim_key:
+                await self.redis_repository.delete(claim_key)
+            raise
 
-        if result and ntf_type:
-            await self._mark_sent(user.telegram_id, ntf_type)
+        if not result and claim_key:
+            await self.redis_repository.delete(claim_key)
 
         return result
 
@@ -101,15 +147,17 @@ class NotificationService(BaseService):
         payload: MessagePayload,
         ntf_type: SystemNotificationType,
     ) -> list[bool]:
-        devs = await self.user_service.get_by_role(role=UserRole.DEV)
-
-        if not devs:
-            devs = [self._get_temp_dev()]
-
         if not await self.settings_service.is_notification_enabled(ntf_type):
             logger.debug("Skipping system notification: notification type is disabled in settings")
             return []
 
+        if ntf_type in self.config.bot.system_digest_types and await self._queue_for_digest(
+            ntf_type, payload
+        ):
+            return []
+
+        devs = await self._get_devs()
+
         logger.debug(
             f"Attempting to send system notification '{payload.i18n_key}' to '{len(devs)}' devs"
         )
@@ -117,11 +165,39 @@ class NotificationService(BaseService):
         async def send_to_dev(dev: UserDto) -> bool:
             return bool(await self._send_message(user=dev, payload=payload))
 
-        tasks = [send_to_dev(dev) for dev in devs]
-        results = await asyncio.gather(*tasks)
+        with send_priority(SendPriority.BULK):
+            tasks = [send_to_dev(dev) for dev in devs]
+            results = await asyncio.gather(*tasks)
 
         return cast(list[bool], results)
 
+    async def flush_system_digest(self, ntf_type: SystemNotificationType) -> int:
+        """Send every queued event of ``ntf_type`` to each dev as one digest; returns the count."""
+        key = SystemDigestKey(ntf_type=ntf_type.value)
+        raw_events = await self.redis_repository.run_script(
+            _CLAIM_DIGEST_SCRIPT,
+            [key.pack(), _PENDING_DIGESTS_KEY.pack()],
+            [ntf_type.value],
+        )
+        if not raw_events:
+            return 0
+
+        events = [MessagePayload(**json_utils.decode(event)) for event in raw_events]
+        devs = await self._get_devs()
+        logger.debug(f"Sending '{ntf_type}' digest of {len(events)} events to '{len(devs)}' devs")
+
+        with send_priority(SendPriority.BULK):
+            await asyncio.gather(*(self._send_digest(dev, ntf_type, events) for dev in devs))
+
+        return len(events)
+
+    async def flush_due_system_digests(self) -> None:
+        """Flush every digest whose first event is older than the digest interval."""
+        cutoff = time.time() - self.config.bot.system_digest_interval
+        due = await self.redis_client.zrangebyscore(_PENDING_DIGESTS_KEY.pack(), "-inf", cutoff)
+        for ntf_type in due:
+            await self.flush_system_digest(SystemNotificationType(ntf_type.decode()))
+
     async def notify_super_dev(self, payload: MessagePayload) -> bool:
         dev = await self.user_service.get(telegram_id=self.config.bot.dev_id)
 
@@ -161,17 +237,12 @@ class NotificationService(BaseService):
         payload.i18n_kwargs.update(self.config.build.data)
         await self.notify_super_dev(payload=payload)
 
-    async def _is_duplicate(self, telegram_id: int, ntf_type: UserNotificationType) -> bool:
-        key = NotificationDedupKey(telegram_id=telegram_id, ntf_type=ntf_type.value)
-        return await self.redis_repository.exists(key)
-
-    async def _mark_sent(self, telegram_id: int, ntf_type: UserNotificationType) -> None:
-        key = NotificationDedupKey(telegram_id=telegram_id, ntf_type=ntf_type.value)
-        await self.redis_repository.set(key, value=None, ex=TIME_24H)
+    async def deliver(self, user: BaseUserDto, payload: MessagePayload) -> Message:
+        """Send ``payload`` to ``user`` without the duplicate and settings checks.
 
-    #
-
-    async def _send_message(self, user: BaseUserDto, payload: MessagePayload) -> Optional[Message]:
+        Unlike ``notify_user`` Telegram errors are raised, so callers such as
+        broadcasts can tell a blocked bot (``TelegramForbiddenError``) apart.
+        """
         reply_markup = self._prepare_reply_markup(
             payload.reply_markup,
             payload.add_close_button,
@@ -179,28 +250,91 @@ class NotificationService(BaseService):
             user.language,
             user.telegram_id,
         )
-        try:
-            if (payload.media or payload.media_id) and payload.media_type:
-                sent_message = await self._send_media_message(user, payload, reply_markup)
-            else:
-                if (payload.media or payload.media_id) and not payload.media_type:
-                    logger.warning(
-                        f"Validation warning: Media provided without media_type "
-                        f"for chat '{user.telegram_id}'. Sending as text message"
-                    )
-                sent_message = await self._send_text_message(user, payload, reply_markup)
-
-            if payload.auto_delete_after is not None and sent_message:
-                asyncio.create_task(
-                    self._schedule_message_deletion(
-                        chat_id=user.telegram_id,
-                        message_id=sent_message.message_id,
-                        delay=payload.auto_delete_after,
-                    )
+        if (payload.media or payload.media_id) and payload.media_type:
+            sent_message = await self._send_media_message(user, payload, reply_markup)
+        else:
+            if (payload.media or payload.media_id) and not payload.media_type:
+                logger.warning(
+                    f"Validation warning: Media provided without media_type "
+                    f"for chat '{user.telegram_id}'. Sending as text message"
                 )
+            sent_message = await self._send_text_message(user, payload, reply_markup)
+
+        if payload.auto_delete_after is not None and sent_message:
+            await self._schedule_message_deletion(
+                chat_id=user.telegram_id,
+                message_id=sent_message.message_id,
+                delay=payload.auto_delete_after,
+            )
+
+        return sent_message
+
+    async def _get_devs(self) -> list[UserDto]:
+        devs = await self.user_service.get_by_role(role=UserRole.DEV)
+        return devs or [self._get_temp_dev()]
 
-            return sent_message
+    async def _queue_for_digest(
+        self,
+        ntf_type: SystemNotificationType,
+        payload: MessagePayload,
+    ) -> bool:
+        """Queue ``payload`` for the next digest; ``False`` means it must be sent right away."""
+        try:
+            event = json_utils.encode(
+                {"i18n_key": payload.i18n_key, "i18n_kwargs": payload.i18n_kwargs}
+            )
+        except TypeError as exception:
+            logger.warning(f"Sending '{ntf_type}' event immediately, cannot queue it: {exception}")
+            return False
+
+        key = SystemDigestKey(ntf_type=ntf_type.value)
+        size = await self.redis_repository.run_script(
+            _PUSH_DIGEST_EVENT_SCRIPT,
+            [key.pack(), _PENDING_DIGESTS_KEY.pack()],
+            [event, ntf_type.value, time.time()],
+        )
+        if size >= self.config.bot.system_digest_max_events:
+            await self.flush_system_digest(ntf_type)
+        return True
 
+    async def _send_digest(
+        self,
+        dev: UserDto,
+        ntf_type: SystemNotificationType,
+        events: list[MessagePayload],
+    ) -> None:
+        texts = [
+            self._get_translated_text(dev.language, event.i18n_key, event.i18n_kwargs)
+            for event in events
+        ]
+
+        chunks: list[list[str]] = [[]]
+        length = 0
+        for text in texts:
+            if chunks[-1] and length + len(text) > _DIGEST_TEXT_LIMIT:
+                chunks.append([])
+                length = 0
+            chunks[-1].append(text)
+            length += len(text) + len(_DIGEST_SEPARATOR)
+
+        for chunk in chunks:
+            await self._send_message(
+                user=dev,
+                payload=MessagePayload.not_deleted(
+                    i18n_key="ntf-event-digest",
+                    i18n_kwargs={
+                        "type": ntf_type.value,
+                        "count": len(chunk),
+                        "events": _DIGEST_SEPARATOR.join(chunk),
+                    },
+                ),
+            )
+
+    #
+
+    async def _send_message(self, user: BaseUserDto, payload: MessagePayload) -> Optional[Message]:
+        try:
+            return await self.deliver(user, payload)
         except TelegramForbiddenError as exception:
             logger.exception(
                 f"Failed to send notification '{payload.i18n_key}' "
@@ -310,14 +444,11 @@ class NotificationService(BaseService):
             f"Scheduling message '{message_id}' for auto-deletion in '{delay}' (chat '{chat_id}')"
         )
         try:
-            await asyncio.sleep(delay)
-            await self.bot.delete_message(chat_id=chat_id, message_id=message_id)
-            logger.debug(
-                f"Message '{message_id}' in chat '{chat_id}' deleted after '{delay}' seconds"
-            )
-        except Exception as exception:
+            await schedule_message_deletion(self.redis_repository, chat_id, message_id, delay)
+        except RedisError as exception:
             logger.error(
-                f"Failed to delete message '{message_id}' in chat '{chat_id}': {exception}"
+                f"Failed to schedule deletion of message '{message_id}' "
+                f"in chat '{chat_id}': {exception}"
             )
 
     def _get_translated_text(
@@ -333,7 +333,7 @@ class PaymentGatewayService(BaseService):
             transaction.user.telegram_id,
             transaction.user.created_at,
         )
-        self.experiment_service.record_conversion(
+        await self.experiment_service.record_conversion(
             ExperimentFeature.CHECKOUT_FLOW.value,
             transaction.user.telegram_id,
             "payment_completed",
@@ -439,7 +439,7 @@ class PaymentGatewayService(BaseService):
                 updated.user.telegram_id,
                 updated.user.created_at,
             )
-            self.experiment_service.record_conversion(
+            await self.experiment_service.record_conversion(
                 ExperimentFeature.CHECKOUT_FLOW.value,
                 updated.user.telegram_id,
                 "payment_canceled",
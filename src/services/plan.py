@@ -4,11 +4,12 @@ from loguru import logger
 from redis.asyncio import Redis
 
 from src.core.config import AppConfig
-from src.core.constants import TIME_10M
+from src.core.constants import TIME_1M, TIME_10M
 from src.core.storage.key_builder import build_key
 from src.infrastructure.billing import BillingClient, billing_plan_to_dto
 from src.infrastructure.redis import RedisRepository
-from src.infrastructure.redis.cache import redis_cache
+from src.infrastructure.redis.cache import CacheStampede, redis_cache
+from src.infrastructure.redis.local_cache import invalidate_cache
 from src.models.dto import PlanDto, UserDto
 
 from .base_billing import BaseBillingService
@@ -84,7 +85,13 @@ class PlanService(BaseBillingService):
 
     #
 
-    @redis_cache(prefix="get_trial_plan", ttl=TIME_10M)
+    @redis_cache(
+        prefix="get_trial_plan",
+        ttl=TIME_10M,
+        local_ttl=TIME_1M,
+        local_maxsize=1,
+        stampede=CacheStampede.LOCK,
+    )
     async def get_trial_plan(self) -> Optional[PlanDto]:
         billing_plan = await self.billing.get_trial_plan()
         if billing_plan:
@@ -123,7 +130,7 @@ class PlanService(BaseBillingService):
 
     async def _clear_plan_cache(self) -> None:
         trial_plan_key = build_key("cache", "get_trial_plan")
-        await self.redis_client.delete(trial_plan_key)
+        await invalidate_cache(self.redis_client, trial_plan_key)
         logger.debug("Trial plan cache invalidated")
 
 
@@ -57,6 +57,7 @@ from src.models.dto import (
     SubscriptionDto,
     UserDto,
 )
+from src.models.dto.subscription import BaseSubscriptionDto
 from src.services.notification import NotificationService
 from src.services.subscription import SubscriptionService
 from src.services.user import UserService
@@ -123,7 +124,7 @@ class RemnawaveService(BaseService):
         )
         return squad_uuid
 
-    async def is_beta_tester(self, subscription: Optional[SubscriptionDto]) -> bool:
+    async def is_beta_tester(self, subscription: Optional[BaseSubscriptionDto]) -> bool:
         if subscription is None:
             return False
         beta_squad = await self._get_beta_testers_squad_uuid()
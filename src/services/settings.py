@@ -5,14 +5,15 @@ from pydantic import SecretStr
 from redis.asyncio import Redis
 
 from src.core.config import AppConfig
-from src.core.constants import TIME_10M
+from src.core.constants import TIME_1M, TIME_10M
 from src.core.enums import AccessMode, Currency, SystemNotificationType, UserNotificationType
 from src.core.storage.key_builder import build_key
 from src.core.utils.types import AnyNotification
 from src.infrastructure.billing import BillingClient
 from src.infrastructure.billing.converters import billing_settings_to_dto
 from src.infrastructure.redis import RedisRepository
-from src.infrastructure.redis.cache import redis_cache
+from src.infrastructure.redis.cache import CacheStampede, redis_cache
+from src.infrastructure.redis.local_cache import invalidate_cache
 from src.models.dto import ReferralSettingsDto, SettingsDto
 
 from .base_billing import BaseBillingService
@@ -33,7 +34,13 @@ class SettingsService(BaseBillingService):
         self.billing = billing
         self._settings_memo: Optional[SettingsDto] = None
 
-    @redis_cache(prefix="get_settings", ttl=TIME_10M)
+    @redis_cache(
+        prefix="get_settings",
+        ttl=TIME_10M,
+        local_ttl=TIME_1M,
+        local_maxsize=1,
+        stampede=CacheStampede.LOCK,
+    )
     async def _fetch_settings(self) -> SettingsDto:
         billing_settings = await self.billing.get_settings()
         logger.debug("Retrieved settings from billing API")
@@ -171,4 +178,4 @@ class SettingsService(BaseBillingService):
         self._settings_memo = None
         settings_cache_key: str = build_key("cache", "get_settings")
         logger.debug(f"Cache '{settings_cache_key}' cleared")
-        await self.redis_client.delete(settings_cache_key)
+        await invalidate_cache(self.redis_client, settings_cache_key)
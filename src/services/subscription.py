@@ -11,10 +11,12 @@ from remnapy.enums.users import TrafficLimitStrategy
 from src.core.config import AppConfig
 from src.core.constants import TIME_1M, TIME_5M, TIME_10M, TIMEZONE
 from src.core.storage.key_builder import build_key
+from src.core.storage.keys import MenuSnapshotKey
 from src.core.utils.time import datetime_now
 from src.infrastructure.billing import BillingClient, billing_subscription_to_dto
 from src.infrastructure.redis import RedisRepository
 from src.infrastructure.redis.cache import redis_cache
+from src.infrastructure.redis.local_cache import invalidate_cache
 from src.models.dto import (
     PlanDto,
     PlanSnapshotDto,
@@ -129,7 +131,9 @@ class SubscriptionService(BaseService):
         billing_subs = await self.billing.list_all_subscriptions()
         return [billing_subscription_to_dto(s) for s in billing_subs]
 
-    @redis_cache(prefix="get_current_subscription", ttl=TIME_1M)
+    @redis_cache(
+        prefix="get_current_subscription", ttl=TIME_5M, local_ttl=TIME_1M, local_maxsize=10_000
+    )
     async def get_current(self, telegram_id: int) -> Optional[SubscriptionDto]:
         billing_sub = await self.billing.get_current_subscription(telegram_id)
         if not billing_sub:
@@ -147,13 +151,21 @@ class SubscriptionService(BaseService):
     async def has_used_trial(self, user_telegram_id: int) -> bool:
         return await self.billing.has_used_trial(user_telegram_id)
 
-    async def clear_subscription_cache(self, subscription_id: int, user_telegram_id: int) -> None:
+    async def clear_subscription_cache(
+        self,
+        subscription_id: Optional[int],
+        user_telegram_id: int,
+    ) -> None:
         list_cache_keys_to_invalidate = [
-            build_key("cache", "get_subscription", subscription_id),
             build_key("cache", "get_current_subscription", user_telegram_id),
             build_key("cache", "has_used_trial", user_telegram_id),
+            MenuSnapshotKey(telegram_id=user_telegram_id).pack(),
         ]
-        await self.redis_client.delete(*list_cache_keys_to_invalidate)
+        if subscription_id is not None:
+            list_cache_keys_to_invalidate.append(
+                build_key("cache", "get_subscription", subscription_id)
+            )
+        await invalidate_cache(self.redis_client, *list_cache_keys_to_invalidate)
 
     @staticmethod
     def subscriptions_match(
@@ -12,12 +12,13 @@ from src.core.config import AppConfig
 from src.core.constants import (
     RECENT_ACTIVITY_MAX_COUNT,
     REMNASHOP_PREFIX,
+    TIME_1M,
     TIME_5M,
     TIME_10M,
 )
 from src.core.enums import Locale, UserRole
-from src.core.storage.key_builder import StorageKey, build_key
-from src.core.storage.keys import RecentActivityUsersKey
+from src.core.storage.key_builder import build_key
+from src.core.storage.keys import MenuSnapshotKey, RecentActivityUsersKey
 from src.core.utils import json_utils
 from src.core.utils.formatters import format_user_name
 from src.core.utils.generators import generate_referral_code
@@ -25,7 +26,13 @@ from src.core.utils.types import RemnaUserDto
 from src.infrastructure.billing import BillingClient
 from src.infrastructure.billing.client import BillingClientError
 from src.infrastructure.billing.converters import billing_user_to_dto
-from src.infrastructure.redis import RedisRepository, redis_cache
+from src.infrastructure.redis import (
+    CacheStampede,
+    RedisRepository,
+    invalidate_cache,
+    publish_invalidation,
+    redis_cache,
+)
 from src.infrastructure.redis.cache import prepare_for_cache
 from src.models.dto import UserDto
 from src.models.dto.user import BaseUserDto
@@ -99,7 +106,7 @@ class UserService(BaseService):
         logger.info(f"Created new user '{remna_user.telegram_id}' from panel")
         return billing_user_to_dto(billing_user)
 
-    @redis_cache(prefix="get_user", ttl=TIME_5M)
+    @redis_cache(prefix="get_user", ttl=TIME_5M, local_ttl=TIME_1M, local_maxsize=10_000)
     async def get(self, telegram_id: int) -> Optional[UserDto]:
         billing_user = await self.billing.get_user(telegram_id)
         if billing_user:
@@ -161,14 +168,18 @@ class UserService(BaseService):
             return billing_user_to_dto(billing_user)
         return None
 
-    @redis_cache(prefix="users_count", ttl=TIME_10M)
+    @redis_cache(prefix="users_count", ttl=TIME_10M, stampede=CacheStampede.XFETCH)
     async def count(self) -> int:
         count = await self.billing.count_users()
         logger.debug(f"Total users count: '{count}'")
         return count
 
-    @redis_cache(prefix="get_by_role", ttl=TIME_10M)
+    @redis_cache(prefix="get_by_role", ttl=TIME_10M, stampede=CacheStampede.XFETCH)
     async def get_by_role(self, role: UserRole) -> list[UserDto]:
+        return await self.fetch_by_role(role)
+
+    async def fetch_by_role(self, role: UserRole) -> list[UserDto]:
+        """Same as `get_by_role`, read straight from billing instead of the cache."""
         billing_users = await self.billing.list_users_by_role(role.value)
         logger.debug(f"Retrieved '{len(billing_users)}' users with role '{role}'")
         return [billing_user_to_dto(u) for u in billing_users]
@@ -220,11 +231,14 @@ class UserService(BaseService):
     #
 
     async def update_recent_activity(self, telegram_id: int) -> None:
-        throttle_key = build_key("throttle", "recent_activity", telegram_id)
-        if await self.redis_client.exists(throttle_key):
-            return
-        await self.redis_client.setex(throttle_key, TIME_5M, 1)
-        await self._add_to_recent_activity(RecentActivityUsersKey(), telegram_id)
+        # One script call: throttle check, throttle mark and the list move
+        await self.redis_repository.list_push_unique(
+            RecentActivityUsersKey(),
+            telegram_id,
+            max_length=RECENT_ACTIVITY_MAX_COUNT,
+            guard_key=build_key("throttle", "recent_activity", telegram_id),
+            guard_ttl=TIME_5M,
+        )
 
     async def get_recent_activity_users(self, excluded_ids: list[int] = []) -> list[UserDto]:
         telegram_ids = await self._get_recent_activity()
@@ -292,31 +306,31 @@ class UserService(BaseService):
 
     async def clear_user_cache(self, telegram_id: int) -> None:
         user_cache_key: str = build_key("cache", "get_user", telegram_id)
-        await self.redis_client.delete(user_cache_key)
-        await self._clear_list_caches()
+        await invalidate_cache(
+            self.redis_client, user_cache_key, *self._dependent_cache_keys(telegram_id)
+        )
         logger.debug(f"User cache for '{telegram_id}' invalidated")
 
     async def _repopulate_user_cache(self, telegram_id: int, user_dto: UserDto) -> None:
         user_cache_key: str = build_key("cache", "get_user", telegram_id)
         safe_result = prepare_for_cache(_USER_DTO_ADAPTER.dump_python(user_dto))
         await self.redis_client.setex(user_cache_key, TIME_5M, json_utils.encode(safe_result))
-        await self._clear_list_caches()
+        await publish_invalidation(self.redis_client, user_cache_key)
+        await self._clear_dependent_caches(telegram_id)
         logger.debug(f"User cache for '{telegram_id}' repopulated")
 
-    async def _clear_list_caches(self) -> None:
-        list_cache_keys_to_invalidate = [
+    async def _clear_dependent_caches(self, telegram_id: int) -> None:
+        await invalidate_cache(self.redis_client, *self._dependent_cache_keys(telegram_id))
+
+    def _dependent_cache_keys(self, telegram_id: int) -> list[str]:
+        keys = [
+            MenuSnapshotKey(telegram_id=telegram_id).pack(),
             build_key("cache", "get_blocked_users"),
-            build_key("cache", "count"),
+            build_key("cache", "users_count"),
         ]
         for role in UserRole:
-            key = build_key("cache", "get_by_role", role=role)
-            list_cache_keys_to_invalidate.append(key)
-        await self.redis_client.delete(*list_cache_keys_to_invalidate)
-
-    async def _add_to_recent_activity(self, key: StorageKey, telegram_id: int) -> None:
-        await self.redis_repository.list_remove(key, value=telegram_id, count=0)
-        await self.redis_repository.list_push(key, telegram_id)
-        await self.redis_repository.list_trim(key, start=0, end=RECENT_ACTIVITY_MAX_COUNT - 1)
+            keys.append(build_key("cache", "get_by_role", role=role))
+        return keys
 
     async def _remove_from_recent_activity(self, telegram_id: int) -> None:
         await self.redis_repository.list_remove(
@@ -245,13 +245,11 @@ class TestRouterRegistration:
 
 
 class TestRemovedServices:
-    """Verify removed admin services are no longer importable."""
+    """Verify removed admin services are no longer importable.
 
-    def test_broadcast_service_not_importable(self):
-        import importlib
-
-        with pytest.raises((ImportError, ModuleNotFoundError)):
-            importlib.import_module("src.services.broadcast")
+    Broadcast delivery came back as a taskiq pipeline driven by /broadcast;
+    only its dashboard dialog stays removed.
+    """
 
     def test_importer_service_not_importable(self):
         import importlib
@@ -259,12 +257,6 @@ class TestRemovedServices:
         with pytest.raises((ImportError, ModuleNotFoundError)):
             importlib.import_module("src.services.importer")
 
-    def test_broadcast_tasks_not_importable(self):
-        import importlib
-
-        with pytest.raises((ImportError, ModuleNotFoundError)):
-            importlib.import_module("src.infrastructure.taskiq.tasks.broadcast")
-
     def test_importer_tasks_not_importable(self):
         import importlib
 
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
 
 import httpx
 import pytest
 
-from src.infrastructure.billing.client import BillingClient, BillingClientError
+from src.infrastructure.billing.client import (
+    BillingClient,
+    BillingClientError,
+    BillingPriceQuery,
+)
 from src.infrastructure.billing.models import (
     BillingCustomer,
     BillingPaymentGateway,
@@ -25,6 +31,7 @@ from src.infrastructure.billing.models import (
     BillingTransaction,
     BillingUser,
 )
+from src.infrastructure.billing.structs import BillingPlanStruct, BillingTransactionStruct
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -1465,3 +1472,286 @@ class TestClientLifecycle:
         # Clean up if real client was created
         if isinstance(http_client, httpx.AsyncClient):
             await http_client.aclose()
+
+
+# ---------------------------------------------------------------------------
+# Single-flight coalescing
+# ---------------------------------------------------------------------------
+
+
+def _slow_response(gate: asyncio.Event, response: MagicMock):
+    async def _request(*args, **kwargs):
+        await gate.wait()
+        return response
+
+    return _request
+
+
+class TestSingleFlight:
+
+    async def test_concurrent_identical_gets_share_one_request(self):
+        client, mock_http = _make_client_with_mock()
+        gate = asyncio.Event()
+        mock_http.request.side_effect = _slow_response(gate, _make_response(200, SAMPLE_SETTINGS))
+
+        calls = [asyncio.create_task(client.get_settings()) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*calls)
+
+        assert mock_http.request.await_count == 1
+        assert all(isinstance(r, BillingSettings) for r in results)
+        assert client._in_flight == {}
+
+    async def test_different_params_are_not_coalesced(self):
+        client, mock_http = _make_client_with_mock()
+        gate = asyncio.Event()
+        mock_http.request.side_effect = _slow_response(gate, _make_response(200, {"ok": True}))
+
+        calls = [
+            asyncio.create_task(client._get("/x", params={"a": 1}, coalesce="x")),
+            asyncio.create_task(client._get("/x", params={"a": 2}, coalesce="x")),
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*calls)
+
+        assert mock_http.request.await_count == 2
+
+    async def test_uncoalesced_endpoints_issue_own_requests(self):
+        client, mock_http = _make_client_with_mock()
+        gate = asyncio.Event()
+        mock_http.request.side_effect = _slow_response(gate, _make_response(200, []))
+
+        calls = [asyncio.create_task(client.list_plans()) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*calls)
+
+        assert mock_http.request.await_count == 3
+
+    async def test_disabled_single_flight_issues_every_request(self):
+        client, mock_http = _make_client_with_mock()
+        client._single_flight = False
+        gate = asyncio.Event()
+        mock_http.request.side_effect = _slow_response(gate, _make_response(200, SAMPLE_SETTINGS))
+
+        calls = [asyncio.create_task(client.get_settings()) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*calls)
+
+        assert mock_http.request.await_count == 3
+
+    async def test_error_fans_out_to_every_waiter(self):
+        client, mock_http = _make_client_with_mock()
+        gate = asyncio.Event()
+        mock_http.request.side_effect = _slow_response(gate, _make_response(503, text="down"))
+
+        calls = [asyncio.create_task(client.get_trial_plan()) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert mock_http.request.await_count == 1
+        assert all(isinstance(r, BillingClientError) for r in results)
+        assert all(r.status_code == 503 for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        client, mock_http = _make_client_with_mock()
+        gate = asyncio.Event()
+        mock_http.request.side_effect = _slow_response(gate, _make_response(200, {"currency": "RUB"}))
+
+        first = asyncio.create_task(client.get_default_currency())
+        second = asyncio.create_task(client.get_default_currency())
+        await asyncio.sleep(0)
+        first.cancel()
+        gate.set()
+
+        assert await second == "RUB"
+        assert first.cancelled()
+
+    async def test_next_call_after_completion_issues_new_request(self):
+        client, mock_http = _make_client_with_mock()
+        mock_http.request.return_value = _make_response(200, [SAMPLE_GATEWAY])
+
+        await client.list_active_gateways()
+        await client.list_active_gateways()
+
+        assert mock_http.request.await_count == 2
+
+
+def _make_raw_response(status_code: int = 200, content: bytes = b"") -> MagicMock:
+    resp = _make_response(status_code)
+    resp.content = content
+    return resp
+
+
+class TestStructDecoding:
+
+    async def test_enabled_endpoint_decodes_structs_from_bytes(self):
+        client, mock_http = _make_client_with_mock()
+        client._struct_endpoints = frozenset({"list_plans"})
+        mock_http.request.return_value = _make_raw_response(
+            200, json.dumps([SAMPLE_PLAN]).encode()
+        )
+
+        result = await client.list_plans()
+
+        assert len(result) == 1
+        assert isinstance(result[0], BillingPlanStruct)
+        assert result[0].ID == 42
+        assert result[0].Durations[0].Prices[0].Price == "119"
+        mock_http.request.return_value.json.assert_not_called()
+
+    async def test_other_endpoints_keep_pydantic(self):
+        client, mock_http = _make_client_with_mock()
+        client._struct_endpoints = frozenset({"list_transactions"})
+        mock_http.request.return_value = _make_response(200, [SAMPLE_PLAN])
+
+        result = await client.list_plans()
+
+        assert isinstance(result[0], BillingPlan)
+
+    @pytest.mark.parametrize("content", [b"", b"null", b"{}"])
+    async def test_empty_or_non_list_body_yields_empty_list(self, content):
+        client, mock_http = _make_client_with_mock()
+        client._struct_endpoints = frozenset({"list_all_transactions"})
+        mock_http.request.return_value = _make_raw_response(200, content)
+
+        assert await client.list_all_transactions() == []
+
+    async def test_no_content_yields_empty_list(self):
+        client, mock_http = _make_client_with_mock()
+        client._struct_endpoints = frozenset({"list_transactions"})
+        mock_http.request.return_value = _make_raw_response(204)
+
+        assert await client.list_transactions(123) == []
+
+    async def test_lax_numbers_are_coerced_like_pydantic(self):
+        client, mock_http = _make_client_with_mock()
+        client._struct_endpoints = frozenset({"list_transactions"})
+        mock_http.request.return_value = _make_raw_response(
+            200, b'[{"ID": "7", "UserTelegramID": 123.0}]'
+        )
+
+        result = await client.list_transactions(123)
+
+        assert isinstance(result[0], BillingTransactionStruct)
+        assert (result[0].ID, result[0].UserTelegramID) == (7, 123)
+
+
+# ---------------------------------------------------------------------------
+# Batch price quoting
+# ---------------------------------------------------------------------------
+
+
+def _price_for_request(*args, **kwargs):
+    days = kwargs["json"]["duration_days"]
+    return _make_response(
+        200,
+        {"original_amount": str(days), "discount_percent": 0, "final_amount": str(days)},
+    )
+
+
+class TestCalculatePrices:
+
+    async def test_returns_quotes_in_query_order(self):
+        client, mock_http = _make_client_with_mock()
+        mock_http.request.side_effect = _price_for_request
+
+        queries = [BillingPriceQuery(42, days, "RUB") for days in (30, 90, 180)]
+        result = await client.calculate_prices(123, queries)
+
+        assert [r.final_amount for r in result] == ["30", "90", "180"]
+        assert mock_http.request.await_count == 3
+
+    async def test_repeated_quotes_served_from_cache(self):
+        client, mock_http = _make_client_with_mock()
+        mock_http.request.side_effect = _price_for_request
+
+        queries = [BillingPriceQuery(42, 30, "RUB"), BillingPriceQuery(42, 90, "RUB")]
+        await client.calculate_prices(123, queries)
+        result = await client.calculate_prices(123, queries)
+
+        assert [r.final_amount for r in result] == ["30", "90"]
+        assert mock_http.request.await_count == 2
+
+    async def test_cache_keyed_by_experiment_and_channel_discount(self):
+        client, mock_http = _make_client_with_mock()
+        mock_http.request.side_effect = _price_for_request
+
+        await client.calculate_prices(123, [BillingPriceQuery(42, 30, "RUB")])
+        await client.calculate_prices(
+            123, [BillingPriceQuery(42, 30, "RUB", experiment={"variant_key": "v1"})]
+        )
+        await client.calculate_prices(
+            123, [BillingPriceQuery(42, 30, "RUB")], channel_discount={"percent": 5}
+        )
+        await client.calculate_prices(456, [BillingPriceQuery(42, 30, "RUB")])
+
+        assert mock_http.request.await_count == 4
+
+    async def test_passes_experiment_and_channel_discount(self):
+        client, mock_http = _make_client_with_mock()
+        mock_http.request.side_effect = _price_for_request
+
+        await client.calculate_prices(
+            123,
+            [BillingPriceQuery(42, 30, "USD", experiment={"feature_key": "intro_price"})],
+            channel_discount={"source": "compono_channel", "percent": 5},
+        )
+
+        body = mock_http.request.call_args[1]["json"]
+        assert body["currency"] == "USD"
+        assert body["experiment"] == {"feature_key": "intro_price"}
+        assert body["channel_discount"]["percent"] == 5
+
+    async def test_concurrency_is_bounded(self):
+        client, mock_http = _make_client_with_mock()
+        in_flight = 0
+        peak = 0
+
+        async def _request(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _price_for_request(*args, **kwargs)
+
+        mock_http.request.side_effect = _request
+
+        queries = [BillingPriceQuery(42, days, "RUB") for days in range(1, 11)]
+        await client.calculate_prices(123, queries)
+
+        assert mock_http.request.await_count == 10
+        assert 1 < peak <= 4
+
+    async def test_update_user_drops_cached_quotes(self):
+        client, mock_http = _make_client_with_mock()
+        mock_http.request.side_effect = _price_for_request
+
+        queries = [BillingPriceQuery(42, 30, "RUB")]
+        await client.calculate_prices(123, queries)
+        await client.calculate_prices(456, queries)
+
+        mock_http.request.side_effect = None
+        mock_http.request.return_value = _make_response(200, SAMPLE_USER)
+        await client.update_user(123, {"personal_discount": 10})
+
+        mock_http.request.side_effect = _price_for_request
+        await client.calculate_prices(123, queries)
+        await client.calculate_prices(456, queries)
+
+        # 2 initial quotes + update_user + one re-quote for the updated user only
+        assert mock_http.request.await_count == 4
+
+    async def test_errors_are_not_cached(self):
+        client, mock_http = _make_client_with_mock()
+        mock_http.request.return_value = _make_response(500, text="boom")
+
+        with pytest.raises(BillingClientError):
+            await client.calculate_prices(123, [BillingPriceQuery(42, 30, "RUB")])
+
+        assert client._quotes.currsize == 0
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from aiogram.methods import SendMessage
+
+from src.core.enums import BroadcastStatus, Locale, UserRole
+from src.core.utils.message_payload import MessagePayload
+from src.services import broadcast as broadcast_module
+from src.services.broadcast import BroadcastProgress, BroadcastService
+from tests.conftest import make_config, make_user
+
+_PAYLOAD = MessagePayload(i18n_key="ntf-broadcast-preview", i18n_kwargs={"content": "hi"})
+
+
+def _make_service() -> tuple[BroadcastService, AsyncMock, MagicMock, AsyncMock, AsyncMock]:
+    redis_client = AsyncMock()
+    redis_repository = MagicMock()
+    redis_repository.run_script = AsyncMock()
+    user_service = AsyncMock()
+    notification_service = AsyncMock()
+
+    svc = BroadcastService(
+        config=make_config(),
+        bot=AsyncMock(),
+        redis_client=redis_client,
+        redis_repository=redis_repository,
+        translator_hub=MagicMock(),
+        user_service=user_service,
+        notification_service=notification_service,
+    )
+    return svc, redis_client, redis_repository, user_service, notification_service
+
+
+def _pipeline(repository: MagicMock, results: list[object]) -> list[MagicMock]:
+    """Make ``repository.pipeline()`` hand out pipes whose execute() returns ``results`` in turn."""
+    pipes: list[MagicMock] = []
+
+    def pipeline(transaction: bool = True) -> MagicMock:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=results.pop(0) if results else [])
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=pipe)
+        context.__aexit__ = AsyncMock(return_value=False)
+        pipes.append(pipe)
+        return context
+
+    repository.pipeline.side_effect = pipeline
+    return pipes
+
+
+def _forbidden() -> TelegramForbiddenError:
+    method = SendMessage(chat_id=1, text="x")
+    return TelegramForbiddenError(method=method, message="Forbidden: bot was blocked by the user")
+
+
+class TestBroadcastProgress:
+    def test_admin_message_reports_rate_and_eta(self, monkeypatch):
+        monkeypatch.setattr(broadcast_module.time, "time", lambda: 1_100.0)
+        progress = BroadcastProgress(
+            broadcast_id="abc",
+            status=BroadcastStatus.PROCESSING,
+            total=3_000,
+            sent=900,
+            blocked=50,
+            failed=50,
+            started_at=1_000.0,
+        )
+
+        message = progress.to_admin_message()
+
+        assert "progress: 1000/3000 (33.3%)" in message
+        assert "rate: 10.0 msg/s" in message
+        assert "eta: 3m 20s" in message
+
+    def test_from_meta(self):
+        meta = {
+            "status": "COMPLETED",
+            "total": "2",
+            "sent": "2",
+            "started_at": "5",
+            "finished_at": "7",
+        }
+
+        progress = BroadcastProgress.from_meta("abc", meta)
+
+        assert progress.status is BroadcastStatus.COMPLETED
+        assert progress.rate == 1.0
+        assert "eta" not in progress.to_admin_message()
+
+
+class TestRecipients:
+    async def test_skips_blocked_and_duplicate_users(self):
+        svc, _, _, user_service, _ = _make_service()
+        user = make_user(telegram_id=1)
+        admin = make_user(telegram_id=2).model_copy(
+            update={"role": UserRole.ADMIN, "language": Locale.EN}
+        )
+        banned = make_user(telegram_id=3).model_copy(update={"is_blocked": True})
+        gone = make_user(telegram_id=4).model_copy(update={"is_bot_blocked": True})
+        user_service.fetch_by_role.side_effect = [[user, banned, gone], [admin, user], []]
+
+        pages = [page async for page in svc._recipient_pages()]
+
+        assert pages == [["1:ru"], ["2:en"], []]
+        user_service.get_by_role.assert_not_awaited()
+
+    async def test_create_pushes_each_page_as_it_arrives(self):
+        svc, _, redis_repository, user_service, _ = _make_service()
+        admin = make_user(telegram_id=9)
+        user_service.fetch_by_role.side_effect = [
+            [make_user(telegram_id=1), make_user(telegram_id=2)],
+            [make_user(telegram_id=3)],
+            [],
+        ]
+        pipes = _pipeline(redis_repository, [])
+
+        progress = await svc.create(admin, _PAYLOAD)
+
+        assert progress.total == 3
+        pushed = [call.args[1:] for pipe in pipes for call in pipe.rpush.call_args_list]
+        assert pushed == [("1:ru", "2:ru"), ("3:ru",)]
+        # One pipeline per role page, then the broadcast metadata
+        assert len(pipes) == 4
+        pipes[-1].hset.assert_called_once()
+
+
+class TestCreateOnce:
+    async def test_first_confirm_creates_and_records_the_broadcast(self):
+        svc, redis_client, redis_repository, _, _ = _make_service()
+        redis_repository.claim = AsyncMock(return_value=True)
+        progress = BroadcastProgress(
+            broadcast_id="abc123", status=BroadcastStatus.PROCESSING, total=1, started_at=0.0
+        )
+        svc.create = AsyncMock(return_value=progress)  # type: ignore[method-assign]
+
+        result = await svc.create_once(make_user(), _PAYLOAD, chat_id=-5, message_id=7)
+
+        assert result == (progress, None)
+        redis_repository.claim.assert_awaited_once()
+        assert redis_repository.claim.await_args.args[0].pack() == "broadcast_source:-5:7"
+        redis_client.set.assert_awaited_once_with(
+            "broadcast_source:-5:7", "abc123", ex=broadcast_module.BROADCAST_TTL
+        )
+
+    async def test_repeated_confirm_answers_with_the_existing_broadcast(self):
+        svc, redis_client, redis_repository, _, _ = _make_service()
+        redis_repository.claim = AsyncMock(return_value=False)
+        svc.create = AsyncMock()  # type: ignore[method-assign]
+
+        redis_client.get.return_value = b"abc123"
+        assert await svc.create_once(make_user(), _PAYLOAD, chat_id=-5, message_id=7) == (
+            None,
+            "abc123",
+        )
+        # Still being created by the first confirm
+        redis_client.get.return_value = b"1"
+        assert await svc.create_once(make_user(), _PAYLOAD, chat_id=-5, message_id=7) == (
+            None,
+            None,
+        )
+        svc.create.assert_not_awaited()
+
+    async def test_failed_create_releases_the_claim(self):
+        svc, _, redis_repository, _, _ = _make_service()
+        redis_repository.claim = AsyncMock(return_value=True)
+        redis_repository.delete = AsyncMock()
+        svc.create = AsyncMock(side_effect=RuntimeError("billing down"))  # type: ignore[method-assign]
+
+        with pytest.raises(RuntimeError):
+            await svc.create_once(make_user(), _PAYLOAD, chat_id=-5, message_id=7)
+
+        redis_repository.delete.assert_awaited_once()
+
+
+class TestSend:
+    async def test_delivers_in_recipient_locale(self):
+        svc, _, _, _, notification_service = _make_service()
+
+        assert await svc._send("42:ru", _PAYLOAD) == "sent"
+
+        user, payload = notification_service.deliver.await_args.args
+        assert (user.telegram_id, user.language, payload) == (42, Locale.RU, _PAYLOAD)
+
+    async def test_forbidden_marks_user_bot_blocked(self):
+        svc, _, _, user_service, notification_service = _make_service()
+        notification_service.deliver.side_effect = _forbidden()
+        user = make_user(telegram_id=42)
+        user_service.get.return_value = user
+
+        assert await svc._send("42:en", _PAYLOAD) == "blocked"
+
+        user_service.set_bot_blocked.assert_awaited_once_with(user, blocked=True)
+
+    async def test_other_telegram_errors_count_as_failed(self):
+        svc, _, _, user_service, notification_service = _make_service()
+        method = SendMessage(chat_id=42, text="x")
+        notification_service.deliver.side_effect = TelegramBadRequest(method, "chat not found")
+
+        assert await svc._send("42:en", _PAYLOAD) == "failed"
+
+        user_service.set_bot_blocked.assert_not_awaited()
+
+
+class TestProcessChunk:
+    async def test_resumes_from_checkpoint_and_checkpoints_each_send(self):
+        svc, redis_client, redis_repository, _, notification_service = _make_service()
+        redis_client.hget.return_value = b"203"
+        redis_client.lrange.return_value = [b"4:en", b"5:en"]
+        pipes = _pipeline(
+            redis_repository,
+            [[1, 1, 0, b"PROCESSING"], [1, 1, 0, b"PROCESSING"], [1, 1]],
+        )
+
+        assert await svc._process_chunk("abc", 200, 1_000, _PAYLOAD)
+
+        redis_client.lrange.assert_awaited_once_with("broadcast_recipients:abc", 203, 399)
+        assert notification_service.deliver.await_count == 2
+        pipes[0].hset.assert_called_once_with("broadcast_checkpoints:abc", "200", "204")
+        pipes[1].hset.assert_called_once_with("broadcast_checkpoints:abc", "200", "205")
+        pipes[1].hincrby.assert_called_once_with("broadcast:abc", "sent", 1)
+        pipes[2].zrem.assert_called_once_with("broadcast_leases:abc", "200")
+
+    async def test_stops_when_broadcast_is_canceled(self):
+        svc, redis_client, redis_repository, _, notification_service = _make_service()
+        redis_client.hget.return_value = None
+        redis_client.lrange.return_value = [b"1:en", b"2:en"]
+        _pipeline(redis_repository, [[1, 1, 0, b"CANCELED"]])
+
+        assert not await svc._process_chunk("abc", 0, 2, _PAYLOAD)
+
+        assert notification_service.deliver.await_count == 1
+
+
+class TestRunWorker:
+    async def test_claims_chunks_until_none_left_then_completes(self, monkeypatch):
+        svc, redis_client, redis_repository, _, _ = _make_service()
+        redis_client.hgetall.return_value = {
+            b"status": b"PROCESSING",
+            b"total": b"400",
+            b"payload": _PAYLOAD.model_dump_json().encode(),
+        }
+        process_chunk = AsyncMock(return_value=True)
+        report_progress = AsyncMock()
+        monkeypatch.setattr(svc, "_process_chunk", process_chunk)
+        monkeypatch.setattr(svc, "_report_progress", report_progress)
+        redis_repository.run_script.side_effect = [0, 200, -1, 1]
+
+        await svc.run_worker("abc")
+
+        assert [call.args[1] for call in process_chunk.await_args_list] == [0, 200]
+        assert process_chunk.await_args_list[0].args[3] == _PAYLOAD
+        finish_args = redis_repository.run_script.await_args_list[-1].args[2]
+        assert finish_args[2:4] == ["COMPLETED", 1]
+        report_progress.assert_awaited_with("abc", force=True)
+
+    async def test_missing_broadcast_is_ignored(self):
+        svc, redis_client, redis_repository, _, _ = _make_service()
+        redis_client.hgetall.return_value = {}
+
+        await svc.run_worker("abc")
+
+        redis_repository.run_script.assert_not_awaited()
@@ -0,0 +1,160 @@
+"""Tests for redis_cache stampede protection (lock-or-serve-stale and XFetch)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Optional
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.core.utils import json_utils
+from src.infrastructure.redis import cache as cache_module
+from src.infrastructure.redis.cache import CacheStampede, redis_cache
+
+
+class _FakeRedis:
+    """Just enough of redis.asyncio.Redis for the stampede paths."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, px: Optional[int] = None) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value.encode()
+        return True
+
+    async def setex(self, key: str, ttl: Any, value: str) -> None:
+        self.data[key] = value.encode()
+        self.ttls[key] = ttl
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        if self.data.get(key) == token.encode():
+            del self.data[key]
+            return 1
+        return 0
+
+
+class _Service:
+    def __init__(self, redis_client: _FakeRedis, delay: float = 0.0) -> None:
+        self.redis_client = redis_client
+        self.delay = delay
+        self.calls = 0
+
+    async def _compute(self) -> dict[str, int]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"calls": self.calls}
+
+    @redis_cache(prefix="stampede_lock", ttl=60, stampede=CacheStampede.LOCK, stale_ttl=30)
+    async def locked(self) -> dict[str, int]:
+        return await self._compute()
+
+    @redis_cache(prefix="stampede_xfetch", ttl=60, stampede=CacheStampede.XFETCH)
+    async def xfetch(self) -> dict[str, int]:
+        return await self._compute()
+
+
+def _entry(value: Any, expires_in: float, delta: float = 0.1) -> bytes:
+    entry = {"value": value, "expires_at": time.time() + expires_in, "delta": delta}
+    return json_utils.encode(entry).encode()
+
+
+def _metric(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture(autouse=True)
+def _fast_polling(monkeypatch):
+    monkeypatch.setattr(cache_module, "STAMPEDE_POLL_INTERVAL", 0.001)
+
+
+class TestLockMode:
+    async def test_concurrent_cold_misses_recompute_once(self):
+        redis = _FakeRedis()
+        svc = _Service(redis, delay=0.01)
+        waited_before = _metric(
+            "cache_recomputes_avoided_total", prefix="stampede_lock", outcome="waited"
+        )
+
+        results = await asyncio.gather(*(svc.locked() for _ in range(5)))
+
+        assert svc.calls == 1
+        assert all(result == {"calls": 1} for result in results)
+        assert "lock:cache:stampede_lock" not in redis.data
+        waited = _metric("cache_recomputes_avoided_total", prefix="stampede_lock", outcome="waited")
+        assert waited - waited_before == 4
+
+    async def test_expired_entry_is_served_stale_while_locked(self):
+        redis = _FakeRedis()
+        redis.data["cache:stampede_lock"] = _entry({"calls": 0}, expires_in=-1)
+        redis.data["lock:cache:stampede_lock"] = b"other-replica"
+        svc = _Service(redis)
+
+        assert await svc.locked() == {"calls": 0}
+        assert svc.calls == 0
+
+    async def test_expired_entry_is_recomputed_by_lock_holder(self):
+        redis = _FakeRedis()
+        redis.data["cache:stampede_lock"] = _entry({"calls": 0}, expires_in=-1)
+        svc = _Service(redis)
+
+        assert await svc.locked() == {"calls": 1}
+        assert "lock:cache:stampede_lock" not in redis.data
+        # The key outlives the logical ttl so the next expiry can be served stale
+        assert redis.ttls["cache:stampede_lock"] == 90
+
+    async def test_lock_timeout_falls_back_to_recompute(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "STAMPEDE_WAIT_TIMEOUT", 0.01)
+        redis = _FakeRedis()
+        redis.data["lock:cache:stampede_lock"] = b"stuck"
+        svc = _Service(redis)
+
+        assert await svc.locked() == {"calls": 1}
+
+    async def test_plain_value_from_before_protection_is_a_miss(self):
+        redis = _FakeRedis()
+        redis.data["cache:stampede_lock"] = json_utils.encode({"calls": 0}).encode()
+        svc = _Service(redis)
+
+        assert await svc.locked() == {"calls": 1}
+
+
+class TestXFetchMode:
+    async def test_fresh_entry_is_served(self, monkeypatch):
+        monkeypatch.setattr(cache_module.random, "random", lambda: 0.5)
+        redis = _FakeRedis()
+        redis.data["cache:stampede_xfetch"] = _entry({"calls": 0}, expires_in=50, delta=0.1)
+        svc = _Service(redis)
+
+        assert await svc.xfetch() == {"calls": 0}
+        assert svc.calls == 0
+
+    async def test_entry_near_expiry_is_refreshed_early(self, monkeypatch):
+        # 1 - U close to 0 draws a large -log(1 - U), pulling the refresh point forward
+        monkeypatch.setattr(cache_module.random, "random", lambda: 0.999)
+        redis = _FakeRedis()
+        redis.data["cache:stampede_xfetch"] = _entry({"calls": 0}, expires_in=1, delta=0.5)
+        svc = _Service(redis)
+        before = _metric("cache_recomputes_total", prefix="stampede_xfetch", reason="early_refresh")
+
+        assert await svc.xfetch() == {"calls": 1}
+        after = _metric("cache_recomputes_total", prefix="stampede_xfetch", reason="early_refresh")
+        assert after - before == 1
+        assert redis.ttls["cache:stampede_xfetch"] == 60
+
+
+@pytest.mark.parametrize("legacy", [b"42", b"null", b'"text"', b"[1, 2]"])
+@pytest.mark.parametrize("method", ["locked", "xfetch"])
+async def test_legacy_non_dict_value_is_a_miss(method: str, legacy: bytes):
+    redis = _FakeRedis()
+    redis.data[f"cache:stampede_{'lock' if method == 'locked' else 'xfetch'}"] = legacy
+    svc = _Service(redis)
+
+    assert await getattr(svc, method)() == {"calls": 1}
@@ -72,7 +72,7 @@ class TestOnCancelSurveyAnswer:
         redis_client = AsyncMock()
         redis_client.exists.return_value = 0
         billing = AsyncMock()
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
         i18n.get.side_effect = lambda key, **kwargs: f"[{key}]"
 
@@ -89,7 +89,7 @@ class TestOnCancelSurveyAnswer:
         redis_client = AsyncMock()
         redis_client.exists.return_value = 0
         billing = AsyncMock()
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
         i18n.get.side_effect = lambda key, **kwargs: f"[{key}]"
 
@@ -107,7 +107,7 @@ class TestOnCancelSurveyAnswer:
         redis_client = AsyncMock()
         redis_client.exists.return_value = 0
         billing = AsyncMock()
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
         i18n.get.side_effect = lambda key, **kwargs: f"[{key}]"
 
@@ -133,7 +133,7 @@ class TestOnCancelSurveyAnswer:
         redis_client.exists.return_value = 0
         billing = AsyncMock()
         billing.get_transaction.return_value = MagicMock(GatewayType="YOOKASSA")
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
         i18n.get.side_effect = lambda key, **kwargs: f"[{key}]"
 
@@ -153,7 +153,7 @@ class TestOnCancelSurveyAnswer:
         redis_client = AsyncMock()
         redis_client.exists.return_value = 1
         billing = AsyncMock()
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
         i18n.get.side_effect = lambda key, **kwargs: f"[{key}]"
 
@@ -174,7 +174,7 @@ class TestOnCancelSurveyAnswer:
         redis_client = AsyncMock()
         redis_client.exists.return_value = 0
         billing = AsyncMock()
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
         i18n.get.side_effect = lambda key, **kwargs: f"[{key}]"
 
@@ -199,7 +199,7 @@ class TestOnCancelSurveyAnswer:
         redis_client.exists.return_value = 0
         billing = AsyncMock()
         billing.get_transaction.return_value = MagicMock(GatewayType="YOOKASSA")
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
         i18n.get.side_effect = lambda key, **kwargs: f"[{key}]"
 
@@ -250,7 +250,7 @@ class TestOnCancelSurveyOtherText:
         billing = AsyncMock()
         billing.get_transaction.return_value = MagicMock(GatewayType="CRYPTOMUS")
         notification_service = AsyncMock()
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
         i18n.get.side_effect = lambda key, **kwargs: f"[{key}]"
 
@@ -292,7 +292,7 @@ class TestOnCancelSurveyOtherText:
         redis_client.exists.return_value = 0
         billing = AsyncMock()
         notification_service = AsyncMock()
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
 
         raw = unwrap_inject(on_cancel_survey_other_text)
@@ -319,7 +319,7 @@ class TestOnCancelSurveyOtherText:
         redis_client.exists.return_value = 0
         billing = AsyncMock()
         notification_service = AsyncMock()
-        experiment_service = MagicMock()
+        experiment_service = AsyncMock()
         i18n = MagicMock()
 
         raw = unwrap_inject(on_cancel_survey_other_text)
@@ -170,7 +170,7 @@ class TestProcessDueMemberPending:
         user_service.get.return_value = user
         notification_service = AsyncMock()
 
-        await _process_due_member(
+        requeue_at = await _process_due_member(
             member, created_at + 60, billing, user_service, notification_service, redis_client
         )
 
@@ -183,9 +183,8 @@ class TestProcessDueMemberPending:
         notification_service.notify_user.assert_awaited_once()
         payload = notification_service.notify_user.await_args.kwargs["payload"]
         assert payload.i18n_key == "ntf-event-cancel-survey-pending"
-        redis_client.zadd.assert_awaited_once_with(
-            _PENDING_KEY.pack(), {member: created_at}, nx=True
-        )
+        assert requeue_at == created_at
+        redis_client.zadd.assert_not_awaited()
 
     async def test_young_pending_does_not_repeat_ping(self):
         payment_id = str(uuid4())
@@ -200,7 +199,7 @@ class TestProcessDueMemberPending:
         user_service.get.return_value = user
         notification_service = AsyncMock()
 
-        await _process_due_member(
+        requeue_at = await _process_due_member(
             member, created_at + 60, billing, user_service, notification_service, redis_client
         )
 
@@ -211,9 +210,8 @@ class TestProcessDueMemberPending:
             ex=_PENDING_PING_TTL,
         )
         notification_service.notify_user.assert_not_awaited()
-        redis_client.zadd.assert_awaited_once_with(
-            _PENDING_KEY.pack(), {member: created_at}, nx=True
-        )
+        assert requeue_at == created_at
+        redis_client.zadd.assert_not_awaited()
 
     async def test_stale_pending_past_max_age_is_dropped(self):
         payment_id = str(uuid4())
@@ -225,10 +223,11 @@ class TestProcessDueMemberPending:
         user_service = AsyncMock()
         notification_service = AsyncMock()
 
-        await _process_due_member(
+        requeue_at = await _process_due_member(
             member, time.time(), billing, user_service, notification_service, redis_client
         )
 
+        assert requeue_at is None
         redis_client.zadd.assert_not_awaited()
         notification_service.notify_user.assert_not_awaited()
 
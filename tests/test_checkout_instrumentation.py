@@ -33,7 +33,7 @@ class _ExperimentService:
         self.events: list[tuple[str, int]] = []
         self.exposures: list[tuple[str, int]] = []
 
-    def evaluate_feature_for_user(self, user, experiment_key: str | ExperimentFeature):
+    async def evaluate_feature_for_user(self, user, experiment_key: str | ExperimentFeature):
         key = (
             experiment_key.value
             if isinstance(experiment_key, ExperimentFeature)
@@ -63,7 +63,7 @@ class _ExperimentService:
         self.exposures.append((evaluation.feature_key, telegram_id))
         return evaluation.variant
 
-    def record_conversion(
+    async def record_conversion(
         self,
         experiment_key: str,
         telegram_id: int,
@@ -131,6 +131,24 @@ class _Billing:
             final_amount=Decimal(final_amount),
         )
 
+    async def calculate_prices(
+        self,
+        telegram_id: int,
+        queries,
+        channel_discount: dict[str, Any] | None = None,
+    ) -> list[SimpleNamespace]:
+        return [
+            await self.calculate_price(
+                telegram_id=telegram_id,
+                plan_id=query.plan_id,
+                duration_days=query.duration_days,
+                currency=query.currency,
+                experiment=query.experiment,
+                channel_discount=channel_discount,
+            )
+            for query in queries
+        ]
+
     async def create_payment(
         self,
         telegram_id: int,
@@ -24,9 +24,11 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 import httpx
+import msgspec
 import pytest
 from pydantic import BaseModel
 
+from src.infrastructure.billing import converters
 from src.infrastructure.billing.client import BillingClient
 from src.infrastructure.billing.models import (
     BillingCustomer,
@@ -44,6 +46,21 @@ from src.infrastructure.billing.models import (
     BillingTransaction,
     BillingUser,
 )
+from src.infrastructure.billing.structs import (
+    STRUCT_DECODING_ENDPOINTS,
+    BillingPlanSnapshotStruct,
+    BillingPlanStruct,
+    BillingPromocodeStruct,
+    BillingSubscriptionStruct,
+    BillingTransactionStruct,
+)
+from src.infrastructure.kafka.consumer import UserNotificationConsumer
+from src.infrastructure.kafka.events import (
+    NotifyUserRedirectEvent,
+    NotifyUserSystemEvent,
+    RejectedEvent,
+    build_value_deserializer,
+)
 
 FIXTURES_DIR = Path(__file__).resolve().parent.parent / "contracts" / "shop-billing" / "v1" / "http"
 
@@ -74,6 +91,19 @@ def _make_client_with_mock(json_data: Any, status_code: int = 200) -> BillingCli
     return client
 
 
+def _make_struct_client_with_mock(json_data: Any) -> BillingClient:
+    """Like _make_client_with_mock, but with every list endpoint decoding
+    the raw response bytes into msgspec Structs."""
+    client = BillingClient(BASE_URL, SECRET, struct_endpoints=STRUCT_DECODING_ENDPOINTS)
+    resp = _make_response(200, json_data)
+    resp.content = json.dumps(json_data).encode()
+    mock_http = AsyncMock(spec=httpx.AsyncClient)
+    mock_http.is_closed = False
+    mock_http.request.return_value = resp
+    client._client = mock_http
+    return client
+
+
 def assert_model_matches_fixture(instance: Any, raw: Any, path: str = "$") -> None:
     """Recursively assert every field `instance` (a parsed Pydantic model,
     or a nested value inside one) declares equals the value the pinned
@@ -91,6 +121,16 @@ def assert_model_matches_fixture(instance: Any, raw: Any, path: str = "$") -> No
             assert_model_matches_fixture(getattr(instance, field_name), raw[key], f"{path}.{key}")
         return
 
+    if isinstance(instance, msgspec.Struct):
+        assert isinstance(raw, dict), f"{path}: fixture is not an object ({raw!r})"
+        for key in instance.__struct_fields__:
+            assert key in raw, (
+                f"{path}.{key}: {type(instance).__name__} declares field '{key}' "
+                f"but the pinned contract fixture has no '{key}' key at this path"
+            )
+            assert_model_matches_fixture(getattr(instance, key), raw[key], f"{path}.{key}")
+        return
+
     if isinstance(instance, list):
         assert isinstance(raw, list), f"{path}: fixture is not an array ({raw!r})"
         assert len(instance) == len(raw), (
@@ -314,6 +354,94 @@ class TestUsersListContract:
         assert_model_matches_fixture(users[0], fixture)
 
 
+_STRUCT_LIST_CASES = [
+    ("plan.json", "list_plans", (), BillingPlan, converters.billing_plan_to_dto),
+    ("plan.json", "get_available_plans", (1,), BillingPlan, converters.billing_plan_to_dto),
+    ("plan.json", "get_allowed_plans", (), BillingPlan, converters.billing_plan_to_dto),
+    (
+        "subscription.json",
+        "list_subscriptions_by_user",
+        (1,),
+        BillingSubscription,
+        converters.billing_subscription_to_dto,
+    ),
+    (
+        "subscription.json",
+        "list_all_subscriptions",
+        (),
+        BillingSubscription,
+        converters.billing_subscription_to_dto,
+    ),
+    (
+        "transaction.json",
+        "list_transactions",
+        (1,),
+        BillingTransaction,
+        converters.billing_transaction_to_dto,
+    ),
+    (
+        "transaction.json",
+        "list_all_transactions",
+        (),
+        BillingTransaction,
+        converters.billing_transaction_to_dto,
+    ),
+    (
+        "transaction.json",
+        "list_transactions_by_status",
+        ("COMPLETED",),
+        BillingTransaction,
+        converters.billing_transaction_to_dto,
+    ),
+    ("promocode.json", "list_promocodes", (), BillingPromocode, converters.billing_promocode_to_dto),
+]
+
+
+class TestStructDecodingContract:
+    """The msgspec Struct path (structs.py) must read the pinned fixtures
+    exactly like the Pydantic models do: same fields, same defaults, and
+    identical DTOs once converted."""
+
+    def test_every_struct_endpoint_is_covered(self):
+        assert {case[1] for case in _STRUCT_LIST_CASES} == STRUCT_DECODING_ENDPOINTS
+
+    @pytest.mark.parametrize(
+        ("fixture_name", "method", "args", "model", "convert"),
+        _STRUCT_LIST_CASES,
+        ids=[case[1] for case in _STRUCT_LIST_CASES],
+    )
+    async def test_struct_list_matches_fixture_and_pydantic(
+        self, fixture_name, method, args, model, convert
+    ):
+        fixture = load_fixture(fixture_name)
+        client = _make_struct_client_with_mock([fixture, fixture])
+
+        items = await getattr(client, method)(*args)
+
+        assert len(items) == 2
+        assert isinstance(items[0], msgspec.Struct)
+        assert_model_matches_fixture(items[0], fixture)
+        assert convert(items[0]) == convert(model.model_validate(fixture))
+
+    @pytest.mark.parametrize(
+        ("struct", "model"),
+        [
+            (BillingPlanStruct, BillingPlan),
+            (BillingPlanSnapshotStruct, BillingPlanSnapshot),
+            (BillingSubscriptionStruct, BillingSubscription),
+            (BillingTransactionStruct, BillingTransaction),
+            (BillingPromocodeStruct, BillingPromocode),
+        ],
+    )
+    def test_struct_defaults_match_pydantic(self, struct, model):
+        """An empty object must decode to the same defaults on both paths,
+        so a field billing omits degrades identically."""
+        decoded = msgspec.json.decode(b"{}", type=struct)
+
+        assert set(struct.__struct_fields__) == set(model.model_fields)
+        assert msgspec.to_builtins(decoded) == model().model_dump(mode="json")
+
+
 @pytest.mark.parametrize(
     "fixture_name",
     [
@@ -321,18 +449,20 @@ class TestUsersListContract:
         "notify_user_redirect.json",
     ],
 )
-def test_kafka_notify_user_fixtures_have_documented_shape(fixture_name):
+def test_kafka_notify_user_fixtures_decode_to_typed_events(fixture_name):
     """The notify.user Kafka event (src/infrastructure/kafka/consumer.py,
-    UserNotificationConsumer) is consumed as a raw dict via payload.get(...),
-    not a Pydantic model, so there is no DTO to pin here. This just asserts
-    the two variants documented in that consumer's docstring / this module's
-    docstring still round-trip as valid JSON with the keys the consumer
-    reads, so the fixtures can't silently rot relative to the code comment.
+    UserNotificationConsumer) is decoded straight from the message bytes into
+    the structs in src/infrastructure/kafka/events.py. Each fixture must
+    decode with the consumer's own deserializer, and re-encoding the event
+    must give back the fixture exactly, so no field the consumer reads is
+    silently filled from a default.
     """
-    fixture = json.loads((FIXTURES_DIR.parent / "kafka" / fixture_name).read_text())
-    assert fixture["telegram_id"]
-    assert fixture["type"] in ("system", "redirect")
-    if fixture["type"] == "system":
-        assert {"ntf_type", "i18n_key", "i18n_kwargs"} <= fixture.keys()
-    else:
-        assert {"redirect_to", "purchase_type"} <= fixture.keys()
+    raw = (FIXTURES_DIR.parent / "kafka" / fixture_name).read_bytes()
+    deserialize = build_value_deserializer(UserNotificationConsumer.payload_type, "contract")
+
+    event = deserialize(raw)
+
+    assert not isinstance(event, RejectedEvent), event
+    expected_type = {"system": NotifyUserSystemEvent, "redirect": NotifyUserRedirectEvent}
+    assert type(event) is expected_type[json.loads(raw)["type"]]
+    assert msgspec.to_builtins(event) == json.loads(raw)
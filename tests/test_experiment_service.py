@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
 from unittest.mock import AsyncMock, MagicMock
@@ -185,7 +186,7 @@ def _service_estimand(
         off_variant=off_variant,
         feature_key=feature_key,
     )
-    estimand_client.fetch_config.return_value = payload
+    estimand_client.fetch_config = AsyncMock(return_value=payload)
     estimand_client.evaluate_feature.side_effect = lambda **kwargs: evaluate_feature_from_payload(
         config=payload,
         feature_key=kwargs["feature_key"],
@@ -269,18 +270,18 @@ class TestTrialExperiment:
         assert estimand_client.fetch_config.call_count == 1
         assert estimand_client.track_exposure.call_count == 0
 
-    def test_estimand_config_cache_reuses_payload_within_ttl(self, monkeypatch):
+    async def test_estimand_config_cache_reuses_payload_within_ttl(self, monkeypatch):
         times = iter([100.0, 120.0])
         monkeypatch.setattr(experiment_module, "monotonic", lambda: next(times))
         svc, estimand_client, _ = _service_estimand()
         user = UserDto(telegram_id=555, name="Cache")
 
-        svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
-        svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
+        await svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
+        await svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
 
         assert estimand_client.fetch_config.call_count == 1
 
-    def test_estimand_temporary_outage_recovers_without_restart(self, monkeypatch):
+    async def test_estimand_temporary_outage_recovers_without_restart(self, monkeypatch):
         times = iter([100.0, 131.0, 131.0, 162.0, 162.0])
         monkeypatch.setattr(experiment_module, "monotonic", lambda: next(times))
         svc, estimand_client, payload = _service_estimand()
@@ -291,9 +292,9 @@ class TestTrialExperiment:
             payload,
         ]
 
-        first = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
-        during_outage = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
-        after_recovery = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
+        first = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
+        during_outage = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
+        after_recovery = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
 
         assert first.variant in {TRIAL_VARIANT_ON, TRIAL_VARIANT_OFF}
         assert during_outage.variant == first.variant
@@ -319,10 +320,10 @@ class TestTrialExperiment:
             fallback="local_fallback",
         ) or 0.0
 
-        first = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
-        second = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
-        third = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
-        fourth = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
+        first = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
+        second = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
+        third = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
+        fourth = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
 
         assert first.variant == second.variant == third.variant == fourth.variant
         assert first.variant in {TRIAL_VARIANT_ON, TRIAL_VARIANT_OFF}
@@ -357,14 +358,14 @@ class TestTrialExperiment:
         }
         assert estimand_client.evaluate_feature.call_count == 1
 
-    def test_estimand_config_cache_refreshes_after_ttl(self, monkeypatch):
+    async def test_estimand_config_cache_refreshes_after_ttl(self, monkeypatch):
         times = iter([100.0, 131.0])
         monkeypatch.setattr(experiment_module, "monotonic", lambda: next(times))
         svc, estimand_client, _ = _service_estimand()
         user = UserDto(telegram_id=555, name="Cache")
 
-        svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
-        svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
+        await svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
+        await svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
 
         assert estimand_client.fetch_config.call_count == 2
 
@@ -392,7 +393,7 @@ class TestTrialExperiment:
         )
         user = UserDto(telegram_id=555, name="NonServing")
 
-        evaluation = svc.evaluate_feature_for_user(user, ExperimentFeature.CHECKOUT_FLOW)
+        evaluation = await svc.evaluate_feature_for_user(user, ExperimentFeature.CHECKOUT_FLOW)
 
         assert evaluation.feature_key == feature_key
         assert evaluation.variant == "checkout_flow_v1_off"
@@ -403,7 +404,7 @@ class TestTrialExperiment:
         assert variant == "checkout_flow_v1_off"
         svc.redis_client.set.assert_not_awaited()
 
-        svc.record_conversion(
+        await svc.record_conversion(
             feature_key,
             user.telegram_id,
             "payment_link_created",
@@ -437,14 +438,14 @@ class TestTrialExperiment:
         )
         user = UserDto(telegram_id=556, name="Unpublished")
 
-        evaluation = svc.evaluate_feature_for_user(user, ExperimentFeature.START_TIER_PRICE)
+        evaluation = await svc.evaluate_feature_for_user(user, ExperimentFeature.START_TIER_PRICE)
 
         assert evaluation.feature_key == feature_key
         assert evaluation.variant == "start_tier_price_v1_off"
         assert evaluation.payload is None
 
         await svc.expose(feature_key, user.telegram_id, user.created_at)
-        svc.record_conversion(feature_key, user.telegram_id, "payment_completed", user.created_at)
+        await svc.record_conversion(feature_key, user.telegram_id, "payment_completed", user.created_at)
 
         svc.redis_client.set.assert_not_awaited()
         estimand_client.track_exposure.assert_not_called()
@@ -464,7 +465,7 @@ class TestTrialExperiment:
         )
         user = UserDto(telegram_id=555, name="NonTrial")
 
-        evaluation = svc.evaluate_feature_for_user(user, ExperimentFeature.CHECKOUT_FLOW)
+        evaluation = await svc.evaluate_feature_for_user(user, ExperimentFeature.CHECKOUT_FLOW)
 
         assert evaluation.feature_key == feature_key
         assert evaluation.variant in {on_variant, off_variant}
@@ -494,7 +495,7 @@ class TestTrialExperiment:
         )
         user = UserDto(telegram_id=321, name="MultiArm")
 
-        evaluation = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_LENGTH)
+        evaluation = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_LENGTH)
 
         assert evaluation.variant == "trial_14"
         trial_length_variation = (
@@ -556,21 +557,21 @@ class TestTrialExperiment:
     async def test_disabled_experiment_uses_local_control_without_estimate(self):
         svc = _service(trial_enabled=False, trial_on_weight=0)
         assert await svc.expose(TRIAL_EXPERIMENT_KEY, 7) == TRIAL_VARIANT_ON
-        assert svc.variant(TRIAL_EXPERIMENT_KEY, 7) == TRIAL_VARIANT_ON
+        assert await svc.variant(TRIAL_EXPERIMENT_KEY, 7) == TRIAL_VARIANT_ON
 
     async def test_disabled_experiment_service_does_not_send_remote_conversion(self):
         svc = _service(trial_enabled=False, trial_on_weight=100)
         svc.estimand_client = MagicMock()
 
-        svc.record_conversion(TRIAL_EXPERIMENT_KEY, 42, "rescue_clicked")
+        await svc.record_conversion(TRIAL_EXPERIMENT_KEY, 42, "rescue_clicked")
 
         svc.estimand_client.track_conversion.assert_not_called()
 
     async def test_variant_names(self):
         svc = _service(trial_on_weight=100)
-        assert svc.variant(TRIAL_EXPERIMENT_KEY, 1) == TRIAL_VARIANT_ON
+        assert await svc.variant(TRIAL_EXPERIMENT_KEY, 1) == TRIAL_VARIANT_ON
         svc_off = _service(trial_on_weight=0)
-        assert svc_off.variant(TRIAL_EXPERIMENT_KEY, 1) == TRIAL_VARIANT_OFF
+        assert await svc_off.variant(TRIAL_EXPERIMENT_KEY, 1) == TRIAL_VARIANT_OFF
 
     async def test_exposure_deduped_by_redis_nx(self):
         svc = _service(trial_on_weight=100)
@@ -588,8 +589,7 @@ class TestTrialExperiment:
         updated_payload = _build_estimand_payload(revision="rev-2")
         estimand_client.fetch_config.return_value = updated_payload
         estimand_client.evaluate_feature.side_effect = _payload_evaluator(updated_payload)
-        svc._fetched_config = None
-        svc._fetched_config_at = 0.0
+        svc.estimand_runtime._config_at = 0.0
 
         await svc.expose(TRIAL_EXPERIMENT_KEY, 42)
 
@@ -629,8 +629,7 @@ class TestTrialExperiment:
         )
         estimand_client.fetch_config.return_value = second_payload
         estimand_client.evaluate_feature.side_effect = _payload_evaluator(second_payload)
-        svc._fetched_config = None
-        svc._fetched_config_at = 0.0
+        svc.estimand_runtime._config_at = 0.0
 
         await svc.expose(ExperimentFeature.CHECKOUT_FLOW.value, 42)
 
@@ -647,8 +646,8 @@ class TestTrialExperiment:
 
     async def test_estimand_variant_is_sticky_for_same_telegram_id(self):
         svc, _, _ = _service_estimand()
-        first = svc.variant(TRIAL_EXPERIMENT_KEY, 12345)
-        second = svc.variant(TRIAL_EXPERIMENT_KEY, 12345)
+        first = await svc.variant(TRIAL_EXPERIMENT_KEY, 12345)
+        second = await svc.variant(TRIAL_EXPERIMENT_KEY, 12345)
         assert first == second
         assert first in {TRIAL_VARIANT_ON, TRIAL_VARIANT_OFF}
         assert svc.estimand_client.evaluate_feature.call_count >= 2
@@ -658,13 +657,13 @@ class TestTrialExperiment:
         variant = await svc.expose(TRIAL_EXPERIMENT_KEY, 42)
         assert variant in {TRIAL_VARIANT_ON, TRIAL_VARIANT_OFF}
         assert estimand_client.track_exposure.call_count == 1
-        svc.record_conversion(TRIAL_EXPERIMENT_KEY, 42, "trial_activated")
+        await svc.record_conversion(TRIAL_EXPERIMENT_KEY, 42, "trial_activated")
         assert estimand_client.track_conversion.call_count == 1
         assert not isinstance(variant, type(None))
 
     async def test_estimand_uses_default_conversion_event_when_empty(self):
         svc, estimand_client, _ = _service_estimand()
-        svc.record_conversion(TRIAL_EXPERIMENT_KEY, 7, "")
+        await svc.record_conversion(TRIAL_EXPERIMENT_KEY, 7, "")
         assert estimand_client.track_conversion.call_count == 1
         assert estimand_client.track_conversion.call_args.kwargs["event_name"] == "trial_activated"
 
@@ -685,7 +684,7 @@ class TestTrialExperiment:
             payload=initial_payload,
         )
         user = UserDto(telegram_id=777, name="Checkout", created_at=datetime.now(timezone.utc))
-        original = svc.evaluate_feature_for_user(user, ExperimentFeature.INTRO_PRICE)
+        original = await svc.evaluate_feature_for_user(user, ExperimentFeature.INTRO_PRICE)
         original_eval_count = estimand_client.evaluate_feature.call_count
 
         updated_payload = _build_estimand_payload(
@@ -699,8 +698,7 @@ class TestTrialExperiment:
         )
         estimand_client.fetch_config.return_value = updated_payload
         estimand_client.evaluate_feature.side_effect = _payload_evaluator(updated_payload)
-        svc._fetched_config = None
-        svc._fetched_config_at = 0.0
+        svc.estimand_runtime._config_at = 0.0
 
         svc.record_attributed_conversion(
             original.feature_key,
@@ -751,7 +749,7 @@ class TestTrialExperiment:
         )
         user = UserDto(telegram_id=777, name="Compat")
 
-        evaluation = svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
+        evaluation = await svc.evaluate_feature_for_user(user, ExperimentFeature.TRIAL_OFFER)
 
         assert evaluation.feature_key == TRIAL_EXPERIMENT_KEY
         assert evaluation.variant in {on_variant, off_variant}
@@ -764,8 +762,75 @@ class TestTrialExperiment:
         user = UserDto(telegram_id=902, name="Multi", created_at=datetime.now(timezone.utc))
         svc = _service(checkout_flow_start_date=datetime.now(timezone.utc))
 
-        evaluation = svc.evaluate_feature_for_user(user, ExperimentFeature.CHECKOUT_FLOW)
+        evaluation = await svc.evaluate_feature_for_user(user, ExperimentFeature.CHECKOUT_FLOW)
 
         assert evaluation.feature_key == "checkout_flow"
         assert evaluation.variant == "checkout_flow_v1_off"
         assert evaluation.payload is None
+
+
+class TestEstimandRuntime:
+    async def test_runtime_config_is_shared_across_request_services(self):
+        svc, estimand_client, _ = _service_estimand()
+        other = ExperimentService(
+            svc.config,
+            AsyncMock(),
+            estimand_runtime=svc.estimand_runtime,
+        )
+        user = UserDto(telegram_id=555, name="Shared")
+
+        first = await svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
+        second = await other.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
+
+        assert first.variant == second.variant
+        assert other.estimand_client is estimand_client
+        assert estimand_client.fetch_config.call_count == 1
+
+    async def test_circuit_state_survives_new_request_services(self):
+        svc, estimand_client, _ = _service_estimand()
+        estimand_client.fetch_config.side_effect = Exception("estimand down")
+        user = UserDto(telegram_id=555, name="Down")
+
+        await svc.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
+        other = ExperimentService(
+            svc.config,
+            AsyncMock(),
+            estimand_runtime=svc.estimand_runtime,
+        )
+        await other.evaluate_feature_for_user(user, TRIAL_EXPERIMENT_KEY)
+
+        assert estimand_client.fetch_config.call_count == 1
+
+    async def test_background_refresh_publishes_new_revision(self, monkeypatch):
+        monkeypatch.setattr(experiment_module, "_ESTIMAND_CONFIG_CACHE_TTL_SECONDS", 0.01)
+        svc, estimand_client, _ = _service_estimand()
+        runtime = svc.estimand_runtime
+        updated_payload = _build_estimand_payload(revision="rev-2")
+        estimand_client.aclose = AsyncMock()
+
+        runtime.start()
+        await asyncio.sleep(0)
+        assert runtime.revision == "rev-1"
+
+        estimand_client.fetch_config.return_value = updated_payload
+        await asyncio.sleep(0.05)
+        fetches = estimand_client.fetch_config.call_count
+        await svc.variant(TRIAL_EXPERIMENT_KEY, 42)
+        await runtime.aclose()
+
+        assert runtime.revision == "rev-2"
+        assert estimand_client.fetch_config.call_count == fetches
+        estimand_client.aclose.assert_awaited_once()
+
+    async def test_stale_config_is_served_while_refresher_runs(self):
+        svc, estimand_client, _ = _service_estimand()
+        runtime = svc.estimand_runtime
+        estimand_client.aclose = AsyncMock()
+        runtime.start()
+        await asyncio.sleep(0)
+        runtime._config_at -= 60.0
+
+        assert await runtime.get_config() is not None
+        await runtime.aclose()
+
+        assert estimand_client.fetch_config.call_count == 1
@@ -13,9 +13,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
+from aiokafka import TopicPartition
 from prometheus_client import REGISTRY
 
 from src.infrastructure.kafka.base_consumer import SupervisedKafkaConsumer
+from src.infrastructure.kafka.events import RejectedEvent
+
+_PARTITION = TopicPartition("test.topic", 0)
 
 
 def _metric_value(name: str, consumer: str) -> float | None:
@@ -26,8 +30,14 @@ class _FakeConsumer(SupervisedKafkaConsumer):
     def __init__(self, consumer_name: str, handle_message=None) -> None:
         config = MagicMock()
         config.kafka_brokers = "localhost:9092"
+        config.kafka_batch_size = 100
+        config.kafka_max_concurrency = 4
+        config.kafka_fetch_timeout_ms = 10
+        config.kafka_max_attempts = 2
+        config.kafka_retry_backoff = 0
         super().__init__(config=config, container=MagicMock())
         self.consumer_name = consumer_name
+        self._dead_letters = AsyncMock()
         self._handle = handle_message or AsyncMock()
         # Fast backoff for tests.
         self._initial_backoff = 0.001
@@ -46,30 +56,46 @@ class _FakeConsumer(SupervisedKafkaConsumer):
         await self._handle(payload)
 
 
-def _make_aiokafka_consumer_mock(messages: list, *, end_with_exception: Exception | None = None):
-    """Build a mock AIOKafkaConsumer whose async iteration yields `messages`
-    (each wrapped with a `.value` attribute) and then either stops or raises."""
+def _make_aiokafka_consumer_mock(
+    consumer: SupervisedKafkaConsumer,
+    messages: list,
+    *,
+    highwater: int | None = None,
+):
+    """Build a mock AIOKafkaConsumer whose `getmany` returns `messages` as one
+    batch on partition 0 (offsets 0..n-1) and then stops the consume loop.
+    A message may be a `(value, headers)` pair."""
     mock_consumer = MagicMock()
     mock_consumer.start = AsyncMock()
     mock_consumer.stop = AsyncMock()
     mock_consumer.commit = AsyncMock()
-
-    async def _aiter():
-        for value in messages:
-            msg = MagicMock()
-            msg.value = value
-            yield msg
-        if end_with_exception:
-            raise end_with_exception
-
-    mock_consumer.__aiter__ = lambda self: _aiter()
+    mock_consumer.highwater = MagicMock(return_value=highwater)
+
+    records = []
+    for offset, message in enumerate(messages):
+        value, headers = message if isinstance(message, tuple) else (message, ())
+        record = MagicMock()
+        record.offset = offset
+        record.key = None
+        record.value = value
+        record.headers = headers
+        records.append(record)
+    batches = [{_PARTITION: records}] if records else []
+
+    async def getmany(**kwargs):
+        if batches:
+            return batches.pop(0)
+        consumer._stopping = True
+        return {}
+
+    mock_consumer.getmany = AsyncMock(side_effect=getmany)
     return mock_consumer
 
 
 class TestRunOnceCommitSemantics:
     async def test_commits_after_successful_handle(self):
         consumer = _FakeConsumer("test-commit-success")
-        mock_kafka = _make_aiokafka_consumer_mock([{"foo": "bar"}])
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, [{"foo": "bar"}])
 
         with patch(
             "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
@@ -78,12 +104,13 @@ class TestRunOnceCommitSemantics:
             await consumer._run_once()
 
         consumer._handle.assert_awaited_once_with({"foo": "bar"})
-        mock_kafka.commit.assert_awaited_once()
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 1})
 
-    async def test_does_not_commit_when_handler_raises(self):
+    async def test_does_not_commit_when_dead_letter_sink_is_down(self):
         handler = AsyncMock(side_effect=ValueError("boom"))
         consumer = _FakeConsumer("test-commit-failure", handle_message=handler)
-        mock_kafka = _make_aiokafka_consumer_mock([{"foo": "bar"}])
+        consumer._dead_letters.publish.side_effect = ConnectionError("redis down")
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, [{"foo": "bar"}])
 
         with patch(
             "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
@@ -97,9 +124,10 @@ class TestRunOnceCommitSemantics:
     async def test_commits_each_message_independently(self):
         """Second message must not be committed if it fails, even though
         the first one succeeded (redelivery must be scoped to the failure)."""
-        handler = AsyncMock(side_effect=[None, ValueError("boom")])
+        handler = AsyncMock(side_effect=[None, ValueError("boom"), ValueError("boom")])
         consumer = _FakeConsumer("test-commit-partial", handle_message=handler)
-        mock_kafka = _make_aiokafka_consumer_mock([{"n": 1}, {"n": 2}])
+        consumer._dead_letters.publish.side_effect = ConnectionError("redis down")
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, [{"n": 1}, {"n": 2}])
 
         with patch(
             "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
@@ -108,7 +136,174 @@ class TestRunOnceCommitSemantics:
             with pytest.raises(ValueError):
                 await consumer._run_once()
 
-        assert mock_kafka.commit.await_count == 1
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 1})
+
+
+class TestBatchProcessing:
+    async def test_commits_only_up_to_first_failure(self):
+        """Later messages that succeeded are redelivered with the failed one."""
+
+        async def handle(payload):
+            if payload["telegram_id"] == 2:
+                raise ValueError("boom")
+
+        consumer = _FakeConsumer("test-batch-prefix", handle_message=handle)
+        consumer._dead_letters.publish.side_effect = ConnectionError("redis down")
+        messages = [{"telegram_id": n} for n in (1, 1, 2, 3, 4)]
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, messages)
+
+        with patch(
+            "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
+            return_value=mock_kafka,
+        ):
+            with pytest.raises(ValueError):
+                await consumer._run_once()
+
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 2})
+
+    async def test_keeps_per_user_order_and_runs_users_concurrently(self):
+        events: list[tuple[str, int, int]] = []
+
+        async def handle(payload):
+            events.append(("start", payload["telegram_id"], payload["n"]))
+            await asyncio.sleep(0)
+            events.append(("end", payload["telegram_id"], payload["n"]))
+
+        consumer = _FakeConsumer("test-batch-order", handle_message=handle)
+        messages = [
+            {"telegram_id": 1, "n": 0},
+            {"telegram_id": 2, "n": 1},
+            {"telegram_id": 1, "n": 2},
+        ]
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, messages)
+
+        with patch(
+            "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
+            return_value=mock_kafka,
+        ):
+            await consumer._run_once()
+
+        user_1 = [event for event in events if event[1] == 1]
+        assert user_1 == [("start", 1, 0), ("end", 1, 0), ("start", 1, 2), ("end", 1, 2)]
+        # user 2 started before user 1's first message finished
+        assert events.index(("start", 2, 1)) < events.index(("end", 1, 0))
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 3})
+
+    async def test_rejected_values_are_committed_without_reaching_the_handler(self):
+        consumer = _FakeConsumer("test-batch-rejected")
+        rejected = RejectedEvent(reason="malformed_json", error="bad")
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, [rejected, {"telegram_id": 1}])
+
+        with patch(
+            "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
+            return_value=mock_kafka,
+        ):
+            await consumer._run_once()
+
+        consumer._handle.assert_awaited_once_with({"telegram_id": 1})
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 2})
+        entry = consumer._dead_letters.publish.await_args.args[0]
+        assert (entry.offset, entry.reason, entry.attempts) == (0, "malformed_json", 0)
+
+    async def test_reports_lag_and_throughput(self):
+        consumer_name = f"test-batch-metrics-{uuid4()}"
+        consumer = _FakeConsumer(consumer_name)
+        mock_kafka = _make_aiokafka_consumer_mock(
+            consumer, [{"telegram_id": 1}, {"telegram_id": 2}], highwater=10
+        )
+
+        with patch(
+            "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
+            return_value=mock_kafka,
+        ):
+            await consumer._run_once()
+
+        lag = REGISTRY.get_sample_value(
+            "kafka_consumer_lag", {"consumer": consumer_name, "partition": "0"}
+        )
+        processed = REGISTRY.get_sample_value(
+            "kafka_consumer_messages_total",
+            {"consumer": consumer_name, "result": "processed"},
+        )
+        assert (lag, processed) == (8.0, 2.0)
+
+
+class TestRetriesAndDeadLetters:
+    async def test_retries_a_failing_message_before_moving_on(self):
+        consumer_name = f"test-retry-{uuid4()}"
+        handler = AsyncMock(side_effect=[ValueError("flaky"), None])
+        consumer = _FakeConsumer(consumer_name, handle_message=handler)
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, [{"telegram_id": 1}])
+
+        with patch(
+            "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
+            return_value=mock_kafka,
+        ):
+            await consumer._run_once()
+
+        assert handler.await_count == 2
+        assert _metric_value("kafka_consumer_retries_total", consumer_name) == 1.0
+        consumer._dead_letters.publish.assert_not_awaited()
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 1})
+
+    async def test_dead_letters_after_the_retry_budget_and_commits_past_it(self):
+        async def handle(payload):
+            if payload["telegram_id"] == 2:
+                raise ValueError("boom")
+
+        consumer = _FakeConsumer("test-dead-letter", handle_message=handle)
+        messages = [{"telegram_id": n} for n in (1, 2, 3)]
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, messages)
+
+        with patch(
+            "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
+            return_value=mock_kafka,
+        ):
+            await consumer._run_once()
+
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 3})
+        entry = consumer._dead_letters.publish.await_args.args[0]
+        assert (entry.topic, entry.offset, entry.value) == ("test.topic", 1, '{"telegram_id":2}')
+        assert (entry.reason, entry.error_type, entry.error, entry.attempts) == (
+            "exhausted",
+            "ValueError",
+            "boom",
+            2,
+        )
+
+    async def test_non_retryable_error_is_dead_lettered_on_first_attempt(self):
+        handler = AsyncMock(side_effect=KeyError("missing"))
+        consumer = _FakeConsumer("test-non-retryable", handle_message=handler)
+        consumer.non_retryable = (KeyError,)
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, [{"telegram_id": 1}])
+
+        with patch(
+            "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
+            return_value=mock_kafka,
+        ):
+            await consumer._run_once()
+
+        handler.assert_awaited_once()
+        entry = consumer._dead_letters.publish.await_args.args[0]
+        assert (entry.reason, entry.attempts) == ("non_retryable", 1)
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 1})
+
+    async def test_replayed_message_only_reaches_its_target_handler(self):
+        consumer = _FakeConsumer("test-replay-target")
+        messages = [
+            ({"telegram_id": 1}, [("dlq_handler", b"other-handler")]),
+            ({"telegram_id": 2}, [("dlq_handler", b"test-replay-target")]),
+        ]
+        mock_kafka = _make_aiokafka_consumer_mock(consumer, messages)
+
+        with patch(
+            "src.infrastructure.kafka.base_consumer.AIOKafkaConsumer",
+            return_value=mock_kafka,
+        ):
+            await consumer._run_once()
+
+        consumer._handle.assert_awaited_once_with({"telegram_id": 2})
+        mock_kafka.commit.assert_awaited_once_with({_PARTITION: 2})
 
 
 class TestSupervisorRestart:
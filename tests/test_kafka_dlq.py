@@ -0,0 +1,163 @@
+"""Tests for the Kafka dead-letter sinks and the replay CLI helpers."""
+
+from __future__ import annotations
+
+import argparse
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import msgspec
+
+from src.infrastructure.kafka.dlq import DeadLetter, RedisDeadLetterSink
+from src.infrastructure.kafka.dlq_cli import (
+    DeadLetterFilter,
+    replay_entries,
+    run,
+    select_entries,
+    summarize,
+)
+
+_KEY = "kafka_dlq"
+
+
+def _entry(**overrides) -> DeadLetter:
+    fields = {
+        "consumer": "hub_payment_completed",
+        "handler": "pricing_outcome",
+        "topic": "prod.billing.payment.completed.v1",
+        "partition": 0,
+        "offset": 10,
+        "key": "42",
+        "value": '{"telegram_id":42}',
+        "reason": "exhausted",
+        "error_type": "ValueError",
+        "error": "boom",
+        "attempts": 3,
+        "failed_at": 1_000.0,
+    }
+    fields.update(overrides)
+    return DeadLetter(**fields)
+
+
+class _Sink:
+    def __init__(self, entries: list[DeadLetter], *, supports_delete: bool = True) -> None:
+        self._entries = entries
+        self.supports_delete = supports_delete
+        self.delete = AsyncMock(side_effect=lambda entry_ids: len(entry_ids))
+        self.close = AsyncMock()
+
+    async def entries(self):
+        for index, entry in enumerate(self._entries):
+            yield f"{index}-0", entry
+
+
+async def test_redis_sink_appends_to_a_capped_stream():
+    redis_client = MagicMock()
+    redis_client.xadd = AsyncMock()
+    sink = RedisDeadLetterSink(redis_client, max_length=500)
+    entry = _entry()
+
+    await sink.publish(entry)
+
+    redis_client.xadd.assert_awaited_once_with(
+        _KEY, {"entry": msgspec.json.encode(entry)}, maxlen=500, approximate=True
+    )
+
+
+async def test_redis_sink_pages_through_the_stream():
+    entries = [_entry(offset=offset) for offset in range(3)]
+    pages = [
+        [(f"{n}-0".encode(), {b"entry": msgspec.json.encode(entries[n])}) for n in (0, 1)],
+        [(b"2-0", {b"entry": msgspec.json.encode(entries[2])})],
+    ]
+    redis_client = MagicMock()
+    redis_client.xrange = AsyncMock(side_effect=pages)
+    sink = RedisDeadLetterSink(redis_client, max_length=500)
+
+    with patch("src.infrastructure.kafka.dlq._STREAM_PAGE", 2):
+        read = [item async for item in sink.entries()]
+
+    assert read == [("0-0", entries[0]), ("1-0", entries[1]), ("2-0", entries[2])]
+    assert redis_client.xrange.await_args_list[1].kwargs["min"] == "(1-0"
+
+
+async def test_filters_combine_and_limit_counts_matches():
+    sink = _Sink(
+        [
+            _entry(reason="exhausted", failed_at=100.0),
+            _entry(reason="malformed_json", failed_at=200.0),
+            _entry(reason="exhausted", failed_at=300.0),
+            _entry(reason="exhausted", failed_at=400.0),
+        ]
+    )
+
+    selected = await select_entries(sink, DeadLetterFilter(reason="exhausted", since=200.0))
+    limited = await select_entries(sink, DeadLetterFilter(reason="exhausted", limit=2))
+
+    assert [entry_id for entry_id, _ in selected] == ["2-0", "3-0"]
+    assert [entry_id for entry_id, _ in limited] == ["0-0", "2-0"]
+
+
+async def test_replay_targets_the_failed_handler_only():
+    producer = MagicMock()
+    producer.send_and_wait = AsyncMock()
+    failed = _entry()
+    rejected = _entry(handler="hub_payment_completed", key=None, reason="invalid_schema")
+
+    await replay_entries(producer, [("0-0", failed), ("1-0", rejected)])
+
+    first, second = producer.send_and_wait.await_args_list
+    assert first.args == ("prod.billing.payment.completed.v1",)
+    assert first.kwargs == {
+        "value": b'{"telegram_id":42}',
+        "key": b"42",
+        "headers": [("dlq_handler", b"pricing_outcome")],
+    }
+    assert (second.kwargs["key"], second.kwargs["headers"]) == (None, [])
+
+
+def test_summary_counts_by_handler_and_reason():
+    entries = [("0-0", _entry()), ("1-0", _entry()), ("2-0", _entry(reason="non_retryable"))]
+
+    assert summarize(entries) == [
+        "       2  hub_payment_completed/pricing_outcome  exhausted",
+        "       1  hub_payment_completed/pricing_outcome  non_retryable",
+    ]
+
+
+def _args(command: str, **options) -> argparse.Namespace:
+    values = dict.fromkeys(("consumer", "handler", "topic", "reason", "error_type", "since"))
+    values.update(options)
+    return argparse.Namespace(command=command, limit=None, **values)
+
+
+async def _run_cli(args: argparse.Namespace, sink: _Sink) -> tuple[int, MagicMock]:
+    redis_client = MagicMock()
+    redis_client.aclose = AsyncMock()
+    with (
+        patch("src.infrastructure.kafka.dlq_cli.AppConfig") as app_config,
+        patch("src.infrastructure.kafka.dlq_cli.Redis.from_url", return_value=redis_client),
+        patch("src.infrastructure.kafka.dlq_cli.create_dead_letter_sink", return_value=sink),
+        patch("src.infrastructure.kafka.dlq_cli.AIOKafkaProducer") as producer_type,
+    ):
+        app_config.get.return_value.kafka_dlq_backend = "KAFKA"
+        return await run(args), producer_type
+
+
+async def test_deleting_is_refused_up_front_without_backend_support():
+    for args in (_args("purge"), _args("replay", dry_run=False, delete=True)):
+        sink = _Sink([_entry()], supports_delete=False)
+
+        exit_code, producer_type = await _run_cli(args, sink)
+
+        assert exit_code == 1
+        producer_type.assert_not_called()
+        sink.delete.assert_not_awaited()
+
+
+async def test_purge_deletes_matching_entries():
+    sink = _Sink([_entry(reason="exhausted"), _entry(reason="malformed_json")])
+
+    exit_code, _ = await _run_cli(_args("purge", reason="malformed_json"), sink)
+
+    assert exit_code == 0
+    sink.delete.assert_awaited_once_with(["1-0"])
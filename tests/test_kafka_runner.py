@@ -0,0 +1,48 @@
+"""Tests for the standalone Kafka consumer process."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.kafka.runner import run_consumers, select_consumers
+
+
+def _consumer(name: str, calls: list[str]) -> MagicMock:
+    consumer = MagicMock()
+    consumer.consumer_name = name
+    consumer.start = AsyncMock(side_effect=lambda: calls.append(f"start {name}"))
+    consumer.stop = AsyncMock(side_effect=lambda: calls.append(f"stop {name}"))
+    return consumer
+
+
+def test_select_consumers_defaults_to_all():
+    consumers = [_consumer("notification", []), _consumer("hub_payment_completed", [])]
+
+    assert select_consumers(consumers, None) == consumers
+
+
+def test_select_consumers_filters_by_name_and_rejects_unknown():
+    notification = _consumer("notification", [])
+    hub = _consumer("hub_payment_completed", [])
+
+    assert select_consumers([notification, hub], ["hub_payment_completed"]) == [hub]
+    with pytest.raises(ValueError, match="trial_reminder"):
+        select_consumers([notification, hub], ["trial_reminder"])
+
+
+async def test_runs_until_stopped_then_stops_in_reverse_order():
+    calls: list[str] = []
+    consumers = [_consumer("first", calls), _consumer("second", calls)]
+    stop_event = asyncio.Event()
+
+    task = asyncio.create_task(run_consumers(consumers, stop_event))
+    await asyncio.sleep(0)
+    assert calls == ["start first", "start second"]
+
+    stop_event.set()
+    await task
+
+    assert calls[2:] == ["stop second", "stop first"]
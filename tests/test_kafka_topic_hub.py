@@ -0,0 +1,171 @@
+"""Tests for KafkaTopicHub: one consumer group per topic fanning out to
+handlers with per-handler failure isolation and progress."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiokafka import TopicPartition
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.infrastructure.kafka.base_consumer import SupervisedKafkaConsumer
+from src.infrastructure.kafka.hub import KafkaTopicHub
+from src.infrastructure.kafka.registry import create_kafka_consumers
+
+_PARTITION = TopicPartition("test.topic", 0)
+_PROGRESS_KEY = "kafka_progress:test-group-topic"
+
+
+def _config() -> MagicMock:
+    config = MagicMock()
+    config.kafka_brokers = "localhost:9092"
+    config.kafka_group_id = "test-group"
+    config.kafka_batch_size = 100
+    config.kafka_max_concurrency = 4
+    config.kafka_fetch_timeout_ms = 10
+    config.kafka_max_attempts = 2
+    config.kafka_retry_backoff = 0
+    return config
+
+
+class _Handler(SupervisedKafkaConsumer):
+    def __init__(self, name: str, fail_on: int | None = None) -> None:
+        super().__init__(config=_config(), container=MagicMock())
+        self.consumer_name = name
+        self.fail_on = fail_on
+        self.seen: list[int] = []
+
+    async def _handle_message(self, payload: dict) -> None:
+        if payload["n"] == self.fail_on:
+            raise ValueError(f"{self.consumer_name} failed")
+        self.seen.append(payload["n"])
+
+
+def _redis(stored: dict[bytes, bytes] | Exception) -> tuple[MagicMock, MagicMock]:
+    redis_client = MagicMock()
+    if isinstance(stored, Exception):
+        redis_client.hgetall = AsyncMock(side_effect=stored)
+    else:
+        redis_client.hgetall = AsyncMock(return_value=stored)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=pipe)
+    context.__aexit__ = AsyncMock(return_value=False)
+    redis_client.pipeline.return_value = context
+    return redis_client, pipe
+
+
+def _hub(handlers: list[_Handler], redis_client: MagicMock) -> KafkaTopicHub:
+    container = MagicMock()
+    container.get = AsyncMock(side_effect=lambda dependency: {Redis: redis_client}[dependency])
+    hub = KafkaTopicHub(
+        _config(),
+        container,
+        topic="test.topic",
+        group_suffix="topic",
+        event="topic",
+        handlers=handlers,
+    )
+    hub._consumer = MagicMock()
+    hub._consumer.commit = AsyncMock()
+    hub._consumer.highwater = MagicMock(return_value=None)
+    hub._dead_letters = AsyncMock()
+    return hub
+
+
+def _batch(*offsets: int) -> dict:
+    records = []
+    for offset in offsets:
+        record = MagicMock()
+        record.offset = offset
+        record.key = None
+        record.headers = ()
+        record.value = {"telegram_id": offset + 1, "n": offset}
+        records.append(record)
+    return {_PARTITION: records}
+
+
+async def test_every_handler_sees_each_message_once():
+    first, second = _Handler("first"), _Handler("second")
+    redis_client, pipe = _redis({})
+    hub = _hub([first, second], redis_client)
+
+    await hub._process_batch(_batch(0, 1, 2))
+
+    assert sorted(first.seen) == sorted(second.seen) == [0, 1, 2]
+    hub._consumer.commit.assert_awaited_once_with({_PARTITION: 3})
+    pipe.execute.assert_not_awaited()
+
+
+async def test_failing_handler_holds_back_commit_and_others_record_progress():
+    healthy, failing = _Handler("healthy"), _Handler("failing", fail_on=1)
+    redis_client, pipe = _redis({})
+    hub = _hub([healthy, failing], redis_client)
+    hub._dead_letters.publish.side_effect = RedisConnectionError("down")
+
+    with pytest.raises(ValueError, match="failing failed"):
+        await hub._process_batch(_batch(0, 1, 2))
+
+    assert sorted(healthy.seen) == [0, 1, 2]
+    hub._consumer.commit.assert_awaited_once_with({_PARTITION: 1})
+    pipe.hset.assert_called_once_with(_PROGRESS_KEY, mapping={"healthy:0": 3})
+
+
+async def test_failing_handler_dead_letters_and_commit_moves_on():
+    healthy, failing = _Handler("healthy"), _Handler("failing", fail_on=1)
+    redis_client, _ = _redis({})
+    hub = _hub([healthy, failing], redis_client)
+
+    await hub._process_batch(_batch(0, 1, 2))
+
+    assert sorted(failing.seen) == [0, 2]
+    hub._consumer.commit.assert_awaited_once_with({_PARTITION: 3})
+    entry = hub._dead_letters.publish.await_args.args[0]
+    assert (entry.consumer, entry.handler, entry.offset, entry.attempts) == (
+        "hub_topic",
+        "failing",
+        1,
+        2,
+    )
+
+
+async def test_redelivered_batch_skips_messages_a_handler_already_handled():
+    healthy, recovered = _Handler("healthy"), _Handler("recovered")
+    redis_client, pipe = _redis({b"healthy:0": b"3"})
+    hub = _hub([healthy, recovered], redis_client)
+
+    await hub._process_batch(_batch(1, 2))
+
+    assert healthy.seen == []
+    assert sorted(recovered.seen) == [1, 2]
+    hub._consumer.commit.assert_awaited_once_with({_PARTITION: 3})
+    pipe.hdel.assert_called_once_with(_PROGRESS_KEY, "healthy:0")
+
+
+async def test_handlers_still_run_when_progress_is_unavailable():
+    handler = _Handler("only")
+    redis_client, _ = _redis(RedisConnectionError("down"))
+    hub = _hub([handler], redis_client)
+
+    await hub._process_batch(_batch(0))
+
+    assert handler.seen == [0]
+    hub._consumer.commit.assert_awaited_once_with({_PARTITION: 1})
+
+
+def test_hubs_reuse_existing_consumer_groups():
+    config = _config()
+    config.kafka_subscription_created_topic = "prod.billing.subscription.created.v1"
+    config.kafka_payment_completed_topic = "prod.billing.payment.completed.v1"
+
+    groups = {
+        consumer.consumer_name: consumer.group_id
+        for consumer in create_kafka_consumers(config, MagicMock())
+    }
+
+    # Committed offsets carry over, so nothing published during the rollout is skipped
+    assert groups["hub_subscription_created"] == "test-group-trial-reminder"
+    assert groups["hub_payment_completed"] == "test-group-pricing-outcome-payment-completed"
@@ -0,0 +1,200 @@
+"""Tests for the in-process L1 tier behind redis_cache and its pub/sub invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.utils import json_utils
+from src.infrastructure.redis.cache import redis_cache
+from src.infrastructure.redis.local_cache import (
+    CACHE_INVALIDATION_CHANNEL,
+    MISSING,
+    CacheInvalidationListener,
+    LocalCache,
+    invalidate_cache,
+    local_cache,
+    publish_invalidation,
+)
+
+
+class _Service:
+    def __init__(self, redis_client: AsyncMock) -> None:
+        self.redis_client = redis_client
+        self.calls = 0
+
+    @redis_cache(prefix="l1_test_value", local_ttl=60, local_maxsize=8)
+    async def get_value(self, item_id: int) -> dict[str, int]:
+        self.calls += 1
+        return {"id": item_id, "calls": self.calls}
+
+
+@pytest.fixture
+def active_local_cache():
+    local_cache.clear()
+    local_cache.active = True
+    yield local_cache
+    local_cache.active = False
+    local_cache.clear()
+
+
+def _redis_miss() -> AsyncMock:
+    redis = AsyncMock()
+    redis.get.return_value = None
+    return redis
+
+
+class TestRedisCacheLocalTier:
+    async def test_second_read_is_served_without_redis(self, active_local_cache):
+        redis = _redis_miss()
+        svc = _Service(redis)
+
+        first = await svc.get_value(1)
+        second = await svc.get_value(1)
+
+        assert first == second == {"id": 1, "calls": 1}
+        assert redis.get.await_count == 1
+
+    async def test_local_hit_returns_fresh_copy(self, active_local_cache):
+        svc = _Service(_redis_miss())
+
+        first = await svc.get_value(1)
+        first["calls"] = 99
+
+        assert (await svc.get_value(1))["calls"] == 1
+
+    async def test_redis_hit_populates_local_tier(self, active_local_cache):
+        redis = AsyncMock()
+        redis.get.return_value = json_utils.encode({"id": 2, "calls": 7}).encode()
+        svc = _Service(redis)
+
+        await svc.get_value(2)
+        result = await svc.get_value(2)
+
+        assert result == {"id": 2, "calls": 7}
+        assert redis.get.await_count == 1
+        assert svc.calls == 0
+
+    async def test_inactive_tier_always_reads_redis(self):
+        local_cache.active = False
+        redis = _redis_miss()
+        svc = _Service(redis)
+
+        await svc.get_value(3)
+        await svc.get_value(3)
+
+        assert redis.get.await_count == 2
+
+    async def test_invalidation_drops_local_entry(self, active_local_cache):
+        redis = _redis_miss()
+        svc = _Service(redis)
+
+        await svc.get_value(4)
+        await invalidate_cache(redis, "cache:l1_test_value:4")
+        result = await svc.get_value(4)
+
+        assert result["calls"] == 2
+        redis.delete.assert_awaited_once_with("cache:l1_test_value:4")
+
+
+class TestLocalCache:
+    def test_put_skipped_when_invalidated_during_load(self):
+        cache = LocalCache()
+        cache.register("p", maxsize=4, ttl=60)
+        cache.active = True
+
+        generation = cache.generation("p")
+        cache.invalidate("cache:p:1")
+        cache.put("p", "cache:p:1", {"stale": True}, generation)
+
+        assert cache.get("p", "cache:p:1") is MISSING
+
+    def test_unregistered_prefix_is_ignored(self):
+        cache = LocalCache()
+        cache.active = True
+
+        cache.invalidate("cache:unknown:1")
+        cache.put("unknown", "cache:unknown:1", 1, 0)
+
+        assert cache.get("unknown", "cache:unknown:1") is MISSING
+
+    def test_maxsize_bounds_entries(self):
+        cache = LocalCache()
+        cache.register("p", maxsize=2, ttl=60)
+        cache.active = True
+
+        for i in range(3):
+            cache.put("p", f"cache:p:{i}", i, cache.generation("p"))
+
+        assert cache.get("p", "cache:p:0") is MISSING
+        assert cache.get("p", "cache:p:2") == 2
+
+
+class TestPublishInvalidation:
+    async def test_publishes_keys_on_channel(self):
+        redis = AsyncMock()
+
+        await publish_invalidation(redis, "cache:a:1", "cache:b")
+
+        redis.publish.assert_awaited_once()
+        channel, data = redis.publish.await_args.args
+        assert channel == CACHE_INVALIDATION_CHANNEL
+        assert json_utils.decode(data) == {"keys": ["cache:a:1", "cache:b"]}
+
+    async def test_no_keys_is_noop(self):
+        redis = AsyncMock()
+
+        await invalidate_cache(redis)
+
+        redis.delete.assert_not_awaited()
+        redis.publish.assert_not_awaited()
+
+
+class _FakePubSub:
+    def __init__(self, messages: list[dict]) -> None:
+        self._messages = messages
+        self.subscribe = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def listen(self):
+        for message in self._messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+class TestCacheInvalidationListener:
+    async def test_activates_on_subscribe_and_applies_invalidations(self):
+        cache = LocalCache()
+        cache.register("p", maxsize=4, ttl=60)
+        cache.active = True
+        cache.put("p", "cache:p:1", 1, cache.generation("p"))
+        cache.active = False
+
+        pubsub = _FakePubSub(
+            [
+                {"type": "subscribe", "data": 1},
+                {"type": "message", "data": b'{"keys":["cache:p:2"]}'},
+            ]
+        )
+        redis = AsyncMock()
+        redis.pubsub = lambda: pubsub
+        listener = CacheInvalidationListener(redis, cache)
+
+        await listener.start()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert cache.active is True
+        # Entries from before the subscription are dropped on (re)connect
+        assert cache.get("p", "cache:p:1") is MISSING
+        pubsub.subscribe.assert_awaited_once_with(CACHE_INVALIDATION_CHANNEL)
+
+        await listener.stop()
+        assert cache.active is False
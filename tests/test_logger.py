@@ -0,0 +1,62 @@
+"""Tests for the hot-logger DEBUG rate limit installed by setup_logger."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from loguru import logger
+
+from src.core import logger as logger_module
+from src.core.logger import HotLogSampler
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    now = [100.0]
+    monkeypatch.setattr(logger_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def sinks() -> Iterator[tuple[list[str], list[str]]]:
+    first: list[str] = []
+    second: list[str] = []
+    sampler = HotLogSampler([__name__, ""], rate=2)
+    ids = [
+        logger.add(first.append, level="DEBUG", format="{message}", filter=sampler),
+        logger.add(second.append, level="DEBUG", format="{message}", filter=sampler),
+    ]
+    yield first, second
+    for handler_id in ids:
+        logger.remove(handler_id)
+
+
+def test_caps_debug_records_per_second(clock, sinks):
+    first, second = sinks
+
+    for index in range(4):
+        logger.debug(f"debug {index}")
+    clock[0] += 1.0
+    logger.debug("next second")
+
+    assert first == ["debug 0\n", "debug 1\n", "next second\n"]
+    assert second == first
+
+
+def test_higher_levels_are_never_dropped(clock, sinks):
+    first, _ = sinks
+
+    for _ in range(3):
+        logger.debug("debug")
+    logger.info("info")
+
+    assert first == ["debug\n", "debug\n", "info\n"]
+
+
+def test_other_modules_are_not_sampled():
+    sampler = HotLogSampler(["src.infrastructure.redis.cache"], rate=0)
+
+    assert sampler._hot_prefix("src.infrastructure.redis.cache") == "src.infrastructure.redis.cache"
+    assert sampler._hot_prefix("src.infrastructure.redis.cache_keys") is None
+    assert sampler._hot_prefix("src.services.user") is None
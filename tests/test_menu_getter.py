@@ -10,7 +10,9 @@ from unittest.mock import AsyncMock
 import pytest
 
 from src.bot.routers.menu.getters import menu_getter as _menu_getter
+from src.infrastructure.billing.converters import billing_settings_to_dto
 from src.infrastructure.billing.models import BillingTGProxy
+from src.services.menu import MenuService
 from tests.conftest import (
     make_billing_client,
     make_config,
@@ -31,6 +33,31 @@ menu_getter = unwrap_inject(_menu_getter)
 # ---------------------------------------------------------------------------
 
 
+def _make_menu_service(billing, referral_service, remnawave_service) -> MenuService:
+    redis_repository = AsyncMock()
+    redis_repository.get.return_value = None
+
+    plan_service = AsyncMock()
+    plan_service.get_trial_plan.side_effect = billing.get_trial_plan
+    subscription_service = AsyncMock()
+    subscription_service.has_used_trial.side_effect = billing.has_used_trial
+    settings_service = AsyncMock()
+    settings_service.get.return_value = billing_settings_to_dto(
+        billing.get_settings.return_value
+    )
+
+    return MenuService(
+        config=make_config(),
+        redis_repository=redis_repository,
+        billing=billing,
+        plan_service=plan_service,
+        settings_service=settings_service,
+        subscription_service=subscription_service,
+        referral_service=referral_service,
+        remnawave_service=remnawave_service,
+    )
+
+
 async def _call_menu_getter(
     user=None,
     billing=None,
@@ -43,15 +70,18 @@ async def _call_menu_getter(
     if remnawave_service is None:
         remnawave_service = AsyncMock()
         remnawave_service.is_beta_tester.return_value = False
+    menu_service = _make_menu_service(
+        billing=billing or make_billing_client(),
+        referral_service=referral_service or make_referral_service(),
+        remnawave_service=remnawave_service,
+    )
     return await menu_getter(
         dialog_manager=make_dialog_manager(),
         config=config or make_config(),
         user=user or make_user(),
         i18n=i18n or make_i18n(),
-        billing=billing or make_billing_client(),
-        referral_service=referral_service or make_referral_service(),
+        menu_service=menu_service,
         experiment_service=experiment_service or make_experiment_service(),
-        remnawave_service=remnawave_service,
     )
 
 
@@ -0,0 +1,114 @@
+"""Tests for the per-user main menu snapshot cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.billing.converters import billing_settings_to_dto
+from src.infrastructure.billing.models import BillingSettings, BillingTGProxy
+from src.services.menu import MENU_SNAPSHOT_TTL, MenuService, MenuSnapshot
+from tests.conftest import make_config, make_referral_service, make_subscription, make_user
+
+_PROXY = BillingTGProxy(id=1, server="1.2.3.4", port=443, secret="abc", link="tg://proxy")
+
+
+def _make_service(cached: MenuSnapshot | None = None) -> MenuService:
+    redis_repository = AsyncMock()
+    redis_repository.get.return_value = cached
+
+    billing = AsyncMock()
+    billing.get_tg_proxies.return_value = [_PROXY]
+    settings_service = AsyncMock()
+    settings_service.get.return_value = billing_settings_to_dto(BillingSettings())
+    plan_service = AsyncMock()
+    plan_service.get_trial_plan.return_value = object()
+    subscription_service = AsyncMock()
+    subscription_service.has_used_trial.return_value = False
+    remnawave_service = AsyncMock()
+    remnawave_service.is_beta_tester.return_value = False
+
+    return MenuService(
+        config=make_config(),
+        redis_repository=redis_repository,
+        billing=billing,
+        plan_service=plan_service,
+        settings_service=settings_service,
+        subscription_service=subscription_service,
+        referral_service=make_referral_service(),
+        remnawave_service=remnawave_service,
+    )
+
+
+class TestMenuSnapshot:
+    @pytest.mark.asyncio
+    async def test_miss_builds_and_stores_snapshot(self):
+        svc = _make_service()
+        user = make_user(subscription=make_subscription(plan_id=2))
+
+        snapshot = await svc.get_snapshot(user)
+
+        assert snapshot.tg_proxy_available is True
+        svc.redis_repository.set.assert_awaited_once()
+        assert svc.redis_repository.set.await_args.kwargs["ex"] == MENU_SNAPSHOT_TTL
+
+    @pytest.mark.asyncio
+    async def test_matching_fingerprint_is_served_from_cache(self):
+        user = make_user(subscription=make_subscription(plan_id=2))
+        cached = MenuSnapshot(
+            fingerprint=MenuService._fingerprint(user.current_subscription),
+            ref_link="https://t.me/cached",
+            is_referral_enable=True,
+            invitee_discount=10,
+            referrer_days=14,
+            long_referrer_days=30,
+            tg_proxy_available=True,
+        )
+        svc = _make_service(cached)
+
+        snapshot = await svc.get_snapshot(user)
+
+        assert snapshot.ref_link == "https://t.me/cached"
+        svc.billing.get_tg_proxies.assert_not_awaited()
+        svc.settings_service.get.assert_not_awaited()
+        svc.redis_repository.set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_fingerprint_is_rebuilt(self):
+        user = make_user(subscription=make_subscription(plan_id=2, active=False))
+        cached = MenuSnapshot(
+            fingerprint=MenuService._fingerprint(make_subscription(plan_id=2)),
+            ref_link="https://t.me/cached",
+            is_referral_enable=True,
+            invitee_discount=10,
+            referrer_days=14,
+            long_referrer_days=30,
+            tg_proxy_available=True,
+        )
+        svc = _make_service(cached)
+
+        snapshot = await svc.get_snapshot(user)
+
+        assert snapshot.tg_proxy_available is False
+        svc.redis_repository.set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_subscription_resolves_trial_inputs(self):
+        svc = _make_service()
+
+        snapshot = await svc.get_snapshot(make_user(subscription=None))
+
+        assert snapshot.trial_available is True
+        svc.billing.get_tg_proxies.assert_not_awaited()
+        svc.remnawave_service.is_beta_tester.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_fresh_build(self):
+        svc = _make_service()
+        svc.redis_repository.get.side_effect = ConnectionError("redis down")
+        svc.redis_repository.set.side_effect = ConnectionError("redis down")
+
+        snapshot = await svc.get_snapshot(make_user(subscription=make_subscription(plan_id=2)))
+
+        assert snapshot.tg_proxy_available is True
@@ -0,0 +1,78 @@
+"""Tests for the Redis-backed auto-deletion queue."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.exceptions import TelegramBadRequest, TelegramNetworkError
+from aiogram.methods import DeleteMessages
+
+from src.infrastructure.telegram import deletion as deletion_module
+from src.infrastructure.telegram.deletion import MessageDeletionScheduler, schedule_message_deletion
+
+
+def _scheduler(*claimed: bytes) -> MessageDeletionScheduler:
+    repository = MagicMock()
+    repository.run_script = AsyncMock(return_value=list(claimed))
+    repository.sorted_collection_remove = AsyncMock()
+    return MessageDeletionScheduler(AsyncMock(), repository)
+
+
+async def test_schedule_scores_by_due_time(monkeypatch):
+    monkeypatch.setattr(deletion_module.time, "time", lambda: 1_000.0)
+    repository = MagicMock()
+    repository.sorted_collection_add = AsyncMock()
+
+    await schedule_message_deletion(repository, -100123, 7, delay=5)
+
+    key, mapping = repository.sorted_collection_add.await_args.args
+    assert key.pack() == "message_deletions"
+    assert mapping == {"-100123:7": 1_005.0}
+
+
+async def test_drain_deletes_per_chat_and_removes_entries():
+    scheduler = _scheduler(b"1:10", b"2:20", b"1:11")
+
+    assert await scheduler.drain() == 3
+
+    calls = [call.kwargs for call in scheduler.bot.delete_messages.await_args_list]
+    assert calls == [
+        {"chat_id": 1, "message_ids": [10, 11]},
+        {"chat_id": 2, "message_ids": [20]},
+    ]
+    removed = scheduler.redis_repository.sorted_collection_remove.await_args.args[1:]
+    assert sorted(removed) == ["1:10", "1:11", "2:20"]
+
+
+async def test_drain_splits_large_chats_into_api_sized_calls():
+    scheduler = _scheduler(*(f"1:{index}".encode() for index in range(150)))
+
+    await scheduler.drain()
+
+    sizes = [
+        len(call.kwargs["message_ids"]) for call in scheduler.bot.delete_messages.await_args_list
+    ]
+    assert sizes == [100, 50]
+
+
+async def test_transient_failures_stay_queued_for_retry():
+    scheduler = _scheduler(b"1:10", b"2:20")
+    method = DeleteMessages(chat_id=1, message_ids=[10])
+    scheduler.bot.delete_messages.side_effect = [
+        TelegramNetworkError(method, "timeout"),
+        TelegramBadRequest(method, "message can't be deleted"),
+    ]
+
+    await scheduler.drain()
+
+    removed = scheduler.redis_repository.sorted_collection_remove.await_args.args[1:]
+    assert removed == ("2:20",)
+
+
+async def test_nothing_due():
+    scheduler = _scheduler()
+
+    assert await scheduler.drain() == 0
+
+    scheduler.bot.delete_messages.assert_not_awaited()
+    scheduler.redis_repository.sorted_collection_remove.assert_not_awaited()
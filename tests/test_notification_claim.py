@@ -0,0 +1,99 @@
+"""Tests for the atomic dedup claim taken by NotificationService.notify_user."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramNetworkError
+from aiogram.methods import SendMessage
+
+from src.core.constants import TIME_24H
+from src.core.enums import UserNotificationType
+from src.core.storage.keys import SentNotificationKey
+from src.core.utils.message_payload import MessagePayload
+from src.services.notification import NotificationService
+from tests.conftest import make_config, make_user
+
+_PAYLOAD = MessagePayload(i18n_key="ntf-event-user-not-connected")
+_TYPE = UserNotificationType.NOT_CONNECTED
+
+
+def _make_service(claimed: bool = True) -> NotificationService:
+    redis_repository = MagicMock()
+    redis_repository.claim = AsyncMock(return_value=claimed)
+    redis_repository.delete = AsyncMock()
+    settings_service = AsyncMock()
+    settings_service.is_notification_enabled.return_value = True
+
+    svc = NotificationService(
+        config=make_config(),
+        bot=AsyncMock(),
+        redis_client=AsyncMock(),
+        redis_repository=redis_repository,
+        translator_hub=MagicMock(),
+        user_service=AsyncMock(),
+        settings_service=settings_service,
+    )
+    svc._send_message = AsyncMock(return_value=MagicMock())  # type: ignore[method-assign]
+    return svc
+
+
+async def test_typed_notification_claims_before_sending():
+    svc = _make_service()
+
+    assert await svc.notify_user(make_user(telegram_id=42), _PAYLOAD, ntf_type=_TYPE)
+
+    (key,) = svc.redis_repository.claim.await_args.args
+    assert key.pack() == "ntf_dedup:NOT_CONNECTED:42"
+    assert svc.redis_repository.claim.await_args.kwargs == {"ex": TIME_24H}
+    svc.redis_repository.delete.assert_not_awaited()
+
+
+async def test_taken_claim_skips_the_send():
+    svc = _make_service(claimed=False)
+
+    assert await svc.notify_user(make_user(telegram_id=42), _PAYLOAD, ntf_type=_TYPE) is None
+
+    svc._send_message.assert_not_awaited()
+
+
+async def test_custom_key_and_ttl():
+    svc = _make_service()
+    key = SentNotificationKey(telegram_id=42, type="not_connected_reminder")
+
+    await svc.notify_user(
+        make_user(telegram_id=42), _PAYLOAD, ntf_type=_TYPE, dedup_key=key, dedup_ttl=60
+    )
+
+    svc.redis_repository.claim.assert_awaited_once_with(key, ex=60)
+
+
+async def test_failed_send_releases_the_claim():
+    svc = _make_service()
+    svc._send_message.return_value = None
+
+    await svc.notify_user(make_user(telegram_id=42), _PAYLOAD, ntf_type=_TYPE)
+
+    svc.redis_repository.delete.assert_awaited_once()
+
+
+async def test_send_error_releases_the_claim_and_propagates():
+    svc = _make_service()
+    svc._send_message.side_effect = TelegramNetworkError(
+        SendMessage(chat_id=42, text="x"), "timeout"
+    )
+
+    with pytest.raises(TelegramNetworkError):
+        await svc.notify_user(make_user(telegram_id=42), _PAYLOAD, ntf_type=_TYPE)
+
+    svc.redis_repository.delete.assert_awaited_once()
+
+
+async def test_untyped_notification_is_not_deduplicated():
+    svc = _make_service()
+
+    await svc.notify_user(make_user(telegram_id=42), _PAYLOAD)
+
+    svc.redis_repository.claim.assert_not_awaited()
+    svc._send_message.assert_awaited_once()
@@ -1,11 +1,20 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from aiokafka import TopicPartition
 from fluentogram.exceptions import FormatError
 from prometheus_client import REGISTRY
 
+from src.core.enums import SystemNotificationType
 from src.infrastructure.kafka.consumer import UserNotificationConsumer, _format_plan_i18n_kwargs
+from src.infrastructure.kafka.events import (
+    NotifyUserRedirectEvent,
+    NotifyUserSystemEvent,
+    RejectedEvent,
+    build_value_deserializer,
+)
 
 
 def _consumer() -> UserNotificationConsumer:
@@ -13,36 +22,39 @@ def _consumer() -> UserNotificationConsumer:
     config.kafka_brokers = "localhost:9092"
     config.kafka_notify_topic = "prod.compono.notify.user.v1"
     config.kafka_group_id = f"test-{uuid4()}"
+    config.kafka_max_attempts = 3
+    config.kafka_retry_backoff = 0
     return UserNotificationConsumer(config, MagicMock())
 
 
-async def test_format_error_is_discarded_so_next_message_can_advance() -> None:
+async def test_format_error_is_dead_lettered_without_retrying() -> None:
     consumer = _consumer()
+    consumer._dead_letters = AsyncMock()
     consumer._handle_system_notify = AsyncMock(  # type: ignore[method-assign]
         side_effect=FormatError(ValueError("missing Fluent variable"), "broken-key")
     )
-
-    before = (
-        REGISTRY.get_sample_value(
-            "kafka_consumer_discarded_messages_total",
-            {"consumer": "notification", "reason": "format_error"},
-        )
-        or 0
-    )
-
-    await consumer._handle_message(
-        {
-            "telegram_id": 123,
-            "type": "system",
-            "i18n_key": "ntf-event-subscription-change",
-        }
+    partition = TopicPartition("prod.compono.notify.user.v1", 0)
+    record = MagicMock(offset=7, key=b"123", headers=())
+    record.value = NotifyUserSystemEvent(
+        telegram_id=123,
+        ntf_type=SystemNotificationType.SUBSCRIPTION,
+        i18n_key="ntf-event-subscription-change",
     )
 
-    after = REGISTRY.get_sample_value(
-        "kafka_consumer_discarded_messages_total",
-        {"consumer": "notification", "reason": "format_error"},
+    done, error = await consumer._dispatch(consumer, {partition: [record]}, asyncio.Semaphore(1))
+
+    # The offset counts as done, so the next message can advance
+    assert (done, error) == ({partition: {7}}, None)
+    consumer._handle_system_notify.assert_awaited_once()
+    entry = consumer._dead_letters.publish.await_args.args[0]
+    assert (entry.handler, entry.reason, entry.error_type, entry.attempts, entry.key) == (
+        "notification",
+        "non_retryable",
+        "FormatError",
+        1,
+        "123",
     )
-    assert after == before + 1
+    assert '"i18n_key":"ntf-event-subscription-change"' in entry.value
 
 
 async def test_transient_redirect_error_still_propagates_for_retry() -> None:
@@ -53,14 +65,61 @@ async def test_transient_redirect_error_still_propagates_for_retry() -> None:
 
     with pytest.raises(RuntimeError, match="Telegram unavailable"):
         await consumer._handle_message(
-            {
-                "telegram_id": 123,
-                "type": "redirect",
-                "redirect_to": "subscription_success",
-            }
+            NotifyUserRedirectEvent(telegram_id=123, redirect_to="subscription_success")
         )
 
 
+def _discarded(reason: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "kafka_consumer_discarded_messages_total",
+        {"consumer": "notification", "reason": reason},
+    )
+    return value or 0
+
+
+@pytest.mark.parametrize(
+    ("raw", "reason"),
+    [
+        (b"{not json", "malformed_json"),
+        (None, "malformed_json"),
+        (b'{"telegram_id": 1, "type": "unknown"}', "invalid_schema"),
+        (
+            b'{"telegram_id": 1, "type": "system", "ntf_type": "NOPE", "i18n_key": "k"}',
+            "invalid_schema",
+        ),
+        (
+            b'{"telegram_id": 1, "type": "system", "ntf_type": "SUBSCRIPTION", "i18n_key": ""}',
+            "invalid_schema",
+        ),
+        (
+            b'{"telegram_id": 0, "type": "redirect", "redirect_to": "subscription_success"}',
+            "invalid_schema",
+        ),
+        (b'{"telegram_id": 1, "type": "redirect", "redirect_to": "elsewhere"}', "invalid_schema"),
+    ],
+)
+def test_invalid_values_are_rejected_when_decoded(raw: bytes | None, reason: str) -> None:
+    deserialize = build_value_deserializer(UserNotificationConsumer.payload_type, "notification")
+    before = _discarded(reason)
+
+    value = deserialize(raw)
+
+    assert isinstance(value, RejectedEvent)
+    assert value.reason == reason
+    assert _discarded(reason) == before + 1
+
+
+def test_redirect_without_purchase_type_defaults_to_new() -> None:
+    deserialize = build_value_deserializer(UserNotificationConsumer.payload_type, "notification")
+
+    value = deserialize(
+        b'{"telegram_id": 5, "type": "redirect", "redirect_to": "subscription_success"}'
+    )
+
+    assert value == NotifyUserRedirectEvent(telegram_id=5, redirect_to="subscription_success")
+    assert value.purchase_type == "NEW"
+
+
 def test_change_notification_formats_previous_plan_fields() -> None:
     kwargs = {
         "plan_traffic_limit": 300,
@@ -21,11 +21,11 @@ import pytest
 
 from tests.conftest import make_user, make_subscription
 
+from src.core.storage.keys import SentNotificationKey
 from src.infrastructure.taskiq.tasks.notifications import (
     NOT_CONNECTED_NOTIFICATION_KEY,
     NOT_CONNECTED_REMINDER_DELAY,
     _PENDING_KEY,
-    _SENT_NTF_KEY_PREFIX,
     _SENT_NTF_TTL,
     schedule_not_connected_reminder,
 )
@@ -81,9 +81,8 @@ class TestNotificationDedupKey:
 
     def test_dedup_key_format(self):
         """Dedup key follows the pattern: sent_ntf:{telegram_id}:not_connected_reminder."""
-        telegram_id = 12345
-        expected_key = f"{_SENT_NTF_KEY_PREFIX}{telegram_id}:{NOT_CONNECTED_NOTIFICATION_KEY}"
-        assert expected_key == "sent_ntf:12345:not_connected_reminder"
+        key = SentNotificationKey(telegram_id=12345, type=NOT_CONNECTED_NOTIFICATION_KEY)
+        assert key.pack() == "sent_ntf:12345:not_connected_reminder"
 
     def test_dedup_ttl_is_90_days(self):
         """The TTL for dedup keys is 90 days in seconds."""
@@ -112,7 +111,7 @@ async def _simulate_reminder_processing(
     Matches the task implementation: get due items, dedup-check each one,
     fetch user + subscription separately (subscription via SubscriptionService
     because UserDto.current_subscription is not populated in this code path),
-    check device count, then send + mark dedup.
+    check device count, then send through notify_user, which claims the dedup key.
     """
     now = time.time()
     key = _PENDING_KEY.pack()
@@ -127,10 +126,12 @@ async def _simulate_reminder_processing(
 
         sep = member.index(":")
         user_telegram_id = int(member[:sep])
-        connect_url = member[sep + 1:]
+        connect_url = member[sep + 1 :]
 
-        dedup_key = f"{_SENT_NTF_KEY_PREFIX}{user_telegram_id}:{NOT_CONNECTED_NOTIFICATION_KEY}"
-        already_sent = await redis.exists(dedup_key)
+        dedup_key = SentNotificationKey(
+            telegram_id=user_telegram_id, type=NOT_CONNECTED_NOTIFICATION_KEY
+        )
+        already_sent = await redis.exists(dedup_key.pack())
         if already_sent:
             continue
 
@@ -149,8 +150,9 @@ async def _simulate_reminder_processing(
         if devices:
             continue
 
-        await notification_service.notify_user(user=user, payload=MagicMock())
-        await redis.setex(dedup_key, _SENT_NTF_TTL, "1")
+        await notification_service.notify_user(
+            user=user, payload=MagicMock(), dedup_key=dedup_key, dedup_ttl=_SENT_NTF_TTL
+        )
 
 
 class TestNotificationDedup:
@@ -161,7 +163,6 @@ class TestNotificationDedup:
         redis.zrangebyscore.return_value = due_items or []
         redis.zrem.return_value = 1
         redis.exists.return_value = 1 if already_sent else 0
-        redis.setex.return_value = True
         return redis
 
     def _make_subscription_service(self, subscription=None):
@@ -188,14 +189,12 @@ class TestNotificationDedup:
         # exists() should be checked for dedup
         redis.exists.assert_awaited_once()
         dedup_key_checked = redis.exists.call_args[0][0]
-        assert dedup_key_checked == f"{_SENT_NTF_KEY_PREFIX}12345:{NOT_CONNECTED_NOTIFICATION_KEY}"
+        assert dedup_key_checked == "sent_ntf:12345:not_connected_reminder"
         # Notification should NOT be sent
         notification_service.notify_user.assert_not_awaited()
-        # No new dedup key written
-        redis.setex.assert_not_awaited()
 
-    async def test_new_notification_sends_and_sets_dedup_key(self):
-        """When dedup key does not exist, notification is sent and dedup key is written with TTL."""
+    async def test_new_notification_is_sent_with_the_dedup_claim(self):
+        """When dedup key does not exist, notification is sent claiming the key with its TTL."""
         user = make_user(telegram_id=12345)
         member = b"12345:https://panel.example.com/sub/abc"
 
@@ -211,17 +210,11 @@ class TestNotificationDedup:
             redis, user_service, subscription_service, remnawave_service, notification_service
         )
 
-        # Notification should be sent
+        # Notification should be sent, claiming the dedup key with the correct TTL
         notification_service.notify_user.assert_awaited_once()
-        # Dedup key should be set with correct TTL
-        redis.setex.assert_awaited_once()
-        setex_args = redis.setex.call_args[0]
-        dedup_key = setex_args[0]
-        ttl = setex_args[1]
-        value = setex_args[2]
-        assert dedup_key == f"{_SENT_NTF_KEY_PREFIX}12345:{NOT_CONNECTED_NOTIFICATION_KEY}"
-        assert ttl == _SENT_NTF_TTL
-        assert value == "1"
+        kwargs = notification_service.notify_user.call_args.kwargs
+        assert kwargs["dedup_key"].pack() == "sent_ntf:12345:not_connected_reminder"
+        assert kwargs["dedup_ttl"] == _SENT_NTF_TTL
 
     async def test_billing_driven_trial_user_not_connected_dto_field(self):
         """Regression: UserDto.current_subscription is None for users hydrated by
@@ -245,7 +238,6 @@ class TestNotificationDedup:
         )
 
         notification_service.notify_user.assert_awaited_once()
-        redis.setex.assert_awaited_once()
 
     async def test_skips_user_without_subscription(self):
         """If subscription_service returns no current sub, reminder is skipped."""
@@ -264,7 +256,6 @@ class TestNotificationDedup:
         )
 
         notification_service.notify_user.assert_not_awaited()
-        redis.setex.assert_not_awaited()
 
     async def test_skips_user_with_inactive_subscription(self):
         """If subscription is inactive, reminder is skipped."""
@@ -283,7 +274,6 @@ class TestNotificationDedup:
         )
 
         notification_service.notify_user.assert_not_awaited()
-        redis.setex.assert_not_awaited()
 
     async def test_skips_already_connected_user(self):
         """If user already has devices, reminder is skipped."""
@@ -303,7 +293,6 @@ class TestNotificationDedup:
         )
 
         notification_service.notify_user.assert_not_awaited()
-        redis.setex.assert_not_awaited()
 
     async def test_no_due_items_exits_early(self):
         """When there are no due items, the task returns immediately."""
@@ -331,7 +320,6 @@ class TestNotificationDedup:
         redis.zrem.return_value = 1
         # First exists() call (22222) returns True (skip), second (11111) returns False (send)
         redis.exists.side_effect = [1, 0]
-        redis.setex.return_value = True
 
         user_service = AsyncMock()
         user_service.get.return_value = user_ok
@@ -346,6 +334,4 @@ class TestNotificationDedup:
 
         # Only one notification should be sent (the non-deduped one)
         notification_service.notify_user.assert_awaited_once()
-        # Only one dedup key should be written
-        redis.setex.assert_awaited_once()
-        assert "11111" in redis.setex.call_args[0][0]
+        assert notification_service.notify_user.call_args.kwargs["dedup_key"].telegram_id == 11111
@@ -369,7 +369,7 @@ class TestCheckoutEvents:
         subscription_service = AsyncMock()
         experiment_service = MagicMock()
         experiment_service.expose = AsyncMock()
-        experiment_service.record_conversion = MagicMock()
+        experiment_service.record_conversion = AsyncMock()
         transaction = MagicMock()
         transaction.user = make_user(telegram_id=123)
         transaction.is_test = False
@@ -400,7 +400,7 @@ class TestCheckoutEvents:
             await svc.handle_payment_succeeded(uuid4())
 
         experiment_service.expose.assert_awaited_once()
-        experiment_service.record_conversion.assert_called_once_with(
+        experiment_service.record_conversion.assert_awaited_once_with(
             "checkout_flow",
             123,
             "payment_completed",
@@ -412,7 +412,7 @@ class TestCheckoutEvents:
         transaction_service = AsyncMock()
         experiment_service = MagicMock()
         experiment_service.expose = AsyncMock()
-        experiment_service.record_conversion = MagicMock()
+        experiment_service.record_conversion = AsyncMock()
         updated = MagicMock()
         updated.user = make_user(telegram_id=456)
         transaction_service.transition_status.return_value = updated
@@ -423,7 +423,7 @@ class TestCheckoutEvents:
         await svc.handle_payment_canceled(uuid4())
 
         experiment_service.expose.assert_awaited_once()
-        experiment_service.record_conversion.assert_called_once_with(
+        experiment_service.record_conversion.assert_awaited_once_with(
             "checkout_flow",
             456,
             "payment_canceled",
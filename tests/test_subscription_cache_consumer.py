@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.kafka.subscription_cache_consumer import SubscriptionCacheConsumer
+
+
+def _make_consumer(subscription_service) -> SubscriptionCacheConsumer:
+    request_container = MagicMock()
+
+    async def get(cls):
+        if cls.__name__ == "SubscriptionService":
+            return subscription_service
+        raise KeyError(cls)
+
+    request_container.get = AsyncMock(side_effect=get)
+
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=request_container)
+    cm.__aexit__ = AsyncMock(return_value=None)
+
+    config = MagicMock()
+    config.kafka_brokers = "localhost:9092"
+    config.kafka_group_id = "test-group"
+    return SubscriptionCacheConsumer(
+        config=config,
+        container=MagicMock(return_value=cm),
+        topic="test.topic",
+        group_suffix="subscription-cache",
+        event="subscription_created",
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidates_user_subscription_cache():
+    subscription_service = MagicMock()
+    subscription_service.clear_subscription_cache = AsyncMock()
+    consumer = _make_consumer(subscription_service)
+
+    await consumer._handle_message({"telegram_id": "12345", "subscription_id": 7})
+
+    subscription_service.clear_subscription_cache.assert_awaited_once_with(7, 12345)
+
+
+@pytest.mark.asyncio
+async def test_missing_subscription_id_still_invalidates_user_keys():
+    subscription_service = MagicMock()
+    subscription_service.clear_subscription_cache = AsyncMock()
+    consumer = _make_consumer(subscription_service)
+
+    await consumer._handle_message({"telegram_id": 12345, "is_trial": True})
+
+    subscription_service.clear_subscription_cache.assert_awaited_once_with(None, 12345)
+
+
+@pytest.mark.asyncio
+async def test_skips_payloads_without_telegram_id():
+    subscription_service = MagicMock()
+    subscription_service.clear_subscription_cache = AsyncMock()
+    consumer = _make_consumer(subscription_service)
+
+    await consumer._handle_message({"subscription_id": 7})
+
+    subscription_service.clear_subscription_cache.assert_not_awaited()
@@ -0,0 +1,143 @@
+"""Tests for digest batching of system notifications."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.enums import SystemNotificationType
+from src.core.utils import json_utils
+from src.core.utils.message_payload import MessagePayload
+from src.services import notification as notification_module
+from src.services.notification import NotificationService
+from tests.conftest import make_config, make_user
+
+_REGISTERED = SystemNotificationType.USER_REGISTERED
+
+
+def _make_service(max_events: int = 50) -> NotificationService:
+    config = make_config()
+    config.bot.system_digest_types = [_REGISTERED]
+    config.bot.system_digest_interval = 300
+    config.bot.system_digest_max_events = max_events
+
+    redis_repository = MagicMock()
+    redis_repository.run_script = AsyncMock()
+    user_service = AsyncMock()
+    user_service.get_by_role.return_value = [make_user(telegram_id=1)]
+    settings_service = AsyncMock()
+    settings_service.is_notification_enabled.return_value = True
+
+    svc = NotificationService(
+        config=config,
+        bot=AsyncMock(),
+        redis_client=AsyncMock(),
+        redis_repository=redis_repository,
+        translator_hub=MagicMock(),
+        user_service=user_service,
+        settings_service=settings_service,
+    )
+    svc._send_message = AsyncMock(return_value=MagicMock())  # type: ignore[method-assign]
+    svc._get_translated_text = MagicMock(  # type: ignore[method-assign]
+        side_effect=lambda locale, key, kwargs={}: f"{key}:{kwargs.get('user_id', '')}"
+    )
+    return svc
+
+
+def _event(user_id: str) -> bytes:
+    return json_utils.bytes_encode(
+        {"i18n_key": "ntf-event-new-user", "i18n_kwargs": {"user_id": user_id}}
+    )
+
+
+class TestSystemNotify:
+    async def test_digest_type_is_queued_instead_of_sent(self, monkeypatch):
+        monkeypatch.setattr(notification_module.time, "time", lambda: 1_000.0)
+        svc = _make_service()
+        svc.redis_repository.run_script.return_value = 1
+        payload = MessagePayload.not_deleted(
+            i18n_key="ntf-event-new-user", i18n_kwargs={"user_id": "42"}, reply_markup=None
+        )
+
+        assert await svc.system_notify(payload=payload, ntf_type=_REGISTERED) == []
+
+        svc._send_message.assert_not_awaited()
+        _, keys, args = svc.redis_repository.run_script.await_args.args
+        assert keys == ["system_digest:USER_REGISTERED", "pending_system_digests"]
+        assert json_utils.decode(args[0]) == {
+            "i18n_key": "ntf-event-new-user",
+            "i18n_kwargs": {"user_id": "42"},
+        }
+        assert args[1:] == ["USER_REGISTERED", 1_000.0]
+
+    async def test_full_digest_is_flushed_right_away(self):
+        svc = _make_service(max_events=2)
+        svc.redis_repository.run_script.side_effect = [2, [_event("1"), _event("2")]]
+
+        await svc.system_notify(
+            payload=MessagePayload(i18n_key="ntf-event-new-user"), ntf_type=_REGISTERED
+        )
+
+        payload = svc._send_message.await_args.kwargs["payload"]
+        assert payload.i18n_key == "ntf-event-digest"
+        assert payload.i18n_kwargs["count"] == 2
+        assert payload.i18n_kwargs["events"].split(notification_module._DIGEST_SEPARATOR) == [
+            "ntf-event-new-user:1",
+            "ntf-event-new-user:2",
+        ]
+
+    async def test_other_types_are_sent_immediately(self):
+        svc = _make_service()
+
+        result = await svc.system_notify(
+            payload=MessagePayload(i18n_key="ntf-event-bot-startup"),
+            ntf_type=SystemNotificationType.BOT_LIFETIME,
+        )
+
+        assert result == [True]
+        svc.redis_repository.run_script.assert_not_awaited()
+
+    async def test_unserializable_event_is_sent_immediately(self):
+        svc = _make_service()
+
+        result = await svc.system_notify(
+            payload=MessagePayload(i18n_key="ntf-event-new-user", i18n_kwargs={"x": object()}),
+            ntf_type=_REGISTERED,
+        )
+
+        assert result == [True]
+        svc.redis_repository.run_script.assert_not_awaited()
+
+
+class TestFlush:
+    async def test_long_digest_is_split_across_messages(self, monkeypatch):
+        monkeypatch.setattr(notification_module, "_DIGEST_TEXT_LIMIT", 50)
+        svc = _make_service()
+        svc.redis_repository.run_script.return_value = [_event("1"), _event("2"), _event("3")]
+
+        assert await svc.flush_system_digest(_REGISTERED) == 3
+
+        kwargs = [call.kwargs["payload"].i18n_kwargs for call in svc._send_message.await_args_list]
+        assert len(kwargs) == 2
+        assert "ntf-event-new-user:3" in kwargs[1]["events"]
+        assert [chunk["count"] for chunk in kwargs] == [2, 1]
+
+    async def test_nothing_queued(self):
+        svc = _make_service()
+        svc.redis_repository.run_script.return_value = []
+
+        assert await svc.flush_system_digest(_REGISTERED) == 0
+
+        svc.user_service.get_by_role.assert_not_awaited()
+
+    async def test_due_digests_are_flushed(self, monkeypatch):
+        monkeypatch.setattr(notification_module.time, "time", lambda: 1_000.0)
+        svc = _make_service()
+        svc.redis_client.zrangebyscore.return_value = [b"USER_REGISTERED"]
+        svc.redis_repository.run_script.return_value = [_event("1")]
+
+        await svc.flush_due_system_digests()
+
+        svc.redis_client.zrangebyscore.assert_awaited_once_with(
+            "pending_system_digests", "-inf", 700.0
+        )
+        assert svc._send_message.await_count == 1
@@ -0,0 +1,194 @@
+"""Tests for the shared outbound Telegram rate limiter and its session middleware."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import DeleteMessage, DeleteMessages, GetMe, SendChatAction, SendMessage
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.core.enums import SendPriority
+from src.infrastructure.telegram import rate_limiter as rate_limiter_module
+from src.infrastructure.telegram.rate_limiter import (
+    RateLimitedRequestMiddleware,
+    TelegramRateLimiter,
+    current_send_priority,
+    send_priority,
+    set_default_send_priority,
+)
+
+
+@pytest.fixture
+def sleep(monkeypatch) -> AsyncMock:
+    mock = AsyncMock()
+    monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", mock)
+    return mock
+
+
+def _limiter(*script_results: object, **kwargs: float) -> TelegramRateLimiter:
+    repository = MagicMock()
+    repository.run_script = AsyncMock(side_effect=list(script_results))
+    return TelegramRateLimiter(repository, **kwargs)
+
+
+def _retry_after(seconds: int) -> TelegramRetryAfter:
+    method = SendMessage(chat_id=1, text="hi")
+    return TelegramRetryAfter(method=method, message="Too Many Requests", retry_after=seconds)
+
+
+class TestLimiter:
+    async def test_private_chat_uses_global_and_chat_bucket(self, sleep):
+        limiter = _limiter("0", global_rate=28, chat_rate=1, chat_burst=3)
+
+        await limiter.acquire(42, SendPriority.INTERACTIVE)
+
+        _, keys, args = limiter.redis_repository.run_script.await_args.args
+        assert keys == ["tg_send_bucket:global", "tg_send_bucket:42"]
+        assert args == [28, 28, 0, 1, 3.0, 0]
+        sleep.assert_not_awaited()
+
+    async def test_group_uses_group_rate(self, sleep):
+        limiter = _limiter("0", "0", group_rate=0.5)
+
+        await limiter.acquire(-100123, SendPriority.INTERACTIVE)
+        await limiter.acquire("@channel", SendPriority.INTERACTIVE)
+
+        calls = limiter.redis_repository.run_script.await_args_list
+        assert calls[0].args[1][1] == "tg_send_bucket:-100123"
+        assert calls[0].args[2][3:5] == [0.5, 1.0]
+        assert calls[1].args[1][1] == "tg_send_bucket:@channel"
+
+    async def test_bulk_leaves_a_reserve(self, sleep):
+        limiter = _limiter("0", global_rate=20, chat_burst=5, bulk_reserve=0.2)
+
+        await limiter.acquire(42, SendPriority.BULK)
+
+        _, _, args = limiter.redis_repository.run_script.await_args.args
+        assert args[2] == pytest.approx(4.0)
+        assert args[5] == pytest.approx(1.0)
+
+    @pytest.mark.parametrize(("chat_id", "chat_burst"), [(-100123, 3), ("@channel", 3), (42, 1)])
+    async def test_bulk_reserve_never_exceeds_a_single_token_bucket(
+        self, sleep, chat_id, chat_burst
+    ):
+        limiter = _limiter("0", chat_burst=chat_burst, bulk_reserve=0.2)
+
+        await limiter.acquire(chat_id, SendPriority.BULK)
+
+        _, _, args = limiter.redis_repository.run_script.await_args.args
+        capacity, reserve = args[4:6]
+        assert capacity == 1.0
+        # Taking one token must stay possible once the bucket refills
+        assert 1 + reserve <= capacity
+
+    async def test_waits_until_a_token_is_taken(self, sleep):
+        limiter = _limiter("0.25", "0.1", "0")
+
+        await limiter.acquire(None, SendPriority.INTERACTIVE)
+
+        assert [call.args[0] for call in sleep.await_args_list] == [0.25, 0.1]
+
+    async def test_gives_up_after_max_wait(self, sleep):
+        limiter = _limiter("5", "5", max_wait=0)
+
+        await limiter.acquire(42, SendPriority.BULK)
+
+        assert limiter.redis_repository.run_script.await_count == 1
+        sleep.assert_not_awaited()
+
+    async def test_redis_errors_fail_open(self, sleep):
+        limiter = _limiter(RedisConnectionError("down"))
+
+        await limiter.acquire(42, SendPriority.INTERACTIVE)
+
+        sleep.assert_not_awaited()
+
+    async def test_drain_blocks_the_chat_bucket(self):
+        limiter = _limiter(1, chat_rate=1, chat_burst=3)
+
+        await limiter.drain(42, 7)
+
+        _, keys, args = limiter.redis_repository.run_script.await_args.args
+        assert keys == ["tg_send_bucket:42"]
+        assert args == [1, 3.0, 7]
+
+
+class TestPriority:
+    def test_block_overrides_process_default(self):
+        assert current_send_priority() is SendPriority.INTERACTIVE
+        with send_priority(SendPriority.BULK):
+            assert current_send_priority() is SendPriority.BULK
+        assert current_send_priority() is SendPriority.INTERACTIVE
+
+    def test_process_default(self):
+        set_default_send_priority(SendPriority.BULK)
+        try:
+            assert current_send_priority() is SendPriority.BULK
+            with send_priority(SendPriority.INTERACTIVE):
+                assert current_send_priority() is SendPriority.INTERACTIVE
+        finally:
+            set_default_send_priority(SendPriority.INTERACTIVE)
+
+
+class TestRequestMiddleware:
+    def _middleware(self, max_retries: int = 3) -> RateLimitedRequestMiddleware:
+        limiter = MagicMock()
+        limiter.acquire = AsyncMock(return_value=0.0)
+        limiter.drain = AsyncMock()
+        return RateLimitedRequestMiddleware(limiter, max_retries=max_retries)
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            GetMe(),
+            SendChatAction(chat_id=1, action="typing"),
+            DeleteMessage(chat_id=1, message_id=1),
+        ],
+    )
+    async def test_non_sending_methods_skip_the_limiter(self, method):
+        middleware = self._middleware()
+        make_request = AsyncMock(return_value=True)
+
+        await middleware(make_request, MagicMock(), method)
+
+        middleware.limiter.acquire.assert_not_awaited()
+        make_request.assert_awaited_once()
+
+    async def test_send_waits_for_a_token_with_current_priority(self):
+        middleware = self._middleware()
+        make_request = AsyncMock(return_value="sent")
+
+        with send_priority(SendPriority.BULK):
+            result = await middleware(make_request, MagicMock(), SendMessage(chat_id=7, text="x"))
+
+        assert result == "sent"
+        middleware.limiter.acquire.assert_awaited_once_with(7, SendPriority.BULK)
+
+    async def test_bulk_deletes_are_limited(self):
+        middleware = self._middleware()
+
+        await middleware(AsyncMock(), MagicMock(), DeleteMessages(chat_id=7, message_ids=[1, 2]))
+
+        middleware.limiter.acquire.assert_awaited_once()
+
+    async def test_retry_after_drains_bucket_and_retries(self, sleep):
+        middleware = self._middleware()
+        make_request = AsyncMock(side_effect=[_retry_after(3), "sent"])
+
+        result = await middleware(make_request, MagicMock(), SendMessage(chat_id=7, text="x"))
+
+        assert result == "sent"
+        middleware.limiter.drain.assert_awaited_once_with(7, 3)
+        sleep.assert_awaited_once_with(3)
+        assert middleware.limiter.acquire.await_count == 2
+
+    async def test_retry_after_is_raised_when_retries_run_out(self, sleep):
+        middleware = self._middleware(max_retries=1)
+        make_request = AsyncMock(side_effect=[_retry_after(1), _retry_after(1)])
+
+        with pytest.raises(TelegramRetryAfter):
+            await middleware(make_request, MagicMock(), SendMessage(chat_id=7, text="x"))
+
+        assert make_request.await_count == 2
@@ -0,0 +1,137 @@
+"""Tests for the GCRA flood protection in ThrottlingMiddleware."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.types import CallbackQuery, Message
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.bot.middlewares import throttling as throttling_module
+from src.bot.middlewares.throttling import MemoryThrottle, ThrottlingMiddleware
+from src.core.config import AppConfig
+from src.core.constants import CONTAINER_KEY, USER_KEY
+from src.core.enums import ThrottlingBackend
+from src.infrastructure.redis.repository import RedisRepository
+from src.services.notification import NotificationService
+from tests.conftest import make_config, make_user
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    now = [100.0]
+    monkeypatch.setattr(throttling_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _data(backend: ThrottlingBackend, *script_results: object) -> dict:
+    config = make_config()
+    config.bot.throttling_backend = backend
+    config.bot.throttling_period = 1.0
+    config.bot.throttling_message_limit = 2
+    config.bot.throttling_callback_limit = 4
+    config.bot.throttling_warning_interval = 10.0
+
+    redis_repository = MagicMock()
+    redis_repository.run_script = AsyncMock(side_effect=list(script_results))
+    notification_service = AsyncMock()
+    dependencies = {
+        AppConfig: config,
+        RedisRepository: redis_repository,
+        NotificationService: notification_service,
+    }
+    container = MagicMock()
+    container.get = AsyncMock(side_effect=lambda dependency: dependencies[dependency])
+    return {CONTAINER_KEY: container, USER_KEY: make_user(telegram_id=42)}
+
+
+def _services(data: dict) -> tuple[MagicMock, AsyncMock]:
+    dependencies = data[CONTAINER_KEY].get.side_effect
+    return dependencies(RedisRepository), dependencies(NotificationService)
+
+
+class TestMemoryThrottle:
+    def test_allows_burst_then_paces(self, clock):
+        throttle = MemoryThrottle()
+
+        results = [throttle.hit(1, "message", 0.5, 0.5, 10.0)[0] for _ in range(3)]
+        clock[0] += 0.5
+        results.append(throttle.hit(1, "message", 0.5, 0.5, 10.0)[0])
+
+        assert results == [True, True, False, True]
+
+    def test_event_types_have_separate_budgets(self, clock):
+        throttle = MemoryThrottle()
+
+        throttle.hit(1, "message", 1.0, 0.0, 10.0)
+
+        assert throttle.hit(1, "callback_query", 1.0, 0.0, 10.0) == (True, False)
+        assert throttle.hit(1, "message", 1.0, 0.0, 10.0) == (False, True)
+
+    def test_warns_once_per_interval(self, clock):
+        throttle = MemoryThrottle()
+        throttle.hit(1, "message", 1.0, 0.0, 10.0)
+
+        warnings = [throttle.hit(1, "message", 1.0, 0.0, 10.0)[1] for _ in range(3)]
+        clock[0] += 10.0
+        throttle.hit(1, "message", 1.0, 0.0, 10.0)
+        warnings.append(throttle.hit(1, "message", 1.0, 0.0, 10.0)[1])
+
+        assert warnings == [True, False, False, True]
+
+    def test_expired_state_is_pruned(self, clock):
+        throttle = MemoryThrottle()
+        throttle.hit(1, "message", 1.0, 0.0, 10.0)
+        throttle.hit(1, "message", 1.0, 0.0, 10.0)
+
+        clock[0] += 11.0
+        throttle.hit(2, "message", 1.0, 0.0, 10.0)
+
+        assert list(throttle.tats) == [(2, "message")]
+        assert throttle.warnings == {}
+
+
+class TestMiddleware:
+    async def test_redis_backend_passes_budget_for_the_event_type(self):
+        data = _data(ThrottlingBackend.REDIS, [1, 0])
+        handler = AsyncMock(return_value="handled")
+
+        result = await ThrottlingMiddleware()(handler, MagicMock(spec=CallbackQuery), data)
+
+        assert result == "handled"
+        redis_repository, _ = _services(data)
+        _, keys, args = redis_repository.run_script.await_args.args
+        assert keys == ["throttling:callback_query:42", "throttling_warning:42"]
+        assert args == [250, 750, 10_000]
+
+    async def test_throttled_event_is_dropped_and_warned_once(self):
+        data = _data(ThrottlingBackend.REDIS, [0, 1], [0, 0])
+        handler = AsyncMock()
+        middleware = ThrottlingMiddleware()
+
+        await middleware(handler, MagicMock(spec=Message), data)
+        await middleware(handler, MagicMock(spec=Message), data)
+
+        handler.assert_not_awaited()
+        _, notification_service = _services(data)
+        notification_service.notify_user.assert_awaited_once()
+
+    async def test_redis_errors_fail_open(self):
+        data = _data(ThrottlingBackend.REDIS, RedisConnectionError("down"))
+        handler = AsyncMock(return_value="handled")
+
+        assert await ThrottlingMiddleware()(handler, MagicMock(spec=Message), data) == "handled"
+
+    async def test_memory_backend_skips_redis(self, clock):
+        data = _data(ThrottlingBackend.MEMORY)
+        handler = AsyncMock()
+        middleware = ThrottlingMiddleware()
+
+        for _ in range(3):
+            await middleware(handler, MagicMock(spec=Message), data)
+
+        assert handler.await_count == 2
+        redis_repository, notification_service = _services(data)
+        redis_repository.run_script.assert_not_awaited()
+        notification_service.notify_user.assert_awaited_once()
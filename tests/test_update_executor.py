@@ -0,0 +1,203 @@
+"""Tests for the bounded, per-user-ordered webhook update executor."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.types import Update
+from fastapi import status
+
+from src.api.endpoints.telegram import TelegramWebhookEndpoint
+from src.api.update_executor import UpdateExecutor, update_sender_id
+from src.core.enums import UpdateShedPolicy
+
+
+def _recorder(log: list[str], name: str, gate: asyncio.Event | None = None):
+    async def run() -> None:
+        log.append(f"start:{name}")
+        if gate is not None:
+            await gate.wait()
+        await asyncio.sleep(0)
+        log.append(f"end:{name}")
+
+    return run
+
+
+async def _settle(executor: UpdateExecutor) -> None:
+    while executor._tasks:
+        await asyncio.gather(*list(executor._tasks))
+
+
+class TestOrdering:
+    async def test_same_user_updates_run_in_order(self):
+        executor = UpdateExecutor(concurrency=10)
+        log: list[str] = []
+
+        for name in ("a", "b", "c"):
+            assert executor.submit(1, _recorder(log, name))
+        await _settle(executor)
+
+        assert log == ["start:a", "end:a", "start:b", "end:b", "start:c", "end:c"]
+        assert executor.queued == 0
+        assert executor._queues == {}
+
+    async def test_different_users_run_in_parallel(self):
+        executor = UpdateExecutor(concurrency=10)
+        gate = asyncio.Event()
+        log: list[str] = []
+
+        executor.submit(1, _recorder(log, "u1", gate))
+        executor.submit(2, _recorder(log, "u2", gate))
+        await asyncio.sleep(0)
+
+        assert log == ["start:u1", "start:u2"]
+        gate.set()
+        await _settle(executor)
+
+    async def test_global_concurrency_is_capped(self):
+        executor = UpdateExecutor(concurrency=2)
+        gate = asyncio.Event()
+        log: list[str] = []
+
+        for user in range(5):
+            executor.submit(user, _recorder(log, str(user), gate))
+        await asyncio.sleep(0)
+
+        assert len([entry for entry in log if entry.startswith("start")]) == 2
+        assert executor.queued == 3
+        gate.set()
+        await _settle(executor)
+        assert executor.queued == 0
+
+    async def test_failing_update_does_not_stop_the_user_queue(self):
+        executor = UpdateExecutor()
+        log: list[str] = []
+
+        executor.submit(1, AsyncMock(side_effect=RuntimeError("boom")))
+        executor.submit(1, _recorder(log, "next"))
+        await _settle(executor)
+
+        assert log == ["start:next", "end:next"]
+
+
+class TestShedding:
+    async def test_full_user_queue_drops_newest(self):
+        executor = UpdateExecutor(user_queue_size=1, shed_policy=UpdateShedPolicy.DROP_NEWEST)
+        gate = asyncio.Event()
+        log: list[str] = []
+
+        executor.submit(1, _recorder(log, "running", gate))
+        await asyncio.sleep(0)
+        assert executor.submit(1, _recorder(log, "queued"))
+        assert not executor.submit(1, _recorder(log, "shed"))
+        assert executor.submit(2, _recorder(log, "other-user"))
+
+        gate.set()
+        await _settle(executor)
+        assert "start:shed" not in log
+        assert "end:queued" in log and "end:other-user" in log
+
+    async def test_full_user_queue_drops_oldest(self):
+        executor = UpdateExecutor(user_queue_size=1, shed_policy=UpdateShedPolicy.DROP_OLDEST)
+        gate = asyncio.Event()
+        log: list[str] = []
+
+        executor.submit(1, _recorder(log, "running", gate))
+        await asyncio.sleep(0)
+        executor.submit(1, _recorder(log, "stale"))
+        assert executor.submit(1, _recorder(log, "latest"))
+
+        gate.set()
+        await _settle(executor)
+        assert log == ["start:running", "end:running", "start:latest", "end:latest"]
+        assert executor.queued == 0
+
+    async def test_full_backlog_rejects(self):
+        executor = UpdateExecutor(concurrency=1, max_queued=1)
+        gate = asyncio.Event()
+        log: list[str] = []
+
+        executor.submit(1, _recorder(log, "running", gate))
+        await asyncio.sleep(0)
+        assert executor.submit(2, _recorder(log, "waiting"))
+        assert not executor.submit(3, _recorder(log, "shed"))
+
+        gate.set()
+        await _settle(executor)
+
+    async def test_shutdown_cancels_and_rejects(self):
+        executor = UpdateExecutor()
+        gate = asyncio.Event()
+
+        executor.submit(1, _recorder([], "running", gate))
+        executor.submit(1, _recorder([], "queued"))
+        await asyncio.sleep(0)
+        await executor.shutdown()
+
+        assert executor.queued == 0
+        assert not executor.submit(1, _recorder([], "late"))
+
+
+class TestWebhookEndpoint:
+    def _endpoint(self, executor: UpdateExecutor) -> TelegramWebhookEndpoint:
+        endpoint = TelegramWebhookEndpoint(MagicMock(), "secret", executor=executor)
+        endpoint._feed_update = AsyncMock()
+        return endpoint
+
+    def _update(self, user_id: int) -> MagicMock:
+        update = MagicMock(update_id=1)
+        update.event.from_user.id = user_id
+        return update
+
+    def _request(self) -> MagicMock:
+        request = MagicMock()
+        request.state.dishka_container.get = AsyncMock(return_value=MagicMock())
+        return request
+
+    async def test_rejected_update_answers_503(self):
+        executor = UpdateExecutor(max_queued=0, shed_policy=UpdateShedPolicy.REJECT)
+        endpoint = self._endpoint(executor)
+
+        response = await endpoint._handle_request(
+            self._update(1), "secret", ___dishka_request=self._request()
+        )
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    async def test_dropped_update_is_acknowledged(self):
+        executor = UpdateExecutor(max_queued=0, shed_policy=UpdateShedPolicy.DROP_NEWEST)
+        endpoint = self._endpoint(executor)
+
+        response = await endpoint._handle_request(
+            self._update(1), "secret", ___dishka_request=self._request()
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_sender_id_is_taken_from_the_event(self):
+        assert update_sender_id(self._update(42)) == 42
+        assert update_sender_id(MagicMock(event=object())) is None
+
+    async def test_unknown_update_type_is_accepted_and_fed(self):
+        executor = UpdateExecutor()
+        endpoint = self._endpoint(executor)
+        update = Update(update_id=1)
+
+        response = await endpoint._handle_request(
+            update, "secret", ___dishka_request=self._request()
+        )
+        await asyncio.sleep(0)
+
+        assert response.status_code == status.HTTP_200_OK
+        endpoint._feed_update.assert_awaited_once()
+        assert update_sender_id(update) is None
+
+    async def test_feeding_an_unknown_update_type_does_not_raise(self):
+        dispatcher = MagicMock()
+        dispatcher.feed_update = AsyncMock(return_value=None)
+        endpoint = TelegramWebhookEndpoint(dispatcher, "secret", executor=UpdateExecutor())
+
+        await endpoint._feed_update(bot=MagicMock(), update=Update(update_id=1))
+
+        dispatcher.feed_update.assert_awaited_once()
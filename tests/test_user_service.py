@@ -398,8 +398,21 @@ class TestCacheInvalidation:
 
         await svc.clear_user_cache(100)
 
-        # Should have called redis.delete at least once (user key + list keys)
-        assert redis.delete.await_count >= 1
+        # One DEL covers the user key and every dependent list key
+        redis.delete.assert_awaited_once()
+        deleted = redis.delete.await_args.args
+        assert deleted[0] == "cache:get_user:100"
+        assert "cache:users_count" in deleted
+
+    async def test_update_recent_activity_is_one_script_call(self):
+        svc, _, redis = _make_service()
+
+        await svc.update_recent_activity(100)
+
+        svc.redis_repository.list_push_unique.assert_awaited_once()
+        kwargs = svc.redis_repository.list_push_unique.await_args.kwargs
+        assert kwargs["guard_key"] == "throttle:recent_activity:100"
+        redis.exists.assert_not_awaited()
 
     async def test_repopulate_user_cache_sets_key(self):
         svc, _, redis = _make_service()